@@ -0,0 +1,227 @@
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file is generated by util/generate-ami-index.py from the Mappings of cloudformation/cfncluster.cfn.json.
+# Do not edit it by hand, run the script again after updating the template.
+
+AMIS = {
+    'ap-northeast-1': {
+        'alinux': 'ami-0d111a9e2cc41708f',
+        'centos6': 'ami-09b435c6b7699e0e4',
+        'centos7': 'ami-0aa3d0ccd5ed2a95c',
+        'ubuntu1404': 'ami-0eba7c27cb59a237b',
+        'ubuntu1604': 'ami-0270071615c322b74',
+    },
+    'ap-northeast-2': {
+        'alinux': 'ami-06185eef3b1c08627',
+        'centos6': 'ami-025ca1fa28a035048',
+        'centos7': 'ami-09d851e0ace561ecc',
+        'ubuntu1404': 'ami-0b280886c5268c82c',
+        'ubuntu1604': 'ami-0ab8987221fb3560e',
+    },
+    'ap-northeast-3': {
+        'alinux': 'ami-08d9b827573a70706',
+        'centos6': 'ami-011d672fe71dcedbf',
+        'centos7': 'ami-03eb567a5a8831e5a',
+        'ubuntu1404': 'ami-08c60c70dd5721d9a',
+        'ubuntu1604': 'ami-0564b8d6c791ee545',
+    },
+    'ap-south-1': {
+        'alinux': 'ami-0d441d984f96118fd',
+        'centos6': 'ami-0d07f1d788e79c3d0',
+        'centos7': 'ami-0c1047421394bcfde',
+        'ubuntu1404': 'ami-002e1514fe9de7717',
+        'ubuntu1604': 'ami-003fbe61119d3c395',
+    },
+    'ap-southeast-1': {
+        'alinux': 'ami-06610f443913f350c',
+        'centos6': 'ami-046f84d4273a0914f',
+        'centos7': 'ami-04c3ddca4fea3f161',
+        'ubuntu1404': 'ami-03d901320ea72a386',
+        'ubuntu1604': 'ami-0086422cb2d22cdbe',
+    },
+    'ap-southeast-2': {
+        'alinux': 'ami-03abe8841903bc6de',
+        'centos6': 'ami-07fd47c6447dc1e26',
+        'centos7': 'ami-04a04f31fb8e02627',
+        'ubuntu1404': 'ami-0926a3c94c58591f8',
+        'ubuntu1604': 'ami-0eaa45f32e98b00ea',
+    },
+    'ca-central-1': {
+        'alinux': 'ami-035ccf997b6ada1e5',
+        'centos6': 'ami-095d41ba921b255ea',
+        'centos7': 'ami-0a393b36b310f1409',
+        'ubuntu1404': 'ami-0aa476c73dc4eb261',
+        'ubuntu1604': 'ami-0944638729ecc591e',
+    },
+    'eu-central-1': {
+        'alinux': 'ami-052b446957d6dde33',
+        'centos6': 'ami-0eae3ca872f3c46c9',
+        'centos7': 'ami-03a66f9cf752897c8',
+        'ubuntu1404': 'ami-034f952b6e8ed8d3c',
+        'ubuntu1604': 'ami-096c5966872657ecd',
+    },
+    'eu-west-1': {
+        'alinux': 'ami-0e0d7168ae4c3d79b',
+        'centos6': 'ami-0b206759c94100c62',
+        'centos7': 'ami-0c0a54bf2f46c50c8',
+        'ubuntu1404': 'ami-01328b992e18f658b',
+        'ubuntu1604': 'ami-0807e48d1efb2b592',
+    },
+    'eu-west-2': {
+        'alinux': 'ami-076e033346b601289',
+        'centos6': 'ami-063e38d6a40c96694',
+        'centos7': 'ami-0d34b4490d2f2afe5',
+        'ubuntu1404': 'ami-0b08f8c61db625a6b',
+        'ubuntu1604': 'ami-03d4e45c67474c0c1',
+    },
+    'eu-west-3': {
+        'alinux': 'ami-046b3b62c2f47b6dd',
+        'centos6': 'ami-0f2556ba4e82eee8a',
+        'centos7': 'ami-06d1ee3dd331b701e',
+        'ubuntu1404': 'ami-0c33858ae592cd30e',
+        'ubuntu1604': 'ami-0ca1eea4a5dc78718',
+    },
+    'sa-east-1': {
+        'alinux': 'ami-0fc319ee1b17cb133',
+        'centos6': 'ami-085ddd10c24b9ad02',
+        'centos7': 'ami-05c6b6de73c9a8b74',
+        'ubuntu1404': 'ami-023e938f210af929e',
+        'ubuntu1604': 'ami-00c61c5eca332e0b8',
+    },
+    'us-east-1': {
+        'alinux': 'ami-0d08839fb598a678d',
+        'centos6': 'ami-07ecc9bd36de77fe0',
+        'centos7': 'ami-0aaac75139dac3549',
+        'ubuntu1404': 'ami-0cb3b6ceaf926000a',
+        'ubuntu1604': 'ami-0e330c03d6a0f7416',
+    },
+    'us-east-2': {
+        'alinux': 'ami-0c1e220a7d435626d',
+        'centos6': 'ami-0f83786f018e50aef',
+        'centos7': 'ami-0b8dd95a61cb55947',
+        'ubuntu1404': 'ami-035a7aa06162b1faa',
+        'ubuntu1604': 'ami-03a08f02b6193b9a6',
+    },
+    'us-gov-west-1': {
+        'alinux': 'ami-69009908',
+        'ubuntu1404': 'ami-01009960',
+        'ubuntu1604': 'ami-c40e97a5',
+    },
+    'us-west-1': {
+        'alinux': 'ami-0bfa13075d27a6978',
+        'centos6': 'ami-09504713997f28685',
+        'centos7': 'ami-0fbf2663d87a6e1d1',
+        'ubuntu1404': 'ami-0028dd13009080829',
+        'ubuntu1604': 'ami-0538de8d59ee87ceb',
+    },
+    'us-west-2': {
+        'alinux': 'ami-0a31d27ac6add37d4',
+        'centos6': 'ami-0c8f89011237ac39c',
+        'centos7': 'ami-07c45a2de36de7033',
+        'ubuntu1404': 'ami-0c4467fc5217f7d85',
+        'ubuntu1604': 'ami-01e20e07651baa7b1',
+    },
+}
+
+OS_FEATURES = {
+    'alinux': {
+        'RootDevice': '/dev/xvda',
+        'User': 'ec2-user',
+    },
+    'centos6': {
+        'RootDevice': '/dev/sda1',
+        'User': 'centos',
+    },
+    'centos7': {
+        'RootDevice': '/dev/sda1',
+        'User': 'centos',
+    },
+    'ubuntu1404': {
+        'RootDevice': '/dev/sda1',
+        'User': 'ubuntu',
+    },
+    'ubuntu1604': {
+        'RootDevice': '/dev/sda1',
+        'User': 'ubuntu',
+    },
+}
+
+REGION_CAPABILITIES = {
+    'ap-northeast-1': {
+        'arn': 'aws',
+    },
+    'ap-northeast-2': {
+        'arn': 'aws',
+    },
+    'ap-northeast-3': {
+        'arn': 'aws',
+    },
+    'ap-south-1': {
+        'arn': 'aws',
+    },
+    'ap-southeast-1': {
+        'arn': 'aws',
+    },
+    'ap-southeast-2': {
+        'arn': 'aws',
+    },
+    'ca-central-1': {
+        'arn': 'aws',
+    },
+    'eu-central-1': {
+        'arn': 'aws',
+    },
+    'eu-west-1': {
+        'arn': 'aws',
+    },
+    'eu-west-2': {
+        'arn': 'aws',
+    },
+    'eu-west-3': {
+        'arn': 'aws',
+    },
+    'sa-east-1': {
+        'arn': 'aws',
+    },
+    'us-east-1': {
+        'arn': 'aws',
+    },
+    'us-east-2': {
+        'arn': 'aws',
+    },
+    'us-gov-west-1': {
+        'arn': 'aws-us-gov',
+    },
+    'us-west-1': {
+        'arn': 'aws',
+    },
+    'us-west-2': {
+        'arn': 'aws',
+    },
+}
+
+
+def get_ami(region, base_os):
+    # returns the AMI of the base_os in the region, None if not published
+    return AMIS.get(region, {}).get(base_os)
+
+def get_user(base_os):
+    # returns the default user of the base_os, None if unknown
+    return OS_FEATURES.get(base_os, {}).get('User')
+
+def get_root_device(base_os):
+    # returns the root device name of the base_os, None if unknown
+    return OS_FEATURES.get(base_os, {}).get('RootDevice')
+
+def get_arn_partition(region):
+    # returns the ARN partition of the region, None if unknown
+    return REGION_CAPABILITIES.get(region, {}).get('arn')
@@ -0,0 +1,115 @@
+from __future__ import absolute_import
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Accounting of the AWS API calls made through the clients of cfncluster.utils, based on botocore events:
+# before-call and after-call give the count, latency and outcome of each operation, needs-retry sees every
+# attempt and counts the throttled ones, the retries come from the RetryAttempts of the response metadata.
+
+import json
+import threading
+import time
+
+from . import utils
+
+THROTTLING_ERRORS = ['Throttling', 'ThrottlingException', 'ThrottledException', 'RequestThrottledException',
+                     'TooManyRequestsException', 'RequestLimitExceeded', 'RequestThrottled',
+                     'SlowDown', 'PriorRequestNotComplete', 'EC2ThrottledException']
+
+_lock = threading.Lock()
+_installed = False
+# operation name -> {'calls', 'errors', 'retries', 'throttles', 'latencies'}
+_stats = {}
+
+def _operation(model):
+    return '%s.%s' % (model.service_model.service_name, model.name)
+
+def _get(operation):
+    if operation not in _stats:
+        _stats[operation] = {'calls': 0, 'errors': 0, 'retries': 0, 'throttles': 0, 'latencies': []}
+    return _stats[operation]
+
+def _before_call(model=None, context=None, **kwargs):
+    if context is not None:
+        context['apistats_start'] = time.time()
+
+def _after_call(model=None, context=None, http_response=None, parsed=None, **kwargs):
+    started = (context or {}).get('apistats_start')
+    latency = time.time() - started if started is not None else 0
+    with _lock:
+        stats = _get(_operation(model))
+        stats['calls'] += 1
+        stats['latencies'].append(latency)
+        if http_response is not None and http_response.status_code >= 300:
+            stats['errors'] += 1
+        stats['retries'] += (parsed or {}).get('ResponseMetadata', {}).get('RetryAttempts', 0)
+
+def _needs_retry(response=None, operation=None, **kwargs):
+    # called for every attempt, botocore's own handler decides whether to retry
+    if response is None or operation is None:
+        return
+    code = (response[1] or {}).get('Error', {}).get('Code')
+    if code in THROTTLING_ERRORS:
+        with _lock:
+            _get(_operation(operation))['throttles'] += 1
+
+def install():
+    # registers the handlers on all the current and future clients of cfncluster.utils
+    global _installed
+    with _lock:
+        if _installed:
+            return
+        _installed = True
+    utils.register_handler('before-call', _before_call)
+    utils.register_handler('after-call', _after_call)
+    utils.register_handler('needs-retry', _needs_retry)
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+def percentile(values, percent):
+    # nearest-rank percentile, 0 for no values
+    if len(values) == 0:
+        return 0
+    values = sorted(values)
+    rank = int(round(percent / 100.0 * len(values) + 0.5))
+    return values[max(0, min(len(values), rank) - 1)]
+
+def summary():
+    # returns a dict of operation -> counters and latencies in milliseconds
+    with _lock:
+        result = {}
+        for operation, stats in _stats.items():
+            result[operation] = {'calls': stats['calls'], 'errors': stats['errors'],
+                                 'retries': stats['retries'], 'throttles': stats['throttles'],
+                                 'p50_ms': round(percentile(stats['latencies'], 50) * 1000, 1),
+                                 'p99_ms': round(percentile(stats['latencies'], 99) * 1000, 1),
+                                 'total_ms': round(sum(stats['latencies']) * 1000, 1)}
+        return result
+
+def format_table(stats):
+    lines = ['%-46s %6s %6s %7s %9s %9s %9s %10s' % ('Operation', 'Calls', 'Errors', 'Retries', 'Throttles',
+                                                      'p50 ms', 'p99 ms', 'Total ms')]
+    for operation in sorted(stats):
+        s = stats[operation]
+        lines.append('%-46s %6d %6d %7d %9d %9.1f %9.1f %10.1f' % (operation, s['calls'], s['errors'], s['retries'],
+                                                                  s['throttles'], s['p50_ms'], s['p99_ms'],
+                                                                  s['total_ms']))
+    lines.append('%-46s %6d %6d %7d %9d' % ('Total', sum(s['calls'] for s in stats.values()),
+                                            sum(s['errors'] for s in stats.values()),
+                                            sum(s['retries'] for s in stats.values()),
+                                            sum(s['throttles'] for s in stats.values())))
+    return '\n'.join(lines)
+
+def format_json(stats):
+    return json.dumps(stats, indent=2, sort_keys=True)
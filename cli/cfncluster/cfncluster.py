@@ -14,25 +14,73 @@ from builtins import str
 import sys
 import time
 import logging
-import boto3
 import os
+import errno
+import hashlib
 import json
+import subprocess as sub
+import configparser
 from botocore.exceptions import ClientError
 
 from . import cfnconfig
+from . import ami_index
+from . import utils
+from . import tracing
+from . import spot_advisor
 
 logger = logging.getLogger('cfncluster.cfncluster')
 
+# Parameters that only change the limits of the ComputeFleet ASG
+ASG_SIZING_PARAMETERS = ['MaxQueueSize', 'InitialQueueSize', 'MaintainInitialSize']
+# Seconds an idle SSH control connection to a master server is kept open
+SSH_CONTROL_PERSIST = 600
+# Stack tag recording the URL of the template the stack was last created or updated from
+TEMPLATE_URL_TAG = 'cfncluster:template-url'
+
 def version(args):
     config = cfnconfig.CfnClusterConfig(args)
     logger.info(config.version)
 
+def show_config(args):
+    # prints the cluster section of the template, and the vpc, ebs and scaling sections it uses, with their inherited
+    # options resolved, without checking them
+    if args.config_file is not None:
+        config_file = args.config_file
+    else:
+        config_file = os.path.expanduser(os.path.join('~', '.cfncluster', 'config'))
+    if not os.path.isfile(config_file):
+        logger.error('Config file %s not found' % config_file)
+        sys.exit(1)
+    config, origins = cfnconfig.read_config(config_file)
+    try:
+        template = args.cluster_template or config.get('global', 'cluster_template')
+    except (configparser.NoSectionError, configparser.NoOptionError):
+        logger.error('cluster_template not set in [global] section')
+        sys.exit(1)
+    cluster_section = ('cluster %s' % template)
+    if not config.has_section(cluster_section):
+        logger.error('Section [%s] is not defined' % cluster_section)
+        sys.exit(1)
+
+    sections = [cluster_section]
+    for section_type in ['vpc', 'ebs', 'scaling']:
+        if config.has_option(cluster_section, '%s_settings' % section_type):
+            sections.append('%s %s' % (section_type, config.get(cluster_section, '%s_settings' % section_type)))
+    for section in sections:
+        if config.has_section(section):
+            print(cfnconfig.format_section(config, origins, section))
+        else:
+            print('# [%s] is not defined' % section)
+        print('')
+
 def create(args):
     logger.info('Beginning cluster creation for cluster: %s' % (args.cluster_name))
     logger.debug('Building cluster config based on args %s' % str(args))
 
     # Build the config based on args
     config = cfnconfig.CfnClusterConfig(args)
+    if config.ami_id is not None:
+        logger.info('Using AMI: %s' % config.ami_id)
 
     # Set the ComputeWaitConditionCount parameter to match InitialQueueSize
     try:
@@ -47,12 +95,13 @@ def create(args):
         i = [p[0] for p in config.parameters].index('MasterSubnetId')
         master_subnet_id = config.parameters[i][1]
         try:
-            ec2 = boto3.client('ec2', region_name=config.region,
-                                 aws_access_key_id=config.aws_access_key_id,
-                                 aws_secret_access_key=config.aws_secret_access_key)
-            availability_zone = ec2.describe_subnets(SubnetIds=[master_subnet_id])\
-                .get('Subnets')[0]\
-                .get('AvailabilityZone')
+            ec2 = utils.get_client('ec2', region_name=config.region,
+                                     aws_access_key_id=config.aws_access_key_id,
+                                     aws_secret_access_key=config.aws_secret_access_key)
+            with tracing.span('preflight'):
+                availability_zone = ec2.describe_subnets(SubnetIds=[master_subnet_id])\
+                    .get('Subnets')[0]\
+                    .get('AvailabilityZone')
         except ClientError as e:
             logger.critical(e.response.get('Error').get('Message'))
             sys.stdout.flush()
@@ -61,35 +110,42 @@ def create(args):
     except ValueError:
         pass
 
+    if getattr(args, 'spot_advisor', False):
+        with tracing.span('spot_advisor'):
+            spot_advisor.preflight(config)
+
     capabilities = ["CAPABILITY_IAM"]
     try:
-        cfn = boto3.client('cloudformation', region_name=config.region,
-                           aws_access_key_id=config.aws_access_key_id,
-                           aws_secret_access_key=config.aws_secret_access_key)
+        cfn = utils.get_client('cloudformation', region_name=config.region,
+                               aws_access_key_id=config.aws_access_key_id,
+                               aws_secret_access_key=config.aws_secret_access_key)
         stack_name = 'cfncluster-' + args.cluster_name
         logger.info("Creating stack named: " + stack_name)
 
         cfn_params = [{'ParameterKey': param[0], 'ParameterValue': param[1]} for param in config.parameters]
         tags = [{'Key': t, 'Value': config.tags[t]} for t in config.tags]
-
-        stack = cfn.create_stack(StackName=stack_name,
-                                 TemplateURL=config.template_url,
-                                 Parameters=cfn_params,
-                                 Capabilities=capabilities,
-                                 DisableRollback=args.norollback, Tags=tags)
+        tags = get_template_url_tags(tags, config.template_url)
+
+        with tracing.span('create_stack', stack_name=stack_name):
+            stack = cfn.create_stack(StackName=stack_name,
+                                     TemplateURL=config.template_url,
+                                     Parameters=cfn_params,
+                                     Capabilities=capabilities,
+                                     DisableRollback=args.norollback, Tags=tags)
         logger.debug('StackId: %s' % (stack.get('StackId')))
 
         status = cfn.describe_stacks(StackName=stack_name).get("Stacks")[0].get('StackStatus')
 
         if not args.nowait:
             resource_status = ''
-            while status == 'CREATE_IN_PROGRESS':
-                status = cfn.describe_stacks(StackName=stack_name).get("Stacks")[0].get('StackStatus')
-                events = cfn.describe_stack_events(StackName=stack_name).get('StackEvents')[0]
-                resource_status = ('Status: %s - %s' % (events.get('LogicalResourceId'), events.get('ResourceStatus'))).ljust(80)
-                sys.stdout.write('\r%s' % resource_status)
-                sys.stdout.flush()
-                time.sleep(5)
+            with tracing.span('wait'):
+                while status == 'CREATE_IN_PROGRESS':
+                    status = cfn.describe_stacks(StackName=stack_name).get("Stacks")[0].get('StackStatus')
+                    events = cfn.describe_stack_events(StackName=stack_name).get('StackEvents')[0]
+                    resource_status = ('Status: %s - %s' % (events.get('LogicalResourceId'), events.get('ResourceStatus'))).ljust(80)
+                    sys.stdout.write('\r%s' % resource_status)
+                    sys.stdout.flush()
+                    time.sleep(5)
             # print the last status update in the logs
             if resource_status != '':
                 logger.debug(resource_status)
@@ -103,12 +159,8 @@ def create(args):
                                     (event.get('ResourceType'), event.get('LogicalResourceId'),
                                      event.get('ResourceStatusReason')))
             logger.info('')
-            outputs = cfn.describe_stacks(StackName=stack_name).get("Stacks")[0].get('Outputs', [])
-            ganglia_enabled = is_ganglia_enabled(config.parameters)
-            for output in outputs:
-                if not ganglia_enabled and output.get('OutputKey').startswith('Ganglia'):
-                    continue
-                logger.info("%s: %s" % (output.get('OutputKey'), output.get('OutputValue')))
+            with tracing.span('outputs'):
+                print_stack_outputs(stack_name, config)
         else:
             status = cfn.describe_stacks(StackName=stack_name).get("Stacks")[0].get('StackStatus')
             logger.info('Status: %s' % status)
@@ -132,25 +184,110 @@ def is_ganglia_enabled(parameters):
         pass
     return True
 
+def get_stack_outputs(stack_name, config):
+    # returns a dict of OutputKey -> OutputValue of the stack
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+
+    outputs = cfn.describe_stacks(StackName=stack_name).get("Stacks")[0].get('Outputs', [])
+    return dict((output.get('OutputKey'), output.get('OutputValue')) for output in outputs)
+
+def print_stack_outputs(stack_name, config):
+    outputs = get_stack_outputs(stack_name, config)
+    ganglia_enabled = is_ganglia_enabled(config.parameters)
+    for key in sorted(outputs):
+        if not ganglia_enabled and key.startswith('Ganglia'):
+            continue
+        logger.info("%s: %s" % (key, outputs[key]))
+
+def get_template_url_tag(template_url):
+    # returns the value of TEMPLATE_URL_TAG for the template URL: the URL without its query string, e.g. the signature
+    # of a presigned URL, None if it does not fit in a tag value
+    url = template_url.split('?')[0]
+    return url if len(url) <= 256 else None
+
+def get_template_url_tags(tags, template_url):
+    # returns the stack tags with TEMPLATE_URL_TAG set for the template URL
+    tags = [tag for tag in tags if tag.get('Key') != TEMPLATE_URL_TAG]
+    if get_template_url_tag(template_url) is not None:
+        tags.append({'Key': TEMPLATE_URL_TAG, 'Value': get_template_url_tag(template_url)})
+    return tags
+
+def get_stack_template_url(stack):
+    # returns the template URL recorded on the stack, None if the stack was created without it
+    return dict((tag.get('Key'), tag.get('Value')) for tag in stack.get('Tags', [])).get(TEMPLATE_URL_TAG)
+
+def get_changed_parameters(stack, config, cfn, reset_desired):
+    # returns the keys of the parameters whose value differs between the running stack and the config, None if the
+    # update changes the template or if the stack's template is not JSON, e.g. YAML, which boto3 returns as a string
+    # parameters not set in the config are compared with the defaults of the stack's template, which is the template
+    # of the update when the template URL is the same
+    template_url = get_stack_template_url(stack)
+    if template_url is None or template_url != get_template_url_tag(config.template_url):
+        return None
+    current = dict((p.get('ParameterKey'), p.get('ParameterValue')) for p in stack.get('Parameters', []))
+    template = cfn.get_template(StackName=stack.get('StackName')).get('TemplateBody')
+    if not isinstance(template, dict):
+        return None
+    requested = dict((key, str(value.get('Default'))) for key, value in template.get('Parameters', {}).items()
+                     if 'Default' in value)
+    requested.update(dict((param[0], str(param[1])) for param in config.parameters))
+
+    # AvailabilityZone and ComputeWaitConditionCount are derived by the cli, not read from the config
+    ignored = ['AvailabilityZone', 'ComputeWaitConditionCount']
+    # without --reset-desired, the update sets InitialQueueSize to the current desired capacity of the ASG
+    if not reset_desired:
+        ignored.append('InitialQueueSize')
+    return [key for key in requested if key not in ignored and current.get(key) != requested.get(key)]
+
 def update(args):
     logger.info('Updating: %s' % (args.cluster_name))
     stack_name = ('cfncluster-' + args.cluster_name)
     config = cfnconfig.CfnClusterConfig(args)
     capabilities = ["CAPABILITY_IAM"]
+    nowait = args.nowait
 
-    cfn = boto3.client('cloudformation', region_name=config.region,
-                       aws_access_key_id=config.aws_access_key_id,
-                       aws_secret_access_key=config.aws_secret_access_key)
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
 
-    asg = boto3.client('autoscaling', region_name=config.region,
-                       aws_access_key_id=config.aws_access_key_id,
-                       aws_secret_access_key=config.aws_secret_access_key)
+    asg = utils.get_client('autoscaling', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
 
+    asg_name = None
     if not args.reset_desired:
         asg_name = get_asg_name(stack_name, config)
         desired_capacity = asg.describe_auto_scaling_groups(AutoScalingGroupNames=[asg_name])\
             .get('AutoScalingGroups')[0]\
             .get('DesiredCapacity')
+
+    try:
+        stack = cfn.describe_stacks(StackName=stack_name).get('Stacks')[0]
+        changed = get_changed_parameters(stack, config, cfn, args.reset_desired)
+    except ClientError as e:
+        logger.critical(e.response.get('Error').get('Message'))
+        sys.exit(1)
+
+    # If only the compute fleet sizing changed, apply it to the ASG directly instead of waiting for CloudFormation.
+    # The stack update below still runs in the background so the stack parameters do not drift.
+    if changed is not None and len(changed) > 0 and set(changed).issubset(ASG_SIZING_PARAMETERS):
+        logger.info('Only compute fleet sizing changed (%s), updating ComputeFleet directly' % ', '.join(sorted(changed)))
+        if asg_name is None:
+            asg_name = get_asg_name(stack_name, config)
+        min_queue_size, max_queue_size, desired_queue_size = get_asg_limits(config.parameters)
+        if not args.reset_desired:
+            desired_queue_size = max(min_queue_size, min(max_queue_size, desired_capacity))
+            desired_capacity = desired_queue_size
+        set_asg_limits(asg_name=asg_name, config=config, min=min_queue_size, max=max_queue_size,
+                       desired=desired_queue_size)
+        logger.info('ComputeFleet limits set to min/max/desired = %s/%s/%s'
+                    % (min_queue_size, max_queue_size, desired_queue_size))
+        logger.info('Reconciling stack parameters in the background')
+        nowait = True
+
+    if not args.reset_desired:
         config.parameters.append(('InitialQueueSize', str(desired_capacity)))
 
     # Get the MasterSubnetId and use it to determine AvailabilityZone
@@ -158,9 +295,9 @@ def update(args):
         i = [p[0] for p in config.parameters].index('MasterSubnetId')
         master_subnet_id = config.parameters[i][1]
         try:
-            ec2 = boto3.client('ec2', region_name=config.region,
-                               aws_access_key_id=config.aws_access_key_id,
-                               aws_secret_access_key=config.aws_secret_access_key)
+            ec2 = utils.get_client('ec2', region_name=config.region,
+                                   aws_access_key_id=config.aws_access_key_id,
+                                   aws_secret_access_key=config.aws_secret_access_key)
             availability_zone = ec2.describe_subnets(SubnetIds=[master_subnet_id]) \
                 .get('Subnets')[0] \
                 .get('AvailabilityZone')
@@ -176,9 +313,10 @@ def update(args):
 
         cfn_params = [{'ParameterKey': param[0], 'ParameterValue': param[1]} for param in config.parameters]
         cfn.update_stack(StackName=stack_name,TemplateURL=config.template_url,
-                         Parameters=cfn_params, Capabilities=capabilities)
+                         Parameters=cfn_params, Capabilities=capabilities,
+                         Tags=get_template_url_tags(stack.get('Tags', []), config.template_url))
         status = cfn.describe_stacks(StackName=stack_name).get("Stacks")[0].get('StackStatus')
-        if not args.nowait:
+        if not nowait:
             while status == 'UPDATE_IN_PROGRESS':
                 status = cfn.describe_stacks(StackName=stack_name).get("Stacks")[0].get('StackStatus')
                 events = cfn.describe_stack_events(StackName=stack_name).get('StackEvents')[0]
@@ -196,6 +334,17 @@ def update(args):
         logger.info('\nExiting...')
         sys.exit(0)
 
+def get_asg_limits(parameters):
+    # returns the (min, max, desired) compute fleet limits defined by the given parameters
+    max_queue_size = [param[1] for param in parameters if param[0] == 'MaxQueueSize']
+    max_queue_size = int(max_queue_size[0] if len(max_queue_size) > 0 else 10)
+    desired_queue_size = [param[1] for param in parameters if param[0] == 'InitialQueueSize']
+    desired_queue_size = int(desired_queue_size[0] if len(desired_queue_size) > 0 else 2)
+    min_queue_size = [desired_queue_size for param in parameters if param[0] == 'MaintainInitialSize' and param[1] == "true"]
+    min_queue_size = int(min_queue_size[0] if len(min_queue_size) > 0 else 0)
+
+    return min_queue_size, max_queue_size, desired_queue_size
+
 def start(args):
     # Set resource limits on compute fleet to min/max/desired = 0/max/0
     logger.info('Starting compute fleet : %s' % args.cluster_name)
@@ -203,15 +352,14 @@ def start(args):
     config = cfnconfig.CfnClusterConfig(args)
 
     # Set asg limits
-    max_queue_size = [param[1] for param in config.parameters if param[0] == 'MaxQueueSize']
-    max_queue_size = int(max_queue_size[0] if len(max_queue_size) > 0 else 10)
-    desired_queue_size = [param[1] for param in config.parameters if param[0] == 'InitialQueueSize']
-    desired_queue_size = int(desired_queue_size[0] if len(desired_queue_size) > 0 else 2)
-    min_queue_size = [desired_queue_size for param in config.parameters if param[0] == 'MaintainInitialSize' and param[1] == "true"]
-    min_queue_size = int(min_queue_size[0] if len(min_queue_size) > 0 else 0)
+    min_queue_size, max_queue_size, desired_queue_size = get_asg_limits(config.parameters)
 
     asg_name = get_asg_name(stack_name=stack_name, config=config)
     set_asg_limits(asg_name=asg_name, config=config, min=min_queue_size, max=max_queue_size, desired=desired_queue_size)
+    set_scheduled_actions(asg_name=asg_name, config=config, enabled=True)
+
+    if getattr(args, 'wait', False):
+        wait_for_asg_capacity(asg_name=asg_name, config=config, capacity=desired_queue_size, timeout=args.timeout)
 
 def stop(args):
     # Set resource limits on compute fleet to min/max/desired = 0/0/0
@@ -221,18 +369,113 @@ def stop(args):
 
     # Set Resource limits
     asg_name = get_asg_name(stack_name=stack_name, config=config)
+    set_scheduled_actions(asg_name=asg_name, config=config, enabled=False)
     set_asg_limits(asg_name=asg_name, config=config, min=0, max=0, desired=0)
 
+    if getattr(args, 'wait', False):
+        wait_for_asg_capacity(asg_name=asg_name, config=config, capacity=0, timeout=args.timeout)
+
+def scale(args):
+    # Set the desired capacity of the compute fleet, widening min/max if needed
+    logger.info('Scaling compute fleet : %s to %s' % (args.cluster_name, args.capacity))
+    stack_name = ('cfncluster-' + args.cluster_name)
+    config = cfnconfig.CfnClusterConfig(args)
+
+    if args.capacity < 0:
+        logger.critical('Capacity must be a non-negative number')
+        sys.exit(1)
+
+    asg = utils.get_client('autoscaling', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+
+    asg_name = get_asg_name(stack_name=stack_name, config=config)
+    try:
+        group = asg.describe_auto_scaling_groups(AutoScalingGroupNames=[asg_name]).get('AutoScalingGroups')[0]
+        set_asg_limits(asg_name=asg_name, config=config, min=min(group.get('MinSize'), args.capacity),
+                       max=max(group.get('MaxSize'), args.capacity), desired=args.capacity)
+    except ClientError as e:
+        logger.critical(e.response.get('Error').get('Message'))
+        sys.stdout.flush()
+        sys.exit(1)
+
+    if args.wait:
+        wait_for_asg_capacity(asg_name=asg_name, config=config, capacity=args.capacity, timeout=args.timeout)
+
+def get_running_instances(instance_ids, config):
+    # returns the ids of the given instances that are in the running state, using batched describe_instance_status
+    ec2 = utils.get_client('ec2', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+
+    running = []
+    for i in range(0, len(instance_ids), 100):
+        statuses = ec2.describe_instance_status(InstanceIds=instance_ids[i:i + 100]).get('InstanceStatuses')
+        running.extend([s.get('InstanceId') for s in statuses if s.get('InstanceState').get('Name') == 'running'])
+
+    return running
+
+def wait_for_asg_capacity(asg_name, config, capacity, timeout):
+    # Poll the compute fleet until `capacity` instances are InService and running, or until the fleet is empty when
+    # capacity is 0. Logs the time to the first node, 50% and 100% of the capacity and exits if timeout is reached.
+    asg = utils.get_client('autoscaling', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+
+    # (count, label) pairs, all logged even when they share a count, e.g. for a capacity of 1
+    milestones = []
+    if capacity > 0:
+        milestones = [(1, 'first node'), ((capacity + 1) // 2, '50%'), (capacity, '100%')]
+
+    start_time = time.time()
+    try:
+        while True:
+            instances = asg.describe_auto_scaling_groups(AutoScalingGroupNames=[asg_name])\
+                .get('AutoScalingGroups')[0]\
+                .get('Instances')
+            pending = len([i for i in instances if i.get('LifecycleState').startswith('Pending')])
+            in_service = [i.get('InstanceId') for i in instances if i.get('LifecycleState') == 'InService']
+            joined = len(get_running_instances(in_service, config)) if len(in_service) > 0 else 0
+            elapsed = int(time.time() - start_time)
+
+            sys.stdout.write(('\rComputeFleet: %s pending, %s/%s in service (%ss)'
+                              % (pending, joined, capacity, elapsed)).ljust(80))
+            sys.stdout.flush()
+            reached = [milestone for milestone in milestones if joined >= milestone[0]]
+            done = (capacity > 0 and joined >= capacity) or (capacity == 0 and len(instances) == 0)
+            if len(reached) > 0 or done:
+                sys.stdout.write('\n')
+            for count, label in reached:
+                milestones.remove((count, label))
+                logger.info('ComputeFleet reached %s (%s/%s nodes) after %s seconds'
+                            % (label, count, capacity, elapsed))
+            if done:
+                if capacity == 0:
+                    logger.info('ComputeFleet is empty after %s seconds' % elapsed)
+                return
+            if elapsed >= timeout:
+                logger.critical('\nComputeFleet did not reach the requested capacity of %s after %s seconds'
+                                % (capacity, elapsed))
+                sys.exit(1)
+            time.sleep(5)
+    except ClientError as e:
+        logger.critical(e.response.get('Error').get('Message'))
+        sys.stdout.flush()
+        sys.exit(1)
+    except KeyboardInterrupt:
+        logger.info('\nExiting...')
+        sys.exit(0)
+
 def list(args):
     config = cfnconfig.CfnClusterConfig(args)
-    cfn = boto3.client('cloudformation', region_name=config.region,
-                       aws_access_key_id=config.aws_access_key_id,
-                       aws_secret_access_key=config.aws_secret_access_key)
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
     try:
-        stacks = cfn.describe_stacks().get('Stacks')
-        for stack in stacks:
-            if stack.get('StackName').startswith('cfncluster-'):
-                logger.info('%s' % (stack.get('StackName')[11:]))
+        for page in cfn.get_paginator('describe_stacks').paginate():
+            for stack in page.get('Stacks'):
+                if stack.get('StackName').startswith('cfncluster-'):
+                    logger.info('%s' % (stack.get('StackName')[11:]))
     except ClientError as e:
         logger.critical(e.response.get('Error').get('Message'))
         sys.exit(1)
@@ -243,9 +486,9 @@ def list(args):
 def get_master_server_id(stack_name, config):
     # returns the physical id of the master server
     # if no master server returns []
-    cfn = boto3.client('cloudformation', region_name=config.region,
-                       aws_access_key_id=config.aws_access_key_id,
-                       aws_secret_access_key=config.aws_secret_access_key)
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
 
     try:
         resources = cfn.describe_stack_resource(StackName=stack_name, LogicalResourceId='MasterServer')
@@ -256,9 +499,9 @@ def get_master_server_id(stack_name, config):
 
 
 def poll_master_server_state(stack_name, config):
-    ec2 = boto3.client('ec2', region_name=config.region,
-                       aws_access_key_id=config.aws_access_key_id,
-                       aws_secret_access_key=config.aws_secret_access_key)
+    ec2 = utils.get_client('ec2', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
 
     master_id = get_master_server_id(stack_name, config)
 
@@ -290,9 +533,9 @@ def poll_master_server_state(stack_name, config):
     return state
 
 def get_master_server_ip(stack_name, config):
-    ec2 = boto3.client('ec2', region_name=config.region,
-                       aws_access_key_id=config.aws_access_key_id,
-                       aws_secret_access_key=config.aws_secret_access_key)
+    ec2 = utils.get_client('ec2', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
 
     master_id = get_master_server_id(stack_name, config)
 
@@ -303,7 +546,7 @@ def get_master_server_ip(stack_name, config):
         ip_address = instance.get('PublicIpAddress')
         state = instance.get('State').get('Name')
         if state != 'running' or ip_address is None:
-            logger.info("MasterServer: %s\nCannot get ip address." % state.upper)
+            logger.info("MasterServer: %s\nCannot get ip address." % state.upper())
             sys.exit(1)
         return ip_address
     except ClientError as e:
@@ -315,9 +558,9 @@ def get_master_server_ip(stack_name, config):
         sys.exit(0)
 
 def get_ec2_instances(stack, config):
-    cfn = boto3.client('cloudformation', region_name=config.region,
-                       aws_access_key_id=config.aws_access_key_id,
-                       aws_secret_access_key=config.aws_secret_access_key)
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
 
     try:
         resources = cfn.describe_stack_resources(StackName=stack).get('StackResources')
@@ -335,9 +578,9 @@ def get_ec2_instances(stack, config):
     return instances
 
 def get_asg_name(stack_name, config):
-    cfn = boto3.client('cloudformation', region_name=config.region,
-                       aws_access_key_id=config.aws_access_key_id,
-                       aws_secret_access_key=config.aws_secret_access_key)
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
     try:
         resources = cfn.describe_stack_resources(StackName=stack_name).get('StackResources')
         return [r for r in resources if r.get('LogicalResourceId') == 'ComputeFleet'][0].get('PhysicalResourceId')
@@ -350,21 +593,34 @@ def get_asg_name(stack_name, config):
         sys.exit(1)
 
 def set_asg_limits(asg_name, config, min, max, desired):
-    asg = boto3.client('autoscaling', region_name=config.region,
-                 aws_access_key_id=config.aws_access_key_id,
-                 aws_secret_access_key=config.aws_secret_access_key)
+    asg = utils.get_client('autoscaling', region_name=config.region,
+                     aws_access_key_id=config.aws_access_key_id,
+                     aws_secret_access_key=config.aws_secret_access_key)
 
     asg.update_auto_scaling_group(AutoScalingGroupName=asg_name, MinSize=min, MaxSize=max,
                                   DesiredCapacity=desired)
 
+def set_scheduled_actions(asg_name, config, enabled):
+    # suspends or resumes the scheduled actions of the ASG, e.g. the prewarm schedule, which would otherwise raise the
+    # min capacity of a stopped compute fleet above its max capacity of 0 and fail
+    asg = utils.get_client('autoscaling', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+
+    if enabled:
+        asg.resume_processes(AutoScalingGroupName=asg_name, ScalingProcesses=['ScheduledActions'])
+    else:
+        asg.suspend_processes(AutoScalingGroupName=asg_name, ScalingProcesses=['ScheduledActions'])
+
 def get_asg_instances(stack, config):
-    asg = boto3.client('autoscaling', region_name=config.region,
-                       aws_access_key_id=config.aws_access_key_id,
-                       aws_secret_access_key=config.aws_secret_access_key)
+    asg = utils.get_client('autoscaling', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
 
     asg_name = get_asg_name(stack, config)
     asg = asg.describe_auto_scaling_groups(AutoScalingGroupNames=[asg_name]).get('AutoScalingGroups')[0]
-    name = [tag.get('Value') for tag in asg.get('Tags') if tag.get('Key') == 'aws:cloudformation:logical-id'][0]
+    names = [tag.get('Value') for tag in asg.get('Tags') if tag.get('Key') == 'aws:cloudformation:logical-id']
+    name = names[0] if len(names) > 0 else 'ComputeFleet'
 
     temp_instances = []
     for instance in asg.get('Instances'):
@@ -390,6 +646,47 @@ def get_head_user(parameters, template):
     base_os =[i.get('ParameterValue') for i in parameters if i.get('ParameterKey') == "BaseOS"][0]
     return mappings.get(base_os).get("User")
 
+def get_ssh_target(stack, config):
+    # returns the user and the public ip address to connect to the master server of the stack
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    with tracing.span('stack_lookup'):
+        stack_result = cfn.describe_stacks(StackName=stack).get('Stacks')[0]
+    status = stack_result.get('StackStatus')
+    invalid_status = ['DELETE_COMPLETE', 'DELETE_IN_PROGRESS']
+    if status in invalid_status:
+        logger.info("Stack status: %s. Cannot SSH while in %s" % (status, ' or '.join(invalid_status)))
+        sys.exit(1)
+    with tracing.span('master_ip'):
+        ip = get_master_server_ip(stack, config)
+    parameters = dict((p.get('ParameterKey'), p.get('ParameterValue')) for p in stack_result.get('Parameters'))
+    username = None
+    # The index has the users of the default template of this version, only use it for the stacks recorded with it
+    if get_stack_template_url(stack_result) == cfnconfig.get_default_template_url(config.region, config.version):
+        username = ami_index.get_user(parameters.get('BaseOS'))
+    if username is None:
+        # Other or unknown template, or unknown base_os, read the user from the template the cluster was created with
+        with tracing.span('template_fetch'):
+            template = cfn.get_template(StackName=stack)
+        username = get_head_user(stack_result.get('Parameters'), template)
+    return username, ip
+
+def get_ssh_control_path(cluster_name, region):
+    # path of the OpenSSH control socket of the cluster, hashed to stay below the length limit of the unix sockets
+    control_dir = os.path.join(os.path.expanduser('~'), '.cfncluster', 'ssh')
+    try:
+        os.makedirs(control_dir, 0o700)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            raise
+    key = ('%s/%s' % (region, cluster_name)).encode('utf-8')
+    return os.path.join(control_dir, hashlib.sha1(key).hexdigest()[:20])
+
+def get_ssh_control_options(control_path, persist=SSH_CONTROL_PERSIST):
+    # ssh options sharing a single connection through the control socket, opened by the first command
+    return ['-o', 'ControlMaster=auto', '-o', 'ControlPath=%s' % control_path, '-o', 'ControlPersist=%s' % persist]
+
 def command(args, extra_args):
     stack = ('cfncluster-' + args.cluster_name)
     config = cfnconfig.CfnClusterConfig(args)
@@ -398,19 +695,8 @@ def command(args, extra_args):
     else:
         config_command = "ssh {CFN_USER}@{MASTER_IP} {ARGS}"
 
-    cfn = boto3.client('cloudformation', region_name=config.region,
-                       aws_access_key_id=config.aws_access_key_id,
-                       aws_secret_access_key=config.aws_secret_access_key)
     try:
-        status = cfn.describe_stacks(StackName=stack).get("Stacks")[0].get('StackStatus')
-        invalid_status = ['DELETE_COMPLETE', 'DELETE_IN_PROGRESS']
-        if status in invalid_status:
-            logger.info("Stack status: %s. Cannot SSH while in %s" % (status, ' or '.join(invalid_status)))
-            sys.exit(1)
-        ip = get_master_server_ip(stack, config)
-        stack_result = cfn.describe_stacks(StackName=stack).get('Stacks')[0]
-        template = cfn.get_template(StackName=stack)
-        username = get_head_user(stack_result.get('Parameters'), template)
+        username, ip = get_ssh_target(stack, config)
 
         try:
             from shlex import quote as cmd_quote
@@ -419,6 +705,12 @@ def command(args, extra_args):
 
         # build command
         cmd = config_command.format(CFN_USER=username, MASTER_IP=ip, ARGS=' '.join(cmd_quote(str(e)) for e in extra_args))
+        if getattr(args, 'persist', False):
+            if cmd.startswith('ssh '):
+                control_options = get_ssh_control_options(get_ssh_control_path(args.cluster_name, config.region))
+                cmd = 'ssh %s %s' % (' '.join(cmd_quote(o) for o in control_options), cmd[len('ssh '):])
+            else:
+                logger.warning('--persist only applies to ssh commands, ignoring it')
 
         # run command
         if not args.dryrun:
@@ -433,13 +725,52 @@ def command(args, extra_args):
         logger.info('\nExiting...')
         sys.exit(0)
 
+def ssh_control(args):
+    stack = ('cfncluster-' + args.cluster_name)
+    config = cfnconfig.CfnClusterConfig(args)
+    control_path = get_ssh_control_path(args.cluster_name, config.region)
+
+    if args.action == 'start':
+        try:
+            username, ip = get_ssh_target(stack, config)
+        except ClientError as e:
+            logger.critical(e.response.get('Error').get('Message'))
+            sys.stdout.flush()
+            sys.exit(1)
+        # the connection stays in background after the first command, reused by the next ones
+        cmd = ['ssh'] + get_ssh_control_options(control_path, args.persist_time) + ['%s@%s' % (username, ip), 'true']
+        logger.debug(' '.join(cmd))
+        if sub.call(cmd) != 0:
+            logger.critical('Failed to open the SSH connection to %s@%s' % (username, ip))
+            sys.exit(1)
+        logger.info('SSH connection to %s@%s open for %s seconds of inactivity' % (username, ip, args.persist_time))
+        logger.info('Control socket: %s' % control_path)
+    else:
+        # the control socket is found from its path, the host name is not used
+        running = False
+        if os.path.exists(control_path):
+            with open(os.devnull, 'w') as devnull:
+                running = sub.call(['ssh', '-O', 'check', '-o', 'ControlPath=%s' % control_path, stack],
+                                   stdout=devnull, stderr=devnull) == 0
+        if args.action == 'status':
+            logger.info('SSH connection: %s' % ('open' if running else 'closed'))
+            if running:
+                logger.info('Control socket: %s' % control_path)
+        elif running:
+            with open(os.devnull, 'w') as devnull:
+                sub.call(['ssh', '-O', 'exit', '-o', 'ControlPath=%s' % control_path, stack],
+                         stdout=devnull, stderr=devnull)
+            logger.info('SSH connection closed')
+        else:
+            logger.info('No SSH connection open to cluster %s' % args.cluster_name)
+
 def status(args):
     stack = ('cfncluster-' + args.cluster_name)
     config = cfnconfig.CfnClusterConfig(args)
 
-    cfn = boto3.client('cloudformation', region_name=config.region,
-                       aws_access_key_id=config.aws_access_key_id,
-                       aws_secret_access_key=config.aws_secret_access_key)
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
 
     try:
         status = cfn.describe_stacks(StackName=stack).get("Stacks")[0].get('StackStatus')
@@ -459,12 +790,7 @@ def status(args):
             if status in ['CREATE_COMPLETE', 'UPDATE_COMPLETE']:
                 state = poll_master_server_state(stack, config)
                 if state == 'running':
-                    outputs = cfn.describe_stacks(StackName=stack).get("Stacks")[0].get('Outputs', [])
-                    ganglia_enabled = is_ganglia_enabled(config.parameters)
-                    for output in outputs:
-                        if not ganglia_enabled and output.get('OutputKey').startswith('Ganglia'):
-                            continue
-                        logger.info("%s: %s" % (output.get('OutputKey'), output.get('OutputValue')))
+                    print_stack_outputs(stack, config)
             elif status in ['ROLLBACK_COMPLETE', 'CREATE_FAILED', 'DELETE_FAILED', 'UPDATE_ROLLBACK_COMPLETE']:
                 events = cfn.describe_stack_events(StackName=stack).get('StackEvents')
                 for event in events:
@@ -491,9 +817,9 @@ def delete(args):
 
     config = cfnconfig.CfnClusterConfig(args)
 
-    cfn = boto3.client('cloudformation', region_name=config.region,
-                       aws_access_key_id=config.aws_access_key_id,
-                       aws_secret_access_key=config.aws_secret_access_key)
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
 
     try:
         # delete_stack does not raise an exception if stack does not exist
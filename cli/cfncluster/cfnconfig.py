@@ -18,18 +18,23 @@ from builtins import object
 import configparser
 import os
 import sys
+import threading
 import inspect
 import pkg_resources
 import json
 import urllib.request, urllib.error, urllib.parse
 from . import config_sanity
-import boto3
+from . import ami_index
+from . import instance_index
+from . import utils
+from . import tracing
 from botocore.exceptions import ClientError
 
+@tracing.traced('config.stack_template')
 def getStackTemplate(region, aws_access_key_id, aws_secret_access_key, stack):
-    cfn = boto3.client('cloudformation', region_name=region,
-                       aws_access_key_id=aws_access_key_id,
-                       aws_secret_access_key=aws_secret_access_key)
+    cfn = utils.get_client('cloudformation', region_name=region,
+                           aws_access_key_id=aws_access_key_id,
+                           aws_secret_access_key=aws_secret_access_key)
     __stack_name = ('cfncluster-' + stack)
 
     try:
@@ -42,8 +47,97 @@ def getStackTemplate(region, aws_access_key_id, aws_secret_access_key, stack):
 
     return __cli_template
 
+def get_default_template_url(region, version):
+    # returns the URL of the template published for the cfncluster version in the region
+    if region == 'us-gov-west-1':
+        return ('https://s3-%s.amazonaws.com/%s-cfncluster/templates/cfncluster-%s.cfn.json'
+                % (region, region, version))
+    return ('https://s3.amazonaws.com/%s-cfncluster/templates/cfncluster-%s.cfn.json' % (region, version))
+
+# Types of the sections that can inherit the options they do not set from another section of the same type, with
+# inherit = <name>
+INHERIT_SECTIONS = ('cluster', 'vpc', 'ebs', 'scaling')
+
+# (path, mtime, size) -> (config, origins) of the config files already read and resolved in this process, shared by
+# all the threads: the callers of read_config must not modify them. Nothing is cached across processes.
+_resolved_configs = {}
+_resolved_configs_lock = threading.Lock()
+
+def _own_options(config, section):
+    # returns the options set in the section, not the ones it only gets from [DEFAULT]
+    defaults = config.defaults()
+    return [key for key, value in config.items(section, raw=True) if key not in defaults or defaults[key] != value]
+
+def _resolve_section(config, section, origins, stack):
+    # copies the options inherited by the section, resolving its parents first, and records the section each option
+    # comes from in origins
+    if section in origins:
+        return
+    if section in stack:
+        print("ERROR: inherit cycle %s"
+              % ' -> '.join('[%s]' % s for s in stack[stack.index(section):] + (section,)))
+        sys.exit(1)
+    section_origins = dict((key, section) for key in _own_options(config, section))
+    section_type = section.split(' ')[0]
+    if section_type in INHERIT_SECTIONS and config.has_option(section, 'inherit'):
+        inherit = config.get(section, 'inherit', raw=True).strip()
+        if not inherit:
+            print("ERROR: inherit defined but not set in [%s] section" % section)
+            sys.exit(1)
+        parent = ('%s %s' % (section_type, inherit))
+        if not config.has_section(parent):
+            print("ERROR: Section [%s] inherited by [%s] section is not defined" % (parent, section))
+            sys.exit(1)
+        _resolve_section(config, parent, origins, stack + (section,))
+        for key in _own_options(config, parent):
+            if key not in section_origins:
+                config.set(section, key, config.get(parent, key, raw=True))
+                section_origins[key] = origins[parent][key]
+        config.remove_option(section, 'inherit')
+        del section_origins['inherit']
+    origins[section] = section_origins
+
+@tracing.traced('config.read')
+def read_config(config_file):
+    # returns the parsed config file, with the inherited options of its sections resolved, and section -> option ->
+    # section the option comes from. Each version of a file is read and resolved once per process, the result is
+    # shared with the other callers and must not be modified.
+    path = os.path.abspath(config_file)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime, stat.st_size)
+    with _resolved_configs_lock:
+        if key not in _resolved_configs:
+            config = configparser.ConfigParser()
+            config.read(path)
+            if 'inherit' in config.defaults():
+                print("ERROR: inherit cannot be set in [DEFAULT] section")
+                sys.exit(1)
+            origins = {}
+            for section in config.sections():
+                _resolve_section(config, section, origins, ())
+            _resolved_configs[key] = (config, origins)
+        return _resolved_configs[key]
+
+def clear_configs():
+    # drops the config files already read, e.g. to time reading them again
+    with _resolved_configs_lock:
+        _resolved_configs.clear()
+
+def format_section(config, origins, section):
+    # returns the resolved section in the config file format, the inherited options commented with their section
+    lines = ['[%s]' % section]
+    for key, value in config.items(section, raw=True):
+        if key not in origins.get(section, {}):
+            continue
+        line = '%s = %s' % (key, value.replace('\n', '\n\t'))
+        if origins[section][key] != section:
+            line += '  # from [%s]' % origins[section][key]
+        lines.append(line)
+    return '\n'.join(lines)
+
 class CfnClusterConfig(object):
 
+    @tracing.traced('config')
     def __init__(self, args):
         self.args = args
         self.parameters = []
@@ -71,8 +165,7 @@ class CfnClusterConfig(object):
                 sys.exit(1)
 
 
-        __config = configparser.ConfigParser()
-        __config.read(self.__config_file)
+        __config = read_config(self.__config_file)[0]
 
         # Determine the EC2 region to used used or default to us-east-1
         # Order is 1) CLI arg 2) AWS_DEFAULT_REGION env 3) Config file 4) us-east-1
@@ -162,6 +255,7 @@ class CfnClusterConfig(object):
 
         # Determine the CloudFormation URL to be used
         # Order is 1) CLI arg 2) Config file 3) default for version + region
+        self.__custom_template_url = True
         try:
             if args.template_url is not None:
                 self.template_url = args.template_url
@@ -176,12 +270,8 @@ class CfnClusterConfig(object):
                         config_sanity.check_resource(self.region, self.aws_access_key_id, self.aws_secret_access_key,
                                                      'URL', self.template_url)
                 except configparser.NoOptionError:
-                    if self.region == 'us-gov-west-1':
-                        self.template_url = ('https://s3-%s.amazonaws.com/%s-cfncluster/templates/cfncluster-%s.cfn.json'
-                                             % (self.region, self.region, self.version))
-                    else:
-                        self.template_url = ('https://s3.amazonaws.com/%s-cfncluster/templates/cfncluster-%s.cfn.json'
-                                             % (self.region, self.version))
+                    self.__custom_template_url = False
+                    self.template_url = get_default_template_url(self.region, self.version)
         except AttributeError:
             pass
 
@@ -252,6 +342,57 @@ class CfnClusterConfig(object):
             except configparser.NoOptionError:
                 pass
 
+        # Determine the AMI used by the cluster, validating base_os against the AMIs published for the region.
+        # The lookup uses the AMI index generated from the template, so it only applies to the default template.
+        __parameters = dict(self.parameters)
+        __base_os = __parameters.get('BaseOS', 'alinux')
+        if 'CustomAMI' in __parameters:
+            self.ami_id = __parameters.get('CustomAMI')
+        else:
+            self.ami_id = ami_index.get_ami(self.region, __base_os)
+            if self.ami_id is None and (__args_func == 'create' or __args_func == 'update') \
+                    and self.region in ami_index.AMIS and not self.__custom_template_url:
+                print("ERROR: base_os %s in [%s] section is not available in region %s"
+                      % (__base_os, self.__cluster_section, self.region))
+                sys.exit(1)
+
+        # Validate the instance types against the instance type index, offline. The instance types missing from the
+        # index, e.g. released after it was generated, and the regions missing from it are not validated. The index
+        # is not verified against recorded API output yet, so its findings are warnings.
+        if __args_func == 'create' or __args_func == 'update':
+            __placement_group = __parameters.get('PlacementGroup', 'NONE') != 'NONE'
+            for __key, __parameter in [('master_instance_type', 'MasterInstanceType'),
+                                       ('compute_instance_type', 'ComputeInstanceType')]:
+                __instance_type = __parameters.get(__parameter, 't2.micro')
+                __capabilities = instance_index.get_instance_type(__instance_type)
+                if __capabilities is None:
+                    print("warning: %s %s in [%s] section is not in the instance type index (generated %s), "
+                          "it is not validated" % (__key, __instance_type, self.__cluster_section,
+                                                   instance_index.GENERATED))
+                    continue
+                if instance_index.is_offered(__instance_type, self.region) is False:
+                    print("warning: %s %s in [%s] section is not offered in region %s according to the instance "
+                          "type index (generated %s)" % (__key, __instance_type, self.__cluster_section, self.region,
+                                                         instance_index.GENERATED))
+                # the master server is in the placement group too with the placement = cluster default
+                __in_placement_group = __placement_group and (__parameter == 'ComputeInstanceType'
+                                                              or __parameters.get('Placement', 'cluster') == 'cluster')
+                if __in_placement_group and not __capabilities['placement_group']:
+                    print("warning: %s %s in [%s] section does not support cluster placement groups according to "
+                          "the instance type index, see placement_group" % (__key, __instance_type,
+                                                                           self.__cluster_section))
+                if __parameter == 'MasterInstanceType' and __capabilities['ebs_optimized'] == 'unsupported' \
+                        and __instance_type not in instance_index.TEMPLATE_NOT_EBS_OPTIMIZED \
+                        and not self.__custom_template_url:
+                    print("warning: %s %s in [%s] section does not support EBS optimization according to the "
+                          "instance type index, the template launches it EBS optimized"
+                          % (__key, __instance_type, self.__cluster_section))
+                if __parameter == 'ComputeInstanceType' and __capabilities['instance_storage'] == 0 \
+                        and (__parameters.get('EncryptedEphemeral') == 'true' or 'EphemeralDir' in __parameters):
+                    print("warning: %s %s in [%s] section has no instance store volume, ephemeral_dir and "
+                          "encrypted_ephemeral have no effect" % (__key, __instance_type,
+                                                                         self.__cluster_section))
+
         # Merge tags from config with tags from command line args
         # Command line args take precedent and overwite tags supplied in the config
         self.tags = {}
@@ -267,6 +408,15 @@ class CfnClusterConfig(object):
         except AttributeError:
             pass
 
+        # Number of stopped clusters to keep in the pool for this cluster template
+        try:
+            self.pool_size = __config.getint(self.__cluster_section, 'pool_size')
+        except configparser.NoOptionError:
+            self.pool_size = 0
+        except ValueError:
+            print("ERROR: pool_size must be an integer in [%s] section" % self.__cluster_section)
+            sys.exit(1)
+
         # Determine if EBS settings are defined and set section
         try:
             self.__ebs_settings = __config.get(self.__cluster_section, 'ebs_settings')
@@ -335,6 +485,38 @@ class CfnClusterConfig(object):
         except AttributeError:
             pass
 
+        # Determine if prewarm settings are defined, see cfncluster prewarm
+        self.prewarm = None
+        try:
+            self.__prewarm_settings = __config.get(self.__cluster_section, 'prewarm_settings')
+            if not self.__prewarm_settings:
+                print("ERROR: prewarm_settings defined but not set in [%s] section"
+                                                % self.__cluster_section)
+                sys.exit(1)
+            self.__prewarm_section = ('prewarm %s' % self.__prewarm_settings)
+            self.prewarm = {}
+            for key in ['start', 'end', 'size']:
+                try:
+                    self.prewarm[key] = __config.get(self.__prewarm_section, key)
+                except configparser.NoOptionError:
+                    print("ERROR: %s not set in [%s] section" % (key, self.__prewarm_section))
+                    sys.exit(1)
+                except configparser.NoSectionError:
+                    print("ERROR: [%s] section not found" % self.__prewarm_section)
+                    sys.exit(1)
+            for key in ['start', 'end']:
+                if len(self.prewarm[key].split()) != 5:
+                    print("ERROR: %s must be a cron expression with 5 fields in [%s] section"
+                                                % (key, self.__prewarm_section))
+                    sys.exit(1)
+            try:
+                self.prewarm['size'] = int(self.prewarm['size'])
+            except ValueError:
+                print("ERROR: size must be an integer in [%s] section" % self.__prewarm_section)
+                sys.exit(1)
+        except configparser.NoOptionError:
+            pass
+
         # handle aliases
         self.aliases = {}
         self.__alias_section = 'aliases'
@@ -20,9 +20,22 @@ import errno
 
 from . import cfncluster
 from . import easyconfig
+from . import pool
+from . import remote
+from . import scaling_report
+from . import prewarm
+from . import db
+from . import sqs
+from . import logs
+from . import spot_advisor
+from . import apistats
+from . import tracing
 
 def create(args):
-    cfncluster.create(args)
+    if args.from_pool:
+        pool.claim(args)
+    else:
+        cfncluster.create(args)
 
 def configure(args):
     easyconfig.configure(args)
@@ -30,6 +43,34 @@ def configure(args):
 def command(args, extra_args):
     cfncluster.command(args, extra_args)
 
+def execute(args, extra_args):
+    remote.execute(args, extra_args)
+
+def scaling_report_command(args):
+    scaling_report.scaling_report(args)
+
+def prewarm_command(args):
+    prewarm.prewarm(args)
+
+def db_command(args):
+    if args.action == 'dump':
+        db.dump(args)
+
+def queue_command(args):
+    sqs.queue(args)
+
+def logs_command(args):
+    logs.logs(args)
+
+def spot_advisor_command(args):
+    spot_advisor.spot_advisor(args)
+
+def show_config(args):
+    cfncluster.show_config(args)
+
+def ssh_control(args):
+    cfncluster.ssh_control(args)
+
 def status(args):
     cfncluster.status(args)
 
@@ -54,6 +95,17 @@ def start(args):
 def stop(args):
     cfncluster.stop(args)
 
+def scale(args):
+    cfncluster.scale(args)
+
+def pool_command(args):
+    if args.action == 'fill':
+        pool.fill(args)
+    elif args.action == 'list':
+        pool.list_pool(args)
+    elif args.action == 'drain':
+        pool.drain(args)
+
 def config_logger():
     logger = logging.getLogger('cfncluster.cfncluster')
     logger.setLevel(logging.DEBUG)
@@ -85,8 +137,44 @@ def addarg_nowait(subparser):
     subparser.add_argument( "--nowait", "-nw", dest="nowait", action='store_true',
                     help='do not wait for stack events, after executing stack command')
 
+def addarg_wait(subparser):
+    subparser.add_argument("--wait", "-w", dest="wait", action='store_true',
+                           help='wait for the compute fleet to reach the requested capacity')
+    subparser.add_argument("--timeout", type=int, dest="timeout", default=1800,
+                           help='seconds to wait for the compute fleet capacity, defaults to 1800')
+
+def positive_int(value):
+    # argparse type of the options that must be at least 1
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError('%s is not a positive integer' % value)
+    return number
+
+def addarg_api_stats(subparser):
+    subparser.add_argument("--api-stats", dest="api_stats", action='store_true', default=False,
+                           help='print the AWS API calls made by the command')
+    subparser.add_argument("--api-stats-format", dest="api_stats_format", choices=['table', 'json'],
+                           default='table', help='format of --api-stats, defaults to table')
+
+def addarg_trace(subparser):
+    subparser.add_argument("--trace", dest="trace", metavar="FILE", default=None,
+                           help='write a trace of the command phases and AWS API calls to FILE, '
+                                'in the Chrome trace event format')
+
+def print_api_stats(args):
+    logger = logging.getLogger('cfncluster.cfncluster')
+    stats = apistats.summary()
+    logger.debug('AWS API calls:\n%s' % apistats.format_table(stats))
+    if not getattr(args, 'api_stats', False):
+        return
+    if getattr(args, 'api_stats_format', 'table') == 'json':
+        sys.stderr.write(apistats.format_json(stats) + '\n')
+    else:
+        sys.stderr.write(apistats.format_table(stats) + '\n')
+
 def main():
     config_logger()
+    apistats.install()
 
     logger = logging.getLogger('cfncluster.cfncluster')
     logger.debug("CfnCluster cli starting")
@@ -113,6 +201,11 @@ def main():
                          help='add extra parameters to stack create')
     pcreate.add_argument("--tags", "-g", type=json.loads, dest="tags", default=None,
                          help='tags to be added to the stack')
+    pcreate.add_argument("--from-pool", action='store_true', dest="from_pool", default=False,
+                         help='claim a stopped cluster from the pool of the cluster template')
+    pcreate.add_argument("--spot-advisor", action='store_true', dest="spot_advisor", default=False,
+                         help='check the spot_price and the availability zone of a spot cluster against the spot '
+                              'price history before creating it')
     pcreate.set_defaults(func=create)
 
     pupdate = subparsers.add_parser('update', help='update a running cluster')
@@ -146,6 +239,7 @@ def main():
                         help='starts the compute fleet of the provided cluster name.')
     addarg_config(pstart)
     addarg_region(pstart)
+    addarg_wait(pstart)
     pstart.set_defaults(func=start)
 
     pstop = subparsers.add_parser('stop', help='stop the compute fleet, but leave the master server running for '
@@ -154,8 +248,19 @@ def main():
                         help='stops the compute fleet of the provided cluster name.')
     addarg_config(pstop)
     addarg_region(pstop)
+    addarg_wait(pstop)
     pstop.set_defaults(func=stop)
 
+    pscale = subparsers.add_parser('scale', help='set the desired capacity of the compute fleet')
+    pscale.add_argument("cluster_name", type=str, default=None,
+                        help='scales the compute fleet of the provided cluster name.')
+    pscale.add_argument("capacity", type=int, default=None,
+                        help='number of compute nodes requested.')
+    addarg_config(pscale)
+    addarg_region(pscale)
+    addarg_wait(pscale)
+    pscale.set_defaults(func=scale)
+
     pstatus = subparsers.add_parser('status', help='pull the current status of the cluster')
     pstatus.add_argument("cluster_name", type=str, default=None,
                         help='show the status of cfncluster with the provided name.')
@@ -184,22 +289,209 @@ def main():
                         help='name of the cluster to set variables for.')
     pssh.add_argument("--dryrun", "-d", action='store_true', dest="dryrun", default=False,
                          help='print command and exit.')
+    pssh.add_argument("--persist", action='store_true', dest="persist", default=False,
+                      help='share a persistent connection with the next ssh commands to the cluster')
     pssh.set_defaults(func=command)
 
+    pexec = subparsers.add_parser('exec', help='run a command on the nodes of the cluster',
+                                  description='run a command on every running compute node, through the master '
+                                              'server, e.g. "cfncluster exec mycluster -- df -h /scratch".')
+    pexec.add_argument("cluster_name", type=str, default=None,
+                       help='name of the cluster to run the command on.')
+    addarg_config(pexec)
+    addarg_region(pexec)
+    pexecnodes = pexec.add_mutually_exclusive_group()
+    pexecnodes.add_argument("--compute", action='store_false', dest="all", default=False,
+                            help='run the command on the compute nodes only (default)')
+    pexecnodes.add_argument("--all", action='store_true', dest="all", default=False,
+                            help='run the command on the master server too')
+    pexec.add_argument("--parallelism", "-n", type=positive_int, dest="parallelism",
+                       default=remote.DEFAULT_PARALLELISM,
+                       help='number of nodes running the command at the same time, defaults to %d'
+                            % remote.DEFAULT_PARALLELISM)
+    pexec.add_argument("--timeout", "-t", type=int, dest="timeout", default=None,
+                       help='seconds after which the command is killed on a node')
+    pexec.add_argument("--identity-file", "-i", type=str, dest="identity_file", default=None,
+                       help='private key for the connections to the master server and the nodes')
+    pexec.add_argument("--json", action='store_true', dest="json", default=False,
+                       help='print the exit code and the output of every node as JSON')
+    pexec.add_argument("--dryrun", "-d", action='store_true', dest="dryrun", default=False,
+                       help='print the ssh command of every node and exit.')
+    pexec.set_defaults(func=execute)
+
+    psshcontrol = subparsers.add_parser('ssh-control', help='manage the persistent SSH connection to the master server',
+                                        description='open, close or check the persistent connection shared by '
+                                                    '"cfncluster ssh --persist" and the other ssh commands to the cluster.')
+    psshcontrol.add_argument("action", choices=['start', 'stop', 'status'],
+                             help='open the connection, close it or check whether it is open')
+    psshcontrol.add_argument("cluster_name", type=str, default=None,
+                             help='name of the cluster to connect to.')
+    addarg_config(psshcontrol)
+    addarg_region(psshcontrol)
+    psshcontrol.add_argument("--persist-time", type=int, dest="persist_time", default=cfncluster.SSH_CONTROL_PERSIST,
+                             help='seconds the idle connection is kept open, defaults to %d' % cfncluster.SSH_CONTROL_PERSIST)
+    psshcontrol.set_defaults(func=ssh_control)
+
+    pscalingreport = subparsers.add_parser('scaling-report', help='report the scaling latencies of the compute fleet',
+                                           description='report the scale-up latencies, the node lifetimes and the '
+                                                       'idle node-hours from the scaling activities of the ComputeFleet '
+                                                       'of the cluster, kept 6 weeks.')
+    pscalingreport.add_argument("cluster_name", type=str, default=None,
+                                help='name of the cluster to report on.')
+    addarg_config(pscalingreport)
+    addarg_region(pscalingreport)
+    pscalingreport.add_argument("--format", "-f", dest="format", choices=['table', 'json', 'csv'], default='table',
+                                help='summary table (default), JSON with the nodes and the capacity over time, '
+                                     'or CSV with a row per node')
+    pscalingreport.add_argument("--bucket-size", type=int, dest="bucket_size", default=60,
+                                help='seconds per bucket of the scale-up latency histogram, defaults to 60')
+    pscalingreport.set_defaults(func=scaling_report_command)
+
+    pprewarm = subparsers.add_parser('prewarm', help='schedule the pre-warming of the compute fleet',
+                                     description='raise the min and desired capacity of the compute fleet ahead of '
+                                                 'known demand peaks with scheduled actions, from the prewarm section '
+                                                 'of the cluster or from its scaling history.')
+    pprewarm.add_argument("action", choices=['apply', 'show', 'clear'],
+                          help='create the scheduled actions, show them or delete them')
+    pprewarm.add_argument("cluster_name", type=str, default=None,
+                          help='name of the cluster to pre-warm.')
+    addarg_config(pprewarm)
+    addarg_region(pprewarm)
+    pprewarm.add_argument("--from-history", action='store_true', dest="from_history", default=False,
+                          help='derive the schedule from the scaling activities of the last 6 weeks')
+    pprewarm.add_argument("--lead-time", type=int, dest="lead_time", default=15,
+                          help='minutes between the pre-warming and the usual first launch of the day, '
+                               'with --from-history, defaults to 15')
+    pprewarm.set_defaults(func=prewarm_command)
+
+    pdb = subparsers.add_parser('db', help='export the instance table of the cluster',
+                                description='dump the DynamoDB table where the node daemons track the compute '
+                                            'instances, one JSON object per line.')
+    pdb.add_argument("action", choices=['dump'],
+                     help='scan the table and write its items as JSON lines')
+    pdb.add_argument("cluster_name", type=str, default=None,
+                     help='name of the cluster to export.')
+    addarg_config(pdb)
+    addarg_region(pdb)
+    pdb.add_argument("--segments", type=int, dest="segments", default=db.DEFAULT_SEGMENTS,
+                     help='number of segments scanned in parallel, defaults to %d' % db.DEFAULT_SEGMENTS)
+    pdb.add_argument("--stale", action='store_true', dest="stale", default=False,
+                     help='flag with "%s" the items whose instance is not in the ComputeFleet' % db.STALE_KEY)
+    pdb.add_argument("--output", "-o", type=str, dest="output", default=None,
+                     help='file to write the items to, defaults to the standard output')
+    pdb.set_defaults(func=db_command)
+
+    pqueue = subparsers.add_parser('queue', help='inspect and replay the scaling notifications queue of the cluster',
+                                   description='inspect the SQS queue where the ComputeFleet notifications are '
+                                               'delivered to the sqswatcher, and send messages back to it.')
+    pqueue.add_argument("action", choices=['stats', 'peek', 'replay'],
+                        help='stats: message counts and age of the oldest message, '
+                             'peek: print messages as JSON lines without consuming them, '
+                             'replay: send messages back to the queue in batches')
+    pqueue.add_argument("cluster_name", type=str, default=None,
+                        help='name of the cluster.')
+    addarg_config(pqueue)
+    addarg_region(pqueue)
+    pqueue.add_argument("--json", action='store_true', dest="json", default=False,
+                        help='print the stats as JSON')
+    pqueue.add_argument("--count", "-n", type=int, dest="count", default=None,
+                        help='maximum number of messages to peek (default %d) or to replay (default all)'
+                             % sqs.BATCH_SIZE)
+    pqueue.add_argument("--wait-time", type=int, dest="wait_time", default=sqs.DEFAULT_WAIT_TIME,
+                        help='long polling time in seconds of each peek batch, 0 to 20, defaults to %d'
+                             % sqs.DEFAULT_WAIT_TIME)
+    pqueue.add_argument("--output", "-o", type=str, dest="output", default=None,
+                        help='file to write the peeked messages to, defaults to the standard output')
+    pqueue.add_argument("--file", "-f", type=str, dest="file", default=None,
+                        help='replay the messages of a file written by peek')
+    pqueue.add_argument("--source-queue", type=str, dest="source_queue", default=None,
+                        help='replay by moving the messages of this queue, name or URL, e.g. a dead-letter queue')
+    pqueue.set_defaults(func=queue_command)
+
+    plogs = subparsers.add_parser('logs', help='print the logs of the cluster from its CloudWatch Logs group',
+                                  description='print the events of the CloudWatch Logs group of the cluster '
+                                              '(cwl_log_group), merged by timestamp across the log streams.')
+    plogs.add_argument("cluster_name", type=str, default=None,
+                       help='name of the cluster.')
+    addarg_config(plogs)
+    addarg_region(plogs)
+    plogs.add_argument("--follow", "-f", action='store_true', dest="follow", default=False,
+                       help='keep printing the new events, every %d seconds' % logs.FOLLOW_INTERVAL)
+    plogs.add_argument("--filter", type=str, dest="filter", default=None,
+                       help='CloudWatch Logs filter pattern of the events to print')
+    plogs.add_argument("--node", type=str, dest="node", default=None,
+                       help='print only the log streams whose name contains NODE, e.g. an instance id')
+    plogs.add_argument("--since", type=int, dest="since", default=60,
+                       help='print the events of the last SINCE minutes, 0 for all, defaults to 60')
+    plogs.add_argument("--parallelism", "-n", type=int, dest="parallelism", default=logs.DEFAULT_PARALLELISM,
+                       help='number of log streams read at the same time, defaults to %d' % logs.DEFAULT_PARALLELISM)
+    plogs.set_defaults(func=logs_command)
+
+    pspot = subparsers.add_parser('spot-advisor', help='recommend a subnet and a spot_price for the compute fleet',
+                                  description='rank the availability zones of the VPC of a cluster template by the '
+                                              'spot price history of the compute instance type, and recommend the '
+                                              'compute subnet and the bid of the cheapest and most stable one.')
+    addarg_config(pspot)
+    addarg_region(pspot)
+    pspot.add_argument("--cluster-template", "-t", type=str, dest="cluster_template", default=None,
+                       help='specify a specific cluster template to use')
+    pspot.add_argument("--instance-type", "-i", type=str, dest="instance_type", default=None,
+                       help='instance type to advise for, defaults to the compute_instance_type of the template')
+    pspot.add_argument("--hours", type=int, dest="hours", default=spot_advisor.DEFAULT_HOURS,
+                       help='hours of spot price history, defaults to %d' % spot_advisor.DEFAULT_HOURS)
+    pspot.add_argument("--refresh", action='store_true', dest="refresh", default=False,
+                       help='fetch the spot price history even if it is cached')
+    pspot.add_argument("--json", action='store_true', dest="json", default=False,
+                       help='print the advice as JSON')
+    pspot.set_defaults(func=spot_advisor_command)
+
+    ppool = subparsers.add_parser('pool', help='manage the pool of stopped clusters of a cluster template')
+    ppool.add_argument("action", choices=['fill', 'list', 'drain'],
+                       help='fill the pool up to its size, list its clusters or delete its unclaimed clusters')
+    addarg_config(ppool)
+    addarg_region(ppool)
+    ppool.add_argument("--cluster-template", "-t", type=str, dest="cluster_template", default=None,
+                       help='specify a specific cluster template to use')
+    ppool.add_argument("--template-url", "-u", type=str, dest="template_url", default=None,
+                       help='specify a URL for a custom cloudformation template')
+    ppool.add_argument("--extra-parameters", "-p", type=json.loads, dest="extra_parameters", default=None,
+                       help='add extra parameters to stack create')
+    ppool.add_argument("--size", "-s", type=int, dest="size", default=None,
+                       help='number of clusters to keep in the pool, overrides pool_size')
+    ppool.set_defaults(func=pool_command)
+
     pconfigure = subparsers.add_parser('configure', help='creating initial cfncluster configuration')
     addarg_config(pconfigure)
     pconfigure.set_defaults(func=configure)
 
+    pshowconfig = subparsers.add_parser('show-config', help='display a cluster template with its inherited options resolved')
+    addarg_config(pshowconfig)
+    pshowconfig.add_argument("--cluster-template", "-t", type=str, dest="cluster_template", default=None,
+                             help='specify a specific cluster template to show')
+    pshowconfig.set_defaults(func=show_config)
+
     pversion = subparsers.add_parser('version', help='display version of cfncluster')
     pversion.set_defaults(func=version)
 
+    for subparser in subparsers.choices.values():
+        addarg_api_stats(subparser)
+        addarg_trace(subparser)
+
     args, extra_args = parser.parse_known_args()
     logger.debug(args)
-    if args.func.__name__ == 'command':
-        args.func(args, extra_args)
-    else:
-        if extra_args != []:
-            parser.print_usage()
-            print('Invalid arguments %s...' % extra_args)
-            sys.exit(1)
-        args.func(args)
+    trace_file = getattr(args, 'trace', None) or os.environ.get(tracing.ENV_VAR)
+    if trace_file:
+        tracing.enable(trace_file)
+    try:
+        with tracing.span('cfncluster %s' % args.func.__name__):
+            if args.func.__name__ in ['command', 'execute']:
+                args.func(args, extra_args)
+            else:
+                if extra_args != []:
+                    parser.print_usage()
+                    print('Invalid arguments %s...' % extra_args)
+                    sys.exit(1)
+                args.func(args)
+    finally:
+        print_api_stats(args)
+        tracing.write()
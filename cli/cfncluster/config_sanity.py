@@ -14,35 +14,41 @@ from future import standard_library
 standard_library.install_aliases()
 __author__ = 'dougalb'
 
-import boto3
 import urllib.request, urllib.error, urllib.parse
 from urllib.parse import urlparse
 import sys
 from botocore.exceptions import ClientError
 
-def check_resource(region, aws_access_key_id, aws_secret_access_key, resource_type,resource_value):
+from . import utils
+from . import tracing
+
+def check_resource(region, aws_access_key_id, aws_secret_access_key, resource_type, resource_value):
+    with tracing.span('sanity', resource_type=resource_type):
+        _check_resource(region, aws_access_key_id, aws_secret_access_key, resource_type, resource_value)
+
+def _check_resource(region, aws_access_key_id, aws_secret_access_key, resource_type,resource_value):
 
     # Loop over all supported resource checks
     # EC2 KeyPair
     if resource_type == 'EC2KeyPair':
         try:
-            ec2 = boto3.client('ec2', region_name=region,
-                                        aws_access_key_id=aws_access_key_id,
-                                        aws_secret_access_key=aws_secret_access_key)
+            ec2 = utils.get_client('ec2', region_name=region,
+                                            aws_access_key_id=aws_access_key_id,
+                                            aws_secret_access_key=aws_secret_access_key)
             test = ec2.describe_key_pairs(KeyNames=[resource_value])
         except ClientError as e:
             print('Config sanity error: %s' % e.response.get('Error').get('Message'))
             sys.exit(1)
     if resource_type == 'EC2IAMRoleName':
         try:
-            iam = boto3.client('iam', region_name=region,
-                                aws_access_key_id=aws_access_key_id,
-                                aws_secret_access_key=aws_secret_access_key)
+            iam = utils.get_client('iam', region_name=region,
+                                    aws_access_key_id=aws_access_key_id,
+                                    aws_secret_access_key=aws_secret_access_key)
 
             arn = iam.get_role(RoleName=resource_value).get('Role').get('Arn')
-            accountid = boto3.client('sts', region_name=region,
-                                        aws_access_key_id=aws_access_key_id,
-                                        aws_secret_access_key=aws_secret_access_key).get_caller_identity().get('Account')
+            accountid = utils.get_client('sts', region_name=region,
+                                            aws_access_key_id=aws_access_key_id,
+                                            aws_secret_access_key=aws_secret_access_key).get_caller_identity().get('Account')
 
             iam_policy = [(['ec2:DescribeVolumes', 'ec2:AttachVolume', 'ec2:DescribeInstanceAttribute', 'ec2:DescribeInstanceStatus', 'ec2:DescribeInstances'], "*"),
                         (['dynamodb:ListTables'], "*"),
@@ -68,9 +74,9 @@ def check_resource(region, aws_access_key_id, aws_secret_access_key, resource_ty
     elif resource_type == 'VPC':
         try:
 
-            ec2 = boto3.client('ec2', region_name=region,
-                                        aws_access_key_id=aws_access_key_id,
-                                        aws_secret_access_key=aws_secret_access_key)
+            ec2 = utils.get_client('ec2', region_name=region,
+                                            aws_access_key_id=aws_access_key_id,
+                                            aws_secret_access_key=aws_secret_access_key)
             test = ec2.describe_vpcs(VpcIds=[resource_value])
         except ClientError as e:
             print('Config sanity error: %s' % e.response.get('Error').get('Message'))
@@ -87,9 +93,9 @@ def check_resource(region, aws_access_key_id, aws_secret_access_key, resource_ty
     # VPC Subnet Id
     elif resource_type == 'VPCSubnet':
         try:
-            ec2 = boto3.client('ec2', region_name=region,
-                                        aws_access_key_id=aws_access_key_id,
-                                        aws_secret_access_key=aws_secret_access_key)
+            ec2 = utils.get_client('ec2', region_name=region,
+                                            aws_access_key_id=aws_access_key_id,
+                                            aws_secret_access_key=aws_secret_access_key)
             test = ec2.describe_subnets(SubnetIds=[resource_value])
         except ClientError as e:
             print('Config sanity error: %s' % e.response.get('Error').get('Message'))
@@ -97,9 +103,9 @@ def check_resource(region, aws_access_key_id, aws_secret_access_key, resource_ty
     # VPC Security Group
     elif resource_type == 'VPCSecurityGroup':
         try:
-            ec2 = boto3.client('ec2', region_name=region,
-                               aws_access_key_id=aws_access_key_id,
-                               aws_secret_access_key=aws_secret_access_key)
+            ec2 = utils.get_client('ec2', region_name=region,
+                                   aws_access_key_id=aws_access_key_id,
+                                   aws_secret_access_key=aws_secret_access_key)
             test = ec2.describe_security_groups(GroupIds=[resource_value])
         except ClientError as e:
             print('Config sanity error: %s' % e.response.get('Error').get('Message'))
@@ -107,9 +113,9 @@ def check_resource(region, aws_access_key_id, aws_secret_access_key, resource_ty
     # EC2 AMI Id
     elif resource_type == 'EC2Ami':
         try:
-            ec2 = boto3.client('ec2', region_name=region,
-                               aws_access_key_id=aws_access_key_id,
-                               aws_secret_access_key=aws_secret_access_key)
+            ec2 = utils.get_client('ec2', region_name=region,
+                                   aws_access_key_id=aws_access_key_id,
+                                   aws_secret_access_key=aws_secret_access_key)
             test = ec2.describe_images(ImageIds=[resource_value])
         except ClientError as e:
             print('Config sanity error: %s' % e.response.get('Error').get('Message'))
@@ -120,9 +126,9 @@ def check_resource(region, aws_access_key_id, aws_secret_access_key, resource_ty
             pass
         else:
             try:
-                ec2 = boto3.client('ec2', region_name=region,
-                                   aws_access_key_id=aws_access_key_id,
-                                   aws_secret_access_key=aws_secret_access_key)
+                ec2 = utils.get_client('ec2', region_name=region,
+                                       aws_access_key_id=aws_access_key_id,
+                                       aws_secret_access_key=aws_secret_access_key)
                 test = ec2.describe_placement_groups(GroupNames=[resource_value])
             except ClientError as e:
                 print('Config sanity error: %s' % e.response.get('Error').get('Message'))
@@ -144,9 +150,9 @@ def check_resource(region, aws_access_key_id, aws_secret_access_key, resource_ty
     # EC2 EBS Snapshot Id
     elif resource_type == 'EC2Snapshot':
         try:
-            ec2 = boto3.client('ec2', region_name=region,
-                               aws_access_key_id=aws_access_key_id,
-                               aws_secret_access_key=aws_secret_access_key)
+            ec2 = utils.get_client('ec2', region_name=region,
+                                   aws_access_key_id=aws_access_key_id,
+                                   aws_secret_access_key=aws_secret_access_key)
             test = ec2.describe_snapshots(SnapshotIds=[resource_value])
         except ClientError as e:
             print('Config sanity error: %s' % e.response.get('Error').get('Message'))
@@ -154,9 +160,9 @@ def check_resource(region, aws_access_key_id, aws_secret_access_key, resource_ty
     # EC2 EBS Volume Id
     elif resource_type == 'EC2Volume':
         try:
-            ec2 = boto3.client('ec2', region_name=region,
-                               aws_access_key_id=aws_access_key_id,
-                               aws_secret_access_key=aws_secret_access_key)
+            ec2 = utils.get_client('ec2', region_name=region,
+                                   aws_access_key_id=aws_access_key_id,
+                                   aws_secret_access_key=aws_secret_access_key)
             test = ec2.describe_volumes(VolumeIds=[resource_value]).get('Volumes')[0]
             if test.get('State') != 'available':
                 print('Volume %s is in state \'%s\' not \'available\'' % (resource_value, test.get('State')))
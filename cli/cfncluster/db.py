@@ -0,0 +1,134 @@
+from __future__ import absolute_import
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Export of the DynamoDBTable of a cluster, where the node daemons track the compute instances by instanceId.
+# The table is scanned in parallel segments, one thread each, and the items are written as they arrive, one JSON
+# object per line (NDJSON), by the calling thread.
+
+import sys
+import json
+import base64
+import logging
+import threading
+from decimal import Decimal
+from boto3.dynamodb.types import TypeDeserializer, Binary
+from botocore.exceptions import ClientError
+
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+
+from . import cfncluster
+from . import cfnconfig
+from . import utils
+
+logger = logging.getLogger('cfncluster.cfncluster')
+
+# Number of parallel scan segments, the default table has 5 read capacity units
+DEFAULT_SEGMENTS = 4
+
+STALE_KEY = '_stale'
+
+_deserializer = TypeDeserializer()
+
+def get_table_name(stack_name, config):
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    return cfn.describe_stack_resource(StackName=stack_name, LogicalResourceId='DynamoDBTable')\
+        .get('StackResourceDetail').get('PhysicalResourceId')
+
+def _scan_segment(table_name, segment, segments, config, items):
+    # puts the items of the segment on the queue, then None, or the exception that stopped the scan
+    dynamodb = utils.get_client('dynamodb', region_name=config.region,
+                                aws_access_key_id=config.aws_access_key_id,
+                                aws_secret_access_key=config.aws_secret_access_key)
+    try:
+        paginator = dynamodb.get_paginator('scan')
+        for page in paginator.paginate(TableName=table_name, Segment=segment, TotalSegments=segments):
+            for item in page.get('Items', []):
+                items.put(item)
+        items.put(None)
+    except Exception as e:
+        items.put(e)
+
+def scan(table_name, config, segments):
+    # yields the items of the table, in their DynamoDB JSON format, from a parallel scan
+    items = Queue(maxsize=1000)
+    for segment in range(segments):
+        thread = threading.Thread(target=_scan_segment, args=(table_name, segment, segments, config, items))
+        thread.daemon = True
+        thread.start()
+
+    running = segments
+    while running > 0:
+        item = items.get()
+        if item is None:
+            running -= 1
+        elif isinstance(item, Exception):
+            raise item
+        else:
+            yield item
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, Binary):
+        return base64.b64encode(value.value).decode('ascii')
+    if isinstance(value, set):
+        return sorted(value)
+    raise TypeError('%r is not JSON serializable' % value)
+
+def to_json(item):
+    return json.dumps(dict((k, _deserializer.deserialize(v)) for k, v in item.items()), sort_keys=True,
+                      default=_json_default)
+
+def dump(args):
+    stack_name = ('cfncluster-' + args.cluster_name)
+    config = cfnconfig.CfnClusterConfig(args)
+    out = open(args.output, 'w') if args.output else sys.stdout
+
+    try:
+        table_name = get_table_name(stack_name, config)
+        members = None
+        if args.stale:
+            members = set(instance[1] for instance in cfncluster.get_asg_instances(stack_name, config))
+
+        count = 0
+        stale = 0
+        seen = set()
+        for item in scan(table_name, config, args.segments):
+            if members is not None:
+                instance_id = item.get('instanceId', {}).get('S')
+                seen.add(instance_id)
+                item[STALE_KEY] = {'BOOL': instance_id not in members}
+                stale += 1 if instance_id not in members else 0
+            out.write(to_json(item) + '\n')
+            count += 1
+        out.flush()
+    except ClientError as e:
+        logger.critical(e.response.get('Error').get('Message'))
+        sys.stdout.flush()
+        sys.exit(1)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    # the summary goes to stderr, stdout is the dump
+    sys.stderr.write('%d item(s) in %s\n' % (count, table_name))
+    if members is not None:
+        sys.stderr.write('%d stale item(s), not in the ComputeFleet\n' % stale)
+        missing = sorted(members - seen)
+        if len(missing) > 0:
+            sys.stderr.write('%d ComputeFleet instance(s) not in the table: %s\n' % (len(missing), ' '.join(missing)))
@@ -16,13 +16,13 @@ standard_library.install_aliases()
 from builtins import input
 import configparser
 import sys
-import boto3
 import os
 import logging
 import stat
 import errno
 
 from . import cfnconfig
+from . import utils
 
 logger = logging.getLogger('cfncluster.cfncluster')
 unsupported_regions = ['ap-northeast-3', 'cn-north-1', 'cn-northwest-1']
@@ -55,7 +55,7 @@ def prompt(prompt, default_value=None, hidden=False, options=None, check_validit
             return var
 
 def get_regions():
-    ec2 = boto3.client('ec2')
+    ec2 = utils.get_client('ec2')
     regions = ec2.describe_regions().get('Regions')
     return [region.get('RegionName') for region in regions if region.get('RegionName') not in unsupported_regions]
 
@@ -67,9 +67,9 @@ def ec2_conn(aws_access_key_id, aws_secret_access_key, aws_region_name):
     else:
         region = 'us-east-1'
 
-    ec2 = boto3.client('ec2', region_name=region,
-                       aws_access_key_id=aws_access_key_id,
-                       aws_secret_access_key=aws_secret_access_key)
+    ec2 = utils.get_client('ec2', region_name=region,
+                           aws_access_key_id=aws_access_key_id,
+                           aws_secret_access_key=aws_secret_access_key)
     return ec2
 
 def list_keys(aws_access_key_id, aws_secret_access_key, aws_region_name):
@@ -0,0 +1,1459 @@
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file is generated by util/generate-instance-index.py from the EC2 DescribeInstanceTypes and
+# DescribeInstanceTypeOfferings APIs. Do not edit it by hand, run the script again to refresh it.
+#
+# The index shipped here was not generated from recorded API output and cannot be reproduced with the script: it is a
+# provisional seed. Regenerate it with --instance-types-file and --offerings-file, or against the live APIs, before
+# relying on it. Until then, cfncluster only prints warnings from it.
+
+GENERATED = '2026-10-18'
+
+# Values of the INSTANCE_TYPES tuples: DefaultVCpus, SizeInMiB, EbsOptimizedSupport, instance store
+# disks, cluster placement group support, EnaSupport
+INSTANCE_FIELDS = ('vcpus', 'memory', 'ebs_optimized', 'instance_storage', 'placement_group', 'ena')
+
+# Master instance types launched without EbsOptimized, from the IsMasterInstanceEbsOpt condition
+TEMPLATE_NOT_EBS_OPTIMIZED = frozenset('''
+    c3.8xlarge c3.large cc2.8xlarge cg1.4xlarge cr1.8xlarge g2.8xlarge i2.8xlarge i2.large m3.large m3.medium r3.8xlarge
+    r3.large t2.2xlarge t2.large t2.medium t2.micro t2.nano t2.small t2.xlarge
+'''.split())
+
+INSTANCE_TYPES = {
+    'c1.medium': (2, 1740, 'unsupported', 1, False, 'unsupported'),
+    'c1.xlarge': (8, 7168, 'supported', 4, False, 'unsupported'),
+    'c3.2xlarge': (8, 15360, 'supported', 2, True, 'unsupported'),
+    'c3.4xlarge': (16, 30720, 'supported', 2, True, 'unsupported'),
+    'c3.8xlarge': (32, 61440, 'unsupported', 2, True, 'unsupported'),
+    'c3.large': (2, 3840, 'unsupported', 2, True, 'unsupported'),
+    'c3.xlarge': (4, 7680, 'supported', 2, True, 'unsupported'),
+    'c4.2xlarge': (8, 15360, 'default', 0, True, 'unsupported'),
+    'c4.4xlarge': (16, 30720, 'default', 0, True, 'unsupported'),
+    'c4.8xlarge': (36, 61440, 'default', 0, True, 'unsupported'),
+    'c4.large': (2, 3840, 'default', 0, True, 'unsupported'),
+    'c4.xlarge': (4, 7680, 'default', 0, True, 'unsupported'),
+    'c5.12xlarge': (48, 98304, 'default', 0, True, 'required'),
+    'c5.18xlarge': (72, 147456, 'default', 0, True, 'required'),
+    'c5.24xlarge': (96, 196608, 'default', 0, True, 'required'),
+    'c5.2xlarge': (8, 16384, 'default', 0, True, 'required'),
+    'c5.4xlarge': (16, 32768, 'default', 0, True, 'required'),
+    'c5.9xlarge': (36, 73728, 'default', 0, True, 'required'),
+    'c5.large': (2, 4096, 'default', 0, True, 'required'),
+    'c5.metal': (96, 196608, 'default', 0, True, 'required'),
+    'c5.xlarge': (4, 8192, 'default', 0, True, 'required'),
+    'c5a.12xlarge': (48, 98304, 'default', 0, True, 'required'),
+    'c5a.16xlarge': (64, 131072, 'default', 0, True, 'required'),
+    'c5a.24xlarge': (96, 196608, 'default', 0, True, 'required'),
+    'c5a.2xlarge': (8, 16384, 'default', 0, True, 'required'),
+    'c5a.4xlarge': (16, 32768, 'default', 0, True, 'required'),
+    'c5a.8xlarge': (32, 65536, 'default', 0, True, 'required'),
+    'c5a.large': (2, 4096, 'default', 0, True, 'required'),
+    'c5a.xlarge': (4, 8192, 'default', 0, True, 'required'),
+    'c5ad.12xlarge': (48, 98304, 'default', 2, True, 'required'),
+    'c5ad.16xlarge': (64, 131072, 'default', 2, True, 'required'),
+    'c5ad.24xlarge': (96, 196608, 'default', 2, True, 'required'),
+    'c5ad.2xlarge': (8, 16384, 'default', 1, True, 'required'),
+    'c5ad.4xlarge': (16, 32768, 'default', 2, True, 'required'),
+    'c5ad.8xlarge': (32, 65536, 'default', 2, True, 'required'),
+    'c5ad.large': (2, 4096, 'default', 1, True, 'required'),
+    'c5ad.xlarge': (4, 8192, 'default', 1, True, 'required'),
+    'c5d.12xlarge': (48, 98304, 'default', 2, True, 'required'),
+    'c5d.18xlarge': (72, 147456, 'default', 2, True, 'required'),
+    'c5d.24xlarge': (96, 196608, 'default', 4, True, 'required'),
+    'c5d.2xlarge': (8, 16384, 'default', 1, True, 'required'),
+    'c5d.4xlarge': (16, 32768, 'default', 1, True, 'required'),
+    'c5d.9xlarge': (36, 73728, 'default', 1, True, 'required'),
+    'c5d.large': (2, 4096, 'default', 1, True, 'required'),
+    'c5d.metal': (96, 196608, 'default', 4, True, 'required'),
+    'c5d.xlarge': (4, 8192, 'default', 1, True, 'required'),
+    'c5n.18xlarge': (72, 196608, 'default', 0, True, 'required'),
+    'c5n.2xlarge': (8, 21504, 'default', 0, True, 'required'),
+    'c5n.4xlarge': (16, 43008, 'default', 0, True, 'required'),
+    'c5n.9xlarge': (36, 98304, 'default', 0, True, 'required'),
+    'c5n.large': (2, 5376, 'default', 0, True, 'required'),
+    'c5n.metal': (72, 196608, 'default', 0, True, 'required'),
+    'c5n.xlarge': (4, 10752, 'default', 0, True, 'required'),
+    'c6a.12xlarge': (48, 98304, 'default', 0, True, 'required'),
+    'c6a.16xlarge': (64, 131072, 'default', 0, True, 'required'),
+    'c6a.24xlarge': (96, 196608, 'default', 0, True, 'required'),
+    'c6a.2xlarge': (8, 16384, 'default', 0, True, 'required'),
+    'c6a.32xlarge': (128, 262144, 'default', 0, True, 'required'),
+    'c6a.48xlarge': (192, 393216, 'default', 0, True, 'required'),
+    'c6a.4xlarge': (16, 32768, 'default', 0, True, 'required'),
+    'c6a.8xlarge': (32, 65536, 'default', 0, True, 'required'),
+    'c6a.large': (2, 4096, 'default', 0, True, 'required'),
+    'c6a.metal': (192, 393216, 'default', 0, True, 'required'),
+    'c6a.xlarge': (4, 8192, 'default', 0, True, 'required'),
+    'c6i.12xlarge': (48, 98304, 'default', 0, True, 'required'),
+    'c6i.16xlarge': (64, 131072, 'default', 0, True, 'required'),
+    'c6i.24xlarge': (96, 196608, 'default', 0, True, 'required'),
+    'c6i.2xlarge': (8, 16384, 'default', 0, True, 'required'),
+    'c6i.32xlarge': (128, 262144, 'default', 0, True, 'required'),
+    'c6i.4xlarge': (16, 32768, 'default', 0, True, 'required'),
+    'c6i.8xlarge': (32, 65536, 'default', 0, True, 'required'),
+    'c6i.large': (2, 4096, 'default', 0, True, 'required'),
+    'c6i.metal': (128, 262144, 'default', 0, True, 'required'),
+    'c6i.xlarge': (4, 8192, 'default', 0, True, 'required'),
+    'c6id.12xlarge': (48, 98304, 'default', 2, True, 'required'),
+    'c6id.16xlarge': (64, 131072, 'default', 2, True, 'required'),
+    'c6id.24xlarge': (96, 196608, 'default', 4, True, 'required'),
+    'c6id.2xlarge': (8, 16384, 'default', 1, True, 'required'),
+    'c6id.32xlarge': (128, 262144, 'default', 4, True, 'required'),
+    'c6id.4xlarge': (16, 32768, 'default', 1, True, 'required'),
+    'c6id.8xlarge': (32, 65536, 'default', 1, True, 'required'),
+    'c6id.large': (2, 4096, 'default', 1, True, 'required'),
+    'c6id.metal': (128, 262144, 'default', 4, True, 'required'),
+    'c6id.xlarge': (4, 8192, 'default', 1, True, 'required'),
+    'c6in.12xlarge': (48, 98304, 'default', 0, True, 'required'),
+    'c6in.16xlarge': (64, 131072, 'default', 0, True, 'required'),
+    'c6in.24xlarge': (96, 196608, 'default', 0, True, 'required'),
+    'c6in.2xlarge': (8, 16384, 'default', 0, True, 'required'),
+    'c6in.32xlarge': (128, 262144, 'default', 0, True, 'required'),
+    'c6in.4xlarge': (16, 32768, 'default', 0, True, 'required'),
+    'c6in.8xlarge': (32, 65536, 'default', 0, True, 'required'),
+    'c6in.large': (2, 4096, 'default', 0, True, 'required'),
+    'c6in.metal': (128, 262144, 'default', 0, True, 'required'),
+    'c6in.xlarge': (4, 8192, 'default', 0, True, 'required'),
+    'c7a.12xlarge': (48, 98304, 'default', 0, True, 'required'),
+    'c7a.16xlarge': (64, 131072, 'default', 0, True, 'required'),
+    'c7a.24xlarge': (96, 196608, 'default', 0, True, 'required'),
+    'c7a.2xlarge': (8, 16384, 'default', 0, True, 'required'),
+    'c7a.32xlarge': (128, 262144, 'default', 0, True, 'required'),
+    'c7a.48xlarge': (192, 393216, 'default', 0, True, 'required'),
+    'c7a.4xlarge': (16, 32768, 'default', 0, True, 'required'),
+    'c7a.8xlarge': (32, 65536, 'default', 0, True, 'required'),
+    'c7a.large': (2, 4096, 'default', 0, True, 'required'),
+    'c7a.medium': (1, 2048, 'default', 0, True, 'required'),
+    'c7a.metal-48xl': (192, 393216, 'default', 0, True, 'required'),
+    'c7a.xlarge': (4, 8192, 'default', 0, True, 'required'),
+    'c7i.12xlarge': (48, 98304, 'default', 0, True, 'required'),
+    'c7i.16xlarge': (64, 131072, 'default', 0, True, 'required'),
+    'c7i.24xlarge': (96, 196608, 'default', 0, True, 'required'),
+    'c7i.2xlarge': (8, 16384, 'default', 0, True, 'required'),
+    'c7i.48xlarge': (192, 393216, 'default', 0, True, 'required'),
+    'c7i.4xlarge': (16, 32768, 'default', 0, True, 'required'),
+    'c7i.8xlarge': (32, 65536, 'default', 0, True, 'required'),
+    'c7i.large': (2, 4096, 'default', 0, True, 'required'),
+    'c7i.metal-24xl': (96, 196608, 'default', 0, True, 'required'),
+    'c7i.metal-48xl': (192, 393216, 'default', 0, True, 'required'),
+    'c7i.xlarge': (4, 8192, 'default', 0, True, 'required'),
+    'd2.2xlarge': (8, 62464, 'default', 6, True, 'unsupported'),
+    'd2.4xlarge': (16, 124928, 'default', 12, True, 'unsupported'),
+    'd2.8xlarge': (36, 249856, 'default', 24, True, 'unsupported'),
+    'd2.xlarge': (4, 31232, 'default', 3, True, 'unsupported'),
+    'd3.2xlarge': (8, 65536, 'default', 6, True, 'required'),
+    'd3.4xlarge': (16, 131072, 'default', 12, True, 'required'),
+    'd3.8xlarge': (32, 262144, 'default', 24, True, 'required'),
+    'd3.xlarge': (4, 32768, 'default', 3, True, 'required'),
+    'd3en.12xlarge': (48, 196608, 'default', 24, True, 'required'),
+    'd3en.2xlarge': (8, 32768, 'default', 4, True, 'required'),
+    'd3en.4xlarge': (16, 65536, 'default', 8, True, 'required'),
+    'd3en.6xlarge': (24, 98304, 'default', 12, True, 'required'),
+    'd3en.8xlarge': (32, 131072, 'default', 16, True, 'required'),
+    'd3en.xlarge': (4, 16384, 'default', 2, True, 'required'),
+    'dl1.24xlarge': (96, 786432, 'default', 4, True, 'required'),
+    'dl2q.24xlarge': (96, 786432, 'default', 0, True, 'required'),
+    'f1.16xlarge': (64, 999424, 'default', 4, True, 'unsupported'),
+    'f1.2xlarge': (8, 124928, 'default', 1, True, 'unsupported'),
+    'f1.4xlarge': (16, 249856, 'default', 1, True, 'unsupported'),
+    'g3.16xlarge': (64, 499712, 'default', 0, True, 'supported'),
+    'g3.4xlarge': (16, 124928, 'default', 0, True, 'supported'),
+    'g3.8xlarge': (32, 249856, 'default', 0, True, 'supported'),
+    'g3s.xlarge': (4, 31232, 'default', 0, True, 'required'),
+    'g4ad.16xlarge': (64, 262144, 'default', 2, True, 'required'),
+    'g4ad.2xlarge': (8, 32768, 'default', 1, True, 'required'),
+    'g4ad.4xlarge': (16, 65536, 'default', 1, True, 'required'),
+    'g4ad.8xlarge': (32, 131072, 'default', 1, True, 'required'),
+    'g4ad.xlarge': (4, 16384, 'default', 1, True, 'required'),
+    'g4dn.12xlarge': (48, 196608, 'default', 1, True, 'required'),
+    'g4dn.16xlarge': (64, 262144, 'default', 1, True, 'required'),
+    'g4dn.2xlarge': (8, 32768, 'default', 1, True, 'required'),
+    'g4dn.4xlarge': (16, 65536, 'default', 1, True, 'required'),
+    'g4dn.8xlarge': (32, 131072, 'default', 1, True, 'required'),
+    'g4dn.metal': (96, 393216, 'default', 2, True, 'required'),
+    'g4dn.xlarge': (4, 16384, 'default', 1, True, 'required'),
+    'g5.12xlarge': (48, 196608, 'default', 1, True, 'required'),
+    'g5.16xlarge': (64, 262144, 'default', 1, True, 'required'),
+    'g5.24xlarge': (96, 393216, 'default', 1, True, 'required'),
+    'g5.2xlarge': (8, 32768, 'default', 1, True, 'required'),
+    'g5.48xlarge': (192, 786432, 'default', 2, True, 'required'),
+    'g5.4xlarge': (16, 65536, 'default', 1, True, 'required'),
+    'g5.8xlarge': (32, 131072, 'default', 1, True, 'required'),
+    'g5.xlarge': (4, 16384, 'default', 1, True, 'required'),
+    'h1.16xlarge': (64, 262144, 'default', 8, True, 'supported'),
+    'h1.2xlarge': (8, 32768, 'default', 1, True, 'supported'),
+    'h1.4xlarge': (16, 65536, 'default', 2, True, 'supported'),
+    'h1.8xlarge': (32, 131072, 'default', 4, True, 'supported'),
+    'hpc6a.48xlarge': (96, 393216, 'default', 0, True, 'required'),
+    'hpc6id.32xlarge': (64, 1048576, 'default', 4, True, 'required'),
+    'hpc7a.12xlarge': (24, 786432, 'default', 0, True, 'required'),
+    'hpc7a.24xlarge': (48, 786432, 'default', 0, True, 'required'),
+    'hpc7a.48xlarge': (96, 786432, 'default', 0, True, 'required'),
+    'hpc7a.96xlarge': (192, 786432, 'default', 0, True, 'required'),
+    'i2.2xlarge': (8, 62464, 'supported', 2, True, 'unsupported'),
+    'i2.4xlarge': (16, 124928, 'supported', 4, True, 'unsupported'),
+    'i2.8xlarge': (32, 249856, 'unsupported', 8, True, 'unsupported'),
+    'i2.xlarge': (4, 31232, 'supported', 1, True, 'unsupported'),
+    'i3.16xlarge': (64, 499712, 'default', 8, True, 'supported'),
+    'i3.2xlarge': (8, 62464, 'default', 1, True, 'supported'),
+    'i3.4xlarge': (16, 124928, 'default', 2, True, 'supported'),
+    'i3.8xlarge': (32, 249856, 'default', 4, True, 'supported'),
+    'i3.large': (2, 15616, 'default', 1, True, 'supported'),
+    'i3.metal': (72, 524288, 'default', 8, True, 'required'),
+    'i3.xlarge': (4, 31232, 'default', 1, True, 'supported'),
+    'i3en.12xlarge': (48, 393216, 'default', 4, True, 'required'),
+    'i3en.24xlarge': (96, 786432, 'default', 8, True, 'required'),
+    'i3en.2xlarge': (8, 65536, 'default', 2, True, 'required'),
+    'i3en.3xlarge': (12, 98304, 'default', 1, True, 'required'),
+    'i3en.6xlarge': (24, 196608, 'default', 2, True, 'required'),
+    'i3en.large': (2, 16384, 'default', 1, True, 'required'),
+    'i3en.metal': (96, 786432, 'default', 8, True, 'required'),
+    'i3en.xlarge': (4, 32768, 'default', 1, True, 'required'),
+    'i4i.12xlarge': (48, 393216, 'default', 3, True, 'required'),
+    'i4i.16xlarge': (64, 524288, 'default', 4, True, 'required'),
+    'i4i.24xlarge': (96, 786432, 'default', 6, True, 'required'),
+    'i4i.2xlarge': (8, 65536, 'default', 1, True, 'required'),
+    'i4i.32xlarge': (128, 1048576, 'default', 8, True, 'required'),
+    'i4i.4xlarge': (16, 131072, 'default', 1, True, 'required'),
+    'i4i.8xlarge': (32, 262144, 'default', 2, True, 'required'),
+    'i4i.large': (2, 16384, 'default', 1, True, 'required'),
+    'i4i.metal': (128, 1048576, 'default', 8, True, 'required'),
+    'i4i.xlarge': (4, 32768, 'default', 1, True, 'required'),
+    'inf1.24xlarge': (96, 196608, 'default', 0, True, 'required'),
+    'inf1.2xlarge': (8, 16384, 'default', 0, True, 'required'),
+    'inf1.6xlarge': (24, 49152, 'default', 0, True, 'required'),
+    'inf1.xlarge': (4, 8192, 'default', 0, True, 'required'),
+    'inf2.24xlarge': (96, 393216, 'default', 0, True, 'required'),
+    'inf2.48xlarge': (192, 786432, 'default', 0, True, 'required'),
+    'inf2.8xlarge': (32, 131072, 'default', 0, True, 'required'),
+    'inf2.xlarge': (4, 16384, 'default', 0, True, 'required'),
+    'm1.large': (2, 7680, 'supported', 2, False, 'unsupported'),
+    'm1.medium': (1, 3788, 'unsupported', 1, False, 'unsupported'),
+    'm1.small': (1, 1740, 'unsupported', 1, False, 'unsupported'),
+    'm1.xlarge': (4, 15360, 'supported', 4, False, 'unsupported'),
+    'm2.2xlarge': (4, 35020, 'supported', 1, False, 'unsupported'),
+    'm2.4xlarge': (8, 70041, 'supported', 2, False, 'unsupported'),
+    'm2.xlarge': (2, 17510, 'unsupported', 1, False, 'unsupported'),
+    'm3.2xlarge': (8, 30720, 'supported', 2, False, 'unsupported'),
+    'm3.large': (2, 7680, 'unsupported', 1, False, 'unsupported'),
+    'm3.medium': (1, 3840, 'unsupported', 1, False, 'unsupported'),
+    'm3.xlarge': (4, 15360, 'supported', 2, False, 'unsupported'),
+    'm4.10xlarge': (40, 163840, 'default', 0, True, 'unsupported'),
+    'm4.16xlarge': (64, 262144, 'default', 0, True, 'supported'),
+    'm4.2xlarge': (8, 32768, 'default', 0, True, 'unsupported'),
+    'm4.4xlarge': (16, 65536, 'default', 0, True, 'unsupported'),
+    'm4.large': (2, 8192, 'default', 0, True, 'unsupported'),
+    'm4.xlarge': (4, 16384, 'default', 0, True, 'unsupported'),
+    'm5.12xlarge': (48, 196608, 'default', 0, True, 'required'),
+    'm5.16xlarge': (64, 262144, 'default', 0, True, 'required'),
+    'm5.24xlarge': (96, 393216, 'default', 0, True, 'required'),
+    'm5.2xlarge': (8, 32768, 'default', 0, True, 'required'),
+    'm5.4xlarge': (16, 65536, 'default', 0, True, 'required'),
+    'm5.8xlarge': (32, 131072, 'default', 0, True, 'required'),
+    'm5.large': (2, 8192, 'default', 0, True, 'required'),
+    'm5.metal': (96, 393216, 'default', 0, True, 'required'),
+    'm5.xlarge': (4, 16384, 'default', 0, True, 'required'),
+    'm5a.12xlarge': (48, 196608, 'default', 0, True, 'required'),
+    'm5a.16xlarge': (64, 262144, 'default', 0, True, 'required'),
+    'm5a.24xlarge': (96, 393216, 'default', 0, True, 'required'),
+    'm5a.2xlarge': (8, 32768, 'default', 0, True, 'required'),
+    'm5a.4xlarge': (16, 65536, 'default', 0, True, 'required'),
+    'm5a.8xlarge': (32, 131072, 'default', 0, True, 'required'),
+    'm5a.large': (2, 8192, 'default', 0, True, 'required'),
+    'm5a.xlarge': (4, 16384, 'default', 0, True, 'required'),
+    'm5ad.12xlarge': (48, 196608, 'default', 2, True, 'required'),
+    'm5ad.16xlarge': (64, 262144, 'default', 4, True, 'required'),
+    'm5ad.24xlarge': (96, 393216, 'default', 4, True, 'required'),
+    'm5ad.2xlarge': (8, 32768, 'default', 1, True, 'required'),
+    'm5ad.4xlarge': (16, 65536, 'default', 2, True, 'required'),
+    'm5ad.8xlarge': (32, 131072, 'default', 2, True, 'required'),
+    'm5ad.large': (2, 8192, 'default', 1, True, 'required'),
+    'm5ad.xlarge': (4, 16384, 'default', 1, True, 'required'),
+    'm5d.12xlarge': (48, 196608, 'default', 2, True, 'required'),
+    'm5d.16xlarge': (64, 262144, 'default', 4, True, 'required'),
+    'm5d.24xlarge': (96, 393216, 'default', 4, True, 'required'),
+    'm5d.2xlarge': (8, 32768, 'default', 1, True, 'required'),
+    'm5d.4xlarge': (16, 65536, 'default', 2, True, 'required'),
+    'm5d.8xlarge': (32, 131072, 'default', 2, True, 'required'),
+    'm5d.large': (2, 8192, 'default', 1, True, 'required'),
+    'm5d.metal': (96, 393216, 'default', 4, True, 'required'),
+    'm5d.xlarge': (4, 16384, 'default', 1, True, 'required'),
+    'm5dn.12xlarge': (48, 196608, 'default', 2, True, 'required'),
+    'm5dn.16xlarge': (64, 262144, 'default', 4, True, 'required'),
+    'm5dn.24xlarge': (96, 393216, 'default', 4, True, 'required'),
+    'm5dn.2xlarge': (8, 32768, 'default', 1, True, 'required'),
+    'm5dn.4xlarge': (16, 65536, 'default', 2, True, 'required'),
+    'm5dn.8xlarge': (32, 131072, 'default', 2, True, 'required'),
+    'm5dn.large': (2, 8192, 'default', 1, True, 'required'),
+    'm5dn.metal': (96, 393216, 'default', 4, True, 'required'),
+    'm5dn.xlarge': (4, 16384, 'default', 1, True, 'required'),
+    'm5n.12xlarge': (48, 196608, 'default', 0, True, 'required'),
+    'm5n.16xlarge': (64, 262144, 'default', 0, True, 'required'),
+    'm5n.24xlarge': (96, 393216, 'default', 0, True, 'required'),
+    'm5n.2xlarge': (8, 32768, 'default', 0, True, 'required'),
+    'm5n.4xlarge': (16, 65536, 'default', 0, True, 'required'),
+    'm5n.8xlarge': (32, 131072, 'default', 0, True, 'required'),
+    'm5n.large': (2, 8192, 'default', 0, True, 'required'),
+    'm5n.metal': (96, 393216, 'default', 0, True, 'required'),
+    'm5n.xlarge': (4, 16384, 'default', 0, True, 'required'),
+    'm5zn.12xlarge': (48, 196608, 'default', 0, True, 'required'),
+    'm5zn.2xlarge': (8, 32768, 'default', 0, True, 'required'),
+    'm5zn.3xlarge': (12, 49152, 'default', 0, True, 'required'),
+    'm5zn.6xlarge': (24, 98304, 'default', 0, True, 'required'),
+    'm5zn.large': (2, 8192, 'default', 0, True, 'required'),
+    'm5zn.metal': (48, 196608, 'default', 0, True, 'required'),
+    'm5zn.xlarge': (4, 16384, 'default', 0, True, 'required'),
+    'm6a.12xlarge': (48, 196608, 'default', 0, True, 'required'),
+    'm6a.16xlarge': (64, 262144, 'default', 0, True, 'required'),
+    'm6a.24xlarge': (96, 393216, 'default', 0, True, 'required'),
+    'm6a.2xlarge': (8, 32768, 'default', 0, True, 'required'),
+    'm6a.32xlarge': (128, 524288, 'default', 0, True, 'required'),
+    'm6a.48xlarge': (192, 786432, 'default', 0, True, 'required'),
+    'm6a.4xlarge': (16, 65536, 'default', 0, True, 'required'),
+    'm6a.8xlarge': (32, 131072, 'default', 0, True, 'required'),
+    'm6a.large': (2, 8192, 'default', 0, True, 'required'),
+    'm6a.metal': (192, 786432, 'default', 0, True, 'required'),
+    'm6a.xlarge': (4, 16384, 'default', 0, True, 'required'),
+    'm6i.12xlarge': (48, 196608, 'default', 0, True, 'required'),
+    'm6i.16xlarge': (64, 262144, 'default', 0, True, 'required'),
+    'm6i.24xlarge': (96, 393216, 'default', 0, True, 'required'),
+    'm6i.2xlarge': (8, 32768, 'default', 0, True, 'required'),
+    'm6i.32xlarge': (128, 524288, 'default', 0, True, 'required'),
+    'm6i.4xlarge': (16, 65536, 'default', 0, True, 'required'),
+    'm6i.8xlarge': (32, 131072, 'default', 0, True, 'required'),
+    'm6i.large': (2, 8192, 'default', 0, True, 'required'),
+    'm6i.metal': (128, 524288, 'default', 0, True, 'required'),
+    'm6i.xlarge': (4, 16384, 'default', 0, True, 'required'),
+    'm6id.12xlarge': (48, 196608, 'default', 2, True, 'required'),
+    'm6id.16xlarge': (64, 262144, 'default', 2, True, 'required'),
+    'm6id.24xlarge': (96, 393216, 'default', 4, True, 'required'),
+    'm6id.2xlarge': (8, 32768, 'default', 1, True, 'required'),
+    'm6id.32xlarge': (128, 524288, 'default', 4, True, 'required'),
+    'm6id.4xlarge': (16, 65536, 'default', 1, True, 'required'),
+    'm6id.8xlarge': (32, 131072, 'default', 1, True, 'required'),
+    'm6id.large': (2, 8192, 'default', 1, True, 'required'),
+    'm6id.metal': (128, 524288, 'default', 4, True, 'required'),
+    'm6id.xlarge': (4, 16384, 'default', 1, True, 'required'),
+    'm6idn.12xlarge': (48, 196608, 'default', 2, True, 'required'),
+    'm6idn.16xlarge': (64, 262144, 'default', 2, True, 'required'),
+    'm6idn.24xlarge': (96, 393216, 'default', 4, True, 'required'),
+    'm6idn.2xlarge': (8, 32768, 'default', 1, True, 'required'),
+    'm6idn.32xlarge': (128, 524288, 'default', 4, True, 'required'),
+    'm6idn.4xlarge': (16, 65536, 'default', 1, True, 'required'),
+    'm6idn.8xlarge': (32, 131072, 'default', 1, True, 'required'),
+    'm6idn.large': (2, 8192, 'default', 1, True, 'required'),
+    'm6idn.metal': (128, 524288, 'default', 4, True, 'required'),
+    'm6idn.xlarge': (4, 16384, 'default', 1, True, 'required'),
+    'm6in.12xlarge': (48, 196608, 'default', 0, True, 'required'),
+    'm6in.16xlarge': (64, 262144, 'default', 0, True, 'required'),
+    'm6in.24xlarge': (96, 393216, 'default', 0, True, 'required'),
+    'm6in.2xlarge': (8, 32768, 'default', 0, True, 'required'),
+    'm6in.32xlarge': (128, 524288, 'default', 0, True, 'required'),
+    'm6in.4xlarge': (16, 65536, 'default', 0, True, 'required'),
+    'm6in.8xlarge': (32, 131072, 'default', 0, True, 'required'),
+    'm6in.large': (2, 8192, 'default', 0, True, 'required'),
+    'm6in.metal': (128, 524288, 'default', 0, True, 'required'),
+    'm6in.xlarge': (4, 16384, 'default', 0, True, 'required'),
+    'm7a.12xlarge': (48, 196608, 'default', 0, True, 'required'),
+    'm7a.16xlarge': (64, 262144, 'default', 0, True, 'required'),
+    'm7a.24xlarge': (96, 393216, 'default', 0, True, 'required'),
+    'm7a.2xlarge': (8, 32768, 'default', 0, True, 'required'),
+    'm7a.32xlarge': (128, 524288, 'default', 0, True, 'required'),
+    'm7a.48xlarge': (192, 786432, 'default', 0, True, 'required'),
+    'm7a.4xlarge': (16, 65536, 'default', 0, True, 'required'),
+    'm7a.8xlarge': (32, 131072, 'default', 0, True, 'required'),
+    'm7a.large': (2, 8192, 'default', 0, True, 'required'),
+    'm7a.medium': (1, 4096, 'default', 0, True, 'required'),
+    'm7a.metal-48xl': (192, 786432, 'default', 0, True, 'required'),
+    'm7a.xlarge': (4, 16384, 'default', 0, True, 'required'),
+    'm7i-flex.2xlarge': (8, 32768, 'default', 0, False, 'required'),
+    'm7i-flex.4xlarge': (16, 65536, 'default', 0, False, 'required'),
+    'm7i-flex.8xlarge': (32, 131072, 'default', 0, False, 'required'),
+    'm7i-flex.large': (2, 8192, 'default', 0, False, 'required'),
+    'm7i-flex.xlarge': (4, 16384, 'default', 0, False, 'required'),
+    'm7i.12xlarge': (48, 196608, 'default', 0, True, 'required'),
+    'm7i.16xlarge': (64, 262144, 'default', 0, True, 'required'),
+    'm7i.24xlarge': (96, 393216, 'default', 0, True, 'required'),
+    'm7i.2xlarge': (8, 32768, 'default', 0, True, 'required'),
+    'm7i.48xlarge': (192, 786432, 'default', 0, True, 'required'),
+    'm7i.4xlarge': (16, 65536, 'default', 0, True, 'required'),
+    'm7i.8xlarge': (32, 131072, 'default', 0, True, 'required'),
+    'm7i.large': (2, 8192, 'default', 0, True, 'required'),
+    'm7i.metal-24xl': (96, 393216, 'default', 0, True, 'required'),
+    'm7i.metal-48xl': (192, 786432, 'default', 0, True, 'required'),
+    'm7i.xlarge': (4, 16384, 'default', 0, True, 'required'),
+    'p2.16xlarge': (64, 749568, 'default', 0, True, 'supported'),
+    'p2.8xlarge': (32, 499712, 'default', 0, True, 'supported'),
+    'p2.xlarge': (4, 62464, 'default', 0, True, 'supported'),
+    'p3.16xlarge': (64, 499712, 'default', 0, True, 'supported'),
+    'p3.2xlarge': (8, 62464, 'default', 0, True, 'supported'),
+    'p3.8xlarge': (32, 249856, 'default', 0, True, 'supported'),
+    'p3dn.24xlarge': (96, 786432, 'default', 2, True, 'required'),
+    'p4d.24xlarge': (96, 1179648, 'default', 8, True, 'required'),
+    'p5.48xlarge': (192, 2097152, 'default', 8, True, 'required'),
+    'r3.2xlarge': (8, 62464, 'supported', 1, True, 'unsupported'),
+    'r3.4xlarge': (16, 124928, 'supported', 1, True, 'unsupported'),
+    'r3.8xlarge': (32, 249856, 'unsupported', 2, True, 'unsupported'),
+    'r3.large': (2, 15360, 'unsupported', 1, True, 'unsupported'),
+    'r3.xlarge': (4, 31232, 'supported', 1, True, 'unsupported'),
+    'r4.16xlarge': (64, 499712, 'default', 0, True, 'supported'),
+    'r4.2xlarge': (8, 62464, 'default', 0, True, 'supported'),
+    'r4.4xlarge': (16, 124928, 'default', 0, True, 'supported'),
+    'r4.8xlarge': (32, 249856, 'default', 0, True, 'supported'),
+    'r4.large': (2, 15616, 'default', 0, True, 'supported'),
+    'r4.xlarge': (4, 31232, 'default', 0, True, 'supported'),
+    'r5.12xlarge': (48, 393216, 'default', 0, True, 'required'),
+    'r5.16xlarge': (64, 524288, 'default', 0, True, 'required'),
+    'r5.24xlarge': (96, 786432, 'default', 0, True, 'required'),
+    'r5.2xlarge': (8, 65536, 'default', 0, True, 'required'),
+    'r5.4xlarge': (16, 131072, 'default', 0, True, 'required'),
+    'r5.8xlarge': (32, 262144, 'default', 0, True, 'required'),
+    'r5.large': (2, 16384, 'default', 0, True, 'required'),
+    'r5.metal': (96, 786432, 'default', 0, True, 'required'),
+    'r5.xlarge': (4, 32768, 'default', 0, True, 'required'),
+    'r5a.12xlarge': (48, 393216, 'default', 0, True, 'required'),
+    'r5a.16xlarge': (64, 524288, 'default', 0, True, 'required'),
+    'r5a.24xlarge': (96, 786432, 'default', 0, True, 'required'),
+    'r5a.2xlarge': (8, 65536, 'default', 0, True, 'required'),
+    'r5a.4xlarge': (16, 131072, 'default', 0, True, 'required'),
+    'r5a.8xlarge': (32, 262144, 'default', 0, True, 'required'),
+    'r5a.large': (2, 16384, 'default', 0, True, 'required'),
+    'r5a.xlarge': (4, 32768, 'default', 0, True, 'required'),
+    'r5ad.12xlarge': (48, 393216, 'default', 2, True, 'required'),
+    'r5ad.16xlarge': (64, 524288, 'default', 4, True, 'required'),
+    'r5ad.24xlarge': (96, 786432, 'default', 4, True, 'required'),
+    'r5ad.2xlarge': (8, 65536, 'default', 1, True, 'required'),
+    'r5ad.4xlarge': (16, 131072, 'default', 2, True, 'required'),
+    'r5ad.8xlarge': (32, 262144, 'default', 2, True, 'required'),
+    'r5ad.large': (2, 16384, 'default', 1, True, 'required'),
+    'r5ad.xlarge': (4, 32768, 'default', 1, True, 'required'),
+    'r5b.12xlarge': (48, 393216, 'default', 0, True, 'required'),
+    'r5b.16xlarge': (64, 524288, 'default', 0, True, 'required'),
+    'r5b.24xlarge': (96, 786432, 'default', 0, True, 'required'),
+    'r5b.2xlarge': (8, 65536, 'default', 0, True, 'required'),
+    'r5b.4xlarge': (16, 131072, 'default', 0, True, 'required'),
+    'r5b.8xlarge': (32, 262144, 'default', 0, True, 'required'),
+    'r5b.large': (2, 16384, 'default', 0, True, 'required'),
+    'r5b.metal': (96, 786432, 'default', 0, True, 'required'),
+    'r5b.xlarge': (4, 32768, 'default', 0, True, 'required'),
+    'r5d.12xlarge': (48, 393216, 'default', 2, True, 'required'),
+    'r5d.16xlarge': (64, 524288, 'default', 4, True, 'required'),
+    'r5d.24xlarge': (96, 786432, 'default', 4, True, 'required'),
+    'r5d.2xlarge': (8, 65536, 'default', 1, True, 'required'),
+    'r5d.4xlarge': (16, 131072, 'default', 2, True, 'required'),
+    'r5d.8xlarge': (32, 262144, 'default', 2, True, 'required'),
+    'r5d.large': (2, 16384, 'default', 1, True, 'required'),
+    'r5d.metal': (96, 786432, 'default', 4, True, 'required'),
+    'r5d.xlarge': (4, 32768, 'default', 1, True, 'required'),
+    'r5dn.12xlarge': (48, 393216, 'default', 2, True, 'required'),
+    'r5dn.16xlarge': (64, 524288, 'default', 4, True, 'required'),
+    'r5dn.24xlarge': (96, 786432, 'default', 4, True, 'required'),
+    'r5dn.2xlarge': (8, 65536, 'default', 1, True, 'required'),
+    'r5dn.4xlarge': (16, 131072, 'default', 2, True, 'required'),
+    'r5dn.8xlarge': (32, 262144, 'default', 2, True, 'required'),
+    'r5dn.large': (2, 16384, 'default', 1, True, 'required'),
+    'r5dn.metal': (96, 786432, 'default', 4, True, 'required'),
+    'r5dn.xlarge': (4, 32768, 'default', 1, True, 'required'),
+    'r5n.12xlarge': (48, 393216, 'default', 0, True, 'required'),
+    'r5n.16xlarge': (64, 524288, 'default', 0, True, 'required'),
+    'r5n.24xlarge': (96, 786432, 'default', 0, True, 'required'),
+    'r5n.2xlarge': (8, 65536, 'default', 0, True, 'required'),
+    'r5n.4xlarge': (16, 131072, 'default', 0, True, 'required'),
+    'r5n.8xlarge': (32, 262144, 'default', 0, True, 'required'),
+    'r5n.large': (2, 16384, 'default', 0, True, 'required'),
+    'r5n.metal': (96, 786432, 'default', 0, True, 'required'),
+    'r5n.xlarge': (4, 32768, 'default', 0, True, 'required'),
+    'r6a.12xlarge': (48, 393216, 'default', 0, True, 'required'),
+    'r6a.16xlarge': (64, 524288, 'default', 0, True, 'required'),
+    'r6a.24xlarge': (96, 786432, 'default', 0, True, 'required'),
+    'r6a.2xlarge': (8, 65536, 'default', 0, True, 'required'),
+    'r6a.32xlarge': (128, 1048576, 'default', 0, True, 'required'),
+    'r6a.48xlarge': (192, 1572864, 'default', 0, True, 'required'),
+    'r6a.4xlarge': (16, 131072, 'default', 0, True, 'required'),
+    'r6a.8xlarge': (32, 262144, 'default', 0, True, 'required'),
+    'r6a.large': (2, 16384, 'default', 0, True, 'required'),
+    'r6a.metal': (192, 1572864, 'default', 0, True, 'required'),
+    'r6a.xlarge': (4, 32768, 'default', 0, True, 'required'),
+    'r6i.12xlarge': (48, 393216, 'default', 0, True, 'required'),
+    'r6i.16xlarge': (64, 524288, 'default', 0, True, 'required'),
+    'r6i.24xlarge': (96, 786432, 'default', 0, True, 'required'),
+    'r6i.2xlarge': (8, 65536, 'default', 0, True, 'required'),
+    'r6i.32xlarge': (128, 1048576, 'default', 0, True, 'required'),
+    'r6i.4xlarge': (16, 131072, 'default', 0, True, 'required'),
+    'r6i.8xlarge': (32, 262144, 'default', 0, True, 'required'),
+    'r6i.large': (2, 16384, 'default', 0, True, 'required'),
+    'r6i.metal': (128, 1048576, 'default', 0, True, 'required'),
+    'r6i.xlarge': (4, 32768, 'default', 0, True, 'required'),
+    'r6id.12xlarge': (48, 393216, 'default', 2, True, 'required'),
+    'r6id.16xlarge': (64, 524288, 'default', 2, True, 'required'),
+    'r6id.24xlarge': (96, 786432, 'default', 4, True, 'required'),
+    'r6id.2xlarge': (8, 65536, 'default', 1, True, 'required'),
+    'r6id.32xlarge': (128, 1048576, 'default', 4, True, 'required'),
+    'r6id.4xlarge': (16, 131072, 'default', 1, True, 'required'),
+    'r6id.8xlarge': (32, 262144, 'default', 1, True, 'required'),
+    'r6id.large': (2, 16384, 'default', 1, True, 'required'),
+    'r6id.metal': (128, 1048576, 'default', 4, True, 'required'),
+    'r6id.xlarge': (4, 32768, 'default', 1, True, 'required'),
+    'r6idn.12xlarge': (48, 393216, 'default', 2, True, 'required'),
+    'r6idn.16xlarge': (64, 524288, 'default', 2, True, 'required'),
+    'r6idn.24xlarge': (96, 786432, 'default', 4, True, 'required'),
+    'r6idn.2xlarge': (8, 65536, 'default', 1, True, 'required'),
+    'r6idn.32xlarge': (128, 1048576, 'default', 4, True, 'required'),
+    'r6idn.4xlarge': (16, 131072, 'default', 1, True, 'required'),
+    'r6idn.8xlarge': (32, 262144, 'default', 1, True, 'required'),
+    'r6idn.large': (2, 16384, 'default', 1, True, 'required'),
+    'r6idn.metal': (128, 1048576, 'default', 4, True, 'required'),
+    'r6idn.xlarge': (4, 32768, 'default', 1, True, 'required'),
+    'r6in.12xlarge': (48, 393216, 'default', 0, True, 'required'),
+    'r6in.16xlarge': (64, 524288, 'default', 0, True, 'required'),
+    'r6in.24xlarge': (96, 786432, 'default', 0, True, 'required'),
+    'r6in.2xlarge': (8, 65536, 'default', 0, True, 'required'),
+    'r6in.32xlarge': (128, 1048576, 'default', 0, True, 'required'),
+    'r6in.4xlarge': (16, 131072, 'default', 0, True, 'required'),
+    'r6in.8xlarge': (32, 262144, 'default', 0, True, 'required'),
+    'r6in.large': (2, 16384, 'default', 0, True, 'required'),
+    'r6in.metal': (128, 1048576, 'default', 0, True, 'required'),
+    'r6in.xlarge': (4, 32768, 'default', 0, True, 'required'),
+    'r7a.12xlarge': (48, 393216, 'default', 0, True, 'required'),
+    'r7a.16xlarge': (64, 524288, 'default', 0, True, 'required'),
+    'r7a.24xlarge': (96, 786432, 'default', 0, True, 'required'),
+    'r7a.2xlarge': (8, 65536, 'default', 0, True, 'required'),
+    'r7a.32xlarge': (128, 1048576, 'default', 0, True, 'required'),
+    'r7a.48xlarge': (192, 1572864, 'default', 0, True, 'required'),
+    'r7a.4xlarge': (16, 131072, 'default', 0, True, 'required'),
+    'r7a.8xlarge': (32, 262144, 'default', 0, True, 'required'),
+    'r7a.large': (2, 16384, 'default', 0, True, 'required'),
+    'r7a.medium': (1, 8192, 'default', 0, True, 'required'),
+    'r7a.metal-48xl': (192, 1572864, 'default', 0, True, 'required'),
+    'r7a.xlarge': (4, 32768, 'default', 0, True, 'required'),
+    'r7i.12xlarge': (48, 393216, 'default', 0, True, 'required'),
+    'r7i.16xlarge': (64, 524288, 'default', 0, True, 'required'),
+    'r7i.24xlarge': (96, 786432, 'default', 0, True, 'required'),
+    'r7i.2xlarge': (8, 65536, 'default', 0, True, 'required'),
+    'r7i.48xlarge': (192, 1572864, 'default', 0, True, 'required'),
+    'r7i.4xlarge': (16, 131072, 'default', 0, True, 'required'),
+    'r7i.8xlarge': (32, 262144, 'default', 0, True, 'required'),
+    'r7i.large': (2, 16384, 'default', 0, True, 'required'),
+    'r7i.metal-24xl': (96, 786432, 'default', 0, True, 'required'),
+    'r7i.metal-48xl': (192, 1572864, 'default', 0, True, 'required'),
+    'r7i.xlarge': (4, 32768, 'default', 0, True, 'required'),
+    'r7iz.12xlarge': (48, 393216, 'default', 0, True, 'required'),
+    'r7iz.16xlarge': (64, 524288, 'default', 0, True, 'required'),
+    'r7iz.2xlarge': (8, 65536, 'default', 0, True, 'required'),
+    'r7iz.32xlarge': (128, 1048576, 'default', 0, True, 'required'),
+    'r7iz.4xlarge': (16, 131072, 'default', 0, True, 'required'),
+    'r7iz.8xlarge': (32, 262144, 'default', 0, True, 'required'),
+    'r7iz.large': (2, 16384, 'default', 0, True, 'required'),
+    'r7iz.metal-16xl': (64, 524288, 'default', 0, True, 'required'),
+    'r7iz.metal-32xl': (128, 1048576, 'default', 0, True, 'required'),
+    'r7iz.xlarge': (4, 32768, 'default', 0, True, 'required'),
+    't2.2xlarge': (8, 32768, 'unsupported', 0, False, 'unsupported'),
+    't2.large': (2, 8192, 'unsupported', 0, False, 'unsupported'),
+    't2.medium': (2, 4096, 'unsupported', 0, False, 'unsupported'),
+    't2.micro': (1, 1024, 'unsupported', 0, False, 'unsupported'),
+    't2.nano': (1, 512, 'unsupported', 0, False, 'unsupported'),
+    't2.small': (1, 2048, 'unsupported', 0, False, 'unsupported'),
+    't2.xlarge': (4, 16384, 'unsupported', 0, False, 'unsupported'),
+    't3.2xlarge': (8, 32768, 'default', 0, False, 'required'),
+    't3.large': (2, 8192, 'default', 0, False, 'required'),
+    't3.medium': (2, 4096, 'default', 0, False, 'required'),
+    't3.micro': (2, 1024, 'default', 0, False, 'required'),
+    't3.nano': (2, 512, 'default', 0, False, 'required'),
+    't3.small': (2, 2048, 'default', 0, False, 'required'),
+    't3.xlarge': (4, 16384, 'default', 0, False, 'required'),
+    't3a.2xlarge': (8, 32768, 'default', 0, False, 'required'),
+    't3a.large': (2, 8192, 'default', 0, False, 'required'),
+    't3a.medium': (2, 4096, 'default', 0, False, 'required'),
+    't3a.micro': (2, 1024, 'default', 0, False, 'required'),
+    't3a.nano': (2, 512, 'default', 0, False, 'required'),
+    't3a.small': (2, 2048, 'default', 0, False, 'required'),
+    't3a.xlarge': (4, 16384, 'default', 0, False, 'required'),
+    'trn1.2xlarge': (8, 32768, 'default', 1, True, 'required'),
+    'trn1.32xlarge': (128, 524288, 'default', 4, True, 'required'),
+    'trn1n.32xlarge': (128, 524288, 'default', 4, True, 'required'),
+    'u-12tb1.112xlarge': (448, 12582912, 'default', 0, True, 'required'),
+    'u-18tb1.112xlarge': (448, 18874368, 'default', 0, True, 'required'),
+    'u-24tb1.112xlarge': (448, 25165824, 'default', 0, True, 'required'),
+    'u-3tb1.56xlarge': (224, 3145728, 'default', 0, True, 'required'),
+    'u-6tb1.112xlarge': (448, 6291456, 'default', 0, True, 'required'),
+    'u-6tb1.56xlarge': (224, 6291456, 'default', 0, True, 'required'),
+    'u-9tb1.112xlarge': (448, 9437184, 'default', 0, True, 'required'),
+    'vt1.24xlarge': (96, 196608, 'default', 0, False, 'required'),
+    'vt1.3xlarge': (12, 24576, 'default', 0, False, 'required'),
+    'vt1.6xlarge': (24, 49152, 'default', 0, False, 'required'),
+    'x1.16xlarge': (64, 999424, 'default', 1, True, 'supported'),
+    'x1.32xlarge': (128, 1998848, 'default', 2, True, 'supported'),
+    'x1e.16xlarge': (64, 1998848, 'default', 1, True, 'supported'),
+    'x1e.2xlarge': (8, 249856, 'default', 1, True, 'supported'),
+    'x1e.32xlarge': (128, 3997696, 'default', 2, True, 'supported'),
+    'x1e.4xlarge': (16, 499712, 'default', 1, True, 'supported'),
+    'x1e.8xlarge': (32, 999424, 'default', 1, True, 'supported'),
+    'x1e.xlarge': (4, 124928, 'default', 1, True, 'supported'),
+    'x2idn.16xlarge': (64, 1048576, 'default', 1, True, 'required'),
+    'x2idn.24xlarge': (96, 1572864, 'default', 2, True, 'required'),
+    'x2idn.32xlarge': (128, 2097152, 'default', 2, True, 'required'),
+    'x2idn.metal': (128, 2097152, 'default', 2, True, 'required'),
+    'x2iedn.16xlarge': (64, 2097152, 'default', 1, True, 'required'),
+    'x2iedn.24xlarge': (96, 3145728, 'default', 2, True, 'required'),
+    'x2iedn.2xlarge': (8, 262144, 'default', 1, True, 'required'),
+    'x2iedn.32xlarge': (128, 4194304, 'default', 2, True, 'required'),
+    'x2iedn.4xlarge': (16, 524288, 'default', 1, True, 'required'),
+    'x2iedn.8xlarge': (32, 1048576, 'default', 1, True, 'required'),
+    'x2iedn.metal': (128, 4194304, 'default', 2, True, 'required'),
+    'x2iedn.xlarge': (4, 131072, 'default', 1, True, 'required'),
+    'x2iezn.12xlarge': (48, 1572864, 'default', 0, True, 'required'),
+    'x2iezn.2xlarge': (8, 262144, 'default', 0, True, 'required'),
+    'x2iezn.4xlarge': (16, 524288, 'default', 0, True, 'required'),
+    'x2iezn.6xlarge': (24, 786432, 'default', 0, True, 'required'),
+    'x2iezn.8xlarge': (32, 1048576, 'default', 0, True, 'required'),
+    'x2iezn.metal': (48, 1572864, 'default', 0, True, 'required'),
+    'z1d.12xlarge': (48, 393216, 'default', 2, True, 'required'),
+    'z1d.2xlarge': (8, 65536, 'default', 1, True, 'required'),
+    'z1d.3xlarge': (12, 98304, 'default', 1, True, 'required'),
+    'z1d.6xlarge': (24, 196608, 'default', 1, True, 'required'),
+    'z1d.large': (2, 16384, 'default', 1, True, 'required'),
+    'z1d.metal': (48, 393216, 'default', 2, True, 'required'),
+    'z1d.xlarge': (4, 32768, 'default', 1, True, 'required'),
+}
+
+REGION_OFFERINGS = {
+    'ap-northeast-1': frozenset('''
+        c1.medium c1.xlarge c3.2xlarge c3.4xlarge c3.8xlarge c3.large c3.xlarge c4.2xlarge c4.4xlarge c4.8xlarge
+        c4.large c4.xlarge c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge c5.9xlarge c5.large c5.metal
+        c5.xlarge c5a.12xlarge c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge c5a.8xlarge c5a.large c5a.xlarge
+        c5d.12xlarge c5d.18xlarge c5d.24xlarge c5d.2xlarge c5d.4xlarge c5d.9xlarge c5d.large c5d.metal c5d.xlarge
+        c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large c5n.metal c5n.xlarge c6a.12xlarge c6a.16xlarge
+        c6a.24xlarge c6a.2xlarge c6a.32xlarge c6a.48xlarge c6a.4xlarge c6a.8xlarge c6a.large c6a.metal c6a.xlarge
+        c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge c6i.large c6i.metal
+        c6i.xlarge c6id.12xlarge c6id.16xlarge c6id.24xlarge c6id.2xlarge c6id.32xlarge c6id.4xlarge c6id.8xlarge
+        c6id.large c6id.metal c6id.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge c6in.32xlarge
+        c6in.4xlarge c6in.8xlarge c6in.large c6in.metal c6in.xlarge c7i.12xlarge c7i.16xlarge c7i.24xlarge c7i.2xlarge
+        c7i.48xlarge c7i.4xlarge c7i.8xlarge c7i.large c7i.metal-24xl c7i.metal-48xl c7i.xlarge d2.2xlarge d2.4xlarge
+        d2.8xlarge d2.xlarge d3.2xlarge d3.4xlarge d3.8xlarge d3.xlarge d3en.12xlarge d3en.2xlarge d3en.4xlarge
+        d3en.6xlarge d3en.8xlarge d3en.xlarge g3.16xlarge g3.4xlarge g3.8xlarge g3s.xlarge g4ad.16xlarge g4ad.2xlarge
+        g4ad.4xlarge g4ad.8xlarge g4ad.xlarge g4dn.12xlarge g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge g4dn.8xlarge
+        g4dn.metal g4dn.xlarge g5.12xlarge g5.16xlarge g5.24xlarge g5.2xlarge g5.48xlarge g5.4xlarge g5.8xlarge
+        g5.xlarge i2.2xlarge i2.4xlarge i2.8xlarge i2.xlarge i3.16xlarge i3.2xlarge i3.4xlarge i3.8xlarge i3.large
+        i3.metal i3.xlarge i3en.12xlarge i3en.24xlarge i3en.2xlarge i3en.3xlarge i3en.6xlarge i3en.large i3en.metal
+        i3en.xlarge i4i.12xlarge i4i.16xlarge i4i.24xlarge i4i.2xlarge i4i.32xlarge i4i.4xlarge i4i.8xlarge i4i.large
+        i4i.metal i4i.xlarge inf1.24xlarge inf1.2xlarge inf1.6xlarge inf1.xlarge inf2.24xlarge inf2.48xlarge
+        inf2.8xlarge inf2.xlarge m1.large m1.medium m1.small m1.xlarge m2.2xlarge m2.4xlarge m2.xlarge m3.2xlarge
+        m3.large m3.medium m3.xlarge m4.10xlarge m4.16xlarge m4.2xlarge m4.4xlarge m4.large m4.xlarge m5.12xlarge
+        m5.16xlarge m5.24xlarge m5.2xlarge m5.4xlarge m5.8xlarge m5.large m5.metal m5.xlarge m5a.12xlarge m5a.16xlarge
+        m5a.24xlarge m5a.2xlarge m5a.4xlarge m5a.8xlarge m5a.large m5a.xlarge m5ad.12xlarge m5ad.16xlarge m5ad.24xlarge
+        m5ad.2xlarge m5ad.4xlarge m5ad.8xlarge m5ad.large m5ad.xlarge m5d.12xlarge m5d.16xlarge m5d.24xlarge m5d.2xlarge
+        m5d.4xlarge m5d.8xlarge m5d.large m5d.metal m5d.xlarge m5dn.12xlarge m5dn.16xlarge m5dn.24xlarge m5dn.2xlarge
+        m5dn.4xlarge m5dn.8xlarge m5dn.large m5dn.metal m5dn.xlarge m5n.12xlarge m5n.16xlarge m5n.24xlarge m5n.2xlarge
+        m5n.4xlarge m5n.8xlarge m5n.large m5n.metal m5n.xlarge m5zn.12xlarge m5zn.2xlarge m5zn.3xlarge m5zn.6xlarge
+        m5zn.large m5zn.metal m5zn.xlarge m6a.12xlarge m6a.16xlarge m6a.24xlarge m6a.2xlarge m6a.32xlarge m6a.48xlarge
+        m6a.4xlarge m6a.8xlarge m6a.large m6a.metal m6a.xlarge m6i.12xlarge m6i.16xlarge m6i.24xlarge m6i.2xlarge
+        m6i.32xlarge m6i.4xlarge m6i.8xlarge m6i.large m6i.metal m6i.xlarge m6id.12xlarge m6id.16xlarge m6id.24xlarge
+        m6id.2xlarge m6id.32xlarge m6id.4xlarge m6id.8xlarge m6id.large m6id.metal m6id.xlarge m6idn.12xlarge
+        m6idn.16xlarge m6idn.24xlarge m6idn.2xlarge m6idn.32xlarge m6idn.4xlarge m6idn.8xlarge m6idn.large m6idn.metal
+        m6idn.xlarge m6in.12xlarge m6in.16xlarge m6in.24xlarge m6in.2xlarge m6in.32xlarge m6in.4xlarge m6in.8xlarge
+        m6in.large m6in.metal m6in.xlarge m7i-flex.2xlarge m7i-flex.4xlarge m7i-flex.8xlarge m7i-flex.large
+        m7i-flex.xlarge m7i.12xlarge m7i.16xlarge m7i.24xlarge m7i.2xlarge m7i.48xlarge m7i.4xlarge m7i.8xlarge
+        m7i.large m7i.metal-24xl m7i.metal-48xl m7i.xlarge p2.16xlarge p2.8xlarge p2.xlarge p3.16xlarge p3.2xlarge
+        p3.8xlarge p3dn.24xlarge p4d.24xlarge r3.2xlarge r3.4xlarge r3.8xlarge r3.large r3.xlarge r4.16xlarge r4.2xlarge
+        r4.4xlarge r4.8xlarge r4.large r4.xlarge r5.12xlarge r5.16xlarge r5.24xlarge r5.2xlarge r5.4xlarge r5.8xlarge
+        r5.large r5.metal r5.xlarge r5a.12xlarge r5a.16xlarge r5a.24xlarge r5a.2xlarge r5a.4xlarge r5a.8xlarge r5a.large
+        r5a.xlarge r5ad.12xlarge r5ad.16xlarge r5ad.24xlarge r5ad.2xlarge r5ad.4xlarge r5ad.8xlarge r5ad.large
+        r5ad.xlarge r5b.12xlarge r5b.16xlarge r5b.24xlarge r5b.2xlarge r5b.4xlarge r5b.8xlarge r5b.large r5b.metal
+        r5b.xlarge r5d.12xlarge r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge r5d.8xlarge r5d.large r5d.metal
+        r5d.xlarge r5dn.12xlarge r5dn.16xlarge r5dn.24xlarge r5dn.2xlarge r5dn.4xlarge r5dn.8xlarge r5dn.large
+        r5dn.metal r5dn.xlarge r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge r5n.4xlarge r5n.8xlarge r5n.large
+        r5n.metal r5n.xlarge r6a.12xlarge r6a.16xlarge r6a.24xlarge r6a.2xlarge r6a.32xlarge r6a.48xlarge r6a.4xlarge
+        r6a.8xlarge r6a.large r6a.metal r6a.xlarge r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge r6i.32xlarge
+        r6i.4xlarge r6i.8xlarge r6i.large r6i.metal r6i.xlarge r6id.12xlarge r6id.16xlarge r6id.24xlarge r6id.2xlarge
+        r6id.32xlarge r6id.4xlarge r6id.8xlarge r6id.large r6id.metal r6id.xlarge r6idn.12xlarge r6idn.16xlarge
+        r6idn.24xlarge r6idn.2xlarge r6idn.32xlarge r6idn.4xlarge r6idn.8xlarge r6idn.large r6idn.metal r6idn.xlarge
+        r6in.12xlarge r6in.16xlarge r6in.24xlarge r6in.2xlarge r6in.32xlarge r6in.4xlarge r6in.8xlarge r6in.large
+        r6in.metal r6in.xlarge r7i.12xlarge r7i.16xlarge r7i.24xlarge r7i.2xlarge r7i.48xlarge r7i.4xlarge r7i.8xlarge
+        r7i.large r7i.metal-24xl r7i.metal-48xl r7i.xlarge r7iz.12xlarge r7iz.16xlarge r7iz.2xlarge r7iz.32xlarge
+        r7iz.4xlarge r7iz.8xlarge r7iz.large r7iz.metal-16xl r7iz.metal-32xl r7iz.xlarge t2.2xlarge t2.large t2.medium
+        t2.micro t2.nano t2.small t2.xlarge t3.2xlarge t3.large t3.medium t3.micro t3.nano t3.small t3.xlarge
+        t3a.2xlarge t3a.large t3a.medium t3a.micro t3a.nano t3a.small t3a.xlarge u-12tb1.112xlarge u-3tb1.56xlarge
+        u-6tb1.112xlarge u-6tb1.56xlarge u-9tb1.112xlarge vt1.24xlarge vt1.3xlarge vt1.6xlarge x1.16xlarge x1.32xlarge
+        x1e.16xlarge x1e.2xlarge x1e.32xlarge x1e.4xlarge x1e.8xlarge x1e.xlarge x2idn.16xlarge x2idn.24xlarge
+        x2idn.32xlarge x2idn.metal x2iedn.16xlarge x2iedn.24xlarge x2iedn.2xlarge x2iedn.32xlarge x2iedn.4xlarge
+        x2iedn.8xlarge x2iedn.metal x2iedn.xlarge x2iezn.12xlarge x2iezn.2xlarge x2iezn.4xlarge x2iezn.6xlarge
+        x2iezn.8xlarge x2iezn.metal z1d.12xlarge z1d.2xlarge z1d.3xlarge z1d.6xlarge z1d.large z1d.metal z1d.xlarge
+    '''.split()),
+    'ap-northeast-2': frozenset('''
+        c4.2xlarge c4.4xlarge c4.8xlarge c4.large c4.xlarge c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge
+        c5.9xlarge c5.large c5.metal c5.xlarge c5a.12xlarge c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge
+        c5a.8xlarge c5a.large c5a.xlarge c5d.12xlarge c5d.18xlarge c5d.24xlarge c5d.2xlarge c5d.4xlarge c5d.9xlarge
+        c5d.large c5d.metal c5d.xlarge c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large c5n.metal c5n.xlarge
+        c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge c6i.large c6i.metal
+        c6i.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge c6in.32xlarge c6in.4xlarge c6in.8xlarge
+        c6in.large c6in.metal c6in.xlarge c7i.12xlarge c7i.16xlarge c7i.24xlarge c7i.2xlarge c7i.48xlarge c7i.4xlarge
+        c7i.8xlarge c7i.large c7i.metal-24xl c7i.metal-48xl c7i.xlarge d2.2xlarge d2.4xlarge d2.8xlarge d2.xlarge
+        g3.16xlarge g3.4xlarge g3.8xlarge g3s.xlarge g4dn.12xlarge g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge g4dn.8xlarge
+        g4dn.metal g4dn.xlarge g5.12xlarge g5.16xlarge g5.24xlarge g5.2xlarge g5.48xlarge g5.4xlarge g5.8xlarge
+        g5.xlarge i2.2xlarge i2.4xlarge i2.8xlarge i2.xlarge i3.16xlarge i3.2xlarge i3.4xlarge i3.8xlarge i3.large
+        i3.metal i3.xlarge i3en.12xlarge i3en.24xlarge i3en.2xlarge i3en.3xlarge i3en.6xlarge i3en.large i3en.metal
+        i3en.xlarge i4i.12xlarge i4i.16xlarge i4i.24xlarge i4i.2xlarge i4i.32xlarge i4i.4xlarge i4i.8xlarge i4i.large
+        i4i.metal i4i.xlarge inf1.24xlarge inf1.2xlarge inf1.6xlarge inf1.xlarge m4.10xlarge m4.16xlarge m4.2xlarge
+        m4.4xlarge m4.large m4.xlarge m5.12xlarge m5.16xlarge m5.24xlarge m5.2xlarge m5.4xlarge m5.8xlarge m5.large
+        m5.metal m5.xlarge m5a.12xlarge m5a.16xlarge m5a.24xlarge m5a.2xlarge m5a.4xlarge m5a.8xlarge m5a.large
+        m5a.xlarge m5ad.12xlarge m5ad.16xlarge m5ad.24xlarge m5ad.2xlarge m5ad.4xlarge m5ad.8xlarge m5ad.large
+        m5ad.xlarge m5d.12xlarge m5d.16xlarge m5d.24xlarge m5d.2xlarge m5d.4xlarge m5d.8xlarge m5d.large m5d.metal
+        m5d.xlarge m5zn.12xlarge m5zn.2xlarge m5zn.3xlarge m5zn.6xlarge m5zn.large m5zn.metal m5zn.xlarge m6i.12xlarge
+        m6i.16xlarge m6i.24xlarge m6i.2xlarge m6i.32xlarge m6i.4xlarge m6i.8xlarge m6i.large m6i.metal m6i.xlarge
+        m6id.12xlarge m6id.16xlarge m6id.24xlarge m6id.2xlarge m6id.32xlarge m6id.4xlarge m6id.8xlarge m6id.large
+        m6id.metal m6id.xlarge m7i-flex.2xlarge m7i-flex.4xlarge m7i-flex.8xlarge m7i-flex.large m7i-flex.xlarge
+        m7i.12xlarge m7i.16xlarge m7i.24xlarge m7i.2xlarge m7i.48xlarge m7i.4xlarge m7i.8xlarge m7i.large m7i.metal-24xl
+        m7i.metal-48xl m7i.xlarge p2.16xlarge p2.8xlarge p2.xlarge p3.16xlarge p3.2xlarge p3.8xlarge p4d.24xlarge
+        r3.2xlarge r3.4xlarge r3.8xlarge r3.large r3.xlarge r4.16xlarge r4.2xlarge r4.4xlarge r4.8xlarge r4.large
+        r4.xlarge r5.12xlarge r5.16xlarge r5.24xlarge r5.2xlarge r5.4xlarge r5.8xlarge r5.large r5.metal r5.xlarge
+        r5a.12xlarge r5a.16xlarge r5a.24xlarge r5a.2xlarge r5a.4xlarge r5a.8xlarge r5a.large r5a.xlarge r5ad.12xlarge
+        r5ad.16xlarge r5ad.24xlarge r5ad.2xlarge r5ad.4xlarge r5ad.8xlarge r5ad.large r5ad.xlarge r5b.12xlarge
+        r5b.16xlarge r5b.24xlarge r5b.2xlarge r5b.4xlarge r5b.8xlarge r5b.large r5b.metal r5b.xlarge r5d.12xlarge
+        r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge r5d.8xlarge r5d.large r5d.metal r5d.xlarge r5dn.12xlarge
+        r5dn.16xlarge r5dn.24xlarge r5dn.2xlarge r5dn.4xlarge r5dn.8xlarge r5dn.large r5dn.metal r5dn.xlarge
+        r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge r5n.4xlarge r5n.8xlarge r5n.large r5n.metal r5n.xlarge
+        r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge r6i.32xlarge r6i.4xlarge r6i.8xlarge r6i.large r6i.metal
+        r6i.xlarge r6id.12xlarge r6id.16xlarge r6id.24xlarge r6id.2xlarge r6id.32xlarge r6id.4xlarge r6id.8xlarge
+        r6id.large r6id.metal r6id.xlarge r7i.12xlarge r7i.16xlarge r7i.24xlarge r7i.2xlarge r7i.48xlarge r7i.4xlarge
+        r7i.8xlarge r7i.large r7i.metal-24xl r7i.metal-48xl r7i.xlarge t2.2xlarge t2.large t2.medium t2.micro t2.nano
+        t2.small t2.xlarge t3.2xlarge t3.large t3.medium t3.micro t3.nano t3.small t3.xlarge t3a.2xlarge t3a.large
+        t3a.medium t3a.micro t3a.nano t3a.small t3a.xlarge u-12tb1.112xlarge u-24tb1.112xlarge u-6tb1.112xlarge
+        u-6tb1.56xlarge u-9tb1.112xlarge x1.16xlarge x1.32xlarge x1e.16xlarge x1e.2xlarge x1e.32xlarge x1e.4xlarge
+        x1e.8xlarge x1e.xlarge x2idn.16xlarge x2idn.24xlarge x2idn.32xlarge x2idn.metal x2iedn.16xlarge x2iedn.24xlarge
+        x2iedn.2xlarge x2iedn.32xlarge x2iedn.4xlarge x2iedn.8xlarge x2iedn.metal x2iedn.xlarge z1d.12xlarge z1d.2xlarge
+        z1d.3xlarge z1d.6xlarge z1d.large z1d.metal z1d.xlarge
+    '''.split()),
+    'ap-northeast-3': frozenset('''
+        c4.2xlarge c4.4xlarge c4.8xlarge c4.large c4.xlarge c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge
+        c5.9xlarge c5.large c5.metal c5.xlarge c5d.12xlarge c5d.18xlarge c5d.24xlarge c5d.2xlarge c5d.4xlarge
+        c5d.9xlarge c5d.large c5d.metal c5d.xlarge c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large c5n.metal
+        c5n.xlarge c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge c6i.large
+        c6i.metal c6i.xlarge d2.2xlarge d2.4xlarge d2.8xlarge d2.xlarge g4dn.12xlarge g4dn.16xlarge g4dn.2xlarge
+        g4dn.4xlarge g4dn.8xlarge g4dn.metal g4dn.xlarge i3.16xlarge i3.2xlarge i3.4xlarge i3.8xlarge i3.large i3.metal
+        i3.xlarge i3en.12xlarge i3en.24xlarge i3en.2xlarge i3en.3xlarge i3en.6xlarge i3en.large i3en.metal i3en.xlarge
+        i4i.12xlarge i4i.16xlarge i4i.24xlarge i4i.2xlarge i4i.32xlarge i4i.4xlarge i4i.8xlarge i4i.large i4i.metal
+        i4i.xlarge m4.16xlarge m4.2xlarge m4.4xlarge m4.large m4.xlarge m5.12xlarge m5.16xlarge m5.24xlarge m5.2xlarge
+        m5.4xlarge m5.8xlarge m5.large m5.metal m5.xlarge m5d.12xlarge m5d.16xlarge m5d.24xlarge m5d.2xlarge m5d.4xlarge
+        m5d.8xlarge m5d.large m5d.metal m5d.xlarge m6i.12xlarge m6i.16xlarge m6i.24xlarge m6i.2xlarge m6i.32xlarge
+        m6i.4xlarge m6i.8xlarge m6i.large m6i.metal m6i.xlarge r4.16xlarge r4.2xlarge r4.4xlarge r4.8xlarge r4.large
+        r4.xlarge r5.12xlarge r5.16xlarge r5.24xlarge r5.2xlarge r5.4xlarge r5.8xlarge r5.large r5.metal r5.xlarge
+        r5d.12xlarge r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge r5d.8xlarge r5d.large r5d.metal r5d.xlarge
+        r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge r6i.32xlarge r6i.4xlarge r6i.8xlarge r6i.large r6i.metal
+        r6i.xlarge t2.2xlarge t2.large t2.medium t2.micro t2.nano t2.small t2.xlarge t3.2xlarge t3.large t3.medium
+        t3.micro t3.nano t3.small t3.xlarge x1.16xlarge x1.32xlarge x1e.16xlarge x1e.2xlarge x1e.32xlarge x1e.4xlarge
+        x1e.8xlarge x1e.xlarge x2idn.16xlarge x2idn.24xlarge x2idn.32xlarge x2idn.metal x2iedn.16xlarge x2iedn.24xlarge
+        x2iedn.2xlarge x2iedn.32xlarge x2iedn.4xlarge x2iedn.8xlarge x2iedn.metal x2iedn.xlarge
+    '''.split()),
+    'ap-south-1': frozenset('''
+        c4.2xlarge c4.4xlarge c4.8xlarge c4.large c4.xlarge c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge
+        c5.9xlarge c5.large c5.metal c5.xlarge c5a.12xlarge c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge
+        c5a.8xlarge c5a.large c5a.xlarge c5d.12xlarge c5d.18xlarge c5d.24xlarge c5d.2xlarge c5d.4xlarge c5d.9xlarge
+        c5d.large c5d.metal c5d.xlarge c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large c5n.metal c5n.xlarge
+        c6a.12xlarge c6a.16xlarge c6a.24xlarge c6a.2xlarge c6a.32xlarge c6a.48xlarge c6a.4xlarge c6a.8xlarge c6a.large
+        c6a.metal c6a.xlarge c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge
+        c6i.large c6i.metal c6i.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge c6in.32xlarge c6in.4xlarge
+        c6in.8xlarge c6in.large c6in.metal c6in.xlarge c7i.12xlarge c7i.16xlarge c7i.24xlarge c7i.2xlarge c7i.48xlarge
+        c7i.4xlarge c7i.8xlarge c7i.large c7i.metal-24xl c7i.metal-48xl c7i.xlarge d2.2xlarge d2.4xlarge d2.8xlarge
+        d2.xlarge d3.2xlarge d3.4xlarge d3.8xlarge d3.xlarge g4dn.12xlarge g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge
+        g4dn.8xlarge g4dn.metal g4dn.xlarge g5.12xlarge g5.16xlarge g5.24xlarge g5.2xlarge g5.48xlarge g5.4xlarge
+        g5.8xlarge g5.xlarge i2.2xlarge i2.4xlarge i2.8xlarge i2.xlarge i3.16xlarge i3.2xlarge i3.4xlarge i3.8xlarge
+        i3.large i3.metal i3.xlarge i3en.12xlarge i3en.24xlarge i3en.2xlarge i3en.3xlarge i3en.6xlarge i3en.large
+        i3en.metal i3en.xlarge i4i.12xlarge i4i.16xlarge i4i.24xlarge i4i.2xlarge i4i.32xlarge i4i.4xlarge i4i.8xlarge
+        i4i.large i4i.metal i4i.xlarge inf1.24xlarge inf1.2xlarge inf1.6xlarge inf1.xlarge inf2.24xlarge inf2.48xlarge
+        inf2.8xlarge inf2.xlarge m4.10xlarge m4.16xlarge m4.2xlarge m4.4xlarge m4.large m4.xlarge m5.12xlarge
+        m5.16xlarge m5.24xlarge m5.2xlarge m5.4xlarge m5.8xlarge m5.large m5.metal m5.xlarge m5a.12xlarge m5a.16xlarge
+        m5a.24xlarge m5a.2xlarge m5a.4xlarge m5a.8xlarge m5a.large m5a.xlarge m5ad.12xlarge m5ad.16xlarge m5ad.24xlarge
+        m5ad.2xlarge m5ad.4xlarge m5ad.8xlarge m5ad.large m5ad.xlarge m5d.12xlarge m5d.16xlarge m5d.24xlarge m5d.2xlarge
+        m5d.4xlarge m5d.8xlarge m5d.large m5d.metal m5d.xlarge m6a.12xlarge m6a.16xlarge m6a.24xlarge m6a.2xlarge
+        m6a.32xlarge m6a.48xlarge m6a.4xlarge m6a.8xlarge m6a.large m6a.metal m6a.xlarge m6i.12xlarge m6i.16xlarge
+        m6i.24xlarge m6i.2xlarge m6i.32xlarge m6i.4xlarge m6i.8xlarge m6i.large m6i.metal m6i.xlarge m6id.12xlarge
+        m6id.16xlarge m6id.24xlarge m6id.2xlarge m6id.32xlarge m6id.4xlarge m6id.8xlarge m6id.large m6id.metal
+        m6id.xlarge m7i-flex.2xlarge m7i-flex.4xlarge m7i-flex.8xlarge m7i-flex.large m7i-flex.xlarge m7i.12xlarge
+        m7i.16xlarge m7i.24xlarge m7i.2xlarge m7i.48xlarge m7i.4xlarge m7i.8xlarge m7i.large m7i.metal-24xl
+        m7i.metal-48xl m7i.xlarge p2.16xlarge p2.8xlarge p2.xlarge r3.2xlarge r3.4xlarge r3.8xlarge r3.large r3.xlarge
+        r4.16xlarge r4.2xlarge r4.4xlarge r4.8xlarge r4.large r4.xlarge r5.12xlarge r5.16xlarge r5.24xlarge r5.2xlarge
+        r5.4xlarge r5.8xlarge r5.large r5.metal r5.xlarge r5a.12xlarge r5a.16xlarge r5a.24xlarge r5a.2xlarge r5a.4xlarge
+        r5a.8xlarge r5a.large r5a.xlarge r5ad.12xlarge r5ad.16xlarge r5ad.24xlarge r5ad.2xlarge r5ad.4xlarge
+        r5ad.8xlarge r5ad.large r5ad.xlarge r5d.12xlarge r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge r5d.8xlarge
+        r5d.large r5d.metal r5d.xlarge r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge r5n.4xlarge r5n.8xlarge
+        r5n.large r5n.metal r5n.xlarge r6a.12xlarge r6a.16xlarge r6a.24xlarge r6a.2xlarge r6a.32xlarge r6a.48xlarge
+        r6a.4xlarge r6a.8xlarge r6a.large r6a.metal r6a.xlarge r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge
+        r6i.32xlarge r6i.4xlarge r6i.8xlarge r6i.large r6i.metal r6i.xlarge r6id.12xlarge r6id.16xlarge r6id.24xlarge
+        r6id.2xlarge r6id.32xlarge r6id.4xlarge r6id.8xlarge r6id.large r6id.metal r6id.xlarge r7i.12xlarge r7i.16xlarge
+        r7i.24xlarge r7i.2xlarge r7i.48xlarge r7i.4xlarge r7i.8xlarge r7i.large r7i.metal-24xl r7i.metal-48xl r7i.xlarge
+        t2.2xlarge t2.large t2.medium t2.micro t2.nano t2.small t2.xlarge t3.2xlarge t3.large t3.medium t3.micro t3.nano
+        t3.small t3.xlarge t3a.2xlarge t3a.large t3a.medium t3a.micro t3a.nano t3a.small t3a.xlarge u-12tb1.112xlarge
+        u-6tb1.112xlarge u-6tb1.56xlarge x1.16xlarge x1.32xlarge x1e.16xlarge x1e.2xlarge x1e.32xlarge x1e.4xlarge
+        x1e.8xlarge x1e.xlarge x2idn.16xlarge x2idn.24xlarge x2idn.32xlarge x2idn.metal x2iedn.16xlarge x2iedn.24xlarge
+        x2iedn.2xlarge x2iedn.32xlarge x2iedn.4xlarge x2iedn.8xlarge x2iedn.metal x2iedn.xlarge z1d.12xlarge z1d.2xlarge
+        z1d.3xlarge z1d.6xlarge z1d.large z1d.metal z1d.xlarge
+    '''.split()),
+    'ap-southeast-1': frozenset('''
+        c1.medium c1.xlarge c3.2xlarge c3.4xlarge c3.8xlarge c3.large c3.xlarge c4.2xlarge c4.4xlarge c4.8xlarge
+        c4.large c4.xlarge c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge c5.9xlarge c5.large c5.metal
+        c5.xlarge c5a.12xlarge c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge c5a.8xlarge c5a.large c5a.xlarge
+        c5ad.12xlarge c5ad.16xlarge c5ad.24xlarge c5ad.2xlarge c5ad.4xlarge c5ad.8xlarge c5ad.large c5ad.xlarge
+        c5d.12xlarge c5d.18xlarge c5d.24xlarge c5d.2xlarge c5d.4xlarge c5d.9xlarge c5d.large c5d.metal c5d.xlarge
+        c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large c5n.metal c5n.xlarge c6a.12xlarge c6a.16xlarge
+        c6a.24xlarge c6a.2xlarge c6a.32xlarge c6a.48xlarge c6a.4xlarge c6a.8xlarge c6a.large c6a.metal c6a.xlarge
+        c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge c6i.large c6i.metal
+        c6i.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge c6in.32xlarge c6in.4xlarge c6in.8xlarge
+        c6in.large c6in.metal c6in.xlarge c7i.12xlarge c7i.16xlarge c7i.24xlarge c7i.2xlarge c7i.48xlarge c7i.4xlarge
+        c7i.8xlarge c7i.large c7i.metal-24xl c7i.metal-48xl c7i.xlarge d2.2xlarge d2.4xlarge d2.8xlarge d2.xlarge
+        d3.2xlarge d3.4xlarge d3.8xlarge d3.xlarge d3en.12xlarge d3en.2xlarge d3en.4xlarge d3en.6xlarge d3en.8xlarge
+        d3en.xlarge g3.16xlarge g3.4xlarge g3.8xlarge g4dn.12xlarge g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge g4dn.8xlarge
+        g4dn.metal g4dn.xlarge hpc6a.48xlarge i2.2xlarge i2.4xlarge i2.8xlarge i2.xlarge i3.16xlarge i3.2xlarge
+        i3.4xlarge i3.8xlarge i3.large i3.metal i3.xlarge i3en.12xlarge i3en.24xlarge i3en.2xlarge i3en.3xlarge
+        i3en.6xlarge i3en.large i3en.metal i3en.xlarge i4i.12xlarge i4i.16xlarge i4i.24xlarge i4i.2xlarge i4i.32xlarge
+        i4i.4xlarge i4i.8xlarge i4i.large i4i.metal i4i.xlarge inf1.24xlarge inf1.2xlarge inf1.6xlarge inf1.xlarge
+        inf2.24xlarge inf2.48xlarge inf2.8xlarge inf2.xlarge m1.large m1.medium m1.small m1.xlarge m2.2xlarge m2.4xlarge
+        m2.xlarge m3.2xlarge m3.large m3.medium m3.xlarge m4.10xlarge m4.16xlarge m4.2xlarge m4.4xlarge m4.large
+        m4.xlarge m5.12xlarge m5.16xlarge m5.24xlarge m5.2xlarge m5.4xlarge m5.8xlarge m5.large m5.metal m5.xlarge
+        m5a.12xlarge m5a.16xlarge m5a.24xlarge m5a.2xlarge m5a.4xlarge m5a.8xlarge m5a.large m5a.xlarge m5ad.12xlarge
+        m5ad.16xlarge m5ad.24xlarge m5ad.2xlarge m5ad.4xlarge m5ad.8xlarge m5ad.large m5ad.xlarge m5d.12xlarge
+        m5d.16xlarge m5d.24xlarge m5d.2xlarge m5d.4xlarge m5d.8xlarge m5d.large m5d.metal m5d.xlarge m5dn.12xlarge
+        m5dn.16xlarge m5dn.24xlarge m5dn.2xlarge m5dn.4xlarge m5dn.8xlarge m5dn.large m5dn.metal m5dn.xlarge
+        m5n.12xlarge m5n.16xlarge m5n.24xlarge m5n.2xlarge m5n.4xlarge m5n.8xlarge m5n.large m5n.metal m5n.xlarge
+        m5zn.12xlarge m5zn.2xlarge m5zn.3xlarge m5zn.6xlarge m5zn.large m5zn.metal m5zn.xlarge m6a.12xlarge m6a.16xlarge
+        m6a.24xlarge m6a.2xlarge m6a.32xlarge m6a.48xlarge m6a.4xlarge m6a.8xlarge m6a.large m6a.metal m6a.xlarge
+        m6i.12xlarge m6i.16xlarge m6i.24xlarge m6i.2xlarge m6i.32xlarge m6i.4xlarge m6i.8xlarge m6i.large m6i.metal
+        m6i.xlarge m6id.12xlarge m6id.16xlarge m6id.24xlarge m6id.2xlarge m6id.32xlarge m6id.4xlarge m6id.8xlarge
+        m6id.large m6id.metal m6id.xlarge m6idn.12xlarge m6idn.16xlarge m6idn.24xlarge m6idn.2xlarge m6idn.32xlarge
+        m6idn.4xlarge m6idn.8xlarge m6idn.large m6idn.metal m6idn.xlarge m6in.12xlarge m6in.16xlarge m6in.24xlarge
+        m6in.2xlarge m6in.32xlarge m6in.4xlarge m6in.8xlarge m6in.large m6in.metal m6in.xlarge m7i-flex.2xlarge
+        m7i-flex.4xlarge m7i-flex.8xlarge m7i-flex.large m7i-flex.xlarge m7i.12xlarge m7i.16xlarge m7i.24xlarge
+        m7i.2xlarge m7i.48xlarge m7i.4xlarge m7i.8xlarge m7i.large m7i.metal-24xl m7i.metal-48xl m7i.xlarge p2.16xlarge
+        p2.8xlarge p2.xlarge p3.16xlarge p3.2xlarge p3.8xlarge r3.2xlarge r3.4xlarge r3.8xlarge r3.large r3.xlarge
+        r4.16xlarge r4.2xlarge r4.4xlarge r4.8xlarge r4.large r4.xlarge r5.12xlarge r5.16xlarge r5.24xlarge r5.2xlarge
+        r5.4xlarge r5.8xlarge r5.large r5.metal r5.xlarge r5a.12xlarge r5a.16xlarge r5a.24xlarge r5a.2xlarge r5a.4xlarge
+        r5a.8xlarge r5a.large r5a.xlarge r5ad.12xlarge r5ad.16xlarge r5ad.24xlarge r5ad.2xlarge r5ad.4xlarge
+        r5ad.8xlarge r5ad.large r5ad.xlarge r5b.12xlarge r5b.16xlarge r5b.24xlarge r5b.2xlarge r5b.4xlarge r5b.8xlarge
+        r5b.large r5b.metal r5b.xlarge r5d.12xlarge r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge r5d.8xlarge
+        r5d.large r5d.metal r5d.xlarge r5dn.12xlarge r5dn.16xlarge r5dn.24xlarge r5dn.2xlarge r5dn.4xlarge r5dn.8xlarge
+        r5dn.large r5dn.metal r5dn.xlarge r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge r5n.4xlarge r5n.8xlarge
+        r5n.large r5n.metal r5n.xlarge r6a.12xlarge r6a.16xlarge r6a.24xlarge r6a.2xlarge r6a.32xlarge r6a.48xlarge
+        r6a.4xlarge r6a.8xlarge r6a.large r6a.metal r6a.xlarge r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge
+        r6i.32xlarge r6i.4xlarge r6i.8xlarge r6i.large r6i.metal r6i.xlarge r6id.12xlarge r6id.16xlarge r6id.24xlarge
+        r6id.2xlarge r6id.32xlarge r6id.4xlarge r6id.8xlarge r6id.large r6id.metal r6id.xlarge r6idn.12xlarge
+        r6idn.16xlarge r6idn.24xlarge r6idn.2xlarge r6idn.32xlarge r6idn.4xlarge r6idn.8xlarge r6idn.large r6idn.metal
+        r6idn.xlarge r6in.12xlarge r6in.16xlarge r6in.24xlarge r6in.2xlarge r6in.32xlarge r6in.4xlarge r6in.8xlarge
+        r6in.large r6in.metal r6in.xlarge r7i.12xlarge r7i.16xlarge r7i.24xlarge r7i.2xlarge r7i.48xlarge r7i.4xlarge
+        r7i.8xlarge r7i.large r7i.metal-24xl r7i.metal-48xl r7i.xlarge t2.2xlarge t2.large t2.medium t2.micro t2.nano
+        t2.small t2.xlarge t3.2xlarge t3.large t3.medium t3.micro t3.nano t3.small t3.xlarge t3a.2xlarge t3a.large
+        t3a.medium t3a.micro t3a.nano t3a.small t3a.xlarge u-12tb1.112xlarge u-3tb1.56xlarge u-6tb1.112xlarge
+        u-6tb1.56xlarge u-9tb1.112xlarge x1.16xlarge x1.32xlarge x1e.16xlarge x1e.2xlarge x1e.32xlarge x1e.4xlarge
+        x1e.8xlarge x1e.xlarge x2idn.16xlarge x2idn.24xlarge x2idn.32xlarge x2idn.metal x2iedn.16xlarge x2iedn.24xlarge
+        x2iedn.2xlarge x2iedn.32xlarge x2iedn.4xlarge x2iedn.8xlarge x2iedn.metal x2iedn.xlarge z1d.12xlarge z1d.2xlarge
+        z1d.3xlarge z1d.6xlarge z1d.large z1d.metal z1d.xlarge
+    '''.split()),
+    'ap-southeast-2': frozenset('''
+        c1.medium c1.xlarge c3.2xlarge c3.4xlarge c3.8xlarge c3.large c3.xlarge c4.2xlarge c4.4xlarge c4.8xlarge
+        c4.large c4.xlarge c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge c5.9xlarge c5.large c5.metal
+        c5.xlarge c5a.12xlarge c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge c5a.8xlarge c5a.large c5a.xlarge
+        c5ad.12xlarge c5ad.16xlarge c5ad.24xlarge c5ad.2xlarge c5ad.4xlarge c5ad.8xlarge c5ad.large c5ad.xlarge
+        c5d.12xlarge c5d.18xlarge c5d.24xlarge c5d.2xlarge c5d.4xlarge c5d.9xlarge c5d.large c5d.metal c5d.xlarge
+        c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large c5n.metal c5n.xlarge c6a.12xlarge c6a.16xlarge
+        c6a.24xlarge c6a.2xlarge c6a.32xlarge c6a.48xlarge c6a.4xlarge c6a.8xlarge c6a.large c6a.metal c6a.xlarge
+        c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge c6i.large c6i.metal
+        c6i.xlarge c6id.12xlarge c6id.16xlarge c6id.24xlarge c6id.2xlarge c6id.32xlarge c6id.4xlarge c6id.8xlarge
+        c6id.large c6id.metal c6id.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge c6in.32xlarge
+        c6in.4xlarge c6in.8xlarge c6in.large c6in.metal c6in.xlarge c7i.12xlarge c7i.16xlarge c7i.24xlarge c7i.2xlarge
+        c7i.48xlarge c7i.4xlarge c7i.8xlarge c7i.large c7i.metal-24xl c7i.metal-48xl c7i.xlarge d2.2xlarge d2.4xlarge
+        d2.8xlarge d2.xlarge d3.2xlarge d3.4xlarge d3.8xlarge d3.xlarge f1.16xlarge f1.2xlarge f1.4xlarge g3.16xlarge
+        g3.4xlarge g3.8xlarge g3s.xlarge g4dn.12xlarge g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge g4dn.8xlarge g4dn.metal
+        g4dn.xlarge g5.12xlarge g5.16xlarge g5.24xlarge g5.2xlarge g5.48xlarge g5.4xlarge g5.8xlarge g5.xlarge
+        hpc6a.48xlarge i2.2xlarge i2.4xlarge i2.8xlarge i2.xlarge i3.16xlarge i3.2xlarge i3.4xlarge i3.8xlarge i3.large
+        i3.metal i3.xlarge i3en.12xlarge i3en.24xlarge i3en.2xlarge i3en.3xlarge i3en.6xlarge i3en.large i3en.metal
+        i3en.xlarge i4i.12xlarge i4i.16xlarge i4i.24xlarge i4i.2xlarge i4i.32xlarge i4i.4xlarge i4i.8xlarge i4i.large
+        i4i.metal i4i.xlarge inf1.24xlarge inf1.2xlarge inf1.6xlarge inf1.xlarge m1.large m1.medium m1.small m1.xlarge
+        m2.2xlarge m2.4xlarge m2.xlarge m3.2xlarge m3.large m3.medium m3.xlarge m4.10xlarge m4.16xlarge m4.2xlarge
+        m4.4xlarge m4.large m4.xlarge m5.12xlarge m5.16xlarge m5.24xlarge m5.2xlarge m5.4xlarge m5.8xlarge m5.large
+        m5.metal m5.xlarge m5a.12xlarge m5a.16xlarge m5a.24xlarge m5a.2xlarge m5a.4xlarge m5a.8xlarge m5a.large
+        m5a.xlarge m5ad.12xlarge m5ad.16xlarge m5ad.24xlarge m5ad.2xlarge m5ad.4xlarge m5ad.8xlarge m5ad.large
+        m5ad.xlarge m5d.12xlarge m5d.16xlarge m5d.24xlarge m5d.2xlarge m5d.4xlarge m5d.8xlarge m5d.large m5d.metal
+        m5d.xlarge m5zn.12xlarge m5zn.2xlarge m5zn.3xlarge m5zn.6xlarge m5zn.large m5zn.metal m5zn.xlarge m6a.12xlarge
+        m6a.16xlarge m6a.24xlarge m6a.2xlarge m6a.32xlarge m6a.48xlarge m6a.4xlarge m6a.8xlarge m6a.large m6a.metal
+        m6a.xlarge m6i.12xlarge m6i.16xlarge m6i.24xlarge m6i.2xlarge m6i.32xlarge m6i.4xlarge m6i.8xlarge m6i.large
+        m6i.metal m6i.xlarge m6id.12xlarge m6id.16xlarge m6id.24xlarge m6id.2xlarge m6id.32xlarge m6id.4xlarge
+        m6id.8xlarge m6id.large m6id.metal m6id.xlarge m6idn.12xlarge m6idn.16xlarge m6idn.24xlarge m6idn.2xlarge
+        m6idn.32xlarge m6idn.4xlarge m6idn.8xlarge m6idn.large m6idn.metal m6idn.xlarge m6in.12xlarge m6in.16xlarge
+        m6in.24xlarge m6in.2xlarge m6in.32xlarge m6in.4xlarge m6in.8xlarge m6in.large m6in.metal m6in.xlarge
+        m7i-flex.2xlarge m7i-flex.4xlarge m7i-flex.8xlarge m7i-flex.large m7i-flex.xlarge m7i.12xlarge m7i.16xlarge
+        m7i.24xlarge m7i.2xlarge m7i.48xlarge m7i.4xlarge m7i.8xlarge m7i.large m7i.metal-24xl m7i.metal-48xl m7i.xlarge
+        p2.16xlarge p2.8xlarge p2.xlarge p3.16xlarge p3.2xlarge p3.8xlarge r3.2xlarge r3.4xlarge r3.8xlarge r3.large
+        r3.xlarge r4.16xlarge r4.2xlarge r4.4xlarge r4.8xlarge r4.large r4.xlarge r5.12xlarge r5.16xlarge r5.24xlarge
+        r5.2xlarge r5.4xlarge r5.8xlarge r5.large r5.metal r5.xlarge r5a.12xlarge r5a.16xlarge r5a.24xlarge r5a.2xlarge
+        r5a.4xlarge r5a.8xlarge r5a.large r5a.xlarge r5ad.12xlarge r5ad.16xlarge r5ad.24xlarge r5ad.2xlarge r5ad.4xlarge
+        r5ad.8xlarge r5ad.large r5ad.xlarge r5b.12xlarge r5b.16xlarge r5b.24xlarge r5b.2xlarge r5b.4xlarge r5b.8xlarge
+        r5b.large r5b.metal r5b.xlarge r5d.12xlarge r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge r5d.8xlarge
+        r5d.large r5d.metal r5d.xlarge r5dn.12xlarge r5dn.16xlarge r5dn.24xlarge r5dn.2xlarge r5dn.4xlarge r5dn.8xlarge
+        r5dn.large r5dn.metal r5dn.xlarge r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge r5n.4xlarge r5n.8xlarge
+        r5n.large r5n.metal r5n.xlarge r6a.12xlarge r6a.16xlarge r6a.24xlarge r6a.2xlarge r6a.32xlarge r6a.48xlarge
+        r6a.4xlarge r6a.8xlarge r6a.large r6a.metal r6a.xlarge r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge
+        r6i.32xlarge r6i.4xlarge r6i.8xlarge r6i.large r6i.metal r6i.xlarge r6id.12xlarge r6id.16xlarge r6id.24xlarge
+        r6id.2xlarge r6id.32xlarge r6id.4xlarge r6id.8xlarge r6id.large r6id.metal r6id.xlarge r7i.12xlarge r7i.16xlarge
+        r7i.24xlarge r7i.2xlarge r7i.48xlarge r7i.4xlarge r7i.8xlarge r7i.large r7i.metal-24xl r7i.metal-48xl r7i.xlarge
+        t2.2xlarge t2.large t2.medium t2.micro t2.nano t2.small t2.xlarge t3.2xlarge t3.large t3.medium t3.micro t3.nano
+        t3.small t3.xlarge t3a.2xlarge t3a.large t3a.medium t3a.micro t3a.nano t3a.small t3a.xlarge u-12tb1.112xlarge
+        u-3tb1.56xlarge u-6tb1.112xlarge u-6tb1.56xlarge x1.16xlarge x1.32xlarge x1e.16xlarge x1e.2xlarge x1e.32xlarge
+        x1e.4xlarge x1e.8xlarge x1e.xlarge x2idn.16xlarge x2idn.24xlarge x2idn.32xlarge x2idn.metal x2iedn.16xlarge
+        x2iedn.24xlarge x2iedn.2xlarge x2iedn.32xlarge x2iedn.4xlarge x2iedn.8xlarge x2iedn.metal x2iedn.xlarge
+        z1d.12xlarge z1d.2xlarge z1d.3xlarge z1d.6xlarge z1d.large z1d.metal z1d.xlarge
+    '''.split()),
+    'ca-central-1': frozenset('''
+        c4.2xlarge c4.4xlarge c4.8xlarge c4.large c4.xlarge c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge
+        c5.9xlarge c5.large c5.metal c5.xlarge c5a.12xlarge c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge
+        c5a.8xlarge c5a.large c5a.xlarge c5d.12xlarge c5d.18xlarge c5d.24xlarge c5d.2xlarge c5d.4xlarge c5d.9xlarge
+        c5d.large c5d.metal c5d.xlarge c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large c5n.metal c5n.xlarge
+        c6a.12xlarge c6a.16xlarge c6a.24xlarge c6a.2xlarge c6a.32xlarge c6a.48xlarge c6a.4xlarge c6a.8xlarge c6a.large
+        c6a.metal c6a.xlarge c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge
+        c6i.large c6i.metal c6i.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge c6in.32xlarge c6in.4xlarge
+        c6in.8xlarge c6in.large c6in.metal c6in.xlarge c7i.12xlarge c7i.16xlarge c7i.24xlarge c7i.2xlarge c7i.48xlarge
+        c7i.4xlarge c7i.8xlarge c7i.large c7i.metal-24xl c7i.metal-48xl c7i.xlarge d2.2xlarge d2.4xlarge d2.8xlarge
+        d2.xlarge d3.2xlarge d3.4xlarge d3.8xlarge d3.xlarge g3.16xlarge g3.4xlarge g3.8xlarge g4ad.16xlarge
+        g4ad.2xlarge g4ad.4xlarge g4ad.8xlarge g4ad.xlarge g4dn.12xlarge g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge
+        g4dn.8xlarge g4dn.metal g4dn.xlarge g5.12xlarge g5.16xlarge g5.24xlarge g5.2xlarge g5.48xlarge g5.4xlarge
+        g5.8xlarge g5.xlarge i3.16xlarge i3.2xlarge i3.4xlarge i3.8xlarge i3.large i3.metal i3.xlarge i3en.12xlarge
+        i3en.24xlarge i3en.2xlarge i3en.3xlarge i3en.6xlarge i3en.large i3en.metal i3en.xlarge i4i.12xlarge i4i.16xlarge
+        i4i.24xlarge i4i.2xlarge i4i.32xlarge i4i.4xlarge i4i.8xlarge i4i.large i4i.metal i4i.xlarge inf1.24xlarge
+        inf1.2xlarge inf1.6xlarge inf1.xlarge m4.10xlarge m4.16xlarge m4.2xlarge m4.4xlarge m4.large m4.xlarge
+        m5.12xlarge m5.16xlarge m5.24xlarge m5.2xlarge m5.4xlarge m5.8xlarge m5.large m5.metal m5.xlarge m5a.12xlarge
+        m5a.16xlarge m5a.24xlarge m5a.2xlarge m5a.4xlarge m5a.8xlarge m5a.large m5a.xlarge m5ad.12xlarge m5ad.16xlarge
+        m5ad.24xlarge m5ad.2xlarge m5ad.4xlarge m5ad.8xlarge m5ad.large m5ad.xlarge m5d.12xlarge m5d.16xlarge
+        m5d.24xlarge m5d.2xlarge m5d.4xlarge m5d.8xlarge m5d.large m5d.metal m5d.xlarge m6a.12xlarge m6a.16xlarge
+        m6a.24xlarge m6a.2xlarge m6a.32xlarge m6a.48xlarge m6a.4xlarge m6a.8xlarge m6a.large m6a.metal m6a.xlarge
+        m6i.12xlarge m6i.16xlarge m6i.24xlarge m6i.2xlarge m6i.32xlarge m6i.4xlarge m6i.8xlarge m6i.large m6i.metal
+        m6i.xlarge m6id.12xlarge m6id.16xlarge m6id.24xlarge m6id.2xlarge m6id.32xlarge m6id.4xlarge m6id.8xlarge
+        m6id.large m6id.metal m6id.xlarge m7i-flex.2xlarge m7i-flex.4xlarge m7i-flex.8xlarge m7i-flex.large
+        m7i-flex.xlarge m7i.12xlarge m7i.16xlarge m7i.24xlarge m7i.2xlarge m7i.48xlarge m7i.4xlarge m7i.8xlarge
+        m7i.large m7i.metal-24xl m7i.metal-48xl m7i.xlarge p3.16xlarge p3.2xlarge p3.8xlarge r4.16xlarge r4.2xlarge
+        r4.4xlarge r4.8xlarge r4.large r4.xlarge r5.12xlarge r5.16xlarge r5.24xlarge r5.2xlarge r5.4xlarge r5.8xlarge
+        r5.large r5.metal r5.xlarge r5a.12xlarge r5a.16xlarge r5a.24xlarge r5a.2xlarge r5a.4xlarge r5a.8xlarge r5a.large
+        r5a.xlarge r5ad.12xlarge r5ad.16xlarge r5ad.24xlarge r5ad.2xlarge r5ad.4xlarge r5ad.8xlarge r5ad.large
+        r5ad.xlarge r5b.12xlarge r5b.16xlarge r5b.24xlarge r5b.2xlarge r5b.4xlarge r5b.8xlarge r5b.large r5b.metal
+        r5b.xlarge r5d.12xlarge r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge r5d.8xlarge r5d.large r5d.metal
+        r5d.xlarge r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge r5n.4xlarge r5n.8xlarge r5n.large r5n.metal
+        r5n.xlarge r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge r6i.32xlarge r6i.4xlarge r6i.8xlarge r6i.large
+        r6i.metal r6i.xlarge r7i.12xlarge r7i.16xlarge r7i.24xlarge r7i.2xlarge r7i.48xlarge r7i.4xlarge r7i.8xlarge
+        r7i.large r7i.metal-24xl r7i.metal-48xl r7i.xlarge t2.2xlarge t2.large t2.medium t2.micro t2.nano t2.small
+        t2.xlarge t3.2xlarge t3.large t3.medium t3.micro t3.nano t3.small t3.xlarge t3a.2xlarge t3a.large t3a.medium
+        t3a.micro t3a.nano t3a.small t3a.xlarge u-3tb1.56xlarge u-6tb1.112xlarge u-6tb1.56xlarge x1.16xlarge x1.32xlarge
+        x1e.16xlarge x1e.2xlarge x1e.32xlarge x1e.4xlarge x1e.8xlarge x1e.xlarge x2idn.16xlarge x2idn.24xlarge
+        x2idn.32xlarge x2idn.metal x2iedn.16xlarge x2iedn.24xlarge x2iedn.2xlarge x2iedn.32xlarge x2iedn.4xlarge
+        x2iedn.8xlarge x2iedn.metal x2iedn.xlarge
+    '''.split()),
+    'eu-central-1': frozenset('''
+        c3.2xlarge c3.4xlarge c3.8xlarge c3.large c3.xlarge c4.2xlarge c4.4xlarge c4.8xlarge c4.large c4.xlarge
+        c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge c5.9xlarge c5.large c5.metal c5.xlarge c5a.12xlarge
+        c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge c5a.8xlarge c5a.large c5a.xlarge c5ad.12xlarge c5ad.16xlarge
+        c5ad.24xlarge c5ad.2xlarge c5ad.4xlarge c5ad.8xlarge c5ad.large c5ad.xlarge c5d.12xlarge c5d.18xlarge
+        c5d.24xlarge c5d.2xlarge c5d.4xlarge c5d.9xlarge c5d.large c5d.metal c5d.xlarge c5n.18xlarge c5n.2xlarge
+        c5n.4xlarge c5n.9xlarge c5n.large c5n.metal c5n.xlarge c6a.12xlarge c6a.16xlarge c6a.24xlarge c6a.2xlarge
+        c6a.32xlarge c6a.48xlarge c6a.4xlarge c6a.8xlarge c6a.large c6a.metal c6a.xlarge c6i.12xlarge c6i.16xlarge
+        c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge c6i.large c6i.metal c6i.xlarge c6id.12xlarge
+        c6id.16xlarge c6id.24xlarge c6id.2xlarge c6id.32xlarge c6id.4xlarge c6id.8xlarge c6id.large c6id.metal
+        c6id.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge c6in.32xlarge c6in.4xlarge c6in.8xlarge
+        c6in.large c6in.metal c6in.xlarge d2.2xlarge d2.4xlarge d2.8xlarge d2.xlarge d3.2xlarge d3.4xlarge d3.8xlarge
+        d3.xlarge d3en.12xlarge d3en.2xlarge d3en.4xlarge d3en.6xlarge d3en.8xlarge d3en.xlarge dl2q.24xlarge f1.2xlarge
+        f1.4xlarge g3.16xlarge g3.4xlarge g3.8xlarge g3s.xlarge g4ad.16xlarge g4ad.2xlarge g4ad.4xlarge g4ad.8xlarge
+        g4ad.xlarge g4dn.12xlarge g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge g4dn.8xlarge g4dn.metal g4dn.xlarge
+        g5.12xlarge g5.16xlarge g5.24xlarge g5.2xlarge g5.48xlarge g5.4xlarge g5.8xlarge g5.xlarge i2.2xlarge i2.4xlarge
+        i2.8xlarge i2.xlarge i3.16xlarge i3.2xlarge i3.4xlarge i3.8xlarge i3.large i3.metal i3.xlarge i3en.12xlarge
+        i3en.24xlarge i3en.2xlarge i3en.3xlarge i3en.6xlarge i3en.large i3en.metal i3en.xlarge i4i.12xlarge i4i.16xlarge
+        i4i.24xlarge i4i.2xlarge i4i.32xlarge i4i.4xlarge i4i.8xlarge i4i.large i4i.metal i4i.xlarge inf1.24xlarge
+        inf1.2xlarge inf1.6xlarge inf1.xlarge inf2.24xlarge inf2.48xlarge inf2.8xlarge inf2.xlarge m3.2xlarge m3.large
+        m3.medium m3.xlarge m4.10xlarge m4.16xlarge m4.2xlarge m4.4xlarge m4.large m4.xlarge m5.12xlarge m5.16xlarge
+        m5.24xlarge m5.2xlarge m5.4xlarge m5.8xlarge m5.large m5.metal m5.xlarge m5a.12xlarge m5a.16xlarge m5a.24xlarge
+        m5a.2xlarge m5a.4xlarge m5a.8xlarge m5a.large m5a.xlarge m5ad.12xlarge m5ad.16xlarge m5ad.24xlarge m5ad.2xlarge
+        m5ad.4xlarge m5ad.8xlarge m5ad.large m5ad.xlarge m5d.12xlarge m5d.16xlarge m5d.24xlarge m5d.2xlarge m5d.4xlarge
+        m5d.8xlarge m5d.large m5d.metal m5d.xlarge m5dn.12xlarge m5dn.16xlarge m5dn.24xlarge m5dn.2xlarge m5dn.4xlarge
+        m5dn.8xlarge m5dn.large m5dn.metal m5dn.xlarge m5n.12xlarge m5n.16xlarge m5n.24xlarge m5n.2xlarge m5n.4xlarge
+        m5n.8xlarge m5n.large m5n.metal m5n.xlarge m5zn.12xlarge m5zn.2xlarge m5zn.3xlarge m5zn.6xlarge m5zn.large
+        m5zn.metal m5zn.xlarge m6a.12xlarge m6a.16xlarge m6a.24xlarge m6a.2xlarge m6a.32xlarge m6a.48xlarge m6a.4xlarge
+        m6a.8xlarge m6a.large m6a.metal m6a.xlarge m6i.12xlarge m6i.16xlarge m6i.24xlarge m6i.2xlarge m6i.32xlarge
+        m6i.4xlarge m6i.8xlarge m6i.large m6i.metal m6i.xlarge m6id.12xlarge m6id.16xlarge m6id.24xlarge m6id.2xlarge
+        m6id.32xlarge m6id.4xlarge m6id.8xlarge m6id.large m6id.metal m6id.xlarge m6idn.12xlarge m6idn.16xlarge
+        m6idn.24xlarge m6idn.2xlarge m6idn.32xlarge m6idn.4xlarge m6idn.8xlarge m6idn.large m6idn.metal m6idn.xlarge
+        m6in.12xlarge m6in.16xlarge m6in.24xlarge m6in.2xlarge m6in.32xlarge m6in.4xlarge m6in.8xlarge m6in.large
+        m6in.metal m6in.xlarge m7i-flex.2xlarge m7i-flex.4xlarge m7i-flex.8xlarge m7i-flex.large m7i-flex.xlarge
+        m7i.12xlarge m7i.16xlarge m7i.24xlarge m7i.2xlarge m7i.48xlarge m7i.4xlarge m7i.8xlarge m7i.large m7i.metal-24xl
+        m7i.metal-48xl m7i.xlarge p2.16xlarge p2.8xlarge p2.xlarge p3.16xlarge p3.2xlarge p3.8xlarge p4d.24xlarge
+        r3.2xlarge r3.4xlarge r3.8xlarge r3.large r3.xlarge r4.16xlarge r4.2xlarge r4.4xlarge r4.8xlarge r4.large
+        r4.xlarge r5.12xlarge r5.16xlarge r5.24xlarge r5.2xlarge r5.4xlarge r5.8xlarge r5.large r5.metal r5.xlarge
+        r5a.12xlarge r5a.16xlarge r5a.24xlarge r5a.2xlarge r5a.4xlarge r5a.8xlarge r5a.large r5a.xlarge r5ad.12xlarge
+        r5ad.16xlarge r5ad.24xlarge r5ad.2xlarge r5ad.4xlarge r5ad.8xlarge r5ad.large r5ad.xlarge r5b.12xlarge
+        r5b.16xlarge r5b.24xlarge r5b.2xlarge r5b.4xlarge r5b.8xlarge r5b.large r5b.metal r5b.xlarge r5d.12xlarge
+        r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge r5d.8xlarge r5d.large r5d.metal r5d.xlarge r5dn.12xlarge
+        r5dn.16xlarge r5dn.24xlarge r5dn.2xlarge r5dn.4xlarge r5dn.8xlarge r5dn.large r5dn.metal r5dn.xlarge
+        r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge r5n.4xlarge r5n.8xlarge r5n.large r5n.metal r5n.xlarge
+        r6a.12xlarge r6a.16xlarge r6a.24xlarge r6a.2xlarge r6a.32xlarge r6a.48xlarge r6a.4xlarge r6a.8xlarge r6a.large
+        r6a.metal r6a.xlarge r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge r6i.32xlarge r6i.4xlarge r6i.8xlarge
+        r6i.large r6i.metal r6i.xlarge r6id.12xlarge r6id.16xlarge r6id.24xlarge r6id.2xlarge r6id.32xlarge r6id.4xlarge
+        r6id.8xlarge r6id.large r6id.metal r6id.xlarge r6idn.12xlarge r6idn.16xlarge r6idn.24xlarge r6idn.2xlarge
+        r6idn.32xlarge r6idn.4xlarge r6idn.8xlarge r6idn.large r6idn.metal r6idn.xlarge r6in.12xlarge r6in.16xlarge
+        r6in.24xlarge r6in.2xlarge r6in.32xlarge r6in.4xlarge r6in.8xlarge r6in.large r6in.metal r6in.xlarge
+        r7i.12xlarge r7i.16xlarge r7i.24xlarge r7i.2xlarge r7i.48xlarge r7i.4xlarge r7i.8xlarge r7i.large r7i.metal-24xl
+        r7i.metal-48xl r7i.xlarge r7iz.12xlarge r7iz.16xlarge r7iz.2xlarge r7iz.32xlarge r7iz.4xlarge r7iz.8xlarge
+        r7iz.large r7iz.metal-16xl r7iz.metal-32xl r7iz.xlarge t2.2xlarge t2.large t2.medium t2.micro t2.nano t2.small
+        t2.xlarge t3.2xlarge t3.large t3.medium t3.micro t3.nano t3.small t3.xlarge t3a.2xlarge t3a.large t3a.medium
+        t3a.micro t3a.nano t3a.small t3a.xlarge u-12tb1.112xlarge u-3tb1.56xlarge u-6tb1.112xlarge u-6tb1.56xlarge
+        u-9tb1.112xlarge x1.16xlarge x1.32xlarge x1e.16xlarge x1e.2xlarge x1e.32xlarge x1e.4xlarge x1e.8xlarge
+        x1e.xlarge x2idn.16xlarge x2idn.24xlarge x2idn.32xlarge x2idn.metal x2iedn.16xlarge x2iedn.24xlarge
+        x2iedn.2xlarge x2iedn.32xlarge x2iedn.4xlarge x2iedn.8xlarge x2iedn.metal x2iedn.xlarge z1d.12xlarge z1d.2xlarge
+        z1d.3xlarge z1d.6xlarge z1d.large z1d.metal z1d.xlarge
+    '''.split()),
+    'eu-west-1': frozenset('''
+        c1.medium c1.xlarge c3.2xlarge c3.4xlarge c3.8xlarge c3.large c3.xlarge c4.2xlarge c4.4xlarge c4.8xlarge
+        c4.large c4.xlarge c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge c5.9xlarge c5.large c5.metal
+        c5.xlarge c5a.12xlarge c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge c5a.8xlarge c5a.large c5a.xlarge
+        c5ad.12xlarge c5ad.16xlarge c5ad.24xlarge c5ad.2xlarge c5ad.4xlarge c5ad.8xlarge c5ad.large c5ad.xlarge
+        c5d.12xlarge c5d.18xlarge c5d.24xlarge c5d.2xlarge c5d.4xlarge c5d.9xlarge c5d.large c5d.metal c5d.xlarge
+        c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large c5n.metal c5n.xlarge c6a.12xlarge c6a.16xlarge
+        c6a.24xlarge c6a.2xlarge c6a.32xlarge c6a.48xlarge c6a.4xlarge c6a.8xlarge c6a.large c6a.metal c6a.xlarge
+        c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge c6i.large c6i.metal
+        c6i.xlarge c6id.12xlarge c6id.16xlarge c6id.24xlarge c6id.2xlarge c6id.32xlarge c6id.4xlarge c6id.8xlarge
+        c6id.large c6id.metal c6id.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge c6in.32xlarge
+        c6in.4xlarge c6in.8xlarge c6in.large c6in.metal c6in.xlarge c7a.12xlarge c7a.16xlarge c7a.24xlarge c7a.2xlarge
+        c7a.32xlarge c7a.48xlarge c7a.4xlarge c7a.8xlarge c7a.large c7a.medium c7a.metal-48xl c7a.xlarge c7i.12xlarge
+        c7i.16xlarge c7i.24xlarge c7i.2xlarge c7i.48xlarge c7i.4xlarge c7i.8xlarge c7i.large c7i.metal-24xl
+        c7i.metal-48xl c7i.xlarge d2.2xlarge d2.4xlarge d2.8xlarge d2.xlarge d3.2xlarge d3.4xlarge d3.8xlarge d3.xlarge
+        d3en.12xlarge d3en.2xlarge d3en.4xlarge d3en.6xlarge d3en.8xlarge d3en.xlarge f1.16xlarge f1.2xlarge f1.4xlarge
+        g3.16xlarge g3.4xlarge g3.8xlarge g3s.xlarge g4ad.16xlarge g4ad.2xlarge g4ad.4xlarge g4ad.8xlarge g4ad.xlarge
+        g4dn.12xlarge g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge g4dn.8xlarge g4dn.metal g4dn.xlarge g5.12xlarge
+        g5.16xlarge g5.24xlarge g5.2xlarge g5.48xlarge g5.4xlarge g5.8xlarge g5.xlarge h1.16xlarge h1.2xlarge h1.4xlarge
+        h1.8xlarge hpc7a.12xlarge hpc7a.24xlarge hpc7a.48xlarge hpc7a.96xlarge i2.2xlarge i2.4xlarge i2.8xlarge
+        i2.xlarge i3.16xlarge i3.2xlarge i3.4xlarge i3.8xlarge i3.large i3.metal i3.xlarge i3en.12xlarge i3en.24xlarge
+        i3en.2xlarge i3en.3xlarge i3en.6xlarge i3en.large i3en.metal i3en.xlarge i4i.12xlarge i4i.16xlarge i4i.24xlarge
+        i4i.2xlarge i4i.32xlarge i4i.4xlarge i4i.8xlarge i4i.large i4i.metal i4i.xlarge inf1.24xlarge inf1.2xlarge
+        inf1.6xlarge inf1.xlarge inf2.24xlarge inf2.48xlarge inf2.8xlarge inf2.xlarge m1.large m1.medium m1.small
+        m1.xlarge m2.2xlarge m2.4xlarge m2.xlarge m3.2xlarge m3.large m3.medium m3.xlarge m4.10xlarge m4.16xlarge
+        m4.2xlarge m4.4xlarge m4.large m4.xlarge m5.12xlarge m5.16xlarge m5.24xlarge m5.2xlarge m5.4xlarge m5.8xlarge
+        m5.large m5.metal m5.xlarge m5a.12xlarge m5a.16xlarge m5a.24xlarge m5a.2xlarge m5a.4xlarge m5a.8xlarge m5a.large
+        m5a.xlarge m5ad.12xlarge m5ad.16xlarge m5ad.24xlarge m5ad.2xlarge m5ad.4xlarge m5ad.8xlarge m5ad.large
+        m5ad.xlarge m5d.12xlarge m5d.16xlarge m5d.24xlarge m5d.2xlarge m5d.4xlarge m5d.8xlarge m5d.large m5d.metal
+        m5d.xlarge m5dn.12xlarge m5dn.16xlarge m5dn.24xlarge m5dn.2xlarge m5dn.4xlarge m5dn.8xlarge m5dn.large
+        m5dn.metal m5dn.xlarge m5n.12xlarge m5n.16xlarge m5n.24xlarge m5n.2xlarge m5n.4xlarge m5n.8xlarge m5n.large
+        m5n.xlarge m5zn.12xlarge m5zn.2xlarge m5zn.3xlarge m5zn.6xlarge m5zn.large m5zn.metal m5zn.xlarge m6a.12xlarge
+        m6a.16xlarge m6a.24xlarge m6a.2xlarge m6a.32xlarge m6a.48xlarge m6a.4xlarge m6a.8xlarge m6a.large m6a.metal
+        m6a.xlarge m6i.12xlarge m6i.16xlarge m6i.24xlarge m6i.2xlarge m6i.32xlarge m6i.4xlarge m6i.8xlarge m6i.large
+        m6i.metal m6i.xlarge m6id.12xlarge m6id.16xlarge m6id.24xlarge m6id.2xlarge m6id.32xlarge m6id.4xlarge
+        m6id.8xlarge m6id.large m6id.metal m6id.xlarge m6idn.12xlarge m6idn.16xlarge m6idn.24xlarge m6idn.2xlarge
+        m6idn.32xlarge m6idn.4xlarge m6idn.8xlarge m6idn.large m6idn.metal m6idn.xlarge m6in.12xlarge m6in.16xlarge
+        m6in.24xlarge m6in.2xlarge m6in.32xlarge m6in.4xlarge m6in.8xlarge m6in.large m6in.metal m6in.xlarge
+        m7a.12xlarge m7a.16xlarge m7a.24xlarge m7a.2xlarge m7a.32xlarge m7a.48xlarge m7a.4xlarge m7a.8xlarge m7a.large
+        m7a.medium m7a.metal-48xl m7a.xlarge m7i-flex.2xlarge m7i-flex.4xlarge m7i-flex.8xlarge m7i-flex.large
+        m7i-flex.xlarge m7i.12xlarge m7i.16xlarge m7i.24xlarge m7i.2xlarge m7i.48xlarge m7i.4xlarge m7i.8xlarge
+        m7i.large m7i.metal-24xl m7i.metal-48xl m7i.xlarge p2.16xlarge p2.8xlarge p2.xlarge p3.16xlarge p3.2xlarge
+        p3.8xlarge p3dn.24xlarge p4d.24xlarge r3.2xlarge r3.4xlarge r3.8xlarge r3.large r3.xlarge r4.16xlarge r4.2xlarge
+        r4.4xlarge r4.8xlarge r4.large r4.xlarge r5.12xlarge r5.16xlarge r5.24xlarge r5.2xlarge r5.4xlarge r5.8xlarge
+        r5.large r5.metal r5.xlarge r5a.12xlarge r5a.16xlarge r5a.24xlarge r5a.2xlarge r5a.4xlarge r5a.8xlarge r5a.large
+        r5a.xlarge r5ad.12xlarge r5ad.16xlarge r5ad.24xlarge r5ad.2xlarge r5ad.4xlarge r5ad.8xlarge r5ad.large
+        r5ad.xlarge r5b.12xlarge r5b.16xlarge r5b.24xlarge r5b.2xlarge r5b.4xlarge r5b.8xlarge r5b.large r5b.metal
+        r5b.xlarge r5d.12xlarge r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge r5d.8xlarge r5d.large r5d.metal
+        r5d.xlarge r5dn.12xlarge r5dn.16xlarge r5dn.24xlarge r5dn.2xlarge r5dn.4xlarge r5dn.8xlarge r5dn.large
+        r5dn.metal r5dn.xlarge r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge r5n.4xlarge r5n.8xlarge r5n.large
+        r5n.metal r5n.xlarge r6a.12xlarge r6a.16xlarge r6a.24xlarge r6a.2xlarge r6a.32xlarge r6a.48xlarge r6a.4xlarge
+        r6a.8xlarge r6a.large r6a.metal r6a.xlarge r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge r6i.32xlarge
+        r6i.4xlarge r6i.8xlarge r6i.large r6i.metal r6i.xlarge r6id.12xlarge r6id.16xlarge r6id.24xlarge r6id.2xlarge
+        r6id.32xlarge r6id.4xlarge r6id.8xlarge r6id.large r6id.metal r6id.xlarge r6idn.12xlarge r6idn.16xlarge
+        r6idn.24xlarge r6idn.2xlarge r6idn.32xlarge r6idn.4xlarge r6idn.8xlarge r6idn.large r6idn.metal r6idn.xlarge
+        r6in.12xlarge r6in.16xlarge r6in.24xlarge r6in.2xlarge r6in.32xlarge r6in.4xlarge r6in.8xlarge r6in.large
+        r6in.metal r6in.xlarge r7a.12xlarge r7a.16xlarge r7a.24xlarge r7a.2xlarge r7a.32xlarge r7a.48xlarge r7a.4xlarge
+        r7a.8xlarge r7a.large r7a.medium r7a.metal-48xl r7a.xlarge r7i.12xlarge r7i.16xlarge r7i.24xlarge r7i.2xlarge
+        r7i.48xlarge r7i.4xlarge r7i.8xlarge r7i.large r7i.metal-24xl r7i.metal-48xl r7i.xlarge r7iz.12xlarge
+        r7iz.16xlarge r7iz.2xlarge r7iz.32xlarge r7iz.4xlarge r7iz.8xlarge r7iz.large r7iz.metal-16xl r7iz.metal-32xl
+        r7iz.xlarge t2.2xlarge t2.large t2.medium t2.micro t2.nano t2.small t2.xlarge t3.2xlarge t3.large t3.medium
+        t3.micro t3.nano t3.small t3.xlarge t3a.2xlarge t3a.large t3a.medium t3a.micro t3a.nano t3a.small t3a.xlarge
+        u-12tb1.112xlarge u-18tb1.112xlarge u-3tb1.56xlarge u-6tb1.112xlarge u-6tb1.56xlarge u-9tb1.112xlarge
+        vt1.24xlarge vt1.3xlarge vt1.6xlarge x1.16xlarge x1.32xlarge x1e.16xlarge x1e.2xlarge x1e.32xlarge x1e.4xlarge
+        x1e.8xlarge x1e.xlarge x2idn.16xlarge x2idn.24xlarge x2idn.32xlarge x2idn.metal x2iedn.16xlarge x2iedn.24xlarge
+        x2iedn.2xlarge x2iedn.32xlarge x2iedn.4xlarge x2iedn.8xlarge x2iedn.metal x2iedn.xlarge x2iezn.12xlarge
+        x2iezn.2xlarge x2iezn.4xlarge x2iezn.6xlarge x2iezn.8xlarge x2iezn.metal z1d.12xlarge z1d.2xlarge z1d.3xlarge
+        z1d.6xlarge z1d.large z1d.metal z1d.xlarge
+    '''.split()),
+    'eu-west-2': frozenset('''
+        c4.2xlarge c4.4xlarge c4.8xlarge c4.large c4.xlarge c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge
+        c5.9xlarge c5.large c5.metal c5.xlarge c5a.12xlarge c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge
+        c5a.8xlarge c5a.large c5a.xlarge c5d.12xlarge c5d.18xlarge c5d.24xlarge c5d.2xlarge c5d.4xlarge c5d.9xlarge
+        c5d.large c5d.metal c5d.xlarge c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large c5n.metal c5n.xlarge
+        c6a.12xlarge c6a.16xlarge c6a.24xlarge c6a.2xlarge c6a.32xlarge c6a.48xlarge c6a.4xlarge c6a.8xlarge c6a.large
+        c6a.metal c6a.xlarge c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge
+        c6i.large c6i.metal c6i.xlarge c6id.12xlarge c6id.16xlarge c6id.24xlarge c6id.2xlarge c6id.32xlarge c6id.4xlarge
+        c6id.8xlarge c6id.large c6id.metal c6id.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge
+        c6in.32xlarge c6in.4xlarge c6in.8xlarge c6in.large c6in.metal c6in.xlarge c7i.12xlarge c7i.16xlarge c7i.24xlarge
+        c7i.2xlarge c7i.48xlarge c7i.4xlarge c7i.8xlarge c7i.large c7i.metal-24xl c7i.metal-48xl c7i.xlarge d2.2xlarge
+        d2.4xlarge d2.8xlarge d2.xlarge d3.2xlarge d3.4xlarge d3.8xlarge d3.xlarge f1.2xlarge f1.4xlarge g3.16xlarge
+        g3.4xlarge g3.8xlarge g3s.xlarge g4ad.16xlarge g4ad.2xlarge g4ad.4xlarge g4ad.8xlarge g4ad.xlarge g4dn.12xlarge
+        g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge g4dn.8xlarge g4dn.metal g4dn.xlarge g5.12xlarge g5.16xlarge g5.24xlarge
+        g5.2xlarge g5.48xlarge g5.4xlarge g5.8xlarge g5.xlarge i3.16xlarge i3.2xlarge i3.4xlarge i3.8xlarge i3.large
+        i3.metal i3.xlarge i3en.12xlarge i3en.24xlarge i3en.2xlarge i3en.3xlarge i3en.6xlarge i3en.large i3en.metal
+        i3en.xlarge i4i.12xlarge i4i.16xlarge i4i.24xlarge i4i.2xlarge i4i.32xlarge i4i.4xlarge i4i.8xlarge i4i.large
+        i4i.metal i4i.xlarge inf1.24xlarge inf1.2xlarge inf1.6xlarge inf1.xlarge m4.10xlarge m4.16xlarge m4.2xlarge
+        m4.4xlarge m4.large m4.xlarge m5.12xlarge m5.16xlarge m5.24xlarge m5.2xlarge m5.4xlarge m5.8xlarge m5.large
+        m5.metal m5.xlarge m5a.12xlarge m5a.16xlarge m5a.24xlarge m5a.2xlarge m5a.4xlarge m5a.8xlarge m5a.large
+        m5a.xlarge m5ad.12xlarge m5ad.16xlarge m5ad.24xlarge m5ad.2xlarge m5ad.4xlarge m5ad.8xlarge m5ad.large
+        m5ad.xlarge m5d.12xlarge m5d.16xlarge m5d.24xlarge m5d.2xlarge m5d.4xlarge m5d.8xlarge m5d.large m5d.metal
+        m5d.xlarge m6a.12xlarge m6a.16xlarge m6a.24xlarge m6a.2xlarge m6a.32xlarge m6a.48xlarge m6a.4xlarge m6a.8xlarge
+        m6a.large m6a.metal m6a.xlarge m6i.12xlarge m6i.16xlarge m6i.24xlarge m6i.2xlarge m6i.32xlarge m6i.4xlarge
+        m6i.8xlarge m6i.large m6i.metal m6i.xlarge m7i-flex.2xlarge m7i-flex.4xlarge m7i-flex.8xlarge m7i-flex.large
+        m7i-flex.xlarge m7i.12xlarge m7i.16xlarge m7i.24xlarge m7i.2xlarge m7i.48xlarge m7i.4xlarge m7i.8xlarge
+        m7i.large m7i.metal-24xl m7i.metal-48xl m7i.xlarge p3.16xlarge p3.2xlarge p3.8xlarge r4.16xlarge r4.2xlarge
+        r4.4xlarge r4.8xlarge r4.large r4.xlarge r5.12xlarge r5.16xlarge r5.24xlarge r5.2xlarge r5.4xlarge r5.8xlarge
+        r5.large r5.metal r5.xlarge r5a.12xlarge r5a.16xlarge r5a.24xlarge r5a.2xlarge r5a.4xlarge r5a.8xlarge r5a.large
+        r5a.xlarge r5ad.12xlarge r5ad.16xlarge r5ad.24xlarge r5ad.2xlarge r5ad.4xlarge r5ad.8xlarge r5ad.large
+        r5ad.xlarge r5b.12xlarge r5b.16xlarge r5b.24xlarge r5b.2xlarge r5b.4xlarge r5b.8xlarge r5b.large r5b.metal
+        r5b.xlarge r5d.12xlarge r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge r5d.8xlarge r5d.large r5d.metal
+        r5d.xlarge r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge r5n.4xlarge r5n.8xlarge r5n.large r5n.metal
+        r5n.xlarge r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge r6i.32xlarge r6i.4xlarge r6i.8xlarge r6i.large
+        r6i.metal r6i.xlarge r6id.12xlarge r6id.16xlarge r6id.24xlarge r6id.2xlarge r6id.32xlarge r6id.4xlarge
+        r6id.8xlarge r6id.large r6id.metal r6id.xlarge r7i.12xlarge r7i.16xlarge r7i.24xlarge r7i.2xlarge r7i.48xlarge
+        r7i.4xlarge r7i.8xlarge r7i.large r7i.metal-24xl r7i.metal-48xl r7i.xlarge t2.2xlarge t2.large t2.medium
+        t2.micro t2.nano t2.small t2.xlarge t3.2xlarge t3.large t3.medium t3.micro t3.nano t3.small t3.xlarge
+        t3a.2xlarge t3a.large t3a.medium t3a.micro t3a.nano t3a.small t3a.xlarge u-6tb1.112xlarge u-6tb1.56xlarge
+        u-9tb1.112xlarge x1.16xlarge x1.32xlarge x2idn.16xlarge x2idn.24xlarge x2idn.32xlarge x2idn.metal
+        x2iedn.16xlarge x2iedn.24xlarge x2iedn.2xlarge x2iedn.32xlarge x2iedn.4xlarge x2iedn.8xlarge x2iedn.metal
+        x2iedn.xlarge z1d.12xlarge z1d.2xlarge z1d.3xlarge z1d.6xlarge z1d.large z1d.metal z1d.xlarge
+    '''.split()),
+    'eu-west-3': frozenset('''
+        c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge c5.9xlarge c5.large c5.metal c5.xlarge c5a.12xlarge
+        c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge c5a.8xlarge c5a.large c5a.xlarge c5d.18xlarge c5d.2xlarge
+        c5d.4xlarge c5d.9xlarge c5d.large c5d.xlarge c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large
+        c5n.metal c5n.xlarge c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge
+        c6i.large c6i.metal c6i.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge c6in.32xlarge c6in.4xlarge
+        c6in.8xlarge c6in.large c6in.metal c6in.xlarge d2.2xlarge d2.4xlarge d2.8xlarge d2.xlarge g4dn.12xlarge
+        g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge g4dn.8xlarge g4dn.metal g4dn.xlarge i3.16xlarge i3.2xlarge i3.4xlarge
+        i3.8xlarge i3.large i3.metal i3.xlarge i3en.12xlarge i3en.24xlarge i3en.2xlarge i3en.3xlarge i3en.6xlarge
+        i3en.large i3en.metal i3en.xlarge i4i.12xlarge i4i.16xlarge i4i.24xlarge i4i.2xlarge i4i.32xlarge i4i.4xlarge
+        i4i.8xlarge i4i.large i4i.metal i4i.xlarge inf1.24xlarge inf1.2xlarge inf1.6xlarge inf1.xlarge m5.12xlarge
+        m5.16xlarge m5.24xlarge m5.2xlarge m5.4xlarge m5.8xlarge m5.large m5.metal m5.xlarge m5a.12xlarge m5a.16xlarge
+        m5a.24xlarge m5a.2xlarge m5a.4xlarge m5a.8xlarge m5a.large m5a.xlarge m5ad.12xlarge m5ad.16xlarge m5ad.24xlarge
+        m5ad.2xlarge m5ad.4xlarge m5ad.8xlarge m5ad.large m5ad.xlarge m5d.12xlarge m5d.16xlarge m5d.24xlarge m5d.2xlarge
+        m5d.4xlarge m5d.8xlarge m5d.large m5d.metal m5d.xlarge m6i.12xlarge m6i.16xlarge m6i.24xlarge m6i.2xlarge
+        m6i.32xlarge m6i.4xlarge m6i.8xlarge m6i.large m6i.metal m6i.xlarge m7i-flex.2xlarge m7i-flex.4xlarge
+        m7i-flex.8xlarge m7i-flex.large m7i-flex.xlarge m7i.12xlarge m7i.16xlarge m7i.24xlarge m7i.2xlarge m7i.48xlarge
+        m7i.4xlarge m7i.8xlarge m7i.large m7i.metal-24xl m7i.metal-48xl m7i.xlarge r4.16xlarge r4.2xlarge r4.4xlarge
+        r4.8xlarge r4.large r4.xlarge r5.12xlarge r5.16xlarge r5.24xlarge r5.2xlarge r5.4xlarge r5.8xlarge r5.large
+        r5.metal r5.xlarge r5a.12xlarge r5a.16xlarge r5a.24xlarge r5a.2xlarge r5a.4xlarge r5a.8xlarge r5a.large
+        r5a.xlarge r5ad.12xlarge r5ad.16xlarge r5ad.24xlarge r5ad.2xlarge r5ad.4xlarge r5ad.8xlarge r5ad.large
+        r5ad.xlarge r5d.12xlarge r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge r5d.8xlarge r5d.large r5d.metal
+        r5d.xlarge r5dn.12xlarge r5dn.16xlarge r5dn.24xlarge r5dn.2xlarge r5dn.4xlarge r5dn.8xlarge r5dn.large
+        r5dn.metal r5dn.xlarge r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge r5n.4xlarge r5n.8xlarge r5n.large
+        r5n.metal r5n.xlarge r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge r6i.32xlarge r6i.4xlarge r6i.8xlarge
+        r6i.large r6i.metal r6i.xlarge t2.2xlarge t2.large t2.medium t2.micro t2.nano t2.small t2.xlarge t3.2xlarge
+        t3.large t3.medium t3.micro t3.nano t3.small t3.xlarge t3a.2xlarge t3a.large t3a.medium t3a.micro t3a.nano
+        t3a.small t3a.xlarge u-6tb1.112xlarge u-6tb1.56xlarge x1.16xlarge x1.32xlarge x2idn.16xlarge x2idn.24xlarge
+        x2idn.32xlarge x2idn.metal x2iedn.16xlarge x2iedn.24xlarge x2iedn.2xlarge x2iedn.32xlarge x2iedn.4xlarge
+        x2iedn.8xlarge x2iedn.metal x2iedn.xlarge
+    '''.split()),
+    'sa-east-1': frozenset('''
+        c1.medium c1.xlarge c3.2xlarge c3.4xlarge c3.8xlarge c3.large c3.xlarge c4.2xlarge c4.4xlarge c4.8xlarge
+        c4.large c4.xlarge c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge c5.9xlarge c5.large c5.metal
+        c5.xlarge c5a.12xlarge c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge c5a.8xlarge c5a.large c5a.xlarge
+        c5ad.12xlarge c5ad.16xlarge c5ad.24xlarge c5ad.2xlarge c5ad.4xlarge c5ad.8xlarge c5ad.large c5ad.xlarge
+        c5d.12xlarge c5d.18xlarge c5d.24xlarge c5d.2xlarge c5d.4xlarge c5d.9xlarge c5d.large c5d.metal c5d.xlarge
+        c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large c5n.metal c5n.xlarge c6a.12xlarge c6a.16xlarge
+        c6a.24xlarge c6a.2xlarge c6a.32xlarge c6a.48xlarge c6a.4xlarge c6a.8xlarge c6a.large c6a.metal c6a.xlarge
+        c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge c6i.large c6i.metal
+        c6i.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge c6in.32xlarge c6in.4xlarge c6in.8xlarge
+        c6in.large c6in.metal c6in.xlarge g4dn.12xlarge g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge g4dn.8xlarge g4dn.metal
+        g4dn.xlarge g5.12xlarge g5.16xlarge g5.24xlarge g5.2xlarge g5.48xlarge g5.4xlarge g5.8xlarge g5.xlarge
+        i3.16xlarge i3.2xlarge i3.4xlarge i3.8xlarge i3.large i3.metal i3.xlarge i3en.12xlarge i3en.24xlarge
+        i3en.2xlarge i3en.3xlarge i3en.6xlarge i3en.large i3en.metal i3en.xlarge i4i.12xlarge i4i.16xlarge i4i.24xlarge
+        i4i.2xlarge i4i.32xlarge i4i.4xlarge i4i.8xlarge i4i.large i4i.metal i4i.xlarge inf1.24xlarge inf1.2xlarge
+        inf1.6xlarge inf1.xlarge m1.large m1.medium m1.small m1.xlarge m2.2xlarge m2.4xlarge m2.xlarge m3.2xlarge
+        m3.large m3.medium m3.xlarge m4.10xlarge m4.16xlarge m4.2xlarge m4.4xlarge m4.large m4.xlarge m5.12xlarge
+        m5.16xlarge m5.24xlarge m5.2xlarge m5.4xlarge m5.8xlarge m5.large m5.metal m5.xlarge m5a.12xlarge m5a.16xlarge
+        m5a.24xlarge m5a.2xlarge m5a.4xlarge m5a.8xlarge m5a.large m5a.xlarge m5ad.12xlarge m5ad.16xlarge m5ad.24xlarge
+        m5ad.2xlarge m5ad.4xlarge m5ad.8xlarge m5ad.large m5ad.xlarge m5d.12xlarge m5d.16xlarge m5d.24xlarge m5d.2xlarge
+        m5d.4xlarge m5d.8xlarge m5d.large m5d.metal m5d.xlarge m5zn.12xlarge m5zn.2xlarge m5zn.3xlarge m5zn.6xlarge
+        m5zn.large m5zn.metal m5zn.xlarge m6a.12xlarge m6a.16xlarge m6a.24xlarge m6a.2xlarge m6a.32xlarge m6a.48xlarge
+        m6a.4xlarge m6a.8xlarge m6a.large m6a.metal m6a.xlarge m6i.12xlarge m6i.16xlarge m6i.24xlarge m6i.2xlarge
+        m6i.32xlarge m6i.4xlarge m6i.8xlarge m6i.large m6i.metal m6i.xlarge m6id.12xlarge m6id.16xlarge m6id.24xlarge
+        m6id.2xlarge m6id.32xlarge m6id.4xlarge m6id.8xlarge m6id.large m6id.metal m6id.xlarge r3.2xlarge r3.4xlarge
+        r3.8xlarge r3.large r3.xlarge r4.16xlarge r4.2xlarge r4.4xlarge r4.8xlarge r4.large r4.xlarge r5.12xlarge
+        r5.16xlarge r5.24xlarge r5.2xlarge r5.4xlarge r5.8xlarge r5.large r5.metal r5.xlarge r5a.12xlarge r5a.16xlarge
+        r5a.24xlarge r5a.2xlarge r5a.4xlarge r5a.8xlarge r5a.large r5a.xlarge r5ad.12xlarge r5ad.16xlarge r5ad.24xlarge
+        r5ad.2xlarge r5ad.4xlarge r5ad.8xlarge r5ad.large r5ad.xlarge r5b.12xlarge r5b.16xlarge r5b.24xlarge r5b.2xlarge
+        r5b.4xlarge r5b.8xlarge r5b.large r5b.metal r5b.xlarge r5d.12xlarge r5d.16xlarge r5d.24xlarge r5d.2xlarge
+        r5d.4xlarge r5d.8xlarge r5d.large r5d.metal r5d.xlarge r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge
+        r5n.4xlarge r5n.8xlarge r5n.large r5n.metal r5n.xlarge r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge
+        r6i.32xlarge r6i.4xlarge r6i.8xlarge r6i.large r6i.metal r6i.xlarge t2.2xlarge t2.large t2.medium t2.micro
+        t2.nano t2.small t2.xlarge t3.2xlarge t3.large t3.medium t3.micro t3.nano t3.small t3.xlarge t3a.2xlarge
+        t3a.large t3a.medium t3a.micro t3a.nano t3a.small t3a.xlarge u-12tb1.112xlarge u-3tb1.56xlarge u-6tb1.112xlarge
+        u-6tb1.56xlarge x1.16xlarge x1.32xlarge x1e.16xlarge x1e.2xlarge x1e.32xlarge x1e.4xlarge x1e.8xlarge x1e.xlarge
+        x2idn.16xlarge x2idn.24xlarge x2idn.32xlarge x2idn.metal x2iedn.16xlarge x2iedn.24xlarge x2iedn.2xlarge
+        x2iedn.32xlarge x2iedn.4xlarge x2iedn.8xlarge x2iedn.metal x2iedn.xlarge
+    '''.split()),
+    'us-east-1': frozenset('''
+        c1.medium c1.xlarge c3.2xlarge c3.4xlarge c3.8xlarge c3.large c3.xlarge c4.2xlarge c4.4xlarge c4.8xlarge
+        c4.large c4.xlarge c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge c5.9xlarge c5.large c5.metal
+        c5.xlarge c5a.12xlarge c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge c5a.8xlarge c5a.large c5a.xlarge
+        c5ad.12xlarge c5ad.16xlarge c5ad.24xlarge c5ad.2xlarge c5ad.4xlarge c5ad.8xlarge c5ad.large c5ad.xlarge
+        c5d.12xlarge c5d.18xlarge c5d.24xlarge c5d.2xlarge c5d.4xlarge c5d.9xlarge c5d.large c5d.metal c5d.xlarge
+        c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large c5n.metal c5n.xlarge c6a.12xlarge c6a.16xlarge
+        c6a.24xlarge c6a.2xlarge c6a.32xlarge c6a.48xlarge c6a.4xlarge c6a.8xlarge c6a.large c6a.metal c6a.xlarge
+        c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge c6i.large c6i.metal
+        c6i.xlarge c6id.12xlarge c6id.16xlarge c6id.24xlarge c6id.2xlarge c6id.32xlarge c6id.4xlarge c6id.8xlarge
+        c6id.large c6id.metal c6id.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge c6in.32xlarge
+        c6in.4xlarge c6in.8xlarge c6in.large c6in.metal c6in.xlarge c7a.12xlarge c7a.16xlarge c7a.24xlarge c7a.2xlarge
+        c7a.32xlarge c7a.48xlarge c7a.4xlarge c7a.8xlarge c7a.large c7a.medium c7a.metal-48xl c7a.xlarge c7i.12xlarge
+        c7i.16xlarge c7i.24xlarge c7i.2xlarge c7i.48xlarge c7i.4xlarge c7i.8xlarge c7i.large c7i.metal-24xl
+        c7i.metal-48xl c7i.xlarge d2.2xlarge d2.4xlarge d2.8xlarge d2.xlarge d3.2xlarge d3.4xlarge d3.8xlarge d3.xlarge
+        d3en.12xlarge d3en.2xlarge d3en.4xlarge d3en.6xlarge d3en.8xlarge d3en.xlarge dl1.24xlarge f1.16xlarge
+        f1.2xlarge f1.4xlarge g3.16xlarge g3.4xlarge g3.8xlarge g3s.xlarge g4ad.16xlarge g4ad.2xlarge g4ad.4xlarge
+        g4ad.8xlarge g4ad.xlarge g4dn.12xlarge g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge g4dn.8xlarge g4dn.metal
+        g4dn.xlarge g5.12xlarge g5.16xlarge g5.24xlarge g5.2xlarge g5.48xlarge g5.4xlarge g5.8xlarge g5.xlarge
+        h1.16xlarge h1.2xlarge h1.4xlarge h1.8xlarge i2.2xlarge i2.4xlarge i2.8xlarge i2.xlarge i3.16xlarge i3.2xlarge
+        i3.4xlarge i3.8xlarge i3.large i3.metal i3.xlarge i3en.12xlarge i3en.24xlarge i3en.2xlarge i3en.3xlarge
+        i3en.6xlarge i3en.large i3en.metal i3en.xlarge i4i.12xlarge i4i.16xlarge i4i.24xlarge i4i.2xlarge i4i.32xlarge
+        i4i.4xlarge i4i.8xlarge i4i.large i4i.metal i4i.xlarge inf1.24xlarge inf1.2xlarge inf1.6xlarge inf1.xlarge
+        inf2.24xlarge inf2.48xlarge inf2.8xlarge inf2.xlarge m1.large m1.medium m1.small m1.xlarge m2.2xlarge m2.4xlarge
+        m2.xlarge m3.2xlarge m3.large m3.medium m3.xlarge m4.10xlarge m4.16xlarge m4.2xlarge m4.4xlarge m4.large
+        m4.xlarge m5.12xlarge m5.16xlarge m5.24xlarge m5.2xlarge m5.4xlarge m5.8xlarge m5.large m5.metal m5.xlarge
+        m5a.12xlarge m5a.16xlarge m5a.24xlarge m5a.2xlarge m5a.4xlarge m5a.8xlarge m5a.large m5a.xlarge m5ad.12xlarge
+        m5ad.16xlarge m5ad.24xlarge m5ad.2xlarge m5ad.4xlarge m5ad.8xlarge m5ad.large m5ad.xlarge m5d.12xlarge
+        m5d.16xlarge m5d.24xlarge m5d.2xlarge m5d.4xlarge m5d.8xlarge m5d.large m5d.metal m5d.xlarge m5dn.12xlarge
+        m5dn.16xlarge m5dn.24xlarge m5dn.2xlarge m5dn.4xlarge m5dn.8xlarge m5dn.large m5dn.metal m5dn.xlarge
+        m5n.12xlarge m5n.16xlarge m5n.24xlarge m5n.2xlarge m5n.4xlarge m5n.8xlarge m5n.large m5n.metal m5n.xlarge
+        m5zn.12xlarge m5zn.2xlarge m5zn.3xlarge m5zn.6xlarge m5zn.large m5zn.metal m5zn.xlarge m6a.12xlarge m6a.16xlarge
+        m6a.24xlarge m6a.2xlarge m6a.32xlarge m6a.48xlarge m6a.4xlarge m6a.8xlarge m6a.large m6a.metal m6a.xlarge
+        m6i.12xlarge m6i.16xlarge m6i.24xlarge m6i.2xlarge m6i.32xlarge m6i.4xlarge m6i.8xlarge m6i.large m6i.metal
+        m6i.xlarge m6id.12xlarge m6id.16xlarge m6id.24xlarge m6id.2xlarge m6id.32xlarge m6id.4xlarge m6id.8xlarge
+        m6id.large m6id.metal m6id.xlarge m6idn.12xlarge m6idn.16xlarge m6idn.24xlarge m6idn.2xlarge m6idn.32xlarge
+        m6idn.4xlarge m6idn.8xlarge m6idn.large m6idn.metal m6idn.xlarge m6in.12xlarge m6in.16xlarge m6in.24xlarge
+        m6in.2xlarge m6in.32xlarge m6in.4xlarge m6in.8xlarge m6in.large m6in.metal m6in.xlarge m7a.12xlarge m7a.16xlarge
+        m7a.24xlarge m7a.2xlarge m7a.32xlarge m7a.48xlarge m7a.4xlarge m7a.8xlarge m7a.large m7a.medium m7a.metal-48xl
+        m7a.xlarge m7i-flex.2xlarge m7i-flex.4xlarge m7i-flex.8xlarge m7i-flex.large m7i-flex.xlarge m7i.12xlarge
+        m7i.16xlarge m7i.24xlarge m7i.2xlarge m7i.48xlarge m7i.4xlarge m7i.8xlarge m7i.large m7i.metal-24xl
+        m7i.metal-48xl m7i.xlarge p2.16xlarge p2.8xlarge p2.xlarge p3.16xlarge p3.2xlarge p3.8xlarge p3dn.24xlarge
+        p4d.24xlarge p5.48xlarge r3.2xlarge r3.4xlarge r3.8xlarge r3.large r3.xlarge r4.16xlarge r4.2xlarge r4.4xlarge
+        r4.8xlarge r4.large r4.xlarge r5.12xlarge r5.16xlarge r5.24xlarge r5.2xlarge r5.4xlarge r5.8xlarge r5.large
+        r5.metal r5.xlarge r5a.12xlarge r5a.16xlarge r5a.24xlarge r5a.2xlarge r5a.4xlarge r5a.8xlarge r5a.large
+        r5a.xlarge r5ad.12xlarge r5ad.16xlarge r5ad.24xlarge r5ad.2xlarge r5ad.4xlarge r5ad.8xlarge r5ad.large
+        r5ad.xlarge r5b.12xlarge r5b.16xlarge r5b.24xlarge r5b.2xlarge r5b.4xlarge r5b.8xlarge r5b.large r5b.metal
+        r5b.xlarge r5d.12xlarge r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge r5d.8xlarge r5d.large r5d.metal
+        r5d.xlarge r5dn.12xlarge r5dn.16xlarge r5dn.24xlarge r5dn.2xlarge r5dn.4xlarge r5dn.8xlarge r5dn.large
+        r5dn.metal r5dn.xlarge r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge r5n.4xlarge r5n.8xlarge r5n.large
+        r5n.metal r5n.xlarge r6a.12xlarge r6a.16xlarge r6a.24xlarge r6a.2xlarge r6a.32xlarge r6a.48xlarge r6a.4xlarge
+        r6a.8xlarge r6a.large r6a.metal r6a.xlarge r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge r6i.32xlarge
+        r6i.4xlarge r6i.8xlarge r6i.large r6i.metal r6i.xlarge r6id.12xlarge r6id.16xlarge r6id.24xlarge r6id.2xlarge
+        r6id.32xlarge r6id.4xlarge r6id.8xlarge r6id.large r6id.metal r6id.xlarge r6idn.12xlarge r6idn.16xlarge
+        r6idn.24xlarge r6idn.2xlarge r6idn.32xlarge r6idn.4xlarge r6idn.8xlarge r6idn.large r6idn.metal r6idn.xlarge
+        r6in.12xlarge r6in.16xlarge r6in.24xlarge r6in.2xlarge r6in.32xlarge r6in.4xlarge r6in.8xlarge r6in.large
+        r6in.metal r6in.xlarge r7a.12xlarge r7a.16xlarge r7a.24xlarge r7a.2xlarge r7a.32xlarge r7a.48xlarge r7a.4xlarge
+        r7a.8xlarge r7a.large r7a.medium r7a.metal-48xl r7a.xlarge r7i.12xlarge r7i.16xlarge r7i.24xlarge r7i.2xlarge
+        r7i.48xlarge r7i.4xlarge r7i.8xlarge r7i.large r7i.metal-24xl r7i.metal-48xl r7i.xlarge r7iz.12xlarge
+        r7iz.16xlarge r7iz.2xlarge r7iz.32xlarge r7iz.4xlarge r7iz.8xlarge r7iz.large r7iz.metal-16xl r7iz.metal-32xl
+        r7iz.xlarge t2.2xlarge t2.large t2.medium t2.micro t2.nano t2.small t2.xlarge t3.2xlarge t3.large t3.medium
+        t3.micro t3.nano t3.small t3.xlarge t3a.2xlarge t3a.large t3a.medium t3a.micro t3a.nano t3a.small t3a.xlarge
+        trn1.2xlarge trn1.32xlarge trn1n.32xlarge u-12tb1.112xlarge u-18tb1.112xlarge u-24tb1.112xlarge u-3tb1.56xlarge
+        u-6tb1.112xlarge u-6tb1.56xlarge u-9tb1.112xlarge vt1.24xlarge vt1.3xlarge vt1.6xlarge x1.16xlarge x1.32xlarge
+        x1e.16xlarge x1e.2xlarge x1e.32xlarge x1e.4xlarge x1e.8xlarge x1e.xlarge x2idn.16xlarge x2idn.24xlarge
+        x2idn.32xlarge x2idn.metal x2iedn.16xlarge x2iedn.24xlarge x2iedn.2xlarge x2iedn.32xlarge x2iedn.4xlarge
+        x2iedn.8xlarge x2iedn.metal x2iedn.xlarge x2iezn.12xlarge x2iezn.2xlarge x2iezn.4xlarge x2iezn.6xlarge
+        x2iezn.8xlarge x2iezn.metal z1d.12xlarge z1d.2xlarge z1d.3xlarge z1d.6xlarge z1d.large z1d.metal z1d.xlarge
+    '''.split()),
+    'us-east-2': frozenset('''
+        c4.2xlarge c4.4xlarge c4.8xlarge c4.large c4.xlarge c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge
+        c5.9xlarge c5.large c5.metal c5.xlarge c5a.12xlarge c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge
+        c5a.8xlarge c5a.large c5a.xlarge c5ad.12xlarge c5ad.16xlarge c5ad.24xlarge c5ad.2xlarge c5ad.4xlarge
+        c5ad.8xlarge c5ad.large c5ad.xlarge c5d.12xlarge c5d.18xlarge c5d.24xlarge c5d.2xlarge c5d.4xlarge c5d.9xlarge
+        c5d.large c5d.metal c5d.xlarge c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large c5n.metal c5n.xlarge
+        c6a.12xlarge c6a.16xlarge c6a.24xlarge c6a.2xlarge c6a.32xlarge c6a.48xlarge c6a.4xlarge c6a.8xlarge c6a.large
+        c6a.metal c6a.xlarge c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge
+        c6i.large c6i.metal c6i.xlarge c6id.12xlarge c6id.16xlarge c6id.24xlarge c6id.2xlarge c6id.32xlarge c6id.4xlarge
+        c6id.8xlarge c6id.large c6id.metal c6id.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge
+        c6in.32xlarge c6in.4xlarge c6in.8xlarge c6in.large c6in.metal c6in.xlarge c7a.12xlarge c7a.16xlarge c7a.24xlarge
+        c7a.2xlarge c7a.32xlarge c7a.48xlarge c7a.4xlarge c7a.8xlarge c7a.large c7a.medium c7a.metal-48xl c7a.xlarge
+        c7i.12xlarge c7i.16xlarge c7i.24xlarge c7i.2xlarge c7i.48xlarge c7i.4xlarge c7i.8xlarge c7i.large c7i.metal-24xl
+        c7i.metal-48xl c7i.xlarge d2.2xlarge d2.4xlarge d2.8xlarge d2.xlarge d3.2xlarge d3.4xlarge d3.8xlarge d3.xlarge
+        g3.16xlarge g3.4xlarge g3.8xlarge g3s.xlarge g4ad.16xlarge g4ad.2xlarge g4ad.4xlarge g4ad.8xlarge g4ad.xlarge
+        g4dn.12xlarge g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge g4dn.8xlarge g4dn.metal g4dn.xlarge g5.12xlarge
+        g5.16xlarge g5.24xlarge g5.2xlarge g5.48xlarge g5.4xlarge g5.8xlarge g5.xlarge h1.16xlarge h1.2xlarge h1.4xlarge
+        h1.8xlarge hpc6a.48xlarge hpc6id.32xlarge hpc7a.12xlarge hpc7a.24xlarge hpc7a.48xlarge hpc7a.96xlarge i2.2xlarge
+        i2.4xlarge i2.8xlarge i2.xlarge i3.16xlarge i3.2xlarge i3.4xlarge i3.8xlarge i3.large i3.metal i3.xlarge
+        i3en.12xlarge i3en.24xlarge i3en.2xlarge i3en.3xlarge i3en.6xlarge i3en.large i3en.metal i3en.xlarge
+        i4i.12xlarge i4i.16xlarge i4i.24xlarge i4i.2xlarge i4i.32xlarge i4i.4xlarge i4i.8xlarge i4i.large i4i.metal
+        i4i.xlarge inf1.24xlarge inf1.2xlarge inf1.6xlarge inf1.xlarge inf2.24xlarge inf2.48xlarge inf2.8xlarge
+        inf2.xlarge m4.10xlarge m4.16xlarge m4.2xlarge m4.4xlarge m4.large m4.xlarge m5.12xlarge m5.16xlarge m5.24xlarge
+        m5.2xlarge m5.4xlarge m5.8xlarge m5.large m5.metal m5.xlarge m5a.12xlarge m5a.16xlarge m5a.24xlarge m5a.2xlarge
+        m5a.4xlarge m5a.8xlarge m5a.large m5a.xlarge m5ad.12xlarge m5ad.16xlarge m5ad.24xlarge m5ad.2xlarge m5ad.4xlarge
+        m5ad.8xlarge m5ad.large m5ad.xlarge m5d.12xlarge m5d.16xlarge m5d.24xlarge m5d.2xlarge m5d.4xlarge m5d.8xlarge
+        m5d.large m5d.metal m5d.xlarge m5dn.12xlarge m5dn.16xlarge m5dn.24xlarge m5dn.2xlarge m5dn.4xlarge m5dn.8xlarge
+        m5dn.large m5dn.metal m5dn.xlarge m5n.12xlarge m5n.16xlarge m5n.24xlarge m5n.2xlarge m5n.4xlarge m5n.8xlarge
+        m5n.large m5n.metal m5n.xlarge m5zn.12xlarge m5zn.2xlarge m5zn.3xlarge m5zn.6xlarge m5zn.large m5zn.metal
+        m5zn.xlarge m6a.12xlarge m6a.16xlarge m6a.24xlarge m6a.2xlarge m6a.32xlarge m6a.48xlarge m6a.4xlarge m6a.8xlarge
+        m6a.large m6a.metal m6a.xlarge m6i.12xlarge m6i.16xlarge m6i.24xlarge m6i.2xlarge m6i.32xlarge m6i.4xlarge
+        m6i.8xlarge m6i.large m6i.metal m6i.xlarge m6id.12xlarge m6id.16xlarge m6id.24xlarge m6id.2xlarge m6id.32xlarge
+        m6id.4xlarge m6id.8xlarge m6id.large m6id.metal m6id.xlarge m6idn.12xlarge m6idn.16xlarge m6idn.24xlarge
+        m6idn.2xlarge m6idn.32xlarge m6idn.4xlarge m6idn.8xlarge m6idn.large m6idn.metal m6idn.xlarge m6in.12xlarge
+        m6in.16xlarge m6in.24xlarge m6in.2xlarge m6in.32xlarge m6in.4xlarge m6in.8xlarge m6in.large m6in.metal
+        m6in.xlarge m7a.12xlarge m7a.16xlarge m7a.24xlarge m7a.2xlarge m7a.32xlarge m7a.48xlarge m7a.4xlarge m7a.8xlarge
+        m7a.large m7a.medium m7a.metal-48xl m7a.xlarge m7i-flex.2xlarge m7i-flex.4xlarge m7i-flex.8xlarge m7i-flex.large
+        m7i-flex.xlarge m7i.12xlarge m7i.16xlarge m7i.24xlarge m7i.2xlarge m7i.48xlarge m7i.4xlarge m7i.8xlarge
+        m7i.large m7i.metal-24xl m7i.metal-48xl m7i.xlarge p2.16xlarge p2.8xlarge p2.xlarge p3.16xlarge p3.2xlarge
+        p3.8xlarge p4d.24xlarge p5.48xlarge r3.2xlarge r3.4xlarge r3.8xlarge r3.large r3.xlarge r4.16xlarge r4.2xlarge
+        r4.4xlarge r4.8xlarge r4.large r4.xlarge r5.12xlarge r5.16xlarge r5.24xlarge r5.2xlarge r5.4xlarge r5.8xlarge
+        r5.large r5.metal r5.xlarge r5a.12xlarge r5a.16xlarge r5a.24xlarge r5a.2xlarge r5a.4xlarge r5a.8xlarge r5a.large
+        r5a.xlarge r5ad.12xlarge r5ad.16xlarge r5ad.24xlarge r5ad.2xlarge r5ad.4xlarge r5ad.8xlarge r5ad.large
+        r5ad.xlarge r5b.12xlarge r5b.16xlarge r5b.24xlarge r5b.2xlarge r5b.4xlarge r5b.8xlarge r5b.large r5b.metal
+        r5b.xlarge r5d.12xlarge r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge r5d.8xlarge r5d.large r5d.metal
+        r5d.xlarge r5dn.12xlarge r5dn.16xlarge r5dn.24xlarge r5dn.2xlarge r5dn.4xlarge r5dn.8xlarge r5dn.large
+        r5dn.metal r5dn.xlarge r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge r5n.4xlarge r5n.8xlarge r5n.large
+        r5n.metal r5n.xlarge r6a.12xlarge r6a.16xlarge r6a.24xlarge r6a.2xlarge r6a.32xlarge r6a.48xlarge r6a.4xlarge
+        r6a.8xlarge r6a.large r6a.metal r6a.xlarge r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge r6i.32xlarge
+        r6i.4xlarge r6i.8xlarge r6i.large r6i.metal r6i.xlarge r6id.12xlarge r6id.16xlarge r6id.24xlarge r6id.2xlarge
+        r6id.32xlarge r6id.4xlarge r6id.8xlarge r6id.large r6id.metal r6id.xlarge r6idn.12xlarge r6idn.16xlarge
+        r6idn.24xlarge r6idn.2xlarge r6idn.32xlarge r6idn.4xlarge r6idn.8xlarge r6idn.large r6idn.metal r6idn.xlarge
+        r6in.12xlarge r6in.16xlarge r6in.24xlarge r6in.2xlarge r6in.32xlarge r6in.4xlarge r6in.8xlarge r6in.large
+        r6in.metal r6in.xlarge r7a.12xlarge r7a.16xlarge r7a.24xlarge r7a.2xlarge r7a.32xlarge r7a.48xlarge r7a.4xlarge
+        r7a.8xlarge r7a.large r7a.medium r7a.metal-48xl r7a.xlarge r7i.12xlarge r7i.16xlarge r7i.24xlarge r7i.2xlarge
+        r7i.48xlarge r7i.4xlarge r7i.8xlarge r7i.large r7i.metal-24xl r7i.metal-48xl r7i.xlarge r7iz.12xlarge
+        r7iz.16xlarge r7iz.2xlarge r7iz.32xlarge r7iz.4xlarge r7iz.8xlarge r7iz.large r7iz.metal-16xl r7iz.metal-32xl
+        r7iz.xlarge t2.2xlarge t2.large t2.medium t2.micro t2.nano t2.small t2.xlarge t3.2xlarge t3.large t3.medium
+        t3.micro t3.nano t3.small t3.xlarge t3a.2xlarge t3a.large t3a.medium t3a.micro t3a.nano t3a.small t3a.xlarge
+        trn1.2xlarge trn1.32xlarge trn1n.32xlarge u-12tb1.112xlarge u-3tb1.56xlarge u-6tb1.112xlarge u-6tb1.56xlarge
+        u-9tb1.112xlarge x1.16xlarge x1.32xlarge x1e.16xlarge x1e.2xlarge x1e.32xlarge x1e.4xlarge x1e.8xlarge
+        x1e.xlarge x2idn.16xlarge x2idn.24xlarge x2idn.32xlarge x2idn.metal x2iedn.16xlarge x2iedn.24xlarge
+        x2iedn.2xlarge x2iedn.32xlarge x2iedn.4xlarge x2iedn.8xlarge x2iedn.metal x2iedn.xlarge z1d.12xlarge z1d.2xlarge
+        z1d.3xlarge z1d.6xlarge z1d.large z1d.metal z1d.xlarge
+    '''.split()),
+    'us-west-1': frozenset('''
+        c1.medium c1.xlarge c3.2xlarge c3.4xlarge c3.8xlarge c3.large c3.xlarge c4.2xlarge c4.4xlarge c4.8xlarge
+        c4.large c4.xlarge c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge c5.9xlarge c5.large c5.metal
+        c5.xlarge c5a.12xlarge c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge c5a.8xlarge c5a.large c5a.xlarge
+        c5d.12xlarge c5d.18xlarge c5d.24xlarge c5d.2xlarge c5d.4xlarge c5d.9xlarge c5d.large c5d.metal c5d.xlarge
+        c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large c5n.metal c5n.xlarge c6a.12xlarge c6a.16xlarge
+        c6a.24xlarge c6a.2xlarge c6a.32xlarge c6a.48xlarge c6a.4xlarge c6a.8xlarge c6a.large c6a.metal c6a.xlarge
+        c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge c6i.large c6i.metal
+        c6i.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge c6in.32xlarge c6in.4xlarge c6in.8xlarge
+        c6in.large c6in.metal c6in.xlarge c7i.12xlarge c7i.16xlarge c7i.24xlarge c7i.2xlarge c7i.48xlarge c7i.4xlarge
+        c7i.8xlarge c7i.large c7i.metal-24xl c7i.metal-48xl c7i.xlarge d2.2xlarge d2.4xlarge d2.8xlarge d2.xlarge
+        g3.16xlarge g3.4xlarge g3.8xlarge g4dn.12xlarge g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge g4dn.8xlarge g4dn.metal
+        g4dn.xlarge i2.2xlarge i2.4xlarge i2.8xlarge i2.xlarge i3.16xlarge i3.2xlarge i3.4xlarge i3.8xlarge i3.large
+        i3.metal i3.xlarge i3en.12xlarge i3en.24xlarge i3en.2xlarge i3en.3xlarge i3en.6xlarge i3en.large i3en.metal
+        i3en.xlarge i4i.12xlarge i4i.16xlarge i4i.24xlarge i4i.2xlarge i4i.32xlarge i4i.4xlarge i4i.8xlarge i4i.large
+        i4i.metal i4i.xlarge inf1.24xlarge inf1.2xlarge inf1.6xlarge inf1.xlarge m1.large m1.medium m1.small m1.xlarge
+        m2.2xlarge m2.4xlarge m2.xlarge m3.2xlarge m3.large m3.medium m3.xlarge m4.10xlarge m4.16xlarge m4.2xlarge
+        m4.4xlarge m4.large m4.xlarge m5.12xlarge m5.16xlarge m5.24xlarge m5.2xlarge m5.4xlarge m5.8xlarge m5.large
+        m5.metal m5.xlarge m5a.12xlarge m5a.16xlarge m5a.24xlarge m5a.2xlarge m5a.4xlarge m5a.8xlarge m5a.large
+        m5a.xlarge m5ad.12xlarge m5ad.16xlarge m5ad.24xlarge m5ad.2xlarge m5ad.4xlarge m5ad.8xlarge m5ad.large
+        m5ad.xlarge m5d.12xlarge m5d.16xlarge m5d.24xlarge m5d.2xlarge m5d.4xlarge m5d.8xlarge m5d.large m5d.metal
+        m5d.xlarge m5zn.12xlarge m5zn.2xlarge m5zn.3xlarge m5zn.6xlarge m5zn.large m5zn.metal m5zn.xlarge m6a.12xlarge
+        m6a.16xlarge m6a.24xlarge m6a.2xlarge m6a.32xlarge m6a.48xlarge m6a.4xlarge m6a.8xlarge m6a.large m6a.metal
+        m6a.xlarge m6i.12xlarge m6i.16xlarge m6i.24xlarge m6i.2xlarge m6i.32xlarge m6i.4xlarge m6i.8xlarge m6i.large
+        m6i.metal m6i.xlarge m6idn.12xlarge m6idn.16xlarge m6idn.24xlarge m6idn.2xlarge m6idn.32xlarge m6idn.4xlarge
+        m6idn.8xlarge m6idn.large m6idn.metal m6idn.xlarge m6in.12xlarge m6in.16xlarge m6in.24xlarge m6in.2xlarge
+        m6in.32xlarge m6in.4xlarge m6in.8xlarge m6in.large m6in.metal m6in.xlarge m7i-flex.2xlarge m7i-flex.4xlarge
+        m7i-flex.8xlarge m7i-flex.large m7i-flex.xlarge m7i.12xlarge m7i.16xlarge m7i.24xlarge m7i.2xlarge m7i.48xlarge
+        m7i.4xlarge m7i.8xlarge m7i.large m7i.metal-24xl m7i.metal-48xl m7i.xlarge r3.2xlarge r3.4xlarge r3.8xlarge
+        r3.large r3.xlarge r4.16xlarge r4.2xlarge r4.4xlarge r4.8xlarge r4.large r4.xlarge r5.12xlarge r5.16xlarge
+        r5.24xlarge r5.2xlarge r5.4xlarge r5.8xlarge r5.large r5.metal r5.xlarge r5a.12xlarge r5a.16xlarge r5a.24xlarge
+        r5a.2xlarge r5a.4xlarge r5a.8xlarge r5a.large r5a.xlarge r5ad.12xlarge r5ad.16xlarge r5ad.24xlarge r5ad.2xlarge
+        r5ad.4xlarge r5ad.8xlarge r5ad.large r5ad.xlarge r5d.12xlarge r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge
+        r5d.8xlarge r5d.large r5d.metal r5d.xlarge r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge r5n.4xlarge
+        r5n.8xlarge r5n.large r5n.metal r5n.xlarge r6a.12xlarge r6a.16xlarge r6a.24xlarge r6a.2xlarge r6a.32xlarge
+        r6a.48xlarge r6a.4xlarge r6a.8xlarge r6a.large r6a.metal r6a.xlarge r6i.12xlarge r6i.16xlarge r6i.24xlarge
+        r6i.2xlarge r6i.32xlarge r6i.4xlarge r6i.8xlarge r6i.large r6i.metal r6i.xlarge r7i.12xlarge r7i.16xlarge
+        r7i.24xlarge r7i.2xlarge r7i.48xlarge r7i.4xlarge r7i.8xlarge r7i.large r7i.metal-24xl r7i.metal-48xl r7i.xlarge
+        t2.2xlarge t2.large t2.medium t2.micro t2.nano t2.small t2.xlarge t3.2xlarge t3.large t3.medium t3.micro t3.nano
+        t3.small t3.xlarge t3a.2xlarge t3a.large t3a.medium t3a.micro t3a.nano t3a.small t3a.xlarge x2idn.16xlarge
+        x2idn.24xlarge x2idn.32xlarge x2idn.metal x2iedn.16xlarge x2iedn.24xlarge x2iedn.2xlarge x2iedn.32xlarge
+        x2iedn.4xlarge x2iedn.8xlarge x2iedn.metal x2iedn.xlarge z1d.12xlarge z1d.2xlarge z1d.3xlarge z1d.6xlarge
+        z1d.large z1d.metal z1d.xlarge
+    '''.split()),
+    'us-west-2': frozenset('''
+        c1.medium c1.xlarge c3.2xlarge c3.4xlarge c3.8xlarge c3.large c3.xlarge c4.2xlarge c4.4xlarge c4.8xlarge
+        c4.large c4.xlarge c5.12xlarge c5.18xlarge c5.24xlarge c5.2xlarge c5.4xlarge c5.9xlarge c5.large c5.metal
+        c5.xlarge c5a.12xlarge c5a.16xlarge c5a.24xlarge c5a.2xlarge c5a.4xlarge c5a.8xlarge c5a.large c5a.xlarge
+        c5ad.12xlarge c5ad.16xlarge c5ad.24xlarge c5ad.2xlarge c5ad.4xlarge c5ad.8xlarge c5ad.large c5ad.xlarge
+        c5d.12xlarge c5d.18xlarge c5d.24xlarge c5d.2xlarge c5d.4xlarge c5d.9xlarge c5d.large c5d.metal c5d.xlarge
+        c5n.18xlarge c5n.2xlarge c5n.4xlarge c5n.9xlarge c5n.large c5n.metal c5n.xlarge c6a.12xlarge c6a.16xlarge
+        c6a.24xlarge c6a.2xlarge c6a.32xlarge c6a.48xlarge c6a.4xlarge c6a.8xlarge c6a.large c6a.metal c6a.xlarge
+        c6i.12xlarge c6i.16xlarge c6i.24xlarge c6i.2xlarge c6i.32xlarge c6i.4xlarge c6i.8xlarge c6i.large c6i.metal
+        c6i.xlarge c6id.12xlarge c6id.16xlarge c6id.24xlarge c6id.2xlarge c6id.32xlarge c6id.4xlarge c6id.8xlarge
+        c6id.large c6id.metal c6id.xlarge c6in.12xlarge c6in.16xlarge c6in.24xlarge c6in.2xlarge c6in.32xlarge
+        c6in.4xlarge c6in.8xlarge c6in.large c6in.metal c6in.xlarge c7a.12xlarge c7a.16xlarge c7a.24xlarge c7a.2xlarge
+        c7a.32xlarge c7a.48xlarge c7a.4xlarge c7a.8xlarge c7a.large c7a.medium c7a.metal-48xl c7a.xlarge c7i.12xlarge
+        c7i.16xlarge c7i.24xlarge c7i.2xlarge c7i.48xlarge c7i.4xlarge c7i.8xlarge c7i.large c7i.metal-24xl
+        c7i.metal-48xl c7i.xlarge d2.2xlarge d2.4xlarge d2.8xlarge d2.xlarge d3.2xlarge d3.4xlarge d3.8xlarge d3.xlarge
+        d3en.12xlarge d3en.2xlarge d3en.4xlarge d3en.6xlarge d3en.8xlarge d3en.xlarge dl1.24xlarge dl2q.24xlarge
+        f1.16xlarge f1.2xlarge f1.4xlarge g3.16xlarge g3.4xlarge g3.8xlarge g3s.xlarge g4ad.16xlarge g4ad.2xlarge
+        g4ad.4xlarge g4ad.8xlarge g4ad.xlarge g4dn.12xlarge g4dn.16xlarge g4dn.2xlarge g4dn.4xlarge g4dn.8xlarge
+        g4dn.metal g4dn.xlarge g5.12xlarge g5.16xlarge g5.24xlarge g5.2xlarge g5.48xlarge g5.4xlarge g5.8xlarge
+        g5.xlarge h1.16xlarge h1.2xlarge h1.4xlarge h1.8xlarge i2.2xlarge i2.4xlarge i2.8xlarge i2.xlarge i3.16xlarge
+        i3.2xlarge i3.4xlarge i3.8xlarge i3.large i3.metal i3.xlarge i3en.12xlarge i3en.24xlarge i3en.2xlarge
+        i3en.3xlarge i3en.6xlarge i3en.large i3en.metal i3en.xlarge i4i.12xlarge i4i.16xlarge i4i.24xlarge i4i.2xlarge
+        i4i.32xlarge i4i.4xlarge i4i.8xlarge i4i.large i4i.metal i4i.xlarge inf1.24xlarge inf1.2xlarge inf1.6xlarge
+        inf1.xlarge inf2.24xlarge inf2.48xlarge inf2.8xlarge inf2.xlarge m1.large m1.medium m1.small m1.xlarge
+        m2.2xlarge m2.4xlarge m2.xlarge m3.2xlarge m3.large m3.medium m3.xlarge m4.10xlarge m4.16xlarge m4.2xlarge
+        m4.4xlarge m4.large m4.xlarge m5.12xlarge m5.16xlarge m5.24xlarge m5.2xlarge m5.4xlarge m5.8xlarge m5.large
+        m5.metal m5.xlarge m5a.12xlarge m5a.16xlarge m5a.24xlarge m5a.2xlarge m5a.4xlarge m5a.8xlarge m5a.large
+        m5a.xlarge m5ad.12xlarge m5ad.16xlarge m5ad.24xlarge m5ad.2xlarge m5ad.4xlarge m5ad.8xlarge m5ad.large
+        m5ad.xlarge m5d.12xlarge m5d.16xlarge m5d.24xlarge m5d.2xlarge m5d.4xlarge m5d.8xlarge m5d.large m5d.metal
+        m5d.xlarge m5dn.12xlarge m5dn.16xlarge m5dn.24xlarge m5dn.2xlarge m5dn.4xlarge m5dn.8xlarge m5dn.large
+        m5dn.metal m5dn.xlarge m5n.12xlarge m5n.16xlarge m5n.24xlarge m5n.2xlarge m5n.4xlarge m5n.8xlarge m5n.large
+        m5n.metal m5n.xlarge m5zn.12xlarge m5zn.2xlarge m5zn.3xlarge m5zn.6xlarge m5zn.large m5zn.metal m5zn.xlarge
+        m6a.12xlarge m6a.16xlarge m6a.24xlarge m6a.2xlarge m6a.32xlarge m6a.48xlarge m6a.4xlarge m6a.8xlarge m6a.large
+        m6a.metal m6a.xlarge m6i.12xlarge m6i.16xlarge m6i.24xlarge m6i.2xlarge m6i.32xlarge m6i.4xlarge m6i.8xlarge
+        m6i.large m6i.metal m6i.xlarge m6id.12xlarge m6id.16xlarge m6id.24xlarge m6id.2xlarge m6id.32xlarge m6id.4xlarge
+        m6id.8xlarge m6id.large m6id.metal m6id.xlarge m6idn.12xlarge m6idn.16xlarge m6idn.24xlarge m6idn.2xlarge
+        m6idn.32xlarge m6idn.4xlarge m6idn.8xlarge m6idn.large m6idn.metal m6idn.xlarge m6in.12xlarge m6in.16xlarge
+        m6in.24xlarge m6in.2xlarge m6in.32xlarge m6in.4xlarge m6in.8xlarge m6in.large m6in.metal m6in.xlarge
+        m7a.12xlarge m7a.16xlarge m7a.24xlarge m7a.2xlarge m7a.32xlarge m7a.48xlarge m7a.4xlarge m7a.8xlarge m7a.large
+        m7a.medium m7a.metal-48xl m7a.xlarge m7i-flex.2xlarge m7i-flex.4xlarge m7i-flex.8xlarge m7i-flex.large
+        m7i-flex.xlarge m7i.12xlarge m7i.16xlarge m7i.24xlarge m7i.2xlarge m7i.48xlarge m7i.4xlarge m7i.8xlarge
+        m7i.large m7i.metal-24xl m7i.metal-48xl m7i.xlarge p2.16xlarge p2.8xlarge p2.xlarge p3.16xlarge p3.2xlarge
+        p3.8xlarge p3dn.24xlarge p4d.24xlarge p5.48xlarge r3.2xlarge r3.4xlarge r3.8xlarge r3.large r3.xlarge
+        r4.16xlarge r4.2xlarge r4.4xlarge r4.8xlarge r4.large r4.xlarge r5.12xlarge r5.16xlarge r5.24xlarge r5.2xlarge
+        r5.4xlarge r5.8xlarge r5.large r5.metal r5.xlarge r5a.12xlarge r5a.16xlarge r5a.24xlarge r5a.2xlarge r5a.4xlarge
+        r5a.8xlarge r5a.large r5a.xlarge r5ad.12xlarge r5ad.16xlarge r5ad.24xlarge r5ad.2xlarge r5ad.4xlarge
+        r5ad.8xlarge r5ad.large r5ad.xlarge r5b.12xlarge r5b.16xlarge r5b.24xlarge r5b.2xlarge r5b.4xlarge r5b.8xlarge
+        r5b.large r5b.metal r5b.xlarge r5d.12xlarge r5d.16xlarge r5d.24xlarge r5d.2xlarge r5d.4xlarge r5d.8xlarge
+        r5d.large r5d.metal r5d.xlarge r5dn.12xlarge r5dn.16xlarge r5dn.24xlarge r5dn.2xlarge r5dn.4xlarge r5dn.8xlarge
+        r5dn.large r5dn.metal r5dn.xlarge r5n.12xlarge r5n.16xlarge r5n.24xlarge r5n.2xlarge r5n.4xlarge r5n.8xlarge
+        r5n.large r5n.metal r5n.xlarge r6a.12xlarge r6a.16xlarge r6a.24xlarge r6a.2xlarge r6a.32xlarge r6a.48xlarge
+        r6a.4xlarge r6a.8xlarge r6a.large r6a.metal r6a.xlarge r6i.12xlarge r6i.16xlarge r6i.24xlarge r6i.2xlarge
+        r6i.32xlarge r6i.4xlarge r6i.8xlarge r6i.large r6i.metal r6i.xlarge r6id.12xlarge r6id.16xlarge r6id.24xlarge
+        r6id.2xlarge r6id.32xlarge r6id.4xlarge r6id.8xlarge r6id.large r6id.metal r6id.xlarge r6idn.12xlarge
+        r6idn.16xlarge r6idn.24xlarge r6idn.2xlarge r6idn.32xlarge r6idn.4xlarge r6idn.8xlarge r6idn.large r6idn.metal
+        r6idn.xlarge r6in.12xlarge r6in.16xlarge r6in.24xlarge r6in.2xlarge r6in.32xlarge r6in.4xlarge r6in.8xlarge
+        r6in.large r6in.metal r6in.xlarge r7a.12xlarge r7a.16xlarge r7a.24xlarge r7a.2xlarge r7a.32xlarge r7a.48xlarge
+        r7a.4xlarge r7a.8xlarge r7a.large r7a.medium r7a.metal-48xl r7a.xlarge r7i.12xlarge r7i.16xlarge r7i.24xlarge
+        r7i.2xlarge r7i.48xlarge r7i.4xlarge r7i.8xlarge r7i.large r7i.metal-24xl r7i.metal-48xl r7i.xlarge
+        r7iz.12xlarge r7iz.16xlarge r7iz.2xlarge r7iz.32xlarge r7iz.4xlarge r7iz.8xlarge r7iz.large r7iz.metal-16xl
+        r7iz.metal-32xl r7iz.xlarge t2.2xlarge t2.large t2.medium t2.micro t2.nano t2.small t2.xlarge t3.2xlarge
+        t3.large t3.medium t3.micro t3.nano t3.small t3.xlarge t3a.2xlarge t3a.large t3a.medium t3a.micro t3a.nano
+        t3a.small t3a.xlarge trn1.2xlarge trn1.32xlarge trn1n.32xlarge u-12tb1.112xlarge u-18tb1.112xlarge
+        u-24tb1.112xlarge u-3tb1.56xlarge u-6tb1.112xlarge u-6tb1.56xlarge u-9tb1.112xlarge vt1.24xlarge vt1.3xlarge
+        vt1.6xlarge x1.16xlarge x1.32xlarge x1e.16xlarge x1e.2xlarge x1e.32xlarge x1e.4xlarge x1e.8xlarge x1e.xlarge
+        x2idn.16xlarge x2idn.24xlarge x2idn.32xlarge x2idn.metal x2iedn.16xlarge x2iedn.24xlarge x2iedn.2xlarge
+        x2iedn.32xlarge x2iedn.4xlarge x2iedn.8xlarge x2iedn.metal x2iedn.xlarge x2iezn.12xlarge x2iezn.2xlarge
+        x2iezn.4xlarge x2iezn.6xlarge x2iezn.8xlarge x2iezn.metal z1d.12xlarge z1d.2xlarge z1d.3xlarge z1d.6xlarge
+        z1d.large z1d.metal z1d.xlarge
+    '''.split()),
+}
+
+
+def get_instance_type(instance_type):
+    # returns the capabilities of the instance type as a dict, None if it is not in the index
+    capabilities = INSTANCE_TYPES.get(instance_type)
+    if capabilities is None:
+        return None
+    return dict(zip(INSTANCE_FIELDS, capabilities))
+
+def is_offered(instance_type, region):
+    # returns whether the instance type is offered in the region, None if the region is not in the index
+    offerings = REGION_OFFERINGS.get(region)
+    if offerings is None:
+        return None
+    return instance_type in offerings
@@ -0,0 +1,183 @@
+from __future__ import absolute_import
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Reads the CloudWatch Logs group of a cluster (cwl_log_group), where the nodes ship their logs, one stream per node
+# and log file. The events of each stream are ordered by timestamp: a bounded number of worker threads page
+# filter_log_events one stream each, and the calling thread merges the streams by timestamp with a heap as the pages
+# arrive. The cursor keeps the last timestamp read from each stream, and the ids of its events at that timestamp, so
+# --follow only reads the streams with new ingested events, and only asks for the events after the cursor.
+
+import sys
+import time
+import heapq
+import logging
+import threading
+from botocore.exceptions import ClientError
+
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+
+from . import cfnconfig
+from . import utils
+
+logger = logging.getLogger('cfncluster.cfncluster')
+
+# Number of streams read at the same time
+DEFAULT_PARALLELISM = 8
+
+# Seconds between two polls of --follow
+FOLLOW_INTERVAL = 5
+
+# Seconds for an ingested event to be returned by filter_log_events
+SEARCH_DELAY = 60
+
+def get_log_group(stack_name, config):
+    # returns the region and the name of the log group of the cluster, None if it has none
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    parameters = cfn.describe_stacks(StackName=stack_name).get('Stacks')[0].get('Parameters')
+    parameters = dict((p.get('ParameterKey'), p.get('ParameterValue')) for p in parameters)
+    if parameters.get('CWLLogGroup', 'NONE') == 'NONE':
+        return None
+    region = parameters.get('CWLRegion', 'NONE')
+    return (config.region if region == 'NONE' else region), parameters.get('CWLLogGroup')
+
+def get_streams(client, log_group, node):
+    # returns the streams whose name contains node
+    streams = []
+    paginator = client.get_paginator('describe_log_streams')
+    for page in paginator.paginate(logGroupName=log_group):
+        for stream in page.get('logStreams', []):
+            if node is None or node in stream.get('logStreamName'):
+                streams.append(stream)
+    return streams
+
+class Cursor(object):
+    def __init__(self, start):
+        self.start = start
+        # stream name -> [last timestamp, set of the event ids at that timestamp]
+        self.positions = {}
+        # stream name -> last ingestion time at the previous read
+        self.ingestion = {}
+
+    def has_new_events(self, stream):
+        # an event is always ingested after its timestamp, and changes the last ingestion time of its stream
+        name = stream.get('logStreamName')
+        ingestion = stream.get('lastIngestionTime')
+        if ingestion is None:
+            return True
+        if self.start is not None and ingestion < self.start:
+            return False
+        # the events of a recent ingestion may not be searchable yet, their stream is read again at the next poll
+        if self.ingestion.get(name) == ingestion and ingestion < (time.time() - SEARCH_DELAY) * 1000:
+            return False
+        self.ingestion[name] = ingestion
+        return True
+
+    def start_time(self, stream):
+        return self.positions[stream][0] if stream in self.positions else self.start
+
+    def advance(self, stream, event):
+        # returns False for an event already read, records it otherwise
+        position = self.positions.setdefault(stream, [None, set()])
+        if position[0] is not None and event['timestamp'] < position[0]:
+            return False
+        if event['timestamp'] != position[0]:
+            position[0] = event['timestamp']
+            position[1] = set()
+        elif event['eventId'] in position[1]:
+            return False
+        position[1].add(event['eventId'])
+        return True
+
+def _read_streams(client, log_group, streams, cursor, pattern, queues):
+    # reads the streams taken from the list, puts the events of each one on its queue, then None, or the exception
+    # that stopped the read
+    while True:
+        try:
+            index, stream = streams.pop(0)
+        except IndexError:
+            return
+        try:
+            kwargs = {'logGroupName': log_group, 'logStreamNames': [stream]}
+            if cursor.start_time(stream) is not None:
+                kwargs['startTime'] = cursor.start_time(stream)
+            if pattern:
+                kwargs['filterPattern'] = pattern
+            paginator = client.get_paginator('filter_log_events')
+            for page in paginator.paginate(**kwargs):
+                for event in page.get('events', []):
+                    queues[index].put(event)
+            queues[index].put(None)
+        except Exception as e:
+            queues[index].put(e)
+
+def _stream_events(index, queue):
+    while True:
+        event = queue.get()
+        if event is None:
+            return
+        elif isinstance(event, Exception):
+            raise event
+        # the index breaks the ties, events are not comparable
+        yield event['timestamp'], index, event
+
+def read(client, log_group, streams, cursor, pattern, parallelism):
+    # yields (stream, event) for the new events of the streams, merged by timestamp
+    queues = [Queue() for stream in streams]
+    pending = list(enumerate(streams))
+    for i in range(min(parallelism, len(streams))):
+        thread = threading.Thread(target=_read_streams, args=(client, log_group, pending, cursor, pattern, queues))
+        thread.daemon = True
+        thread.start()
+
+    for timestamp, index, event in heapq.merge(*[_stream_events(i, q) for i, q in enumerate(queues)]):
+        if cursor.advance(streams[index], event):
+            yield streams[index], event
+
+def format_event(stream, event):
+    timestamp = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(event['timestamp'] // 1000))
+    return '%s.%03dZ %s %s' % (timestamp, event['timestamp'] % 1000, stream, event.get('message', '').rstrip('\n'))
+
+def logs(args):
+    stack_name = ('cfncluster-' + args.cluster_name)
+    config = cfnconfig.CfnClusterConfig(args)
+
+    try:
+        log_group = get_log_group(stack_name, config)
+        if log_group is None:
+            logger.error('Cluster %s has no CloudWatch Logs group, see cwl_log_group' % args.cluster_name)
+            sys.exit(1)
+        client = utils.get_client('logs', region_name=log_group[0],
+                                  aws_access_key_id=config.aws_access_key_id,
+                                  aws_secret_access_key=config.aws_secret_access_key)
+        cursor = Cursor(int((time.time() - args.since * 60) * 1000) if args.since else None)
+        while True:
+            streams = sorted(stream.get('logStreamName') for stream in get_streams(client, log_group[1], args.node)
+                             if cursor.has_new_events(stream))
+            for stream, event in read(client, log_group[1], streams, cursor, args.filter, args.parallelism):
+                sys.stdout.write(format_event(stream, event) + '\n')
+            sys.stdout.flush()
+            if not args.follow:
+                break
+            time.sleep(FOLLOW_INTERVAL)
+    except ClientError as e:
+        logger.critical(e.response.get('Error').get('Message'))
+        sys.stdout.flush()
+        sys.exit(1)
+    except KeyboardInterrupt:
+        logger.info('\nExiting...')
+        sys.exit(0)
@@ -0,0 +1,195 @@
+from __future__ import absolute_import
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# A pool keeps pre-created clusters for a cluster template with their ComputeFleet stopped (min/max/desired = 0/0/0).
+# Pool clusters carry the POOL_TAG stack tag, which CloudFormation propagates to the ComputeFleet ASG.
+# Claiming a cluster adds the CLAIM_TAG stack tag with a stack update, then restores the ASG limits with the start
+# logic. CloudFormation runs one update of a stack at a time, so of the concurrent claims of a cluster only the first
+# update is accepted, the others fail with a ValidationError and move on to the next cluster. The claimed cluster
+# keeps its pool name, pool list shows the name it was claimed for.
+
+import sys
+import uuid
+import argparse
+import logging
+from botocore.exceptions import ClientError
+
+from . import cfncluster
+from . import cfnconfig
+from . import utils
+
+logger = logging.getLogger('cfncluster.cfncluster')
+
+POOL_TAG = 'cfncluster:pool'
+CLAIM_TAG = 'cfncluster:claimed-by'
+
+# Parameters used to create a pool cluster with a stopped compute fleet
+POOL_PARAMETERS = {'InitialQueueSize': '0', 'MaxQueueSize': '0', 'MaintainInitialSize': 'false'}
+
+# Stack statuses of a pool cluster that can be claimed
+AVAILABLE_STATUSES = ['CREATE_COMPLETE', 'UPDATE_COMPLETE', 'UPDATE_ROLLBACK_COMPLETE']
+
+def get_cluster_template(config):
+    return [param[1] for param in config.parameters if param[0] == 'CLITemplate'][0]
+
+def get_pool_clusters(config, template):
+    # returns a list of (cluster_name, state, claimer) for the clusters of the pool of the given cluster template
+    # state is one of available, pending, claimed or failed, claimer is None if the cluster is not claimed
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+
+    try:
+        clusters = []
+        for page in cfn.get_paginator('describe_stacks').paginate():
+            for stack in page.get('Stacks'):
+                tags = dict((t.get('Key'), t.get('Value')) for t in stack.get('Tags', []))
+                stack_name = stack.get('StackName')
+                status = stack.get('StackStatus')
+                if tags.get(POOL_TAG) != template or not stack_name.startswith('cfncluster-') \
+                        or status.startswith('DELETE_'):
+                    continue
+                if CLAIM_TAG in tags:
+                    state = 'claimed'
+                elif status in AVAILABLE_STATUSES:
+                    state = 'available'
+                elif status.endswith('_IN_PROGRESS'):
+                    state = 'pending'
+                else:
+                    state = 'failed'
+                clusters.append((stack_name[11:], state, tags.get(CLAIM_TAG)))
+    except ClientError as e:
+        logger.critical(e.response.get('Error').get('Message'))
+        sys.stdout.flush()
+        sys.exit(1)
+
+    return clusters
+
+def fill_pool(args, config, size):
+    # creates the clusters missing from the pool, without waiting for the stacks to complete
+    template = get_cluster_template(config)
+    clusters = get_pool_clusters(config, template)
+    missing = size - len([c for c in clusters if c[1] in ['available', 'pending']])
+    if missing <= 0:
+        logger.info('Pool for cluster template %s is full (%s clusters)' % (template, size))
+        return
+
+    logger.info('Adding %s cluster(s) to the pool for cluster template %s' % (missing, template))
+    extra_parameters = dict(POOL_PARAMETERS)
+    if args.extra_parameters is not None:
+        extra_parameters.update(args.extra_parameters)
+    for i in range(missing):
+        create_args = argparse.Namespace(**vars(args))
+        create_args.func = cfncluster.create
+        create_args.cluster_name = 'pool-%s-%s' % (template, uuid.uuid4().hex[:8])
+        create_args.cluster_template = template
+        create_args.extra_parameters = extra_parameters
+        create_args.tags = {POOL_TAG: template}
+        create_args.nowait = True
+        create_args.norollback = False
+        cfncluster.create(create_args)
+
+def claim_cluster(config, cluster_name, claimer):
+    # adds the claim tag to the stack of the given pool cluster
+    # returns False if the cluster has already been claimed, or is being claimed, by someone else
+    stack_name = 'cfncluster-' + cluster_name
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+
+    stack = cfn.describe_stacks(StackName=stack_name).get('Stacks')[0]
+    tags = stack.get('Tags', [])
+    if stack.get('StackStatus') not in AVAILABLE_STATUSES or CLAIM_TAG in [tag.get('Key') for tag in tags]:
+        return False
+
+    try:
+        cfn.update_stack(StackName=stack_name, UsePreviousTemplate=True, Capabilities=['CAPABILITY_IAM'],
+                         Parameters=[{'ParameterKey': p.get('ParameterKey'), 'UsePreviousValue': True}
+                                     for p in stack.get('Parameters', [])],
+                         Tags=tags + [{'Key': CLAIM_TAG, 'Value': claimer}])
+    except ClientError as e:
+        # another claim is updating the stack
+        if e.response.get('Error').get('Code') == 'ValidationError':
+            return False
+        raise
+
+    # Re-read the claim in case another claim updated the stack between our read and our update
+    tags = cfn.describe_stacks(StackName=stack_name).get('Stacks')[0].get('Tags', [])
+    claims = [tag.get('Value') for tag in tags if tag.get('Key') == CLAIM_TAG]
+    return len(claims) == 0 or claims == [claimer]
+
+def claim(args):
+    config = cfnconfig.CfnClusterConfig(args)
+    template = get_cluster_template(config)
+    logger.info('Claiming a cluster from the pool for cluster template %s' % template)
+
+    available = [c[0] for c in get_pool_clusters(config, template) if c[1] == 'available']
+    cluster_name = None
+    try:
+        for candidate in available:
+            if claim_cluster(config, candidate, args.cluster_name):
+                cluster_name = candidate
+                break
+    except ClientError as e:
+        logger.critical(e.response.get('Error').get('Message'))
+        sys.stdout.flush()
+        sys.exit(1)
+
+    if cluster_name is None:
+        logger.info('No cluster available in the pool, creating cluster %s' % args.cluster_name)
+        cfncluster.create(args)
+        return
+
+    logger.info('Claimed cluster %s for %s' % (cluster_name, args.cluster_name))
+
+    # Restore the ComputeFleet limits from the cluster template
+    start_args = argparse.Namespace(**vars(args))
+    start_args.func = cfncluster.start
+    start_args.cluster_name = cluster_name
+    cfncluster.start(start_args)
+
+    # Refill the pool, CloudFormation creates the new clusters in the background
+    if config.pool_size > 0:
+        fill_pool(args, config, config.pool_size)
+
+    logger.info('Use cluster name %s for further cfncluster commands' % cluster_name)
+
+def fill(args):
+    config = cfnconfig.CfnClusterConfig(args)
+    size = args.size if args.size is not None else config.pool_size
+    fill_pool(args, config, size)
+
+def list_pool(args):
+    config = cfnconfig.CfnClusterConfig(args)
+    for cluster_name, state, claimer in get_pool_clusters(config, get_cluster_template(config)):
+        if claimer is not None:
+            state = '%s by %s' % (state, claimer)
+        logger.info('%s         %s' % (cluster_name, state))
+
+def drain(args):
+    # deletes all the unclaimed clusters of the pool
+    config = cfnconfig.CfnClusterConfig(args)
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+
+    for cluster_name, state, claimer in get_pool_clusters(config, get_cluster_template(config)):
+        if state == 'claimed':
+            continue
+        logger.info('Deleting pool cluster %s' % cluster_name)
+        try:
+            cfn.delete_stack(StackName='cfncluster-' + cluster_name)
+        except ClientError as e:
+            logger.critical(e.response.get('Error').get('Message'))
+            sys.stdout.flush()
+            sys.exit(1)
@@ -0,0 +1,159 @@
+from __future__ import absolute_import
+from __future__ import print_function
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Pre-warming raises the min and desired capacity of the ComputeFleet ASG ahead of a known demand peak with a scheduled
+# action, and restores the min capacity of the cluster configuration afterwards with a second one. Only the min
+# capacity falls back: the ASG never terminates a busy node, the nodewatcher terminates the idle ones after
+# scaledown_idletime as usual. The schedule comes from the [prewarm] section of the cluster or from the scaling
+# history of the fleet.
+
+import sys
+import time
+import logging
+from botocore.exceptions import ClientError
+
+from . import cfncluster
+from . import cfnconfig
+from . import scaling_report
+from . import utils
+
+logger = logging.getLogger('cfncluster.cfncluster')
+
+START_ACTION = 'cfncluster-prewarm-start'
+END_ACTION = 'cfncluster-prewarm-end'
+
+# Days of scaling history needed to derive a schedule
+MIN_HISTORY_DAYS = 3
+
+def _median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+def get_schedule_from_history(nodes, lead_time, max_size):
+    # returns a schedule {'start', 'end', 'size'} from the days with launches, None if there are too few:
+    # warm up lead_time minutes before the median first launch of the day, until the median last termination,
+    # with the median daily peak of nodes in service
+    days = {}
+    for node in nodes:
+        requested = node.get('requested') or node.get('launch_start')
+        if requested is None:
+            continue
+        day = days.setdefault(time.strftime('%Y-%m-%d', time.gmtime(requested)), {'first': requested, 'last': None})
+        day['first'] = min(day['first'], requested)
+        if node.get('terminating') is not None:
+            day['last'] = max(day['last'] or 0, node['terminating'])
+    if len(days) < MIN_HISTORY_DAYS:
+        return None
+
+    peaks = {}
+    for timestamp, count in scaling_report.get_capacity_series(nodes):
+        day = time.strftime('%Y-%m-%d', time.gmtime(timestamp))
+        peaks[day] = max(peaks.get(day, 0), count)
+
+    def minute_of_day(timestamp):
+        t = time.gmtime(timestamp)
+        return t.tm_hour * 60 + t.tm_min
+
+    # the start moves to the day before when the lead time goes past midnight
+    start_day, start = divmod(_median([minute_of_day(d['first']) for d in days.values()]) - lead_time, 24 * 60)
+    ends = [minute_of_day(d['last']) for d in days.values() if d['last'] is not None]
+    end = _median(ends) if len(ends) > 0 else (start + 8 * 60) % (24 * 60)
+
+    def cron_weekdays(shift):
+        # cron days of the week, 0 is Sunday
+        weekdays = sorted(set((time.gmtime(d['first']).tm_wday + 1 + shift) % 7 for d in days.values()))
+        return ','.join(str(d) for d in weekdays) if len(weekdays) < 7 else '*'
+
+    size = min(max_size, max(1, _median([peaks.get(day, 0) for day in days])))
+    return {'start': '%d %d * * %s' % (start % 60, start // 60, cron_weekdays(start_day)),
+            'end': '%d %d * * %s' % (end % 60, end // 60, cron_weekdays(0)),
+            'size': size}
+
+def get_scheduled_actions(asg_name, config):
+    asg = utils.get_client('autoscaling', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    actions = []
+    paginator = asg.get_paginator('describe_scheduled_actions')
+    for page in paginator.paginate(AutoScalingGroupName=asg_name):
+        actions.extend(page.get('ScheduledUpdateGroupActions', []))
+    return actions
+
+def put_schedule(asg_name, config, schedule):
+    asg = utils.get_client('autoscaling', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    min_queue_size, max_queue_size, desired_queue_size = cfncluster.get_asg_limits(config.parameters)
+    if schedule['size'] > max_queue_size:
+        logger.error('The prewarm size %d is larger than the max_queue_size %d' % (schedule['size'], max_queue_size))
+        sys.exit(1)
+    asg.put_scheduled_update_group_action(AutoScalingGroupName=asg_name, ScheduledActionName=START_ACTION,
+                                          Recurrence=schedule['start'], MinSize=max(min_queue_size, schedule['size']),
+                                          DesiredCapacity=max(min_queue_size, schedule['size']))
+    asg.put_scheduled_update_group_action(AutoScalingGroupName=asg_name, ScheduledActionName=END_ACTION,
+                                          Recurrence=schedule['end'], MinSize=min_queue_size)
+
+def delete_schedule(asg_name, config):
+    asg = utils.get_client('autoscaling', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    names = [action.get('ScheduledActionName') for action in get_scheduled_actions(asg_name, config)]
+    for name in [START_ACTION, END_ACTION]:
+        if name in names:
+            asg.delete_scheduled_action(AutoScalingGroupName=asg_name, ScheduledActionName=name)
+
+def prewarm(args):
+    stack_name = ('cfncluster-' + args.cluster_name)
+    config = cfnconfig.CfnClusterConfig(args)
+
+    try:
+        asg_name = cfncluster.get_asg_name(stack_name=stack_name, config=config)
+        if args.action == 'clear':
+            delete_schedule(asg_name, config)
+            logger.info('Prewarm schedule removed from the compute fleet of %s' % args.cluster_name)
+            return
+
+        schedule = config.prewarm
+        if args.from_history:
+            nodes = scaling_report.get_nodes(asg_name, config)[0]
+            scaling_report.compute_latencies(nodes, time.time())
+            schedule = get_schedule_from_history(nodes, args.lead_time, cfncluster.get_asg_limits(config.parameters)[1])
+            if schedule is None:
+                logger.error('Not enough scaling history to derive a prewarm schedule, at least %d days are needed'
+                             % MIN_HISTORY_DAYS)
+                sys.exit(1)
+            logger.info('Prewarm schedule derived from the scaling history (UTC):')
+            logger.info('    start = %s' % schedule['start'])
+            logger.info('    end = %s' % schedule['end'])
+            logger.info('    size = %d' % schedule['size'])
+
+        if args.action == 'apply':
+            if schedule is None:
+                logger.error('No prewarm_settings in the cluster section and no --from-history')
+                sys.exit(1)
+            put_schedule(asg_name, config, schedule)
+            logger.info('Prewarm schedule applied to the compute fleet of %s' % args.cluster_name)
+        elif not args.from_history:
+            actions = [a for a in get_scheduled_actions(asg_name, config)
+                       if a.get('ScheduledActionName') in [START_ACTION, END_ACTION]]
+            if len(actions) == 0:
+                logger.info('No prewarm schedule on the compute fleet of %s' % args.cluster_name)
+            for action in sorted(actions, key=lambda a: a.get('ScheduledActionName'), reverse=True):
+                logger.info('%s: %s, min %s, desired %s' % (action.get('ScheduledActionName'),
+                                                           action.get('Recurrence'), action.get('MinSize'),
+                                                           action.get('DesiredCapacity', '-')))
+    except ClientError as e:
+        logger.critical(e.response.get('Error').get('Message'))
+        sys.stdout.flush()
+        sys.exit(1)
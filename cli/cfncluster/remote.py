@@ -0,0 +1,177 @@
+from __future__ import absolute_import
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Runs a command on the nodes of a cluster over ssh, with the master server as jump host. The addresses of the nodes
+# are resolved from the ComputeFleet ASG with batched describe_instances calls, then a bounded number of worker
+# threads run one ssh process per node. The jump connections are multiplexed on the control connection of the
+# master server, so the master pays a single handshake whatever the number of nodes.
+
+import os
+import sys
+import json
+import logging
+import threading
+import subprocess as sub
+from botocore.exceptions import ClientError
+
+try:
+    from shlex import quote as cmd_quote
+except ImportError:
+    from pipes import quote as cmd_quote
+
+from . import cfncluster
+from . import cfnconfig
+from . import utils
+
+logger = logging.getLogger('cfncluster.cfncluster')
+
+# Number of nodes running the command at the same time, as the pdsh default fanout
+DEFAULT_PARALLELISM = 32
+
+def get_nodes(stack, config, include_master):
+    # returns [logical id, instance id, private ip] for the running compute nodes, and the master server if asked
+    instances = []
+    if include_master:
+        instances.extend(cfncluster.get_ec2_instances(stack, config))
+    instances.extend(cfncluster.get_asg_instances(stack, config))
+
+    ec2 = utils.get_client('ec2', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    instance_ids = [instance[1] for instance in instances]
+    addresses = {}
+    # a filter, unlike InstanceIds, does not fail on the instances already gone
+    for i in range(0, len(instance_ids), 100):
+        filters = [{'Name': 'instance-id', 'Values': instance_ids[i:i + 100]},
+                   {'Name': 'instance-state-name', 'Values': ['running']}]
+        for reservation in ec2.describe_instances(Filters=filters).get('Reservations'):
+            for instance in reservation.get('Instances'):
+                addresses[instance.get('InstanceId')] = instance.get('PrivateIpAddress')
+
+    return [[name, instance_id, addresses[instance_id]] for name, instance_id in instances if instance_id in addresses]
+
+def get_ssh_command(username, master_ip, address, control_path, ssh_options, command):
+    # ssh command running command on the node at address, through the master server
+    proxy = ['ssh'] + cfncluster.get_ssh_control_options(control_path) + ssh_options \
+        + ['-W', '%h:%p', '%s@%s' % (username, master_ip)]
+    return ['ssh', '-n', '-o', 'BatchMode=yes', '-o', 'StrictHostKeyChecking=no',
+            '-o', 'ProxyCommand=%s' % ' '.join(cmd_quote(arg) for arg in proxy)] + ssh_options \
+        + ['%s@%s' % (username, address), command]
+
+def run_command(node, ssh_command, timeout):
+    # runs the ssh command of a node, returns its result with the exit code and the output
+    result = {'name': node[0], 'instance_id': node[1], 'address': node[2], 'exit_code': None, 'timed_out': False}
+    with open(os.devnull, 'rb') as devnull:
+        process = sub.Popen(ssh_command, stdin=devnull, stdout=sub.PIPE, stderr=sub.STDOUT)
+    timer = None
+    if timeout:
+        def kill():
+            result['timed_out'] = True
+            try:
+                process.kill()
+            except OSError:
+                pass
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+    output = process.communicate()[0]
+    if timer is not None:
+        timer.cancel()
+    result['exit_code'] = process.returncode
+    result['output'] = output.decode('utf-8', 'replace')
+    return result
+
+def print_result(result):
+    for line in result['output'].splitlines():
+        print('%s: %s' % (result['address'], line))
+    if result['timed_out']:
+        print('%s: timed out' % result['address'])
+    elif result['exit_code'] != 0:
+        print('%s: exit code %s' % (result['address'], result['exit_code']))
+    sys.stdout.flush()
+
+def execute(args, extra_args):
+    stack = ('cfncluster-' + args.cluster_name)
+    config = cfnconfig.CfnClusterConfig(args)
+
+    if len(extra_args) > 0 and extra_args[0] == '--':
+        extra_args = extra_args[1:]
+    if len(extra_args) == 0:
+        logger.error('No command given, usage: cfncluster exec <cluster_name> -- <command>')
+        sys.exit(1)
+    # as ssh, the arguments are joined and run by the login shell of the nodes
+    command = ' '.join(extra_args)
+
+    try:
+        username, master_ip = cfncluster.get_ssh_target(stack, config)
+        nodes = get_nodes(stack, config, args.all)
+    except ClientError as e:
+        logger.critical(e.response.get('Error').get('Message'))
+        sys.stdout.flush()
+        sys.exit(1)
+    if len(nodes) == 0:
+        logger.info('No running node in cluster %s' % args.cluster_name)
+        return
+
+    ssh_options = ['-i', args.identity_file] if args.identity_file else []
+    control_path = cfncluster.get_ssh_control_path(args.cluster_name, config.region)
+    commands = [get_ssh_command(username, master_ip, node[2], control_path, ssh_options, command) for node in nodes]
+    if args.dryrun:
+        for ssh_command in commands:
+            logger.info(' '.join(cmd_quote(arg) for arg in ssh_command))
+        return
+
+    # opens the connection to the master before the fan-out, otherwise every jump would race to become the master
+    if sub.call(['ssh', '-o', 'BatchMode=yes'] + cfncluster.get_ssh_control_options(control_path) + ssh_options
+                + ['%s@%s' % (username, master_ip), 'true']) != 0:
+        logger.critical('Failed to open the SSH connection to %s@%s' % (username, master_ip))
+        sys.exit(1)
+
+    results = []
+    pending = list(zip(nodes, commands))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if len(pending) == 0:
+                    return
+                node, ssh_command = pending.pop(0)
+            result = run_command(node, ssh_command, args.timeout)
+            with lock:
+                results.append(result)
+                if not args.json:
+                    print_result(result)
+
+    threads = [threading.Thread(target=worker) for i in range(min(args.parallelism, len(nodes)))]
+    try:
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            # a join with a timeout keeps the main thread responsive to Ctrl-C
+            while thread.is_alive():
+                thread.join(1)
+    except KeyboardInterrupt:
+        logger.info('\nExiting...')
+        sys.exit(1)
+
+    failed = [result for result in results if result['exit_code'] != 0]
+    if args.json:
+        print(json.dumps(sorted(results, key=lambda result: result['address']), indent=2))
+    else:
+        logger.info('%d node(s), %d succeeded, %d failed' % (len(results), len(results) - len(failed), len(failed)))
+        for result in sorted(failed, key=lambda result: result['address']):
+            logger.info('  %s %s: %s' % (result['instance_id'], result['address'],
+                                         'timed out' if result['timed_out'] else 'exit code %s' % result['exit_code']))
+    if len(failed) > 0:
+        sys.exit(1)
@@ -0,0 +1,217 @@
+from __future__ import absolute_import
+from __future__ import print_function
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Scaling report of a cluster, built from the scaling activities of its ComputeFleet ASG (kept 6 weeks by AWS).
+# The launch and the terminate activities of each instance are paired into a node: requested (the time in the cause
+# of the launch, e.g. the desired capacity change of the jobwatcher), in service (end of the launch), terminating and
+# terminated. Nodes terminated "in response to a user request" were terminated by the nodewatcher, after having been
+# idle for ScaleDownIdleTime minutes.
+
+import re
+import sys
+import csv
+import json
+import time
+import calendar
+import logging
+from botocore.exceptions import ClientError
+
+from . import cfncluster
+from . import cfnconfig
+from . import utils
+
+logger = logging.getLogger('cfncluster.cfncluster')
+
+NODE_FIELDS = ['instance_id', 'requested', 'launch_start', 'in_service', 'terminating', 'terminated',
+               'terminate_reason', 'scale_up_latency', 'lifetime']
+TIME_FIELDS = ['requested', 'launch_start', 'in_service', 'terminating', 'terminated']
+
+_CAUSE_TIME = re.compile(r'At (\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ)')
+_INSTANCE_ID = re.compile(r'\b(i-[0-9a-f]+)\b')
+
+def _epoch(value):
+    # seconds since the epoch of a botocore datetime, None for None
+    if value is None:
+        return None
+    return calendar.timegm(value.utctimetuple())
+
+def _format_time(seconds):
+    if seconds is None:
+        return None
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(seconds))
+
+def get_cause_time(cause):
+    # time of the event that caused the activity, the first "At <time>" of the cause
+    match = _CAUSE_TIME.search(cause or '')
+    if match is None:
+        return None
+    return calendar.timegm(time.strptime(match.group(1), '%Y-%m-%dT%H:%M:%SZ'))
+
+def get_terminate_reason(cause):
+    cause = cause or ''
+    if 'in response to a user request' in cause:
+        return 'idle'
+    if 'health' in cause:
+        return 'unhealthy'
+    if 'difference between desired and actual capacity' in cause:
+        return 'scale-in'
+    return 'other'
+
+def add_activity(nodes, activity):
+    # pairs the activity with the node of its instance, returns False for the failed launches without an instance
+    match = _INSTANCE_ID.search(activity.get('Description', ''))
+    if match is None:
+        return not activity.get('Description', '').startswith('Launching')
+    node = nodes.setdefault(match.group(1), {'instance_id': match.group(1)})
+    if activity.get('Description').startswith('Launching'):
+        node['requested'] = get_cause_time(activity.get('Cause'))
+        node['launch_start'] = _epoch(activity.get('StartTime'))
+        if activity.get('StatusCode') == 'Successful':
+            node['in_service'] = _epoch(activity.get('EndTime'))
+    elif activity.get('Description').startswith('Terminating'):
+        node['terminating'] = _epoch(activity.get('StartTime'))
+        node['terminated'] = _epoch(activity.get('EndTime'))
+        node['terminate_reason'] = get_terminate_reason(activity.get('Cause'))
+    return True
+
+def get_nodes(asg_name, config):
+    # streams the scaling activities of the ASG, returns the nodes and the number of activities without an instance
+    asg = utils.get_client('autoscaling', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    nodes = {}
+    failed = 0
+    paginator = asg.get_paginator('describe_scaling_activities')
+    for page in paginator.paginate(AutoScalingGroupName=asg_name):
+        for activity in page.get('Activities', []):
+            if not add_activity(nodes, activity):
+                failed += 1
+    return list(nodes.values()), failed
+
+def compute_latencies(nodes, now):
+    for node in nodes:
+        requested = node.get('requested') or node.get('launch_start')
+        in_service = node.get('in_service')
+        node['scale_up_latency'] = in_service - requested if in_service is not None and requested is not None else None
+        if in_service is not None:
+            node['lifetime'] = (node.get('terminating') or now) - in_service
+        else:
+            node['lifetime'] = None
+
+def get_histogram(values, bucket_size):
+    # returns [low, high, count] for each bucket from 0 to the highest value
+    if len(values) == 0:
+        return []
+    counts = [0] * (int(max(values) // bucket_size) + 1)
+    for value in values:
+        counts[int(value // bucket_size)] += 1
+    return [[i * bucket_size, (i + 1) * bucket_size, count] for i, count in enumerate(counts)]
+
+def get_capacity_series(nodes):
+    # returns [time, in service nodes] at every change of the number of nodes in service
+    changes = []
+    for node in nodes:
+        if node.get('in_service') is not None:
+            changes.append((node['in_service'], 1))
+            if node.get('terminating') is not None:
+                changes.append((node['terminating'], -1))
+    series = []
+    running = 0
+    for timestamp, change in sorted(changes):
+        running += change
+        if len(series) > 0 and series[-1][0] == timestamp:
+            series[-1][1] = running
+        else:
+            series.append([timestamp, running])
+    return series
+
+def get_summary(nodes, failed_launches, idle_time):
+    latencies = sorted(n['scale_up_latency'] for n in nodes if n.get('scale_up_latency') is not None)
+    reasons = {}
+    for node in nodes:
+        if node.get('terminate_reason') is not None:
+            reasons[node['terminate_reason']] = reasons.get(node['terminate_reason'], 0) + 1
+
+    def percentile(percent):
+        if len(latencies) == 0:
+            return None
+        return latencies[min(len(latencies) - 1, int(percent / 100.0 * len(latencies)))]
+
+    return {'launches': len([n for n in nodes if n.get('in_service') is not None]),
+            'failed_launches': failed_launches,
+            'terminations': sum(reasons.values()),
+            'terminate_reasons': reasons,
+            'scale_up_latency_p50': percentile(50),
+            'scale_up_latency_p90': percentile(90),
+            'scale_up_latency_max': latencies[-1] if len(latencies) > 0 else None,
+            'node_hours': round(sum(n['lifetime'] for n in nodes if n.get('lifetime') is not None) / 3600.0, 2),
+            # every node terminated by the nodewatcher was idle for ScaleDownIdleTime minutes before
+            'idle_node_hours': round(reasons.get('idle', 0) * idle_time / 60.0, 2),
+            'scaledown_idletime': idle_time}
+
+def print_table(summary, histogram, bucket_size):
+    def seconds(value):
+        return '-' if value is None else '%ds' % value
+
+    print('Nodes launched:            %d' % summary['launches'])
+    print('Failed launches:           %d' % summary['failed_launches'])
+    print('Nodes terminated:          %d (%s)' % (summary['terminations'],
+          ', '.join('%s: %d' % (k, v) for k, v in sorted(summary['terminate_reasons'].items())) or 'none'))
+    print('Scale-up latency:          p50 %s, p90 %s, max %s' % (seconds(summary['scale_up_latency_p50']),
+          seconds(summary['scale_up_latency_p90']), seconds(summary['scale_up_latency_max'])))
+    print('Node-hours:                %.2f' % summary['node_hours'])
+    print('Idle node-hours:           %.2f (scaledown_idletime = %s min)' % (summary['idle_node_hours'],
+                                                                            summary['scaledown_idletime']))
+    if len(histogram) > 0:
+        print('')
+        print('Scale-up latency histogram (%ds buckets):' % bucket_size)
+        top = max(count for low, high, count in histogram)
+        for low, high, count in histogram:
+            print('%6ds - %6ds  %-40s %d' % (low, high, '#' * int(round(40.0 * count / top)), count))
+
+def scaling_report(args):
+    stack = ('cfncluster-' + args.cluster_name)
+    config = cfnconfig.CfnClusterConfig(args)
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+
+    try:
+        parameters = cfn.describe_stacks(StackName=stack).get('Stacks')[0].get('Parameters')
+        idle_time = int([p.get('ParameterValue') for p in parameters if p.get('ParameterKey') == 'ScaleDownIdleTime'][0])
+        nodes, failed_launches = get_nodes(cfncluster.get_asg_name(stack, config), config)
+    except ClientError as e:
+        logger.critical(e.response.get('Error').get('Message'))
+        sys.stdout.flush()
+        sys.exit(1)
+
+    compute_latencies(nodes, time.time())
+    nodes.sort(key=lambda node: (node.get('requested') or node.get('launch_start') or 0, node['instance_id']))
+    summary = get_summary(nodes, failed_launches, idle_time)
+    histogram = get_histogram([n['scale_up_latency'] for n in nodes if n.get('scale_up_latency') is not None],
+                              args.bucket_size)
+
+    if args.format == 'json':
+        report = {'summary': summary, 'scale_up_latency_histogram': histogram,
+                  'nodes': [dict((k, _format_time(v) if k in TIME_FIELDS else v) for k, v in node.items())
+                            for node in nodes],
+                  'capacity': [[_format_time(t), count] for t, count in get_capacity_series(nodes)]}
+        print(json.dumps(report, indent=2, sort_keys=True))
+    elif args.format == 'csv':
+        writer = csv.writer(sys.stdout)
+        writer.writerow(NODE_FIELDS)
+        for node in nodes:
+            writer.writerow([_format_time(node.get(k)) if k in TIME_FIELDS else node.get(k) for k in NODE_FIELDS])
+    else:
+        print_table(summary, histogram, args.bucket_size)
@@ -0,0 +1,255 @@
+from __future__ import absolute_import
+from __future__ import print_function
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Spot advisor: ranks the availability zones of the VPC of a cluster template, the ones with a subnet with free
+# addresses, by the spot price history of the compute_instance_type, fetched one thread per zone. The history is a
+# list of price changes, so the statistics are weighted by the time each price was in effect. The score of a zone is
+# its mean price times one plus its coefficient of variation, the cheapest and most stable zone has the lowest, and
+# the bid is the highest price of the window plus a margin. The histories are cached in ~/.cfncluster for CACHE_TTL
+# seconds, so the advisor and the create preflight do not fetch them again on every run.
+
+import os
+import sys
+import json
+import math
+import time
+import calendar
+import logging
+import threading
+from botocore.exceptions import ClientError
+
+from . import cfnconfig
+from . import utils
+
+logger = logging.getLogger('cfncluster.cfncluster')
+
+# Hours of spot price history of the statistics
+DEFAULT_HOURS = 24
+
+# Seconds the spot price histories are cached
+CACHE_TTL = 300
+
+# Margin of the bid over the highest price of the window
+BID_MARGIN = 0.2
+
+PRODUCT_DESCRIPTIONS = ['Linux/UNIX (Amazon VPC)', 'Linux/UNIX']
+
+def get_cache_path():
+    return os.path.join(os.path.expanduser('~'), '.cfncluster', 'spot-price-history.json')
+
+def load_cache(key):
+    # returns the cached histories of key, None when missing or older than CACHE_TTL
+    try:
+        with open(get_cache_path()) as f:
+            entry = json.load(f).get(key)
+    except (IOError, OSError, ValueError):
+        return None
+    if entry is None or time.time() - entry.get('time', 0) > CACHE_TTL:
+        return None
+    return entry.get('history')
+
+def save_cache(key, history):
+    path = get_cache_path()
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (IOError, OSError, ValueError):
+        cache = {}
+    now = time.time()
+    # drops the expired entries, the other keys are other regions or instance types
+    cache = dict((k, v) for k, v in cache.items() if now - v.get('time', 0) <= CACHE_TTL)
+    cache[key] = {'time': now, 'history': history}
+    try:
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        # a rename is atomic, concurrent runs never read a partial file
+        with open(path + '.tmp', 'w') as f:
+            json.dump(cache, f)
+        os.rename(path + '.tmp', path)
+    except (IOError, OSError) as e:
+        logger.debug('Failed to write the spot price cache %s: %s' % (path, e))
+
+def get_subnets(vpc_id, config):
+    # returns availability zone -> [subnet id, free addresses] of the available subnets of the VPC, most free first
+    ec2 = utils.get_client('ec2', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    zones = {}
+    filters = [{'Name': 'vpc-id', 'Values': [vpc_id]}, {'Name': 'state', 'Values': ['available']}]
+    for subnet in ec2.describe_subnets(Filters=filters).get('Subnets'):
+        if subnet.get('AvailableIpAddressCount', 0) > 0:
+            zones.setdefault(subnet.get('AvailabilityZone'), []).append([subnet.get('SubnetId'),
+                                                                          subnet.get('AvailableIpAddressCount')])
+    for subnets in zones.values():
+        subnets.sort(key=lambda subnet: (-subnet[1], subnet[0]))
+    return zones
+
+def _get_zone_history(instance_type, zone, start, config, histories):
+    # puts the [time, price] changes of the zone since start in histories, or the exception that stopped the fetch
+    ec2 = utils.get_client('ec2', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    try:
+        changes = dict((description, []) for description in PRODUCT_DESCRIPTIONS)
+        paginator = ec2.get_paginator('describe_spot_price_history')
+        for page in paginator.paginate(InstanceTypes=[instance_type], ProductDescriptions=PRODUCT_DESCRIPTIONS,
+                                       AvailabilityZone=zone, StartTime=start):
+            for price in page.get('SpotPriceHistory', []):
+                changes[price.get('ProductDescription')].append([calendar.timegm(price.get('Timestamp').utctimetuple()),
+                                                                 float(price.get('SpotPrice'))])
+        # the accounts with EC2-Classic have a separate VPC price
+        history = [changes[d] for d in PRODUCT_DESCRIPTIONS if len(changes[d]) > 0]
+        histories[zone] = sorted(history[0]) if len(history) > 0 else []
+    except Exception as e:
+        histories[zone] = e
+
+def get_histories(instance_type, zones, hours, config, refresh=False):
+    # returns availability zone -> [time, price] changes of the last hours, fetched in parallel
+    key = '%s/%s/%d/%s' % (config.region, instance_type, hours, ','.join(sorted(zones)))
+    histories = None if refresh else load_cache(key)
+    if histories is not None:
+        logger.debug('Using the cached spot price history of %s' % key)
+        return histories
+
+    histories = {}
+    start = time.time() - hours * 3600
+    threads = [threading.Thread(target=_get_zone_history, args=(instance_type, zone, start, config, histories))
+               for zone in zones]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for history in histories.values():
+        if isinstance(history, Exception):
+            raise history
+    save_cache(key, histories)
+    return histories
+
+def get_stats(history, start, end):
+    # returns the statistics of the prices in effect between start and end, None without price
+    before = [[t, p] for t, p in history if t <= start]
+    # the first price of the window is the last change before it
+    points = ([[start, before[-1][1]]] if len(before) > 0 else []) + [[t, p] for t, p in history if start < t < end]
+    if len(points) == 0:
+        return None
+    durations = [(points[i + 1][0] if i + 1 < len(points) else end) - t for i, (t, p) in enumerate(points)]
+    total = sum(durations)
+    if total == 0:
+        mean = points[-1][1]
+        stdev = 0.0
+    else:
+        mean = sum(p * d for (t, p), d in zip(points, durations)) / total
+        stdev = math.sqrt(sum((p - mean) ** 2 * d for (t, p), d in zip(points, durations)) / total)
+    return {'current': points[-1][1],
+            'mean': round(mean, 6),
+            'max': max(p for t, p in points),
+            'stdev': round(stdev, 6),
+            'changes': len(points) - 1,
+            'score': round(mean * (1 + (stdev / mean if mean > 0 else 0)), 6)}
+
+def get_bid(stats):
+    # the highest price of the window plus the margin, rounded up to the spot price precision
+    return math.ceil(round(max(stats['max'], stats['current']) * (1 + BID_MARGIN) * 10000, 6)) / 10000.0
+
+def get_advice(subnets, histories, hours, now):
+    # returns the zones with their subnet and statistics, best first, the zones without price history last
+    zones = []
+    for zone in sorted(subnets):
+        stats = get_stats(histories.get(zone, []), now - hours * 3600, now)
+        advice = {'availability_zone': zone, 'subnet_id': subnets[zone][0][0], 'free_addresses': subnets[zone][0][1]}
+        if stats is not None:
+            advice.update(stats)
+            advice['bid'] = get_bid(stats)
+        zones.append(advice)
+    zones.sort(key=lambda z: (z.get('score') is None, z.get('score'), -z['free_addresses']))
+    return zones
+
+def get_parameters(config):
+    # returns the instance type, VPC, compute subnet, cluster type and spot price of the cluster template
+    parameters = dict(config.parameters)
+    compute_subnet = parameters.get('ComputeSubnetId', 'NONE')
+    return (parameters.get('ComputeInstanceType', 't2.micro'), parameters.get('VPCId'),
+            parameters.get('MasterSubnetId') if compute_subnet == 'NONE' else compute_subnet,
+            parameters.get('ClusterType', 'ondemand'), float(parameters.get('SpotPrice', 0)))
+
+def advise(config, instance_type, hours, refresh=False):
+    vpc_id = get_parameters(config)[1]
+    subnets = get_subnets(vpc_id, config)
+    histories = get_histories(instance_type, list(subnets), hours, config, refresh)
+    return get_advice(subnets, histories, hours, time.time())
+
+def preflight(config):
+    # logs the spot advice for a spot cluster, and warns about a bid below the current price of the compute zone
+    instance_type, vpc_id, compute_subnet, cluster_type, spot_price = get_parameters(config)
+    if cluster_type != 'spot':
+        return
+    try:
+        zones = advise(config, instance_type, DEFAULT_HOURS)
+        ec2 = utils.get_client('ec2', region_name=config.region,
+                               aws_access_key_id=config.aws_access_key_id,
+                               aws_secret_access_key=config.aws_secret_access_key)
+        compute_zone = ec2.describe_subnets(SubnetIds=[compute_subnet]).get('Subnets')[0].get('AvailabilityZone')
+    except ClientError as e:
+        # the advice is optional, the cluster is created anyway
+        logger.warning('Spot advisor skipped: %s' % e.response.get('Error').get('Message'))
+        return
+
+    current = [z for z in zones if z['availability_zone'] == compute_zone]
+    if len(current) > 0 and current[0].get('current') is not None:
+        current = current[0]
+        if spot_price < current['current']:
+            logger.warning('spot_price %s is below the current spot price %s of %s in %s, '
+                           'the compute fleet will not launch' % (spot_price, current['current'], instance_type,
+                                                                  compute_zone))
+        elif spot_price < current['max']:
+            logger.warning('spot_price %s is below the highest spot price %s of %s in %s in the last %d hours, '
+                           'the compute nodes may be interrupted' % (spot_price, current['max'], instance_type,
+                                                                     compute_zone, DEFAULT_HOURS))
+    if len(zones) > 0 and zones[0].get('score') is not None and zones[0]['availability_zone'] != compute_zone:
+        logger.info('Spot advisor: %s is cheaper and more stable for %s, compute_subnet_id = %s, spot_price = %s'
+                    % (zones[0]['availability_zone'], instance_type, zones[0]['subnet_id'], zones[0]['bid']))
+
+def spot_advisor(args):
+    config = cfnconfig.CfnClusterConfig(args)
+    instance_type = args.instance_type or get_parameters(config)[0]
+
+    try:
+        zones = advise(config, instance_type, args.hours, args.refresh)
+    except ClientError as e:
+        logger.critical(e.response.get('Error').get('Message'))
+        sys.stdout.flush()
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps({'instance_type': instance_type, 'hours': args.hours, 'zones': zones}, indent=2,
+                         sort_keys=True))
+        return
+    if len(zones) == 0:
+        logger.info('No subnet with free addresses in the VPC of the cluster template')
+        return
+    print('Spot prices of %s in the last %d hours:' % (instance_type, args.hours))
+    print('%-14s %-26s %9s %9s %9s %9s %8s %9s' % ('Zone', 'Subnet', 'Current', 'Mean', 'Max', 'Stdev', 'Changes',
+                                                    'Bid'))
+    for zone in zones:
+        if zone.get('score') is None:
+            print('%-14s %-26s %9s' % (zone['availability_zone'], zone['subnet_id'], 'no price'))
+            continue
+        print('%-14s %-26s %9.4f %9.4f %9.4f %9.4f %8d %9.4f' % (zone['availability_zone'], zone['subnet_id'],
+                                                                 zone['current'], zone['mean'], zone['max'],
+                                                                 zone['stdev'], zone['changes'], zone['bid']))
+    if zones[0].get('score') is not None:
+        print('')
+        print('Recommended: compute_subnet_id = %s (%s), spot_price = %s' % (zones[0]['subnet_id'],
+                                                                            zones[0]['availability_zone'],
+                                                                            zones[0]['bid']))
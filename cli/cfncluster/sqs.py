@@ -0,0 +1,196 @@
+from __future__ import absolute_import
+from __future__ import print_function
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Inspection of the SQS queue of a cluster, where the SNS topic of the ComputeFleet ASG delivers the launch and
+# terminate notifications consumed by the sqswatcher on the master server.
+#
+# Peeking receives messages with a visibility timeout of 0, so they stay available to the sqswatcher, but every
+# receive increments their ApproximateReceiveCount. Replaying sends messages back to the queue in batches of 10,
+# from a file written by peek or moved from another queue.
+
+import sys
+import json
+import time
+import datetime
+import logging
+from botocore.exceptions import ClientError
+
+from . import cfnconfig
+from . import utils
+
+logger = logging.getLogger('cfncluster.cfncluster')
+
+# Maximum number of messages of the SQS batch APIs
+BATCH_SIZE = 10
+
+# Long polling time of each peek batch, in seconds
+DEFAULT_WAIT_TIME = 2
+
+def get_queue_url(stack_name, config):
+    cfn = utils.get_client('cloudformation', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    # the physical id of an AWS::SQS::Queue is its URL
+    return cfn.describe_stack_resource(StackName=stack_name, LogicalResourceId='SQS')\
+        .get('StackResourceDetail').get('PhysicalResourceId')
+
+def get_oldest_message_age(queue_name, config):
+    # returns the latest ApproximateAgeOfOldestMessage in seconds, None without datapoint in the last 15 minutes
+    cloudwatch = utils.get_client('cloudwatch', region_name=config.region,
+                                  aws_access_key_id=config.aws_access_key_id,
+                                  aws_secret_access_key=config.aws_secret_access_key)
+    now = datetime.datetime.utcnow()
+    datapoints = cloudwatch.get_metric_statistics(Namespace='AWS/SQS', MetricName='ApproximateAgeOfOldestMessage',
+                                                  Dimensions=[{'Name': 'QueueName', 'Value': queue_name}],
+                                                  StartTime=now - datetime.timedelta(minutes=15), EndTime=now,
+                                                  Period=300, Statistics=['Maximum']).get('Datapoints')
+    if len(datapoints) == 0:
+        return None
+    return int(sorted(datapoints, key=lambda d: d.get('Timestamp'))[-1].get('Maximum'))
+
+def get_stats(queue_url, config):
+    sqs = utils.get_client('sqs', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    attributes = sqs.get_queue_attributes(QueueUrl=queue_url, AttributeNames=['All']).get('Attributes')
+    return {'queue': queue_url.split('/')[-1],
+            'visible': int(attributes.get('ApproximateNumberOfMessages', 0)),
+            'in_flight': int(attributes.get('ApproximateNumberOfMessagesNotVisible', 0)),
+            'delayed': int(attributes.get('ApproximateNumberOfMessagesDelayed', 0)),
+            'oldest_age': get_oldest_message_age(queue_url.split('/')[-1], config)}
+
+def describe_message(message):
+    # returns the message as a dict, with the event and the instance of the ASG notification when there is one
+    attributes = message.get('Attributes', {})
+    result = {'MessageId': message.get('MessageId'), 'Body': message.get('Body'),
+              'ApproximateReceiveCount': int(attributes.get('ApproximateReceiveCount', 0))}
+    if 'SentTimestamp' in attributes:
+        sent = int(attributes.get('SentTimestamp')) / 1000.0
+        result['SentTimestamp'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(sent))
+        result['Age'] = int(time.time() - sent)
+    try:
+        notification = json.loads(json.loads(message.get('Body')).get('Message'))
+        result['Event'] = notification.get('Event')
+        result['EC2InstanceId'] = notification.get('EC2InstanceId')
+    except (ValueError, TypeError, AttributeError):
+        pass
+    return result
+
+def peek(queue_url, config, count, wait_time):
+    # returns up to count distinct messages, left visible in the queue
+    sqs = utils.get_client('sqs', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    messages = {}
+    empty_batches = 0
+    # visible messages come back in any order, stop after a few batches without a new one
+    while len(messages) < count and empty_batches < 3:
+        batch = sqs.receive_message(QueueUrl=queue_url, MaxNumberOfMessages=min(BATCH_SIZE, count - len(messages)),
+                                    VisibilityTimeout=0, WaitTimeSeconds=wait_time,
+                                    AttributeNames=['All']).get('Messages', [])
+        new = [m for m in batch if m.get('MessageId') not in messages]
+        empty_batches = empty_batches + 1 if len(new) == 0 else 0
+        for message in new:
+            messages[message.get('MessageId')] = message
+    return list(messages.values())
+
+def send_batch(sqs, queue_url, bodies):
+    # sends the bodies, returns the number of failed messages
+    entries = [{'Id': str(i), 'MessageBody': body} for i, body in enumerate(bodies)]
+    return len(sqs.send_message_batch(QueueUrl=queue_url, Entries=entries).get('Failed', []))
+
+def replay_file(queue_url, config, path):
+    # sends the messages of a file written by peek, returns the numbers of sent and failed messages
+    sqs = utils.get_client('sqs', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    with open(path) as f:
+        bodies = [json.loads(line).get('Body') for line in f if line.strip()]
+    failed = 0
+    for i in range(0, len(bodies), BATCH_SIZE):
+        failed += send_batch(sqs, queue_url, bodies[i:i + BATCH_SIZE])
+    return len(bodies) - failed, failed
+
+def replay_queue(queue_url, config, source_url, count):
+    # moves up to count messages from the source queue, name or URL, deleting only the ones sent, returns the numbers
+    # of sent and failed messages
+    sqs = utils.get_client('sqs', region_name=config.region,
+                           aws_access_key_id=config.aws_access_key_id,
+                           aws_secret_access_key=config.aws_secret_access_key)
+    if not source_url.startswith('https://'):
+        source_url = sqs.get_queue_url(QueueName=source_url).get('QueueUrl')
+    # the resent messages are visible again at once, replaying the queue into itself would never end
+    if source_url.rstrip('/').split('/')[-2:] == queue_url.rstrip('/').split('/')[-2:]:
+        logger.error('The source queue is the queue of the cluster')
+        sys.exit(1)
+    sent = failed = 0
+    while count is None or sent < count:
+        size = BATCH_SIZE if count is None else min(BATCH_SIZE, count - sent)
+        batch = sqs.receive_message(QueueUrl=source_url, MaxNumberOfMessages=size, VisibilityTimeout=60,
+                                    WaitTimeSeconds=1).get('Messages', [])
+        if len(batch) == 0:
+            break
+        entries = [{'Id': str(i), 'MessageBody': m.get('Body')} for i, m in enumerate(batch)]
+        response = sqs.send_message_batch(QueueUrl=queue_url, Entries=entries)
+        done = [batch[int(entry.get('Id'))] for entry in response.get('Successful', [])]
+        if len(done) > 0:
+            entries = [{'Id': str(i), 'ReceiptHandle': m.get('ReceiptHandle')} for i, m in enumerate(done)]
+            sqs.delete_message_batch(QueueUrl=source_url, Entries=entries)
+        sent += len(done)
+        # the failed messages come back to the source queue after the visibility timeout, stop rather than retry them
+        failed = len(batch) - len(done)
+        if failed > 0:
+            break
+    return sent, failed
+
+def queue(args):
+    stack_name = ('cfncluster-' + args.cluster_name)
+    config = cfnconfig.CfnClusterConfig(args)
+
+    try:
+        queue_url = get_queue_url(stack_name, config)
+        if args.action == 'stats':
+            stats = get_stats(queue_url, config)
+            if args.json:
+                print(json.dumps(stats, indent=2, sort_keys=True))
+            else:
+                print('Queue:               %s' % stats['queue'])
+                print('Messages visible:    %d' % stats['visible'])
+                print('Messages in flight:  %d' % stats['in_flight'])
+                print('Messages delayed:    %d' % stats['delayed'])
+                print('Oldest message age:  %s' % ('-' if stats['oldest_age'] is None else '%ds' % stats['oldest_age']))
+        elif args.action == 'peek':
+            out = open(args.output, 'w') if args.output else sys.stdout
+            try:
+                for message in peek(queue_url, config, BATCH_SIZE if args.count is None else args.count,
+                                    args.wait_time):
+                    out.write(json.dumps(describe_message(message), sort_keys=True) + '\n')
+            finally:
+                if out is not sys.stdout:
+                    out.close()
+        elif args.action == 'replay':
+            if (args.file is None) == (args.source_queue is None):
+                logger.error('replay needs either --file or --source-queue')
+                sys.exit(1)
+            if args.file is not None:
+                sent, failed = replay_file(queue_url, config, args.file)
+            else:
+                sent, failed = replay_queue(queue_url, config, args.source_queue, args.count)
+            logger.info('%d message(s) replayed, %d failed' % (sent, failed))
+            if failed > 0:
+                sys.exit(1)
+    except ClientError as e:
+        logger.critical(e.response.get('Error').get('Message'))
+        sys.stdout.flush()
+        sys.exit(1)
@@ -0,0 +1,136 @@
+from __future__ import absolute_import
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Lightweight tracing of the cfncluster operations, exported in the Chrome trace event format
+# (chrome://tracing, Perfetto, speedscope). Spans nest by time on each thread.
+#
+# Tracing is disabled unless enable() is called, e.g. by "cfncluster <command> --trace <file>" or by setting the
+# CFNCLUSTER_TRACE environment variable to a file path. When disabled, span() returns a shared no-op object and
+# traced() calls the function directly.
+
+import functools
+import json
+import os
+import threading
+import time
+
+from . import utils
+
+ENV_VAR = 'CFNCLUSTER_TRACE'
+
+_enabled = False
+_path = None
+_lock = threading.Lock()
+_events = []
+_origin = time.time()
+
+
+class _NoopSpan(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def set(self, key, value):
+        pass
+
+_noop = _NoopSpan()
+
+
+class _Span(object):
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self):
+        self.start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.attributes['error'] = exc_type.__name__
+        _record(self.name, self.start, time.time(), self.attributes)
+        return False
+
+    def set(self, key, value):
+        self.attributes[key] = value
+
+
+def _record(name, start, end, attributes):
+    event = {'name': name, 'cat': 'cfncluster', 'ph': 'X', 'pid': os.getpid(),
+             'tid': threading.current_thread().ident,
+             'ts': int((start - _origin) * 1000000), 'dur': int((end - start) * 1000000)}
+    if attributes:
+        event['args'] = dict((k, str(v)) for k, v in attributes.items())
+    with _lock:
+        _events.append(event)
+
+
+def span(name, **attributes):
+    # returns a context manager timing the enclosed block
+    if not _enabled:
+        return _noop
+    return _Span(name, attributes)
+
+
+def traced(name):
+    # decorator timing every call of the function in a span
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _before_call(model=None, context=None, **kwargs):
+    if context is not None:
+        context['tracing_start'] = time.time()
+
+
+def _after_call(model=None, context=None, http_response=None, **kwargs):
+    started = (context or {}).get('tracing_start')
+    if started is not None:
+        attributes = {}
+        if http_response is not None:
+            attributes['status_code'] = http_response.status_code
+        _record('%s.%s' % (model.service_model.service_name, model.name), started, time.time(), attributes)
+
+
+def enabled():
+    return _enabled
+
+
+def enable(path):
+    # starts recording spans and the AWS API calls, write() saves them to path
+    global _enabled, _path
+    with _lock:
+        if _enabled:
+            return
+        _enabled = True
+        _path = path
+    utils.register_handler('before-call', _before_call)
+    utils.register_handler('after-call', _after_call)
+
+
+def write():
+    if not _enabled:
+        return
+    with _lock:
+        events = list(_events)
+    with open(_path, 'w') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
@@ -0,0 +1,53 @@
+from __future__ import absolute_import
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import boto3
+
+# boto3 clients are thread safe, sessions are not: clients are created under a lock from a single session
+# and shared by all the callers using the same service, region and credentials.
+_session = None
+_clients = {}
+_clients_lock = threading.Lock()
+
+# botocore event handlers registered on all the clients, see register_handler
+_handlers = []
+
+def get_client(service_name, **kwargs):
+    # same arguments as boto3.client, returns a cached client
+    key = (service_name,) + tuple(sorted(kwargs.items()))
+    global _session
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            if _session is None:
+                _session = boto3.session.Session()
+            client = _session.client(service_name, **kwargs)
+            for event_name, handler in _handlers:
+                client.meta.events.register(event_name, handler)
+            _clients[key] = client
+
+    return client
+
+def clear_clients():
+    # drops the cached clients, e.g. after the credentials have changed
+    global _session
+    with _clients_lock:
+        _clients.clear()
+        _session = None
+
+def register_handler(event_name, handler):
+    # registers a botocore event handler, e.g. on 'before-call', on the cached clients and on the ones created later
+    with _clients_lock:
+        _handlers.append((event_name, handler))
+        for client in _clients.values():
+            client.meta.events.register(event_name, handler)
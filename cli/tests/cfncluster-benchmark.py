@@ -0,0 +1,197 @@
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Benchmark config parsing, parameter assembly and the wall time and API calls of the cfncluster commands against moto.
+#
+# Results are written as JSON with --output. With --baseline, the results are compared to a previous output and the
+# script exits with an error if a benchmark makes more API calls or is slower than the baseline beyond --tolerance.
+#
+# usage: python cli/tests/cfncluster-benchmark.py [--sections 200] [--repeat 5] [--output <file>] [--baseline <file>]
+
+from cfncluster import cfncluster
+from cfncluster import cfnconfig
+
+from moto import mock_ec2, mock_cloudformation, mock_s3, mock_autoscaling
+
+import argparse
+import logging
+import pkg_resources
+import platform
+import runpy
+import shutil
+import sys
+import tempfile
+import time
+import os
+import json
+
+# the simulator provides the moto fleet setup and the API call accounting
+simulator = runpy.run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cfncluster-simulator.py'))
+
+# Absolute slowdown in seconds below which a benchmark is never reported as a regression
+min_delta = 0.005
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def write_large_config(path, sections):
+    # writes a config with the given number of [cluster *], [vpc *] and [ebs *] sections
+    with open(path, 'w') as f:
+        f.write('[aws]\naws_region_name = us-east-1\n')
+        f.write('[global]\ncluster_template = c%s\nupdate_check = false\nsanity_check = false\n' % (sections - 1))
+        for i in range(sections):
+            f.write('[cluster c%s]\nkey_name = key%s\nvpc_settings = v%s\nebs_settings = e%s\n'
+                    'initial_queue_size = %s\nmax_queue_size = %s\n' % (i, i, i, i, i % 10, 10 + i % 10))
+            f.write('[vpc v%s]\nvpc_id = vpc-%08x\nmaster_subnet_id = subnet-%08x\n' % (i, i, i))
+            f.write('[ebs e%s]\nvolume_size = %s\nvolume_type = gp2\n' % (i, 20 + i))
+
+
+def time_config(config_file, extra_parameters, repeat, cold=True):
+    # returns the median time of building a CfnClusterConfig for create, reading the config file each time if cold,
+    # from the config files already read by cfnconfig.read_config otherwise
+    args = argparse.Namespace(func=cfncluster.create, config_file=config_file, cluster_name='bench', region=None,
+                              template_url=None, cluster_template=None, extra_parameters=extra_parameters,
+                              tags=None, norollback=False, nowait=True)
+    cfnconfig.clear_configs()
+    if not cold:
+        cfnconfig.read_config(config_file)
+    timings = []
+    for i in range(repeat):
+        if cold:
+            cfnconfig.clear_configs()
+        start = time.time()
+        cfnconfig.CfnClusterConfig(args)
+        timings.append(time.time() - start)
+    return {'seconds': round(median(timings), 6), 'api_calls': 0, 'calls': {}}
+
+
+def config_benchmarks(options, work_dir):
+    config_file = os.path.join(work_dir, 'large-config')
+    write_large_config(config_file, options.sections)
+    extra_parameters = dict(('Extra%s' % i, str(i)) for i in range(options.sections))
+    extra_parameters.update({'MaxQueueSize': '50', 'InitialQueueSize': '5'})
+    return {
+        'config_parse': time_config(config_file, None, options.repeat),
+        'config_parse_warm': time_config(config_file, None, options.repeat, cold=False),
+        'parameter_assembly': time_config(config_file, extra_parameters, options.repeat),
+        'parameter_assembly_warm': time_config(config_file, extra_parameters, options.repeat, cold=False),
+    }
+
+
+def command_benchmarks(options, work_dir):
+    # runs the commands options.repeat times on a fresh cluster, keeps the median time and the last API counts
+    sim = simulator['Simulator'](0.0, 0.0, 0.0, 0)
+    config_file = simulator['setup_fleet'](argparse.Namespace(stacks=0, instances=2, in_progress=0.0), sim, work_dir)
+    sim.install()
+
+    def ssh_dryrun(args):
+        cfncluster.command(args, [])
+
+    commands = [('create', cfncluster.create, cfncluster.create, True),
+                ('update', cfncluster.update, cfncluster.update, True),
+                ('status', cfncluster.status, cfncluster.status, False),
+                ('instances', cfncluster.instances, cfncluster.instances, False),
+                ('ssh_dryrun', cfncluster.command, ssh_dryrun, False),
+                ('delete', cfncluster.delete, cfncluster.delete, True)]
+    runs = dict((command[0], []) for command in commands)
+    for i in range(options.repeat):
+        for name, func, call, nowait in commands:
+            args = simulator['command_args'](func, config_file, 'bench-%s' % i, nowait)
+            args.command = 'ssh'
+            args.dryrun = True
+            runs[name].append(simulator['run_command'](sim, name, call, args, options.verbose))
+
+    results = {}
+    for name in runs:
+        failed = [run for run in runs[name] if run['status'] not in [0, None]]
+        if len(failed) > 0:
+            print('%s exited with status %s' % (name, failed[0]['status']))
+            sys.exit(1)
+        results['command_%s' % name] = {'seconds': median([run['seconds'] for run in runs[name]]),
+                                        'api_calls': runs[name][-1]['api_calls'],
+                                        'calls': runs[name][-1]['calls']}
+    return results
+
+
+def compare(results, baseline, tolerance):
+    # returns the list of regressions against the baseline
+    regressions = []
+    for name in sorted(results):
+        if name not in baseline:
+            continue
+        current = results[name]
+        previous = baseline[name]
+        if current['api_calls'] > previous['api_calls']:
+            regressions.append('%s: %s API calls instead of %s' % (name, current['api_calls'], previous['api_calls']))
+        if current['seconds'] > previous['seconds'] * (1 + tolerance) \
+                and current['seconds'] - previous['seconds'] > min_delta:
+            regressions.append('%s: %.3fs instead of %.3fs' % (name, current['seconds'], previous['seconds']))
+    return regressions
+
+
+def print_results(results, baseline):
+    print('%-24s %12s %12s %10s %10s' % ('benchmark', 'seconds', 'baseline', 'api_calls', 'baseline'))
+    for name in sorted(results):
+        previous = baseline.get(name, {})
+        print('%-24s %12.6f %12s %10d %10s' % (name, results[name]['seconds'], previous.get('seconds', '-'),
+                                               results[name]['api_calls'], previous.get('api_calls', '-')))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the cfncluster CLI against moto')
+    parser.add_argument('--sections', type=int, default=200,
+                        help='number of [cluster], [vpc] and [ebs] sections of the large config')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs of each benchmark')
+    parser.add_argument('--output', type=str, help='write the results to this JSON file')
+    parser.add_argument('--baseline', type=str, help='compare the results to this JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed relative slowdown against the baseline')
+    parser.add_argument('--verbose', action='store_true', default=False, help='show the output of the commands')
+    options = parser.parse_args()
+
+    logger = logging.getLogger('cfncluster.cfncluster')
+    logger.addHandler(logging.StreamHandler(sys.stdout) if options.verbose else logging.NullHandler())
+    logger.setLevel(logging.INFO)
+
+    work_dir = tempfile.mkdtemp()
+    mocks = [mock_ec2(), mock_cloudformation(), mock_s3(), mock_autoscaling()]
+    for mock in mocks:
+        mock.start()
+    try:
+        results = config_benchmarks(options, work_dir)
+        results.update(command_benchmarks(options, work_dir))
+    finally:
+        for mock in mocks:
+            mock.stop()
+        shutil.rmtree(work_dir)
+
+    baseline = {}
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f).get('benchmarks')
+
+    print_results(results, baseline)
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump({'version': pkg_resources.get_distribution('cfncluster').version,
+                       'python': platform.python_version(),
+                       'sections': options.sections,
+                       'benchmarks': results}, f, indent=2, sort_keys=True)
+
+    regressions = compare(results, baseline, options.tolerance)
+    for regression in regressions:
+        print('REGRESSION %s' % regression)
+    if len(regressions) > 0:
+        sys.exit(1)
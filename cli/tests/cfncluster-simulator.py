@@ -0,0 +1,269 @@
+# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#
+# Simulate large cfncluster deployments with moto and measure how the cfncluster commands scale.
+#
+# A synthetic fleet of cfncluster-* stacks, each with a MasterServer and a ComputeFleet ASG, is created in moto.
+# The cfncluster commands then run through their real code paths, while botocore event handlers registered on the
+# clients of the cfncluster package inject latency, throttling errors and CREATE_IN_PROGRESS stack states.
+#
+# usage: python cli/tests/cfncluster-simulator.py [--stacks 1000] [--instances 10] [--latency 0.05]
+#                                                 [--throttle-rate 0.01] [--create-duration 30] [--in-progress 0.1]
+
+from cfncluster import cfncluster
+from cfncluster import utils
+
+from moto import mock_ec2, mock_cloudformation, mock_s3, mock_autoscaling
+from botocore.awsrequest import AWSResponse
+
+import argparse
+import logging
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import os
+import json
+import boto3
+
+region = 'us-east-1'
+stack_prefix = 'cfncluster-sim-'
+
+
+class Simulator(object):
+    # botocore event handlers faking the behaviour of a loaded AWS account on top of moto
+    def __init__(self, latency, throttle_rate, create_duration, seed):
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.create_duration = create_duration
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        # stack name -> simulated creation time
+        self.created = {}
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.calls = {}
+            self.throttled = 0
+
+    def install(self):
+        utils.register_handler('before-call', self.before_call)
+        utils.register_handler('after-call', self.after_call)
+
+    def before_call(self, model=None, params=None, **kwargs):
+        operation = '%s.%s' % (model.service_model.service_name, model.name)
+        with self.lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+            throttle = self.random.random() < self.throttle_rate
+            if throttle:
+                self.throttled += 1
+            if model.name == 'CreateStack':
+                self.created[params.get('body', {}).get('StackName')] = time.time()
+
+        if self.latency > 0:
+            time.sleep(self.latency)
+        if throttle:
+            # short-circuits the call, as if botocore had exhausted its retries
+            return AWSResponse(None, 400, {}, None), \
+                {'Error': {'Code': 'Throttling', 'Message': 'Rate exceeded'},
+                 'ResponseMetadata': {'HTTPStatusCode': 400}}
+
+    def after_call(self, model=None, parsed=None, **kwargs):
+        # moto completes stacks immediately, keep them in CREATE_IN_PROGRESS for create_duration seconds
+        if model.name != 'DescribeStacks' or parsed is None:
+            return
+        now = time.time()
+        for stack in parsed.get('Stacks', []):
+            started = self.created.get(stack.get('StackName'))
+            if started is not None and now - started < self.create_duration \
+                    and stack.get('StackStatus') == 'CREATE_COMPLETE':
+                stack['StackStatus'] = 'CREATE_IN_PROGRESS'
+
+    def api_calls(self):
+        with self.lock:
+            return sum(self.calls.values())
+
+
+def build_template():
+    # real Parameters and Mappings, with just the resources the cfncluster commands look up
+    with open('cloudformation/cfncluster.cfn.json') as f:
+        template = json.load(f)
+    template.pop('Conditions', None)
+    template['Resources'] = {
+        'MasterServer': {'Type': 'AWS::EC2::Instance',
+                         'Properties': {'ImageId': 'ami-12c6146b', 'InstanceType': 't2.micro',
+                                        'NetworkInterfaces': [{'DeviceIndex': '0', 'AssociatePublicIpAddress': True,
+                                                               'SubnetId': {'Ref': 'MasterSubnetId'}}]}},
+        'ComputeServerLaunchConfig': {'Type': 'AWS::AutoScaling::LaunchConfiguration',
+                                      'Properties': {'ImageId': 'ami-12c6146b', 'InstanceType': 't2.micro'}},
+        'ComputeFleet': {'Type': 'AWS::AutoScaling::AutoScalingGroup',
+                         'Properties': {'MinSize': '0', 'MaxSize': {'Ref': 'MaxQueueSize'},
+                                        'DesiredCapacity': {'Ref': 'InitialQueueSize'},
+                                        'LaunchConfigurationName': {'Ref': 'ComputeServerLaunchConfig'},
+                                        'VPCZoneIdentifier': [{'Ref': 'MasterSubnetId'}],
+                                        # moto does not add the CloudFormation tags to the ASG
+                                        'Tags': [{'Key': 'aws:cloudformation:logical-id', 'Value': 'ComputeFleet',
+                                                  'PropagateAtLaunch': False}]}},
+    }
+    template['Outputs'] = {
+        'ClusterUser': {'Value': 'ec2-user'},
+        'MasterPrivateIP': {'Value': {'Fn::GetAtt': ['MasterServer', 'PrivateIp']}},
+        'MasterPublicIP': {'Value': '203.0.113.10'},
+    }
+    return json.dumps(template)
+
+
+def setup_fleet(args, simulator, work_dir):
+    # creates the template, the config file and the synthetic fleet, returns the config file path
+    template = build_template()
+    s3 = boto3.client('s3', region_name=region)
+    s3.create_bucket(Bucket='%s-cfncluster' % region)
+    s3.put_object(Bucket='%s-cfncluster' % region, Key='cfncluster', Body=template)
+    template_url = 'https://s3.amazonaws.com/%s-cfncluster/cfncluster' % region
+
+    ec2 = boto3.client('ec2', region_name=region)
+    vpc = ec2.create_vpc(CidrBlock='10.0.0.0/16').get('Vpc')
+    subnet = ec2.create_subnet(VpcId=vpc.get('VpcId'), CidrBlock='10.0.0.0/16',
+                               AvailabilityZone='%sa' % region).get('Subnet')
+
+    config_file = os.path.join(work_dir, 'config')
+    with open(config_file, 'w') as f:
+        f.write('[aws]\naws_region_name = %s\n' % region)
+        f.write('[cluster default]\nvpc_settings = public\nkey_name = simulator\ntemplate_url = %s\n' % template_url)
+        f.write('initial_queue_size = %s\nmax_queue_size = %s\n' % (args.instances, args.instances))
+        f.write('[vpc public]\nvpc_id = %s\nmaster_subnet_id = %s\n' % (vpc.get('VpcId'), subnet.get('SubnetId')))
+        f.write('[global]\ncluster_template = default\nupdate_check = false\nsanity_check = false\n')
+
+    parameters = {'KeyName': 'simulator', 'VPCId': vpc.get('VpcId'), 'MasterSubnetId': subnet.get('SubnetId'),
+                  'AvailabilityZone': subnet.get('AvailabilityZone'), 'CLITemplate': 'default',
+                  'InitialQueueSize': str(args.instances), 'MaxQueueSize': str(args.instances)}
+    cfn = boto3.client('cloudformation', region_name=region)
+    start = time.time()
+    for i in range(args.stacks):
+        stack_name = '%s%05d' % (stack_prefix, i)
+        cfn.create_stack(StackName=stack_name, TemplateBody=template,
+                         Parameters=[{'ParameterKey': k, 'ParameterValue': v} for k, v in parameters.items()])
+        if simulator.random.random() < args.in_progress:
+            simulator.created[stack_name] = time.time()
+        if (i + 1) % 100 == 0:
+            sys.stderr.write('\rCreated %s/%s stacks' % (i + 1, args.stacks))
+    sys.stderr.write('\rCreated %s stacks with %s instances each in %.1f seconds\n'
+                     % (args.stacks, args.instances, time.time() - start))
+
+    return config_file
+
+
+def command_args(func, config_file, cluster_name, nowait):
+    return argparse.Namespace(func=func, config_file=config_file, cluster_name=cluster_name, region=region,
+                              nowait=nowait, norollback=False, template_url=None, extra_parameters=None,
+                              tags=None, cluster_template=None, reset_desired=False)
+
+
+def run_command(simulator, name, func, args, verbose):
+    # runs a cfncluster command, returns (wall time, api calls, throttled calls, exit status)
+    simulator.reset()
+    stdout = sys.stdout
+    if not verbose:
+        sys.stdout = open(os.devnull, 'w')
+    status = 0
+    start = time.time()
+    try:
+        func(args)
+    except SystemExit as e:
+        status = e.code or 0
+    finally:
+        elapsed = time.time() - start
+        if not verbose:
+            sys.stdout.close()
+            sys.stdout = stdout
+    return {'command': name, 'cluster': args.cluster_name, 'seconds': round(elapsed, 3),
+            'api_calls': simulator.api_calls(), 'throttled': simulator.throttled, 'status': status,
+            'calls': dict(simulator.calls)}
+
+
+def simulate(args):
+    simulator = Simulator(args.latency, args.throttle_rate, args.create_duration, args.seed)
+    work_dir = tempfile.mkdtemp()
+    try:
+        config_file = setup_fleet(args, simulator, work_dir)
+        simulator.install()
+
+        sample = ['sim-%05d' % i for i in simulator.random.sample(range(args.stacks), min(args.sample, args.stacks))]
+        results = []
+        for command in args.commands.split(','):
+            if command == 'list':
+                results.append(run_command(simulator, command, cfncluster.list,
+                                           command_args(cfncluster.list, config_file, None, True), args.verbose))
+            elif command in ['instances', 'status']:
+                func = getattr(cfncluster, command)
+                for cluster_name in sample:
+                    results.append(run_command(simulator, command, func,
+                                               command_args(func, config_file, cluster_name, False), args.verbose))
+            elif command in ['create', 'delete']:
+                func = getattr(cfncluster, command)
+                results.append(run_command(simulator, command, func,
+                                           command_args(func, config_file, 'sim-new', command == 'delete'),
+                                           args.verbose))
+            else:
+                print('Unknown command %s' % command)
+                sys.exit(1)
+    finally:
+        shutil.rmtree(work_dir)
+
+    return results
+
+
+def print_results(results):
+    print('%-10s %-10s %10s %10s %10s %6s' % ('command', 'cluster', 'seconds', 'api_calls', 'throttled', 'exit'))
+    for result in results:
+        print('%-10s %-10s %10.3f %10d %10d %6s' % (result['command'], result['cluster'], result['seconds'],
+                                                    result['api_calls'], result['throttled'], result['status']))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Simulate large cfncluster deployments with moto')
+    parser.add_argument('--stacks', type=int, default=1000, help='number of synthetic cfncluster stacks')
+    parser.add_argument('--instances', type=int, default=10, help='number of ComputeFleet instances per stack')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every API call')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='fraction of API calls failing with Throttling')
+    parser.add_argument('--create-duration', type=float, default=0.0,
+                        help='seconds a new stack stays in CREATE_IN_PROGRESS')
+    parser.add_argument('--in-progress', type=float, default=0.0,
+                        help='fraction of the synthetic stacks starting in CREATE_IN_PROGRESS')
+    parser.add_argument('--sample', type=int, default=10, help='number of clusters for the per-cluster commands')
+    parser.add_argument('--commands', type=str, default='list,instances,status,create,delete',
+                        help='comma separated list of commands to run')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random choices')
+    parser.add_argument('--json', type=str, dest='json_file', help='write the results to this JSON file')
+    parser.add_argument('--verbose', action='store_true', default=False, help='show the output of the commands')
+    args = parser.parse_args()
+
+    logger = logging.getLogger('cfncluster.cfncluster')
+    logger.addHandler(logging.StreamHandler(sys.stdout) if args.verbose else logging.NullHandler())
+    logger.setLevel(logging.INFO)
+
+    mocks = [mock_ec2(), mock_cloudformation(), mock_s3(), mock_autoscaling()]
+    for mock in mocks:
+        mock.start()
+    try:
+        results = simulate(args)
+    finally:
+        for mock in mocks:
+            mock.stop()
+
+    print_results(results)
+    if args.json_file:
+        with open(args.json_file, 'w') as f:
+            json.dump({'options': vars(args), 'results': results}, f, indent=2, sort_keys=True)
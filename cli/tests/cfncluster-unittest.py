@@ -10,12 +10,33 @@
 # limitations under the License.
 
 from cfncluster import cfncluster
+from cfncluster import cfnconfig
+from cfncluster import ami_index
+from cfncluster import instance_index
+from cfncluster import utils
+from cfncluster import apistats
+from cfncluster import tracing
+from cfncluster import remote
+from cfncluster import scaling_report
+from cfncluster import prewarm
+from cfncluster import db
+from cfncluster import sqs
+from cfncluster import logs
+from cfncluster import spot_advisor
+from cfncluster import pool
 
 try:
     from StringIO import StringIO
 except ImportError:
     from io import StringIO
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from botocore.exceptions import ClientError
+
 from moto import mock_ec2, mock_cloudformation, mock_s3, mock_autoscaling
 
 import logging
@@ -26,6 +47,9 @@ import configparser
 import os
 import stat
 import json
+import tempfile
+import datetime
+import calendar
 
 test_log_stream = StringIO()
 config_file = 'cli/tests/config'
@@ -98,6 +122,15 @@ class UpdateClusterArgs(CreateClusterArgs):
         self.reset_desired = reset_desired
 
 
+class PoolArgs(CreateClusterArgs):
+    def __init__(self, template_url):
+        CreateClusterArgs.__init__(self, template_url=template_url, nowait=True)
+        self.cluster_template = None
+        self.extra_parameters = None
+        self.tags = None
+        self.size = 2
+
+
 class CFN_cluster_test(unittest.TestCase):
     def setUp(self):
         config_logger_test()
@@ -109,6 +142,222 @@ class CFN_cluster_test(unittest.TestCase):
         version_returned = re.match(r"^INFO:\w+\.\w+:(\d+\.\d+\.\d+.*)$", log).group(1)
         self.assertEqual(version_returned, version_on_file)
 
+    def test_ami_index(self):
+        mappings = cfncluster_json_data["Mappings"]
+        self.assertEqual(ami_index.AMIS, mappings["AWSRegionOS2AMI"])
+        self.assertEqual(ami_index.OS_FEATURES, mappings["OSFeatures"])
+        self.assertEqual(ami_index.REGION_CAPABILITIES, mappings["AWSRegion2Capabilites"])
+        self.assertEqual(ami_index.get_user('centos7'), 'centos')
+        self.assertEqual(ami_index.get_ami('us-gov-west-1', 'centos7'), None)
+
+    def test_instance_index(self):
+        condition = json.dumps(cfncluster_json_data["Conditions"]["IsMasterInstanceEbsOpt"])
+        for instance_type in instance_index.TEMPLATE_NOT_EBS_OPTIMIZED:
+            self.assertIn('"%s"' % instance_type, condition)
+        self.assertEqual(len(instance_index.TEMPLATE_NOT_EBS_OPTIMIZED), condition.count('"Fn::Equals"'))
+        c5d = instance_index.get_instance_type('c5d.large')
+        self.assertEqual((c5d['vcpus'], c5d['instance_storage'], c5d['placement_group']), (2, 1, True))
+        self.assertFalse(instance_index.get_instance_type('t2.micro')['placement_group'])
+        self.assertIsNone(instance_index.get_instance_type('a1.large'))
+        # PV only, not indexed
+        self.assertIsNone(instance_index.get_instance_type('t1.micro'))
+        self.assertTrue(instance_index.is_offered('c5.large', 'us-east-1'))
+        self.assertIsNone(instance_index.is_offered('c5.large', 'us-gov-west-1'))
+        for region, offerings in instance_index.REGION_OFFERINGS.items():
+            self.assertIn(region, ami_index.REGION_CAPABILITIES)
+            self.assertTrue(offerings <= set(instance_index.INSTANCE_TYPES))
+
+    def test_get_client(self):
+        ec2 = utils.get_client('ec2', region_name='us-east-1')
+        self.assertIs(utils.get_client('ec2', region_name='us-east-1'), ec2)
+        self.assertIsNot(utils.get_client('ec2', region_name='us-west-2'), ec2)
+        utils.clear_clients()
+        self.assertIsNot(utils.get_client('ec2', region_name='us-east-1'), ec2)
+
+    @mock_ec2
+    def test_api_stats(self):
+        apistats.install()
+        apistats.reset()
+        ec2 = utils.get_client('ec2', region_name='us-east-1')
+        ec2.describe_vpcs()
+        ec2.describe_vpcs()
+        stats = apistats.summary()
+        self.assertEqual(stats['ec2.DescribeVpcs']['calls'], 2)
+        self.assertEqual(stats['ec2.DescribeVpcs']['throttles'], 0)
+        self.assertEqual(apistats.percentile([4, 1, 3, 2], 50), 2)
+        self.assertEqual(apistats.percentile([4, 1, 3, 2], 99), 4)
+
+    def test_ssh_control_options(self):
+        control_path = cfncluster.get_ssh_control_path('test', 'us-east-1')
+        self.assertEqual(cfncluster.get_ssh_control_path('test', 'us-east-1'), control_path)
+        self.assertNotEqual(cfncluster.get_ssh_control_path('test', 'us-west-2'), control_path)
+        self.assertTrue(os.path.isdir(os.path.dirname(control_path)))
+        options = cfncluster.get_ssh_control_options(control_path, 60)
+        self.assertEqual(options, ['-o', 'ControlMaster=auto', '-o', 'ControlPath=%s' % control_path,
+                                   '-o', 'ControlPersist=60'])
+
+    def test_exec_ssh_command(self):
+        ssh_command = remote.get_ssh_command('centos', '1.2.3.4', '10.0.0.5', '/tmp/control', ['-i', 'key.pem'],
+                                             'df -h')
+        self.assertEqual(ssh_command[-2:], ['centos@10.0.0.5', 'df -h'])
+        self.assertTrue('-i' in ssh_command)
+        proxy = [option for option in ssh_command if option.startswith('ProxyCommand=')][0]
+        self.assertTrue(proxy.endswith('-W %h:%p centos@1.2.3.4'))
+        self.assertTrue('ControlPath=/tmp/control' in proxy)
+
+    def test_scaling_report(self):
+        def at(minute):
+            return datetime.datetime(2018, 6, 1, 10, minute, 0)
+        cause = 'At 2018-06-01T10:00:00Z a user request explicitly set group desired capacity changing the desired ' \
+                'capacity from 0 to 2.'
+        activities = [
+            {'Description': 'Launching a new EC2 instance: i-0a', 'Cause': cause, 'StatusCode': 'Successful',
+             'StartTime': at(1), 'EndTime': at(3)},
+            {'Description': 'Launching a new EC2 instance: i-0b', 'Cause': cause, 'StatusCode': 'Successful',
+             'StartTime': at(1), 'EndTime': at(5)},
+            {'Description': 'Launching a new EC2 instance.  Status Reason: InsufficientInstanceCapacity',
+             'Cause': cause, 'StatusCode': 'Failed', 'StartTime': at(1), 'EndTime': at(1)},
+            {'Description': 'Terminating EC2 instance: i-0a', 'StatusCode': 'Successful',
+             'Cause': 'At 2018-06-01T10:20:00Z instance i-0a was taken out of service in response to a user '
+                      'request, shrinking the capacity from 2 to 1.', 'StartTime': at(20), 'EndTime': at(21)},
+        ]
+        nodes = {}
+        failed = len([a for a in activities if not scaling_report.add_activity(nodes, a)])
+        nodes = list(nodes.values())
+        scaling_report.compute_latencies(nodes, calendar.timegm(at(30).utctimetuple()))
+        summary = scaling_report.get_summary(nodes, failed, 10)
+        self.assertEqual(summary['launches'], 2)
+        self.assertEqual(summary['failed_launches'], 1)
+        self.assertEqual(summary['terminate_reasons'], {'idle': 1})
+        self.assertEqual(summary['scale_up_latency_max'], 300)
+        self.assertEqual(summary['node_hours'], round((17 + 25) / 60.0, 2))
+        self.assertEqual(summary['idle_node_hours'], round(10 / 60.0, 2))
+        self.assertEqual(scaling_report.get_histogram([180, 300], 120), [[0, 120, 0], [120, 240, 1], [240, 360, 1]])
+        self.assertEqual([count for t, count in scaling_report.get_capacity_series(nodes)], [1, 2, 1])
+
+    def test_prewarm_schedule_from_history(self):
+        def at(day, hour, minute):
+            return calendar.timegm(datetime.datetime(2018, 6, day, hour, minute).utctimetuple())
+        nodes = []
+        # Monday to Wednesday, first launch around 8:05, last termination around 18:00
+        for day, first, last in [(4, at(4, 8, 0), at(4, 18, 0)), (5, at(5, 8, 10), at(5, 18, 30)),
+                                 (6, at(6, 8, 5), at(6, 17, 30))]:
+            nodes.append({'requested': first, 'in_service': first + 300, 'terminating': last})
+            nodes.append({'requested': first + 600, 'in_service': first + 900, 'terminating': last - 3600})
+        schedule = prewarm.get_schedule_from_history(nodes, 15, 10)
+        self.assertEqual(schedule, {'start': '50 7 * * 1,2,3', 'end': '0 18 * * 1,2,3', 'size': 2})
+        self.assertEqual(prewarm.get_schedule_from_history(nodes, 15, 1)['size'], 1)
+        self.assertEqual(prewarm.get_schedule_from_history(nodes[:4], 15, 10), None)
+        # a lead time past midnight starts the pre-warming the day before
+        schedule = prewarm.get_schedule_from_history(nodes, 8 * 60 + 35, 10)
+        self.assertEqual(schedule['start'], '30 23 * * 0,1,2')
+        self.assertEqual(schedule['end'], '0 18 * * 1,2,3')
+
+    def test_db_to_json(self):
+        item = {'instanceId': {'S': 'i-0a'}, 'slots': {'N': '4'}, 'load': {'N': '0.5'}, 'queues': {'SS': ['b', 'a']},
+                'key': {'B': b'\x00\x01'}, 'ready': {'BOOL': True}, 'meta': {'M': {'az': {'S': 'us-east-1a'}}}}
+        self.assertEqual(json.loads(db.to_json(item)),
+                         {'instanceId': 'i-0a', 'slots': 4, 'load': 0.5, 'queues': ['a', 'b'], 'key': 'AAE=',
+                          'ready': True, 'meta': {'az': 'us-east-1a'}})
+
+    def test_sqs_describe_message(self):
+        notification = {'Event': 'autoscaling:EC2_INSTANCE_TERMINATE', 'EC2InstanceId': 'i-0a'}
+        body = json.dumps({'Type': 'Notification', 'Message': json.dumps(notification)})
+        message = sqs.describe_message({'MessageId': 'm1', 'Body': body,
+                                        'Attributes': {'SentTimestamp': '1514764800000',
+                                                       'ApproximateReceiveCount': '3'}})
+        self.assertEqual(message['SentTimestamp'], '2018-01-01T00:00:00Z')
+        self.assertEqual(message['ApproximateReceiveCount'], 3)
+        self.assertEqual(message['Event'], 'autoscaling:EC2_INSTANCE_TERMINATE')
+        self.assertEqual(message['EC2InstanceId'], 'i-0a')
+        self.assertEqual(message['Body'], body)
+        self.assertNotIn('Event', sqs.describe_message({'MessageId': 'm2', 'Body': 'not json'}))
+
+    def test_logs_cursor(self):
+        cursor = logs.Cursor(1000)
+        self.assertEqual(cursor.start_time('node'), 1000)
+        self.assertFalse(cursor.has_new_events({'logStreamName': 'node', 'lastIngestionTime': 999}))
+        self.assertTrue(cursor.has_new_events({'logStreamName': 'node', 'lastIngestionTime': 2000}))
+        self.assertFalse(cursor.has_new_events({'logStreamName': 'node', 'lastIngestionTime': 2000}))
+        self.assertTrue(cursor.advance('node', {'timestamp': 1500, 'eventId': 'a'}))
+        self.assertTrue(cursor.advance('node', {'timestamp': 1500, 'eventId': 'b'}))
+        # a follow read starts at the last timestamp, and gets its events again
+        self.assertEqual(cursor.start_time('node'), 1500)
+        self.assertFalse(cursor.advance('node', {'timestamp': 1500, 'eventId': 'a'}))
+        self.assertTrue(cursor.advance('node', {'timestamp': 1600, 'eventId': 'c'}))
+        self.assertFalse(cursor.advance('node', {'timestamp': 1500, 'eventId': 'd'}))
+        self.assertEqual(logs.format_event('node', {'timestamp': 1514764800123, 'message': 'started\n'}),
+                         '2018-01-01T00:00:00.123Z node started')
+
+    def test_spot_advisor_stats(self):
+        # 0.10 in effect before the window, 0.30 for the first quarter, then 0.10
+        history = [[0, 0.1], [1000, 0.3], [1250, 0.1]]
+        stats = spot_advisor.get_stats(history, 1000, 2000)
+        self.assertEqual(stats['current'], 0.1)
+        self.assertEqual(stats['max'], 0.3)
+        self.assertEqual(stats['changes'], 1)
+        self.assertAlmostEqual(stats['mean'], 0.15)
+        self.assertAlmostEqual(stats['stdev'], 0.0866, places=4)
+        self.assertEqual(spot_advisor.get_bid(stats), 0.36)
+        self.assertIsNone(spot_advisor.get_stats([[3000, 0.1]], 1000, 2000))
+
+        subnets = {'us-east-1a': [['subnet-a', 10]], 'us-east-1b': [['subnet-b', 10]], 'us-east-1c': [['subnet-c', 5]]}
+        histories = {'us-east-1a': history, 'us-east-1b': [[0, 0.12]], 'us-east-1c': []}
+        advice = spot_advisor.get_advice(subnets, histories, 1000.0 / 3600, 2000)
+        self.assertEqual([zone['subnet_id'] for zone in advice], ['subnet-b', 'subnet-a', 'subnet-c'])
+        self.assertEqual(advice[0]['bid'], 0.144)
+        self.assertNotIn('bid', advice[2])
+
+    def test_config_inherit(self):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.cfg', delete=False) as f:
+            f.write('[cluster default]\nkey_name = key\nvpc_settings = public\n'
+                    '[cluster big]\ninherit = mid\ncompute_instance_type = c4.8xlarge\n'
+                    '[cluster mid]\ninherit = default\nkey_name = other\n'
+                    '[vpc public]\nvpc_id = vpc-12345678\n[vpc private]\ninherit = public\n')
+        try:
+            config, origins = cfnconfig.read_config(f.name)
+            self.assertEqual(dict(config.items('cluster big')), {'key_name': 'other', 'vpc_settings': 'public',
+                                                                 'compute_instance_type': 'c4.8xlarge'})
+            self.assertEqual(origins['cluster big']['vpc_settings'], 'cluster default')
+            self.assertEqual(config.get('vpc private', 'vpc_id'), 'vpc-12345678')
+            self.assertIn('vpc_settings = public  # from [cluster default]',
+                          cfnconfig.format_section(config, origins, 'cluster big'))
+            self.assertIs(cfnconfig.read_config(f.name)[0], config)
+            cfnconfig.clear_configs()
+            self.assertIsNot(cfnconfig.read_config(f.name)[0], config)
+
+            with open(f.name, 'a') as cf:
+                cf.write('[ebs a]\ninherit = b\n[ebs b]\ninherit = a\n')
+            os.utime(f.name, (0, 0))
+            with self.assertRaises(SystemExit):
+                cfnconfig.read_config(f.name)
+
+            with open(f.name, 'w') as cf:
+                cf.write('[DEFAULT]\ninherit = default\n[cluster default]\nkey_name = key\n')
+            os.utime(f.name, (1, 1))
+            with self.assertRaises(SystemExit):
+                cfnconfig.read_config(f.name)
+        finally:
+            os.remove(f.name)
+
+    @mock_ec2
+    def test_tracing(self):
+        if not tracing.enabled():
+            self.assertIs(tracing.span('disabled'), tracing.span('disabled'))
+        trace_file = os.path.join(tempfile.mkdtemp(), 'trace.json')
+        tracing.enable(trace_file)
+        with tracing.span('outer', cluster='test'):
+            utils.get_client('ec2', region_name='us-east-1').describe_vpcs()
+        tracing.write()
+        with open(trace_file) as f:
+            events = json.load(f)['traceEvents']
+        outer = [e for e in events if e['name'] == 'outer'][0]
+        call = [e for e in events if e['name'] == 'ec2.DescribeVpcs'][-1]
+        self.assertEqual(outer['ph'], 'X')
+        self.assertEqual(outer['args'], {'cluster': 'test'})
+        self.assertTrue(outer['ts'] <= call['ts'])
+        self.assertTrue(call['ts'] + call['dur'] <= outer['ts'] + outer['dur'])
+
     @mock_ec2
     @mock_cloudformation
     @mock_s3
@@ -201,6 +450,61 @@ class CFN_cluster_test(unittest.TestCase):
         error_prefix = "CRITICAL:"
         self.assertFalse(error_prefix in log)
 
+    @mock_ec2
+    @mock_cloudformation
+    @mock_autoscaling
+    @mock_s3
+    def test_cfn_cluster_update_asg_only(self):
+        template_url = setup_configurations()
+        args = UpdateClusterArgs(template_url, True, False)
+        cfncluster.create(args)
+        args.extra_parameters = {'MaxQueueSize': '20'}
+        cfncluster.update(args)
+        log = test_log_stream.getvalue()
+        success_message = 'updating ComputeFleet directly'
+        error_prefix = "CRITICAL:"
+        self.assertTrue(success_message in log)
+        self.assertFalse(error_prefix in log)
+        asg = boto3.client('autoscaling', region_name='us-east-1').describe_auto_scaling_groups()
+        self.assertEqual(asg.get('AutoScalingGroups')[0].get('MaxSize'), 20)
+
+    @mock_ec2
+    @mock_cloudformation
+    @mock_autoscaling
+    @mock_s3
+    def test_cfn_cluster_update_other_parameter(self):
+        template_url = setup_configurations()
+        args = UpdateClusterArgs(template_url, True, False)
+        cfncluster.create(args)
+        args.extra_parameters = {'MaxQueueSize': '20', 'ComputeInstanceType': 'c4.large'}
+        cfncluster.update(args)
+        log = test_log_stream.getvalue()
+        self.assertFalse('updating ComputeFleet directly' in log)
+        self.assertTrue('INFO:cfncluster.cfncluster:Status: UPDATE_COMPLETE' in log)
+        self.assertFalse("CRITICAL:" in log)
+
+    @mock_ec2
+    @mock_cloudformation
+    @mock_autoscaling
+    @mock_s3
+    def test_cfn_cluster_update_template_change(self):
+        template_url = setup_configurations()
+        args = UpdateClusterArgs(template_url, True, False)
+        cfncluster.create(args)
+        s3 = boto3.client('s3')
+        s3.put_object(Bucket='us-east-1-cfncluster', Key='cfncluster-new', Body=json_dump)
+        args.template_url = s3.generate_presigned_url(ClientMethod='get_object',
+                                                      Params={'Bucket': 'us-east-1-cfncluster',
+                                                              'Key': 'cfncluster-new'})
+        args.extra_parameters = {'MaxQueueSize': '20'}
+        cfncluster.update(args)
+        log = test_log_stream.getvalue()
+        self.assertFalse('updating ComputeFleet directly' in log)
+        self.assertFalse("CRITICAL:" in log)
+        stack = boto3.client('cloudformation', region_name='us-east-1')\
+            .describe_stacks(StackName='cfncluster-test_cluster').get('Stacks')[0]
+        self.assertEqual(cfncluster.get_stack_template_url(stack), args.template_url.split('?')[0])
+
     @mock_ec2
     @mock_cloudformation
     @mock_autoscaling
@@ -302,6 +606,70 @@ class CFN_cluster_test(unittest.TestCase):
         error_prefix = "CRITICAL:"
         self.assertTrue(error_prefix in log)
 
+    @mock_ec2
+    @mock_cloudformation
+    @mock_autoscaling
+    @mock_s3
+    def test_cfn_cluster_scale(self):
+        template_url = setup_configurations()
+        args = CreateClusterArgs(template_url, True)
+        cfncluster.create(args)
+        args.capacity = 12
+        args.wait = False
+        cfncluster.scale(args)
+        log = test_log_stream.getvalue()
+        error_prefix = "CRITICAL:"
+        self.assertFalse(error_prefix in log)
+        asg = boto3.client('autoscaling', region_name='us-east-1').describe_auto_scaling_groups()
+        self.assertEqual(asg.get('AutoScalingGroups')[0].get('DesiredCapacity'), 12)
+        self.assertEqual(asg.get('AutoScalingGroups')[0].get('MaxSize'), 12)
+
+    @mock_ec2
+    @mock_cloudformation
+    @mock_s3
+    def test_ssh_target_custom_template(self):
+        template_url = setup_configurations()
+        args = CreateClusterArgs(template_url, True)
+        cfncluster.create(args)
+        config = cfnconfig.CfnClusterConfig(args)
+        # the cluster is not recorded with the default template: the user comes from its own template
+        with mock.patch.object(cfncluster, 'get_master_server_ip', return_value='10.0.0.1'), \
+                mock.patch.object(ami_index, 'get_user', return_value='other'):
+            self.assertEqual(cfncluster.get_ssh_target('cfncluster-test_cluster', config),
+                             (cfncluster_json_data['Mappings']['OSFeatures']['alinux']['User'], '10.0.0.1'))
+
+    @mock_ec2
+    @mock_cloudformation
+    @mock_autoscaling
+    @mock_s3
+    def test_pool(self):
+        template_url = setup_configurations()
+        args = PoolArgs(template_url)
+        pool.fill(args)
+        config = cfnconfig.CfnClusterConfig(args)
+        clusters = pool.get_pool_clusters(config, 'default')
+        self.assertEqual([c[1] for c in clusters], ['available', 'available'])
+        pool.fill(args)
+        self.assertEqual(len(pool.get_pool_clusters(config, 'default')), 2)
+
+        claimed, other = clusters[0][0], clusters[1][0]
+        self.assertTrue(pool.claim_cluster(config, claimed, 'mine'))
+        self.assertFalse(pool.claim_cluster(config, claimed, 'theirs'))
+        # another claim is updating the stack: CloudFormation rejects the second update
+        cfn = utils.get_client('cloudformation', region_name=config.region,
+                               aws_access_key_id=config.aws_access_key_id,
+                               aws_secret_access_key=config.aws_secret_access_key)
+        in_progress = ClientError({'Error': {'Code': 'ValidationError',
+                                             'Message': 'Stack is in UPDATE_IN_PROGRESS state and can not be updated.'}},
+                                  'UpdateStack')
+        with mock.patch.object(cfn, 'update_stack', side_effect=in_progress):
+            self.assertFalse(pool.claim_cluster(config, other, 'mine'))
+        self.assertEqual(sorted(pool.get_pool_clusters(config, 'default')),
+                         sorted([(claimed, 'claimed', 'mine'), (other, 'available', None)]))
+
+        pool.drain(args)
+        self.assertEqual(pool.get_pool_clusters(config, 'default'), [(claimed, 'claimed', 'mine')])
+
     def tearDown(self):
         test_log_stream.truncate(0)
         test_log_stream.seek(0)
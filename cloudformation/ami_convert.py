@@ -5,6 +5,8 @@
 #
 # usage: ami_convert.py <path to amis.txt>
 #
+# util/generate-ami-list.py --incremental updates the template mapping directly.
+#
 
 import sys
 import re
@@ -19,6 +19,28 @@
 # against limits in each region, the number of simultaneously built
 # clusters in each region is a configuration parameter.
 #
+# The cfncluster commands run in-process through the cfncluster package,
+# sharing the boto3 clients across the worker threads.  Their log output
+# is written to the output file of the test run by the calling thread.
+#
+# A global scheduler dispatches the whole matrix to a single pool of
+# workers, starting the longest combinations first.  Each region has its
+# own concurrency limit and API call budget, and combinations failing on
+# throttling or capacity errors are retried with exponential backoff.
+#
+# The duration of every phase of each combination is recorded and written
+# to a JSON report and to a JUnit report in the --report-dir directory.
+#
+# Every run has a run ID, part of the test names, and a ledger of the
+# attempts in the --report-dir directory.  "--resume <run-id>" deletes
+# the stacks leaked by the interrupted run and queues again only the
+# combinations that did not pass.
+#
+# The ssh and scp commands are supervised by process_helper, which writes
+# their output with timestamps to the output file of the test and kills
+# them after --command-timeout seconds.  They share a single multiplexed
+# SSH connection to the master of each cluster.
+#
 # NOTE:
 # - This script requires python2
 # - To simplify this script, at least one subnet in every region
@@ -34,17 +56,24 @@ import sys
 import subprocess as sub
 import threading
 import time
-import re
 import argparse
-import Queue
-import boto3
+import json
+import logging
+import xml.etree.ElementTree as ET
 import process_helper as prochelp
 from builtins import exit
+from cfncluster import cfncluster
+from cfncluster import utils
+from botocore.exceptions import ClientError
 
 
 class ReleaseCheckException(Exception):
     pass
 
+# Failure caused by throttling or missing capacity, the combination can be retried later
+class RetryableReleaseCheckException(ReleaseCheckException):
+    pass
+
 #
 # configuration
 #
@@ -54,6 +83,17 @@ username_map = { 'alinux' : 'ec2-user',
                  'ubuntu1404' : 'ubuntu',
                  'ubuntu1604' : 'ubuntu' }
 
+# Rough duration in minutes of a combination, used to start the longest ones first
+duration_estimates = { 'alinux' : 20,
+                       'centos6' : 30,
+                       'centos7' : 25,
+                       'ubuntu1404' : 25,
+                       'ubuntu1604' : 25 }
+
+# Error codes and messages that make a combination worth retrying
+retryable_errors = ['Throttling', 'Rate exceeded', 'RequestLimitExceeded', 'LimitExceeded',
+                    'InsufficientInstanceCapacity', 'InsufficientCapacity']
+
 #
 # global variables (sigh)
 #
@@ -62,6 +102,10 @@ setup = {}
 results_lock = threading.Lock()
 failure = 0
 success = 0
+# result of every attempt, see test_runner
+results = []
+# file object of the ledger of the run, a JSON line per attempt
+_ledger = None
 
 # PID of the actual test process
 _child = 0
@@ -70,6 +114,132 @@ _termination_caught = False
 
 _TIMESTAMP_FORMAT = '%Y%m%d%H%M%S'
 _timestamp = datetime.datetime.now().strftime(_TIMESTAMP_FORMAT)
+# ID of the run, the timestamp of its first start
+_run_id = _timestamp
+
+# Routes the cfncluster log records to the output file of the test run by the current thread
+class ThreadLogHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.streams = {}
+        self.errors = {}
+
+    def emit(self, record):
+        ident = threading.current_thread().ident
+        if record.levelno >= logging.CRITICAL:
+            self.errors[ident] = record.getMessage()
+        stream = self.streams.get(ident)
+        if stream is not None:
+            stream.write(self.format(record) + '\n')
+
+    def pop_error(self):
+        # returns and forgets the last critical message of the current thread
+        return self.errors.pop(threading.current_thread().ident, '')
+
+_log_handler = ThreadLogHandler()
+
+# Token bucket limiting the rate of the API calls of a region
+class ApiBudget(object):
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = time.time()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.time()
+                self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+_api_budgets = {}
+
+# botocore before-call handler, blocks until the region of the client has budget for the call
+def _before_api_call(context=None, **kwargs):
+    budget = _api_budgets.get((context or {}).get('client_region'))
+    if budget is not None:
+        budget.acquire()
+
+# Hands out the work items of all the regions to a single pool of workers,
+# longest estimated duration first, without exceeding the concurrency of each region
+class TestScheduler(object):
+    def __init__(self, region_parallelism):
+        self.region_parallelism = region_parallelism
+        self.cond = threading.Condition()
+        self.pending = []
+        self.running = {}
+        self.unfinished = 0
+        self.counter = 0
+
+    def _push(self, item, delay):
+        self.counter += 1
+        item['not_before'] = time.time() + delay
+        self.pending.append((-item['estimate'], self.counter, item))
+        self.cond.notify_all()
+
+    def put(self, item):
+        with self.cond:
+            self.unfinished += 1
+            self._push(item, 0)
+
+    def get(self):
+        # returns the next runnable item, None when all the work is done
+        with self.cond:
+            while True:
+                if self.unfinished == 0:
+                    return None
+                now = time.time()
+                for entry in sorted(self.pending):
+                    item = entry[2]
+                    if item['not_before'] <= now and \
+                            self.running.get(item['region'], 0) < self.region_parallelism:
+                        self.pending.remove(entry)
+                        self.running[item['region']] = self.running.get(item['region'], 0) + 1
+                        return item
+                self.cond.wait(1)
+
+    def retry(self, item, delay):
+        with self.cond:
+            self.running[item['region']] -= 1
+            self._push(item, delay)
+
+    def task_done(self, item):
+        with self.cond:
+            self.running[item['region']] -= 1
+            self.unfinished -= 1
+            self.cond.notify_all()
+
+    def unfinished_tasks(self):
+        with self.cond:
+            return self.unfinished
+
+# Records the duration of the consecutive phases of a test
+class PhaseTimer(object):
+    def __init__(self):
+        self.phases = []
+        self.current = None
+        self.started = None
+
+    def start(self, phase):
+        # stops the current phase, if any, and starts the given one
+        self.stop()
+        self.current = phase
+        self.started = time.time()
+
+    def stop(self):
+        if self.current is not None:
+            self.phases.append([self.current, round(time.time() - self.started, 3)])
+            self.current = None
+
+def _is_retryable(message):
+    return any(error in (message or '') for error in retryable_errors)
 
 
 def _dirname():
@@ -83,9 +253,58 @@ def _double_writeln(fileo, message):
     print(message)
     fileo.write(message + '\n')
 
+# Build the arguments of an in-process cfncluster command
+def _cfncluster_args(func, config_file, cluster_name):
+    return argparse.Namespace(func=func, config_file=config_file, cluster_name=cluster_name, region=None,
+                              nowait=True, norollback=False, template_url=None, extra_parameters=None,
+                              tags=None, cluster_template=None, reset_desired=False)
+
+# Run a cfncluster command in-process, the commands exit on errors
+def _run_cfncluster(func, config_file, cluster_name):
+    try:
+        func(_cfncluster_args(func, config_file, cluster_name))
+    except SystemExit as exc:
+        if exc.code not in [None, 0]:
+            error = _log_handler.pop_error()
+            message = "cfncluster %s %s failed with exit status %s: %s" % (func.__name__, cluster_name, exc.code, error)
+            if _is_retryable(error):
+                raise RetryableReleaseCheckException(message)
+            raise ReleaseCheckException(message)
+
+# Minimal config for the cfncluster helpers, credentials come from the environment
+def _aws_config(region):
+    return argparse.Namespace(region=region, aws_access_key_id=None, aws_secret_access_key=None)
+
+# Wait for the stack to leave the given status, returns the new status
+def wait_for_stack(stack_name, region, in_progress_status):
+    cfn = utils.get_client('cloudformation', region_name=region)
+    status = in_progress_status
+    while status == in_progress_status:
+        if prochelp.termination_caught():
+            raise prochelp.KilledProcessError('cfncluster create %s' % stack_name)
+        time.sleep(10)
+        status = cfn.describe_stacks(StackName=stack_name).get('Stacks')[0].get('StackStatus')
+    return status
+
+# Returns the reasons of the failed events of the stack
+def get_stack_failures(stack_name, region):
+    cfn = utils.get_client('cloudformation', region_name=region)
+    events = cfn.describe_stack_events(StackName=stack_name).get('StackEvents')
+    return [event.get('ResourceStatusReason') or '' for event in events
+            if event.get('ResourceStatus', '').endswith('_FAILED')]
+
+# Wait for the stack to be deleted, returns the last status if the deletion did not complete
+def wait_for_stack_deletion(stack_name, region):
+    try:
+        return wait_for_stack(stack_name, region, 'DELETE_IN_PROGRESS')
+    except ClientError as e:
+        if e.response.get('Error').get('Message').endswith("does not exist"):
+            return 'DELETE_COMPLETE'
+        raise
+
 # Helper method to get the name of the autoscaling group
 def check_asg_capacity(stack_name, region, out_f):
-    asg_conn = boto3.client('autoscaling', region_name=region)
+    asg_conn = utils.get_client('autoscaling', region_name=region)
     iter = 0
     capacity = -1
     while iter < 24 and capacity != 0:
@@ -107,16 +326,33 @@ def check_asg_capacity(stack_name, region, out_f):
 #
 # run a single test, possibly in parallel
 #
-def run_test(region, distro, scheduler, instance_type, key_name, extra_args):
+# Closes the shared SSH connection to a master, if any
+def close_ssh_connection(control_path):
+    if os.path.exists(control_path):
+        with open(os.devnull, 'w') as devnull:
+            sub.call(['ssh', '-O', 'exit', '-o', 'ControlPath=%s' % control_path, 'master'],
+                     stdout=devnull, stderr=devnull)
+
+def run_test(region, distro, scheduler, instance_type, key_name, extra_args, attempt=0, result=None):
     scaledown_idletime = 2
-    testname = '%s-%s-%s-%s-%s' % (region, distro, scheduler, instance_type.replace('.', ''), _timestamp)
+    timer = PhaseTimer()
+    timer.start('config')
+    if result is None:
+        result = {}
+    testname = '%s-%s-%s-%s-%s' % (region, distro, scheduler, instance_type.replace('.', ''), _run_id)
+    if attempt > 0:
+        # the stack of the previous attempt may still be deleting
+        testname += '-r%s' % attempt
     test_filename = "%s-config.cfg" % testname
     key_path = extra_args['key_path']
+    command_timeout = extra_args['command_timeout']
     custom_cookbook = extra_args['custom_cookbook_url']
     custom_node = extra_args['custom_node_url']
     custom_template = extra_args['custom_template_url']
 
     print("--> %s: Starting" % (testname))
+    result['name'] = testname
+    result['phases'] = timer.phases
 
     file = open(test_filename, "w")
     file.write("[aws]\n")
@@ -147,25 +383,33 @@ def run_test(region, distro, scheduler, instance_type, key_name, extra_args):
     file.close()
 
     out_f = open('%s-out.txt' % testname, 'w', 0)
+    _log_handler.streams[threading.current_thread().ident] = out_f
+    stack_name = 'cfncluster-' + testname
 
     master_ip = ''
     username = username_map[distro]
+    control_path = cfncluster.get_ssh_control_path(testname, region)
     _create_interrupted = False;
     _create_done = False;
     try:
         # build the cluster
-        prochelp.exec_command(['cfncluster', 'create', '--config', test_filename, testname],
-                              stdout=out_f, stderr=sub.STDOUT, universal_newlines=True)
+        timer.start('create')
+        if prochelp.termination_caught():
+            raise prochelp.AbortedProcessError('cfncluster create %s' % testname)
+        _run_cfncluster(cfncluster.create, test_filename, testname)
+        status = wait_for_stack(stack_name, region, 'CREATE_IN_PROGRESS')
         _create_done = True
-        # get the master ip, which means grepping through cfncluster status gorp
-        dump = prochelp.exec_command(['cfncluster', 'status', '--config', test_filename,
-                                        testname], stderr=sub.STDOUT, universal_newlines=True)
-        dump_array = dump.splitlines()
-        for line in dump_array:
-            m = re.search('MasterPublicIP: (.+)$', line)
-            if m:
-                master_ip = m.group(1)
-                break
+        _double_writeln(out_f, "--> %s: Stack status: %s" % (testname, status))
+        if status != 'CREATE_COMPLETE':
+            failures = get_stack_failures(stack_name, region)
+            message = '--> %s: Cluster creation failed with status %s: %s' % (testname, status, '; '.join(failures))
+            if any(_is_retryable(failure) for failure in failures):
+                raise RetryableReleaseCheckException(message)
+            raise ReleaseCheckException(message)
+
+        # get the master ip from the stack outputs
+        timer.start('master_ip')
+        master_ip = cfncluster.get_stack_outputs(stack_name, _aws_config(region)).get('MasterPublicIP', '')
         if master_ip == '':
             _double_writeln(out_f, '!! %s: Master IP not found; exiting !!' % (testname))
             raise ReleaseCheckException('--> %s: Master IP not found!' % testname)
@@ -180,23 +424,34 @@ def run_test(region, distro, scheduler, instance_type, key_name, extra_args):
         ssh_params += ['-o', 'ServerAliveInterval=30']
         if key_path:
             ssh_params.extend(['-i', key_path])
+        # the first command opens the connection to the master, the next ones reuse it
+        ssh_params += cfncluster.get_ssh_control_options(control_path)
 
+        timer.start('submit')
         prochelp.exec_command(['scp'] + ssh_params + [os.path.join(_dirname(), 'cluster-check.sh'), '%s@%s:.' % (username, master_ip)],
-                              stdout=out_f, stderr=sub.STDOUT, universal_newlines=True)
+                              output=out_f, timeout=command_timeout)
         prochelp.exec_command(['ssh', '-n'] + ssh_params + ['%s@%s' % (username, master_ip), '/bin/bash --login cluster-check.sh submit %s' % scheduler],
-                              stdout=out_f, stderr=sub.STDOUT, universal_newlines=True)
+                              output=out_f, timeout=command_timeout)
 
         # Sleep for scaledown_idletime to give time for the instances to scale down
+        timer.start('scaledown_wait')
         time.sleep(60*scaledown_idletime)
 
-        check_asg_capacity('cfncluster-' + testname, region, out_f)
+        timer.start('asg_check')
+        check_asg_capacity(stack_name, region, out_f)
 
+        timer.start('scaledown_check')
         prochelp.exec_command(['ssh', '-n'] + ssh_params + ['%s@%s' % (username, master_ip), '/bin/bash --login cluster-check.sh scaledown_check %s' % scheduler],
-                              stdout=out_f, stderr=sub.STDOUT, universal_newlines=True)
+                              output=out_f, timeout=command_timeout)
 
+        timer.stop()
         _double_writeln(out_f, 'SUCCESS:  %s!!' % testname)
         open('%s.success' % testname, 'w').close()
-    except prochelp.ProcessHelperError as exc:
+        result['status'] = 'success'
+    except (prochelp.AbortedProcessError, prochelp.KilledProcessError) as exc:
+        timer.stop()
+        result['status'] = 'aborted'
+        result['message'] = str(exc)
         if not _create_done and isinstance(exc, prochelp.KilledProcessError):
             _create_interrupted = True
             _double_writeln(out_f, "--> %s: Interrupting cfncluster create!" % testname)
@@ -204,6 +459,9 @@ def run_test(region, distro, scheduler, instance_type, key_name, extra_args):
         open('%s.aborted' % testname, 'w').close()
         raise exc
     except Exception as exc:
+        timer.stop()
+        result['status'] = 'failure'
+        result['message'] = str(exc)
         if not _create_done:
             _create_interrupted = True
         _double_writeln(out_f, "Unexpected exception %s: %s" % (str(type(exc)), str(exc)))
@@ -217,18 +475,20 @@ def run_test(region, distro, scheduler, instance_type, key_name, extra_args):
         else:
             # No delete is necessary if cluster creation wasn't started (process_helper.AbortedProcessError)
             _del_iters = 0
+        if master_ip:
+            close_ssh_connection(control_path)
         if _del_iters > 0:
+            timer.start('delete')
             _del_done = False
             _double_writeln(out_f, "--> %s: Deleting - max iterations: %s" % (testname, _del_iters))
             while not _del_done and _del_iters > 0:
                 try:
                     time.sleep(2)
                     # clean up the cluster
-                    _del_output = sub.check_output(['cfncluster', 'delete', '--config', test_filename, '-nw', testname], stderr=sub.STDOUT, universal_newlines=True)
-                    _del_done = "DELETE_IN_PROGRESS" in _del_output or "DELETE_COMPLETE" in _del_output
-                    out_f.write(_del_output + '\n')
-                except sub.CalledProcessError as exc:
-                    out_f.write("CalledProcessError exception launching 'cfncluster delete': %s - Output:\n%s\n" % (str(exc), exc.output))
+                    _run_cfncluster(cfncluster.delete, test_filename, testname)
+                    _del_done = True
+                except ReleaseCheckException as exc:
+                    out_f.write("ReleaseCheckException running 'cfncluster delete': %s\n" % str(exc))
                 except Exception as exc:
                     out_f.write("Unexpected exception launching 'cfncluster delete' %s: %s\n" % (str(type(exc)), str(exc)))
                 finally:
@@ -236,46 +496,157 @@ def run_test(region, distro, scheduler, instance_type, key_name, extra_args):
                     _del_iters -= 1
 
             try:
-                prochelp.exec_command(['cfncluster', 'status', '--config', test_filename, testname], stdout=out_f, stderr=sub.STDOUT, universal_newlines=True)
-            except (prochelp.ProcessHelperError, sub.CalledProcessError):
-                # Usually it terminates with exit status 1 since at the end of the delete operation the stack is not found.
-                pass
+                if _del_done:
+                    status = wait_for_stack_deletion(stack_name, region)
+                    _double_writeln(out_f, "--> %s: Stack status: %s" % (testname, status))
             except Exception as exc:
-                out_f.write("Unexpected exception launching 'cfncluster status' %s: %s\n" % (str(type(exc)), str(exc)))
+                out_f.write("Stack status not available: %s\n" % str(exc))
+            timer.stop()
+        del _log_handler.streams[threading.current_thread().ident]
         out_f.close()
     print("--> %s: Finished" % (testname))
 
 #
-# worker thread, there will be config['parallelism'] of these running
-# per region, dispatching work from the work queue
+# worker thread, there will be config['max_parallelism'] of these running,
+# dispatching work from the global scheduler
 #
-def test_runner(region, q, key_name, extra_args):
+def test_runner(test_scheduler, key_name, extra_args):
     global success
     global failure
     global results_lock
 
     while True:
-        item = q.get()
+        item = test_scheduler.get()
+        if item is None:
+            return
 
         retval = 1
+        retry = False
+        result = {'region': item['region'], 'distro': item['distro'], 'scheduler': item['scheduler'],
+                  'instance_type': item['instance_type'], 'attempt': item['attempt'], 'status': 'aborted',
+                  'phases': []}
+        start = time.time()
         # just in case we miss an exception in run_test, don't abort everything...
         try:
             if not prochelp.termination_caught():
-                run_test(region=region, distro=item['distro'], scheduler=item['scheduler'],
-                         instance_type=item['instance_type'], key_name=key_name, extra_args=extra_args)
+                run_test(region=item['region'], distro=item['distro'], scheduler=item['scheduler'],
+                         instance_type=item['instance_type'], key_name=key_name, extra_args=extra_args,
+                         attempt=item['attempt'], result=result)
                 retval = 0
+        except RetryableReleaseCheckException:
+            retry = item['retries'] < extra_args['max_retries'] and not prochelp.termination_caught()
         except (ReleaseCheckException, prochelp.ProcessHelperError, sub.CalledProcessError):
             pass
         except Exception as exc:
             print("[test_runner] Unexpected exception %s: %s\n" % (str(type(exc)), str(exc)))
 
+        result['duration'] = round(time.time() - start, 3)
+        if retry:
+            result['status'] = 'retried'
+        results_lock.acquire(True)
+        results.append(result)
+        _ledger.write(json.dumps(result) + '\n')
+        _ledger.flush()
+        results_lock.release()
+
+        if retry:
+            delay = extra_args['retry_delay'] * 2 ** item['retries']
+            item['retries'] += 1
+            item['attempt'] += 1
+            print("--> %s-%s-%s-%s: Retrying in %s second(s), attempt %s" %
+                  (item['region'], item['distro'], item['scheduler'], item['instance_type'], delay, item['attempt']))
+            test_scheduler.retry(item, delay)
+            continue
+
         results_lock.acquire(True)
         if retval == 0:
             success += 1
         else:
             failure += 1
         results_lock.release()
-        q.task_done()
+        test_scheduler.task_done(item)
+
+def _ledger_path(report_dir, run_id):
+    return os.path.join(report_dir, 'release-check-%s.ledger' % run_id)
+
+def _combination(result):
+    return (result['region'], result['distro'], result['scheduler'], result['instance_type'])
+
+#
+# read the ledger of a previous run, returns the list of the recorded attempts
+#
+def read_ledger(report_dir, run_id):
+    path = _ledger_path(report_dir, run_id)
+    if not os.path.isfile(path):
+        print('Ledger %s of run %s not found.  Aborting.' % (path, run_id))
+        exit(1)
+    attempts = []
+    with open(path) as f:
+        for line in f:
+            try:
+                attempts.append(json.loads(line))
+            except ValueError:
+                # the last line may be truncated if the run was killed
+                pass
+    return attempts
+
+#
+# delete the test stacks of the run left behind in a region, concurrently
+#
+def cleanup_leaked_stacks(region, run_id):
+    cfn = utils.get_client('cloudformation', region_name=region)
+    leaked = []
+    for page in cfn.get_paginator('list_stacks').paginate():
+        for stack in page.get('StackSummaries'):
+            stack_name = stack.get('StackName')
+            if stack_name.startswith('cfncluster-%s-' % region) and run_id in stack_name \
+                    and stack.get('StackStatus') != 'DELETE_COMPLETE':
+                leaked.append(stack_name)
+
+    def delete_stack(stack_name):
+        try:
+            print("--> Deleting leaked stack %s" % stack_name)
+            cfn.delete_stack(StackName=stack_name)
+            print("--> Leaked stack %s: %s" % (stack_name, wait_for_stack_deletion(stack_name, region)))
+        except Exception as exc:
+            print("--> Failed to delete leaked stack %s, %s: %s" % (stack_name, str(type(exc)), str(exc)))
+
+    threads = [threading.Thread(target=delete_stack, args=(stack_name,)) for stack_name in set(leaked)]
+    for t in threads:
+        t.daemon = True
+        t.start()
+    return threads
+
+#
+# write the results as JSON and as JUnit XML, one testsuite per region
+#
+def write_reports(report_dir):
+    basename = os.path.join(report_dir, 'release-check-%s' % _run_id)
+
+    with open(basename + '.json', 'w') as f:
+        json.dump({'run_id': _run_id, 'results': results}, f, indent=2, sort_keys=True)
+
+    testsuites = ET.Element('testsuites', name='cfncluster-release-check-%s' % _run_id)
+    for region in sorted(set(result['region'] for result in results)):
+        region_results = [result for result in results if result['region'] == region]
+        testsuite = ET.SubElement(testsuites, 'testsuite', name=region,
+                                  tests=str(len(region_results)),
+                                  failures=str(len([r for r in region_results if r['status'] in ['failure', 'retried']])),
+                                  errors=str(len([r for r in region_results if r['status'] == 'aborted'])),
+                                  time=str(sum(r['duration'] for r in region_results)))
+        for result in region_results:
+            name = result.get('name', '%s-%s-%s' % (result['distro'], result['scheduler'], result['instance_type']))
+            testcase = ET.SubElement(testsuite, 'testcase', classname=region, name=name, time=str(result['duration']))
+            properties = ET.SubElement(testcase, 'properties')
+            for phase, duration in result['phases']:
+                ET.SubElement(properties, 'property', name='phase.%s' % phase, value=str(duration))
+            if result['status'] in ['failure', 'retried']:
+                ET.SubElement(testcase, 'failure', message=result.get('message', ''))
+            elif result['status'] == 'aborted':
+                ET.SubElement(testcase, 'error', message=result.get('message', ''))
+    ET.ElementTree(testsuites).write(basename + '.xml', encoding='utf-8')
+
+    return basename
 
 def _term_handler_parent(_signo, _stack_frame):
     global _termination_caught
@@ -341,10 +712,20 @@ def _killme_gently():
     os.kill(os.getpid(), signal.SIGTERM)
 
 def _main_child():
+    global _run_id
+    global _ledger
+
     _bind_signals_child()
     parent = os.getppid()
     print("Parent pid: %s" % parent)
     config = { 'parallelism' : 3,
+               'max_parallelism' : None,
+               'api_rate' : 5.0,
+               'max_retries' : 2,
+               'retry_delay' : 120,
+               'command_timeout' : 900,
+               'report_dir' : '.',
+               'resume' : None,
                'regions' : 'us-east-1,us-east-2,us-west-1,us-west-2,' +
                            'ca-central-1,eu-west-1,eu-west-2,eu-central-1,' +
                            'ap-southeast-1,ap-southeast-2,ap-northeast-1,' +
@@ -360,6 +741,20 @@ def _main_child():
     parser = argparse.ArgumentParser(description = 'Test runner for CfnCluster')
     parser.add_argument('--parallelism', help = 'Number of tests per region to run in parallel',
                         type = int, default = 3)
+    parser.add_argument('--max-parallelism', help = 'Number of tests to run in parallel across all the regions',
+                        type = int)
+    parser.add_argument('--api-rate', help = 'Number of API calls per second allowed in each region',
+                        type = float)
+    parser.add_argument('--max-retries', help = 'Number of retries on throttling or capacity errors',
+                        type = int)
+    parser.add_argument('--retry-delay', help = 'Seconds before the first retry, doubled for each further retry',
+                        type = int)
+    parser.add_argument('--command-timeout', help = 'Seconds after which the commands run on the clusters are killed',
+                        type = int)
+    parser.add_argument('--report-dir', help = 'Directory of the JSON and JUnit reports and of the run ledgers',
+                        type = str)
+    parser.add_argument('--resume', help = 'ID of a previous run to resume, only the combinations that did not pass run again',
+                        type = str)
     parser.add_argument('--regions', help = 'Comma separated list of regions to test',
                         type = str)
     parser.add_argument('--distros', help = 'Comma separated list of distributions to test',
@@ -392,9 +787,24 @@ def _main_child():
     print("==> Instance Types: %s" % (', '.join(instance_type_list)))
     print("==> Distros: %s" % (', '.join(distro_list)))
     print("==> Schedulers: %s" % (', '.join(scheduler_list)))
-    print("==> Parallelism: %d" % (config['parallelism']))
+    if config['max_parallelism'] is None:
+        config['max_parallelism'] = config['parallelism'] * len(region_list)
+
+    print("==> Parallelism: %d per region, %d overall" % (config['parallelism'], config['max_parallelism']))
+    print("==> API rate: %s calls/s per region" % (config['api_rate']))
     print("==> Key Pair: %s" % (config['key_name']))
 
+    logger = logging.getLogger('cfncluster.cfncluster')
+    logger.setLevel(logging.DEBUG)
+    _log_handler.setLevel(logging.INFO)
+    _log_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_log_handler)
+
+    # Every boto3 client of the cfncluster package and of this script draws from the budget of its region
+    for region in region_list:
+        _api_budgets[region] = ApiBudget(config['api_rate'], max(1, 2 * config['api_rate']))
+    utils.register_handler('before-call', _before_api_call)
+
     # Optional params
     if config['key_path']:
         print("==> Key Path: %s" % (config['key_path']))
@@ -407,7 +817,7 @@ def _main_child():
 
     # Populate subnet / vpc data for all regions we're going to test.
     for region in region_list:
-        client = boto3.client('ec2', region_name=region)
+        client = utils.get_client('ec2', region_name=region)
         response = client.describe_tags(Filters=[{'Name': 'key',
                                                   'Values': [ 'CfnClusterTestSubnet' ]}],
                                         MaxResults=16)
@@ -425,47 +835,74 @@ def _main_child():
 
         setup[region] = { 'vpc' : vpcid, 'subnet' : subnetid }
 
-    work_queues = {}
-    # build up a per-region list of work to do
+    # resume a previous run: skip the combinations that passed and delete the leaked stacks
+    passed = set()
+    attempts = {}
+    cleanup_threads = []
+    if config['resume']:
+        _run_id = config['resume']
+        for result in read_ledger(config['report_dir'], _run_id):
+            results.append(result)
+            combination = _combination(result)
+            attempts[combination] = max(attempts.get(combination, -1), result['attempt'])
+            if result['status'] == 'success':
+                passed.add(combination)
+        print("==> Resuming run %s: %d combination(s) already passed" % (_run_id, len(passed)))
+        for region in region_list:
+            cleanup_threads += cleanup_leaked_stacks(region, _run_id)
+        while any(t.is_alive() for t in cleanup_threads):
+            time.sleep(1)
+
+    print("==> Run ID: %s" % (_run_id))
+    _ledger = open(_ledger_path(config['report_dir'], _run_id), 'a')
+
+    # build up the list of work to do for all the regions
+    test_scheduler = TestScheduler(config['parallelism'])
     for region in region_list:
-        work_queues[region] = Queue.Queue()
         for distro in distro_list:
             for scheduler in scheduler_list:
                 for instance in instance_type_list:
-                    work_item = {'distro': distro, 'scheduler': scheduler, 'instance_type': instance}
-                    work_queues[region].put(work_item)
+                    work_item = {'region': region, 'distro': distro, 'scheduler': scheduler, 'instance_type': instance,
+                                 'estimate': duration_estimates.get(distro, 30), 'attempt': 0, 'retries': 0}
+                    combination = _combination(work_item)
+                    if combination in passed:
+                        continue
+                    # the stacks of the previous attempts may still be deleting, use new test names
+                    work_item['attempt'] = attempts.get(combination, -1) + 1
+                    test_scheduler.put(work_item)
 
     # start all the workers
-    for region in region_list:
-        for i in range(0, config['parallelism']):
-            t = threading.Thread(target=test_runner,
-                                 args=(region, work_queues[region], config['key_name'], config))
-            t.daemon = True
-            t.start()
+    for i in range(0, config['max_parallelism']):
+        t = threading.Thread(target=test_runner,
+                             args=(test_scheduler, config['key_name'], config))
+        t.daemon = True
+        t.start()
 
 
-    # Wait for all the work queues to be completed in each region
-    # WARN: The work_queues[region].join() approach prevents the SIGINT signal to be caught from the main thread,
-    #       that is actually blocked in the join.
+    # Wait for all the work to be completed
+    # WARN: A blocking wait would prevent the SIGINT signal to be caught from the main thread
     all_finished = False
     self_killed = False
     while not all_finished:
         time.sleep(1)
-        all_finished = True
-        for queue in work_queues.values():
-            all_finished = all_finished and queue.unfinished_tasks == 0
+        all_finished = test_scheduler.unfinished_tasks() == 0
         # In the case parent process was SIGKILL-ed
         if not _proc_alive(parent) and not self_killed:
             print("Parent process with pid %s died - terminating..." % parent)
             _killme_gently()
             self_killed = True
 
-    print("%s - Regions workers queues all done: %s" % (_time(), all_finished))
+    print("%s - Regions workers all done: %s" % (_time(), all_finished))
 
     # print status...
     print("==> Success: %d" % (success))
     print("==> Failure: %d" % (failure))
+    results_lock.acquire(True)
+    print("==> Reports: %s.{json,xml}" % write_reports(config['report_dir']))
+    results_lock.release()
+    _ledger.close()
     if failure != 0:
+        print("==> Resume with: --resume %s" % (_run_id))
         exit(1)
 
 if __name__ == '__main__':
@@ -14,24 +14,39 @@
 # language governing permissions and limitations under the License.
 #
 #
-# This helper class copes with the termination of multiple processes forked by a simple multi-threaded application.
+# This helper copes with the termination of multiple processes forked by a simple multi-threaded application.
 # All processes are registered internally and if the term_handler() function is registered
 # to handle TERM or INT signals it will kill all the active processes submitted through the exec_command() function.
 # Killed processes would make the exec_command() function to raise an Exception, either AbortedProcessError or
 # KilledProcessError, that can be managed by the client application.
 #
+# A single supervisor thread watches all the child processes with select(): it reads their output as it comes,
+# writes it line by line with a timestamp to the output file of each command, terminates the commands running
+# longer than their timeout and kills the processes ignoring the termination. The calling threads only wait
+# for the result, so many commands can run at the same time without a pipe reader per process.
+#
 
+import datetime
+import errno
 import os
+import select
 import signal
 import subprocess as sub
 import threading
+import time
 
 
+# pid -> _Command, the commands not completed yet
 _procs = {}
 _procs_lock = threading.Lock()
 
 _termination_caught = False
 
+# Seconds between the TERM and the KILL signals sent to a process being stopped
+KILL_GRACE_PERIOD = 10
+
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
 class ProcessHelperError(Exception):
     def __init__(self, cmd, msg=None):
         if msg is None:
@@ -47,6 +62,11 @@ class KilledProcessError(ProcessHelperError):
     def __init__(self, cmd):
         super(KilledProcessError, self).__init__(cmd, "Process for command '%s' was killed" % cmd)
 
+class TimeoutProcessError(ProcessHelperError):
+    def __init__(self, cmd, timeout):
+        super(TimeoutProcessError, self).__init__(cmd, "Command '%s' timed out after %s seconds" % (cmd, timeout))
+        self.timeout = timeout
+
 def termination_caught():
     return _termination_caught
 
@@ -57,73 +77,185 @@ def termination_caught():
 # Killed processes would make the exec_command() function to raise a KilledProcessError
 # or an AbortedProcessError exception.
 #
+# The handler runs in the main thread between two bytecodes, possibly while the main thread holds _procs_lock,
+# so it only sets the flag and wakes up the supervisor, which stops the processes.
+#
 def term_handler(_signo, _stack_frame):
-    global _procs_lock, _procs, _termination_caught
-
-    _procs_lock.acquire()
-    if not _termination_caught:
-        _termination_caught = True
-        for proc in _procs.values():
-            _kill_process(proc)
+    global _termination_caught
 
-    _procs_lock.release()
+    _termination_caught = True
+    _supervisor.wakeup()
 
-def _kill_process(process):
-    try:
-        process.kill()
-    except:
-        pass
+def _timestamp():
+    now = datetime.datetime.now()
+    return '%s.%03d' % (now.strftime(_TIMESTAMP_FORMAT), now.microsecond // 1000)
 
-def _add_process(process):
-    global _procs_lock, _procs, _termination_caught
+class _Command(object):
+    def __init__(self, cmd, process, output, timeout):
+        self.cmd = cmd
+        self.process = process
+        self.output = output
+        self.timeout = timeout
+        self.deadline = time.time() + timeout if timeout else None
+        # output pipe, None once it reached the end of file or if the output was redirected by the caller
+        self.pipe = process.stdout
+        self.partial = b''
+        self.lines = []
+        self.stopped_at = None
+        self.timed_out = False
+        self.exitcode = None
+        self.done = threading.Event()
 
-    if process != None and process.pid != None and process.pid != 0:
-        _procs_lock.acquire()
+    def write(self, data):
+        self.partial += data
+        lines = self.partial.split(b'\n')
+        self.partial = lines.pop()
+        for line in lines:
+            self._write_line(line)
 
-        if _termination_caught:
-            _kill_process(process)
+    def _write_line(self, line):
+        if not isinstance(line, str):
+            line = line.decode('utf-8', 'replace')
+        if self.output is None:
+            self.lines.append(line)
         else:
-            _procs[process.pid] = process
+            self.output.write('[%s] %s\n' % (_timestamp(), line.rstrip('\r')))
+
+    def close_pipe(self):
+        if self.partial:
+            self._write_line(self.partial)
+            self.partial = b''
+        self.pipe.close()
+        self.pipe = None
 
-        _procs_lock.release()
+    def stop(self):
+        # sends TERM first, KILL after the grace period, to the whole process group so that no grandchild
+        # keeps the output pipe open
+        now = time.time()
+        try:
+            if self.stopped_at is None:
+                self.stopped_at = now
+                os.killpg(self.process.pid, signal.SIGTERM)
+            elif now - self.stopped_at > KILL_GRACE_PERIOD:
+                os.killpg(self.process.pid, signal.SIGKILL)
+        except OSError:
+            pass
 
-def _remove_process(process):
-    global _procs_lock, _procs
+    def result(self):
+        return '\n'.join(self.lines) + '\n' if self.lines else ''
 
-    if process != None and _procs.has_key(process.pid):
-        _procs_lock.acquire()
+class _Supervisor(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.thread = None
+        self.wakeup_r, self.wakeup_w = os.pipe()
 
-        del _procs[process.pid]
+    def start(self):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name='process-supervisor')
+                self.thread.daemon = True
+                self.thread.start()
 
-        _procs_lock.release()
+    def wakeup(self):
+        try:
+            os.write(self.wakeup_w, b'x')
+        except OSError:
+            pass
 
+    def run(self):
+        while True:
+            with _procs_lock:
+                commands = list(_procs.values())
+            now = time.time()
+            for command in commands:
+                if command.stopped_at is not None or _termination_caught:
+                    command.stop()
+                elif command.deadline is not None and now > command.deadline:
+                    command.timed_out = True
+                    command.stop()
+
+            pipes = dict((command.pipe.fileno(), command) for command in commands if command.pipe is not None)
+            # pipes at the end of file are polled, the processes without a pipe may exit at any time
+            timeout = 1.0 if len(pipes) == len(commands) else 0.2
+            try:
+                readable = select.select(list(pipes) + [self.wakeup_r], [], [], timeout)[0]
+            except (select.error, OSError) as e:
+                if e.args[0] == errno.EINTR:
+                    continue
+                raise
+            for fd in readable:
+                if fd == self.wakeup_r:
+                    os.read(self.wakeup_r, 4096)
+                    continue
+                command = pipes[fd]
+                data = os.read(fd, 65536)
+                if data:
+                    command.write(data)
+                else:
+                    command.close_pipe()
+
+            for command in commands:
+                if command.pipe is None and command.process.poll() is not None:
+                    self.complete(command)
+
+    def complete(self, command):
+        with _procs_lock:
+            _procs.pop(command.process.pid, None)
+        command.exitcode = command.process.returncode
+        if command.output is not None:
+            command.output.flush()
+        command.done.set()
+
+_supervisor = _Supervisor()
+
+def _add_command(command):
+    with _procs_lock:
+        _procs[command.process.pid] = command
+    _supervisor.start()
+    _supervisor.wakeup()
+
+#
+# Runs the command and waits for its completion, returns its output if no output file object is given,
+# otherwise the output is written line by line to the file object, each line prefixed by a timestamp.
+# The command is terminated after timeout seconds, raising a TimeoutProcessError.
+# Any other keyword argument is passed to subprocess.Popen.
+#
 def exec_command(*cmdargs, **kwargs):
-    global _termination_caught
+    output = kwargs.pop('output', None)
+    timeout = kwargs.pop('timeout', None)
+    cmd = " ".join(*cmdargs)
 
     if _termination_caught:
-        raise AbortedProcessError(" ".join(*cmdargs))
+        raise AbortedProcessError(cmd)
 
     DEV_NULL = open(os.devnull, "rb")
     params = {
         'env' : dict(os.environ),
         'stdin' : DEV_NULL,
         'stdout' : sub.PIPE,
-        'stderr' : sub.STDOUT
+        'stderr' : sub.STDOUT,
+        # own process group, stopped as a whole by the supervisor
+        'preexec_fn' : os.setpgrp
         }
     params.update(kwargs)
+    # the output is read as bytes and decoded line by line
+    params.pop('universal_newlines', None)
 
-    process = None
     try:
         process = sub.Popen(*cmdargs, **params)
-        _add_process(process)
-        stdout = process.communicate()[0]
-        exitcode = process.poll()
-        if exitcode != 0:
-            if _termination_caught:
-                raise KilledProcessError(" ".join(*cmdargs))
-            else:
-                raise sub.CalledProcessError(exitcode, " ".join(*cmdargs), stdout)
-        return stdout
     finally:
         DEV_NULL.close()
-        _remove_process(process)
+    command = _Command(cmd, process, output, timeout)
+    _add_command(command)
+    # a wait with a timeout keeps the calling thread responsive to signals
+    while not command.done.wait(1):
+        pass
+
+    if command.exitcode != 0:
+        if command.timed_out:
+            raise TimeoutProcessError(cmd, timeout)
+        if _termination_caught:
+            raise KilledProcessError(cmd)
+        raise sub.CalledProcessError(command.exitcode, cmd, command.result())
+    return command.result()
@@ -0,0 +1,101 @@
+#!/usr/bin/python
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not
+# use this file except in compliance with the License. A copy of the License
+# is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+#
+#
+# Generate the AMI index shipped in the cfncluster package from the Mappings of the CloudFormation template
+#
+# usage: ./generate-ami-index.py [--cloudformation-template <path>] [--index-file <path>] [--check]
+
+import argparse
+import json
+import sys
+
+header = '''# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file is generated by util/generate-ami-index.py from the Mappings of cloudformation/cfncluster.cfn.json.
+# Do not edit it by hand, run the script again after updating the template.
+
+'''
+
+footer = '''
+
+def get_ami(region, base_os):
+    # returns the AMI of the base_os in the region, None if not published
+    return AMIS.get(region, {}).get(base_os)
+
+def get_user(base_os):
+    # returns the default user of the base_os, None if unknown
+    return OS_FEATURES.get(base_os, {}).get('User')
+
+def get_root_device(base_os):
+    # returns the root device name of the base_os, None if unknown
+    return OS_FEATURES.get(base_os, {}).get('RootDevice')
+
+def get_arn_partition(region):
+    # returns the ARN partition of the region, None if unknown
+    return REGION_CAPABILITIES.get(region, {}).get('arn')
+'''
+
+
+def format_mapping(name, mapping):
+    # keys are sorted so that regenerating the index gives small diffs
+    lines = ['%s = {' % name]
+    for key in sorted(mapping):
+        lines.append("    '%s': {" % key)
+        for k in sorted(mapping[key]):
+            lines.append("        '%s': '%s'," % (k, mapping[key][k]))
+        lines.append('    },')
+    lines.append('}')
+    return '\n'.join(lines)
+
+
+def generate_index(template):
+    mappings = template.get('Mappings')
+    return header + '\n\n'.join([format_mapping('AMIS', mappings.get('AWSRegionOS2AMI')),
+                                 format_mapping('OS_FEATURES', mappings.get('OSFeatures')),
+                                 format_mapping('REGION_CAPABILITIES', mappings.get('AWSRegion2Capabilites'))]) \
+        + '\n' + footer
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate the AMI index of the cfncluster package')
+    parser.add_argument('--cloudformation-template', type=str, help='path to cloudfomation template', required=False,
+                        default='cloudformation/cfncluster.cfn.json')
+    parser.add_argument('--index-file', type=str, help='index output file path', required=False,
+                        default='cli/cfncluster/ami_index.py')
+    parser.add_argument('--check', action='store_true', help='exit with an error if the index is not up to date',
+                        required=False, default=False)
+    args = parser.parse_args()
+
+    with open(args.cloudformation_template) as f:
+        index = generate_index(json.load(f))
+
+    if args.check:
+        with open(args.index_file) as f:
+            if f.read() != index:
+                print("%s is not up to date with %s" % (args.index_file, args.cloudformation_template))
+                sys.exit(1)
+    else:
+        with open(args.index_file, 'w') as f:
+            f.write(index)
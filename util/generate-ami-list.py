@@ -17,40 +17,123 @@
 # Search for CfnCluster public AMIs and generate a list in json and txt format
 #
 # usage: ./generate-ami-list.py --version <cfncluster-version> --date <release-date>
+#
+# With --incremental, only the region/distro entries that changed are updated in the AWSRegionOS2AMI mapping
+# of the CloudFormation template, in the json and txt files and in the AMI index of the cfncluster package.
 
 import boto3
 from botocore.exceptions import ClientError
 import argparse
 import json
+import os
+import runpy
 import sys
+import threading
 from collections import OrderedDict
 
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
 distros = OrderedDict([("alinux", "amzn"), ("centos6", "centos6"), ("centos7", "centos7"), ("ubuntu1404", "ubuntu-1404"), ("ubuntu1604", "ubuntu-1604")])
 
 
-def get_ami_list(regions, date, version, owner):
-    amis_json = {}
+def describe_images(ec2, owner, name):
+    # describe_images is paginated only by recent versions of botocore
+    filters = [{'Name': 'name', "Values": [name]}]
+    if not ec2.can_paginate('describe_images'):
+        return ec2.describe_images(Owners=[owner], Filters=filters).get('Images')
+
+    images = []
+    for page in ec2.get_paginator('describe_images').paginate(Owners=[owner], Filters=filters):
+        images.extend(page.get('Images'))
+    return images
+
+
+def get_region_amis(region_name, date, version, owner):
+    ec2 = boto3.client('ec2', region_name=region_name)
+    images = describe_images(ec2, owner, "cfncluster-%s*%s" % (version, date))
 
+    amis = OrderedDict()
+    for image in images:
+        for key, value in distros.items():
+            if value in image.get('Name'):
+                amis[key] = image.get('ImageId')
+
+    return amis
+
+
+def get_ami_list(regions, date, version, owner, jobs=8):
+    # returns region -> amis, and region -> exception for the regions that failed with another error than ClientError
+    amis_json = {}
+    errors = {}
+    amis_lock = threading.Lock()
+    work_queue = queue.Queue()
     for region_name in regions:
-        try:
-            ec2 = boto3.client('ec2', region_name=region_name)
-            images = ec2.describe_images(Owners=[owner], Filters=[{'Name': 'name', "Values": ["cfncluster-%s*%s" % (version, date)]}])
+        work_queue.put(region_name)
+
+    def worker():
+        while True:
+            try:
+                region_name = work_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                amis = get_region_amis(region_name, date, version, owner)
+                if len(amis) == 0:
+                    print("Warning: there are no AMIs in the selected region (%s)" % region_name)
+                else:
+                    with amis_lock:
+                        amis_json[region_name] = amis
+            except ClientError:
+                # skip regions on which we are not authorized (cn-north-1 and us-gov-west-1)
+                pass
+            except Exception as e:
+                with amis_lock:
+                    errors[region_name] = e
+
+    workers = [threading.Thread(target=worker) for i in range(min(jobs, len(regions)))]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+
+    return amis_json, errors
+
+
+def update_amis(current, amis_json):
+    # merges the new amis into the current mapping, returns the list of (region, distro, old ami, new ami) changed
+    changes = []
+    for region_name in sorted(amis_json):
+        region_amis = current.setdefault(region_name, OrderedDict())
+        for key, value in amis_json[region_name].items():
+            if region_amis.get(key) != value:
+                changes.append((region_name, key, region_amis.get(key), value))
+                region_amis[key] = value
+
+    return changes
+
+
+def update_template(template_path, amis_json):
+    # updates the AWSRegionOS2AMI mapping in place, keeping the layout of the template
+    with open(template_path) as f:
+        data = json.load(f, object_pairs_hook=OrderedDict)
+    changes = update_amis(data.get('Mappings').get('AWSRegionOS2AMI'), amis_json)
+    if len(changes) > 0:
+        with open(template_path, 'w') as f:
+            f.write(json.dumps(data, indent=2, separators=(',', ': ')) + '\n')
 
-            amis = OrderedDict()
-            for image in images.get('Images'):
-                for key, value in distros.items():
-                    if value in image.get('Name'):
-                        amis[key] = image.get('ImageId')
+    return data.get('Mappings').get('AWSRegionOS2AMI'), changes
 
-            if len(amis) == 0:
-                print("Warning: there are no AMIs in the selected region (%s)" % region_name)
-            else:
-                amis_json[region_name] = amis
-        except ClientError:
-            # skip regions on which we are not authorized (cn-north-1 and us-gov-west-1)
-            pass
 
-    return amis_json
+def update_index(template_path, index_path):
+    # regenerates the AMI index of the cfncluster package with util/generate-ami-index.py
+    generator = runpy.run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'generate-ami-index.py'))
+    with open(template_path) as f:
+        index = generator['generate_index'](json.load(f))
+    with open(index_path, 'w') as f:
+        f.write(index)
 
 
 def convert_json_to_txt(regions, amis_json):
@@ -77,6 +160,9 @@ if __name__ == '__main__':
     parser.add_argument('--account-id', type=str, help='account id that owns the amis', required=False,  default="247102896272")
     parser.add_argument('--append', type=str, help='append new amis to current amis.txt', required=False, default=False)
     parser.add_argument('--cloudformation-template', type=str, help='path to cloudfomation template', required=False, default='cloudformation/cfncluster.cfn.json')
+    parser.add_argument('--incremental', action='store_true', help='update only the changed amis in the cloudformation template, json, txt and index files', required=False, default=False)
+    parser.add_argument('--index-file', type=str, help='AMI index file path, updated by --incremental', required=False, default='cli/cfncluster/ami_index.py')
+    parser.add_argument('--jobs', type=int, help='number of regions queried in parallel', required=False, default=8)
     args = parser.parse_args()
 
     # get all regions
@@ -84,21 +170,51 @@ if __name__ == '__main__':
     regions = sorted(r.get('RegionName') for r in ec2.describe_regions().get('Regions'))
 
     # get ami list
-    amis_json = get_ami_list(regions=regions, date=args.date, version=args.version, owner=args.account_id)
-
-    # write amis.json file
-    amis_json_file = open(args.json_file, "w")
-    json.dump(amis_json, amis_json_file, indent=2, sort_keys=True)
-    amis_json_file.close()
-
-    # append to amis.txt file
-    if args.append:
-        with open(args.cloudformation_template) as f:
-            data = json.load(f)
-            amis = data.get('Mappings').get('AWSRegionOS2AMI')
-            amis.update(amis_json)
-            amis_json = amis
-            regions = sorted(amis_json)
+    amis_json, errors = get_ami_list(regions=regions, date=args.date, version=args.version, owner=args.account_id,
+                                     jobs=args.jobs)
+    # do not write mappings missing the regions that failed
+    for region_name in sorted(errors):
+        sys.stderr.write("Failed to query region %s: %s\n" % (region_name, errors[region_name]))
+    if len(errors) > 0:
+        sys.exit(1)
+
+    if args.incremental:
+        found = amis_json
+        amis, changes = update_template(args.cloudformation_template, found)
+        for region_name, key, old_ami, new_ami in changes:
+            print("%s %s: %s -> %s" % (region_name, key, old_ami, new_ami))
+        if len(changes) == 0:
+            print("No AMI changed")
+            sys.exit(0)
+        update_index(args.cloudformation_template, args.index_file)
+
+        # merge the changes into the current json file
+        if os.path.isfile(args.json_file):
+            with open(args.json_file) as f:
+                amis_json = json.load(f, object_pairs_hook=OrderedDict)
+            update_amis(amis_json, found)
+        else:
+            amis_json = found
+        amis_json_file = open(args.json_file, "w")
+        json.dump(amis_json, amis_json_file, indent=2, sort_keys=True)
+        amis_json_file.close()
+
+        amis_json = amis
+        regions = sorted(amis_json)
+    else:
+        # write amis.json file
+        amis_json_file = open(args.json_file, "w")
+        json.dump(amis_json, amis_json_file, indent=2, sort_keys=True)
+        amis_json_file.close()
+
+        # append to amis.txt file
+        if args.append:
+            with open(args.cloudformation_template) as f:
+                data = json.load(f)
+                amis = data.get('Mappings').get('AWSRegionOS2AMI')
+                amis.update(amis_json)
+                amis_json = amis
+                regions = sorted(amis_json)
 
     # convert json to txt
     amis_txt = convert_json_to_txt(regions=regions, amis_json=amis_json)
@@ -0,0 +1,204 @@
+#!/usr/bin/python
+#
+# Copyright 2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not
+# use this file except in compliance with the License. A copy of the License
+# is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+#
+#
+# Generate the instance type index shipped in the cfncluster package from the EC2 DescribeInstanceTypes and
+# DescribeInstanceTypeOfferings APIs, for the regions of the AWSRegion2Capabilites mapping of the CloudFormation
+# template. Only the x86_64 HVM instance types are indexed, the ones the cfncluster AMIs can run on, with the master
+# instance types of the IsMasterInstanceEbsOpt condition of the template. Run it again from time to time to pick up
+# the new instance types and regional offerings.
+#
+# usage: ./generate-instance-index.py [--cloudformation-template <path>] [--index-file <path>] [--region <region>]
+#                                     [--instance-types-file <path>] [--offerings-file <path>]
+
+import argparse
+import datetime
+import json
+import threading
+
+import boto3
+
+header = '''# Copyright 2013-2018 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance with the
+# License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This file is generated by util/generate-instance-index.py from the EC2 DescribeInstanceTypes and
+# DescribeInstanceTypeOfferings APIs. Do not edit it by hand, run the script again to refresh it.
+
+'''
+
+footer = '''
+
+def get_instance_type(instance_type):
+    # returns the capabilities of the instance type as a dict, None if it is not in the index
+    capabilities = INSTANCE_TYPES.get(instance_type)
+    if capabilities is None:
+        return None
+    return dict(zip(INSTANCE_FIELDS, capabilities))
+
+def is_offered(instance_type, region):
+    # returns whether the instance type is offered in the region, None if the region is not in the index
+    offerings = REGION_OFFERINGS.get(region)
+    if offerings is None:
+        return None
+    return instance_type in offerings
+'''
+
+fields = ['vcpus', 'memory', 'ebs_optimized', 'instance_storage', 'placement_group', 'ena']
+
+
+def get_capabilities(instance_type):
+    # returns the values of fields for a DescribeInstanceTypes entry
+    strategies = instance_type.get('PlacementGroupInfo', {}).get('SupportedStrategies', [])
+    disks = instance_type.get('InstanceStorageInfo', {}).get('Disks', [])
+    return (instance_type.get('VCpuInfo').get('DefaultVCpus'),
+            instance_type.get('MemoryInfo').get('SizeInMiB'),
+            instance_type.get('EbsInfo', {}).get('EbsOptimizedSupport', 'unsupported'),
+            sum(disk.get('Count') for disk in disks),
+            'cluster' in strategies,
+            instance_type.get('NetworkInfo', {}).get('EnaSupport', 'unsupported'))
+
+
+def describe_instance_types(region):
+    ec2 = boto3.client('ec2', region_name=region)
+    instance_types = []
+    paginator = ec2.get_paginator('describe_instance_types')
+    for page in paginator.paginate():
+        instance_types.extend(page.get('InstanceTypes'))
+    return instance_types
+
+
+def get_instance_types(described):
+    # returns instance type -> capabilities of the x86_64 HVM instance types
+    instance_types = {}
+    for instance_type in described:
+        if 'x86_64' in instance_type.get('ProcessorInfo', {}).get('SupportedArchitectures', []) \
+                and 'hvm' in instance_type.get('SupportedVirtualizationTypes', []):
+            instance_types[instance_type.get('InstanceType')] = get_capabilities(instance_type)
+    return instance_types
+
+
+def get_offered(described):
+    # returns the instance types of a DescribeInstanceTypeOfferings output
+    return set(offering.get('InstanceType') for offering in described.get('InstanceTypeOfferings'))
+
+
+def get_offerings(region, offerings):
+    # puts the instance types offered in the region in offerings, nothing if the region is not reachable
+    try:
+        ec2 = boto3.client('ec2', region_name=region)
+        paginator = ec2.get_paginator('describe_instance_type_offerings')
+        offered = set()
+        for page in paginator.paginate(LocationType='region'):
+            offered.update(get_offered(page))
+        if len(offered) > 0:
+            offerings[region] = offered
+    except Exception as e:
+        print('Skipping region %s: %s' % (region, e))
+
+
+def format_words(words, indent, width=120):
+    # wraps the words in lines of at most width characters
+    lines = []
+    line = indent
+    for word in words:
+        if len(line) + len(word) + 1 > width and line != indent:
+            lines.append(line)
+            line = indent
+        line += ('' if line == indent else ' ') + word
+    lines.append(line)
+    return '\n'.join(lines)
+
+
+def get_condition_values(condition):
+    # returns the string literals compared by the Fn::Equals of a template condition
+    if isinstance(condition, list):
+        return set().union(*[get_condition_values(c) for c in condition])
+    if isinstance(condition, dict):
+        values = set(v for v in condition.get('Fn::Equals', []) if not isinstance(v, dict))
+        return values.union(*[get_condition_values(v) for k, v in condition.items() if k != 'Fn::Equals'])
+    return set()
+
+
+def generate_index(instance_types, offerings, not_ebs_optimized):
+    # keys are sorted so that regenerating the index gives small diffs
+    lines = ["GENERATED = '%s'" % datetime.date.today().isoformat(), '',
+             '# Values of the INSTANCE_TYPES tuples: DefaultVCpus, SizeInMiB, EbsOptimizedSupport, instance store',
+             '# disks, cluster placement group support, EnaSupport',
+             'INSTANCE_FIELDS = (%s)' % ', '.join("'%s'" % field for field in fields), '',
+             '# Master instance types launched without EbsOptimized, from the IsMasterInstanceEbsOpt condition',
+             "TEMPLATE_NOT_EBS_OPTIMIZED = frozenset('''",
+             format_words(sorted(not_ebs_optimized), ' ' * 4),
+             "'''.split())", '',
+             'INSTANCE_TYPES = {']
+    for name in sorted(instance_types):
+        lines.append("    '%s': (%d, %d, '%s', %d, %s, '%s')," % ((name,) + instance_types[name]))
+    lines.extend(['}', '', 'REGION_OFFERINGS = {'])
+    for region in sorted(offerings):
+        lines.append("    '%s': frozenset('''" % region)
+        lines.append(format_words(sorted(offerings[region] & set(instance_types)), ' ' * 8))
+        lines.append("    '''.split()),")
+    lines.append('}')
+    return header + '\n'.join(lines) + '\n' + footer
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate the instance type index of the cfncluster package')
+    parser.add_argument('--cloudformation-template', type=str, help='path to cloudfomation template', required=False,
+                        default='cloudformation/cfncluster.cfn.json')
+    parser.add_argument('--index-file', type=str, help='index output file path', required=False,
+                        default='cli/cfncluster/instance_index.py')
+    parser.add_argument('--region', type=str, help='region to describe the instance types in', required=False,
+                        default='us-east-1')
+    parser.add_argument('--instance-types-file', type=str, required=False, default=None,
+                        help='output of "aws ec2 describe-instance-types" to read instead of calling the API')
+    parser.add_argument('--offerings-file', type=str, required=False, default=None,
+                        help='JSON object of region -> output of "aws ec2 describe-instance-type-offerings '
+                             '--location-type region" to read instead of calling the API')
+    args = parser.parse_args()
+
+    with open(args.cloudformation_template) as f:
+        template = json.load(f)
+    regions = sorted(template.get('Mappings').get('AWSRegion2Capabilites'))
+    not_ebs_optimized = get_condition_values(template.get('Conditions').get('IsMasterInstanceEbsOpt'))
+
+    if args.instance_types_file:
+        with open(args.instance_types_file) as f:
+            instance_types = get_instance_types(json.load(f).get('InstanceTypes'))
+    else:
+        instance_types = get_instance_types(describe_instance_types(args.region))
+    offerings = {}
+    if args.offerings_file:
+        with open(args.offerings_file) as f:
+            for region, described in json.load(f).items():
+                if region in regions:
+                    offerings[region] = get_offered(described)
+    else:
+        # one thread per region, the offerings are regional APIs
+        threads = [threading.Thread(target=get_offerings, args=(region, offerings)) for region in regions]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    with open(args.index_file, 'w') as f:
+        f.write(generate_index(instance_types, offerings, not_ebs_optimized))
@@ -16,32 +16,45 @@
 #
 # Print a list of AMIs sorted by base distro and release tag
 #
+# amis.txt is read for each tag straight from the git objects of a persistent mirror of the repository,
+# without any checkout. Parsed results are cached per tag commit, so repeated audits only parse new tags.
+#
 # usage: ./get-ami-list.py <tag1> <tag2> <tag3>
 
 import re
 import argparse
-import tempfile
+import json
 import os
-import shutil
+import sys
+import threading
 from git import Repo
 
-repo_url = 'https://github.com/awslabs/cfncluster.git'
+try:
+    import Queue as queue
+except ImportError:
+    import queue
 
+repo_url = 'https://github.com/awslabs/cfncluster.git'
 
-def build_release_ami_list(scratch_dir, tag):
-    repo_dir = os.path.join(scratch_dir, "cfncluster")
 
-    if os.path.isdir(repo_dir):
-        repo = Repo(repo_dir)
+def get_mirror(mirror_dir, fetch):
+    if os.path.isdir(mirror_dir):
+        repo = Repo(mirror_dir)
+        if fetch:
+            repo.git.remote('update', '--prune')
     else:
-        repo = Repo.clone_from(repo_url, repo_dir)
-    repo.git.checkout(tag)
+        repo = Repo.clone_from(repo_url, mirror_dir, mirror=True)
+
+    return repo
 
+
+def parse_amis(amis_txt):
     active_distro = None
     amis = {}
 
-    file = open(os.path.join(repo_dir, 'amis.txt'), 'r')
-    for line in file:
+    for line in amis_txt.splitlines():
+        if not line.strip():
+            continue
         m = re.match('^#\s*(.*)', line)
         if not m == None:
             active_distro = m.groups()[0]
@@ -60,18 +73,84 @@ def build_release_ami_list(scratch_dir, tag):
     return amis
 
 
+def build_release_ami_list(repo, tag):
+    # reads amis.txt of the tag from the git objects, no checkout needed
+    blob = repo.commit(tag).tree / 'amis.txt'
+    return parse_amis(blob.data_stream.read().decode('utf-8'))
+
+
+def build_ami_lists(mirror_dir, tags, cache, jobs):
+    # returns a dict of tag -> amis and a dict of tag -> error for the tags that could not be parsed, parsing in
+    # parallel the tags whose commit is not in the cache
+    repo = Repo(mirror_dir)
+    commits = dict((tag, repo.commit(tag).hexsha) for tag in tags)
+    work_queue = queue.Queue()
+    for tag in tags:
+        if commits[tag] not in cache:
+            work_queue.put(tag)
+    cache_lock = threading.Lock()
+    errors = {}
+
+    def worker():
+        # every thread uses its own Repo, since the git object readers are not thread safe
+        worker_repo = Repo(mirror_dir)
+        while True:
+            try:
+                tag = work_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                amis = build_release_ami_list(repo=worker_repo, tag=tag)
+            except Exception as e:
+                # e.g. a tag without amis.txt, reported by the main thread
+                with cache_lock:
+                    errors[tag] = e
+                continue
+            with cache_lock:
+                cache[commits[tag]] = amis
+
+    workers = [threading.Thread(target=worker) for i in range(min(jobs, work_queue.qsize()))]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+
+    return dict((tag, cache[commits[tag]]) for tag in tags if tag not in errors), errors
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Generate list of AMIs for audit')
     parser.add_argument('tags', type=str, nargs='*',
                         help='List of tags for which to pull amis')
+    parser.add_argument('--mirror-dir', type=str,
+                        default=os.path.expanduser(os.path.join('~', '.cfncluster', 'ami-audit', 'cfncluster.git')),
+                        help='Persistent mirror of the repository')
+    parser.add_argument('--no-fetch', action='store_true', default=False,
+                        help='Do not fetch new tags into an existing mirror')
+    parser.add_argument('--jobs', type=int, default=8,
+                        help='Number of tags parsed in parallel')
     args = parser.parse_args()
 
-    scratch_dir = tempfile.mkdtemp()
+    get_mirror(mirror_dir=args.mirror_dir, fetch=not args.no_fetch)
+
+    cache_file = os.path.join(os.path.dirname(args.mirror_dir), 'amis-cache.json')
+    cache = {}
+    if os.path.isfile(cache_file):
+        with open(cache_file) as f:
+            cache = json.load(f)
+
+    ami_lists, errors = build_ami_lists(mirror_dir=args.mirror_dir, tags=sorted(args.tags), cache=cache,
+                                       jobs=args.jobs)
+
+    with open(cache_file, 'w') as f:
+        json.dump(cache, f)
+
+    for tag in sorted(ami_lists):
+        amis = ami_lists[tag]
+        for distro in sorted(amis):
+            print('%s %s: %s' % (tag, distro, " ".join(amis[distro])))
 
-    try:
-        for tag in sorted(args.tags):
-            amis = build_release_ami_list(scratch_dir=scratch_dir, tag=tag)
-            for distro in sorted(amis):
-                print('%s %s: %s' % (tag, distro, " ".join(amis[distro])))
-    finally:
-        shutil.rmtree(scratch_dir)
+    for tag in sorted(errors):
+        sys.stderr.write('Failed to read amis.txt of tag %s: %s\n' % (tag, errors[tag]))
+    if len(errors) > 0:
+        sys.exit(1)